@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Build the memory-mapped sanctioned INN index from the JSON INN cache.
+
+Run after generate_full_inn_cache.py. SanctionedINNCache maps the index
+instead of loading the JSON when the index is at least as new as the JSON.
+
+Usage:
+    python build_inn_index.py
+    python build_inn_index.py --input src/ai_service/data/sanctioned_inns_cache.json --output /tmp/inns.idx
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from ai_service.layers.search.sanctioned_inn_index import (
+    SanctionedINNIndex,
+    build_index_from_json,
+    default_index_path,
+)
+
+DEFAULT_INPUT = "src/ai_service/data/sanctioned_inns_cache.json"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the sanctioned INN index")
+    parser.add_argument("--input", default=DEFAULT_INPUT, help="JSON INN cache")
+    parser.add_argument("--output", help="Index file (default: next to the JSON, .idx)")
+    args = parser.parse_args()
+
+    input_path = Path(args.input)
+    if not input_path.exists():
+        print(f"❌ File not found: {input_path}")
+        return 1
+
+    output_path = Path(args.output) if args.output else default_index_path(input_path)
+    info = build_index_from_json(input_path, output_path)
+
+    index = SanctionedINNIndex(output_path)
+    print(f"✅ INN index written: {info['path']}")
+    print(f"   INNs: {info['count']:,} (skipped {info['skipped']})")
+    print(f"   Size: {info['bytes']:,} bytes (JSON: {input_path.stat().st_size:,} bytes)")
+    for entity_type, count in sorted(index.type_counts.items()):
+        print(f"   {entity_type}: {count:,}")
+    index.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
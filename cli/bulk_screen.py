@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Offline bulk screening of a CSV/TSV or JSONL payments file.
+
+Shards the input across a process pool (one UnifiedOrchestrator per worker),
+writes results incrementally and can resume from its checkpoint.
+
+Usage:
+    python cli/bulk_screen.py payments.csv results.jsonl --text-column purpose --id-column payment_id
+    python cli/bulk_screen.py payments.jsonl results.parquet --workers 8 --chunk-size 500
+    python cli/bulk_screen.py payments.csv results.jsonl --resume
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from ai_service.core.bulk_screening import run_bulk_screening
+from ai_service.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bulk screening of payment descriptions")
+    parser.add_argument("input", help="CSV/TSV or JSONL input file")
+    parser.add_argument("output", help="JSONL output file or Parquet output directory")
+    parser.add_argument("--workers", "-w", type=int, default=None, help="Worker processes (default: CPU count, 0 = in-process)")
+    parser.add_argument("--chunk-size", type=int, default=200, help="Records per worker task")
+    parser.add_argument("--text-column", default="text", help="CSV column with the payment text")
+    parser.add_argument("--id-column", help="CSV column with the record id")
+    parser.add_argument("--format", choices=["jsonl", "parquet"], help="Output format (default: by output suffix)")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <output>.checkpoint.json)")
+    parser.add_argument("--resume", action="store_true", help="Resume from the checkpoint")
+    parser.add_argument("--enable-search", action="store_true", help="Enable hybrid search (needs Elasticsearch)")
+    parser.add_argument("--no-decision", action="store_true", help="Disable the decision engine")
+    parser.add_argument("--variants", action="store_true", help="Generate variants for each record")
+    parser.add_argument("--progress-every", type=int, default=10, help="Log throughput every N chunks")
+    args = parser.parse_args()
+
+    try:
+        stats = run_bulk_screening(
+            args.input,
+            args.output,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            text_column=args.text_column,
+            id_column=args.id_column,
+            output_format=args.format,
+            checkpoint_path=args.checkpoint,
+            resume=args.resume,
+            factory_kwargs={
+                "enable_search": args.enable_search,
+                "enable_decision_engine": not args.no_decision,
+                "enable_variants": args.variants,
+            },
+            generate_variants=args.variants,
+            progress_every=args.progress_every,
+        )
+    except KeyboardInterrupt:
+        print("\nInterrupted; rerun with --resume to continue")
+        return 130
+    except Exception as e:
+        logger.error(f"Bulk screening failed: {e}")
+        return 1
+
+    print(json.dumps(stats, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
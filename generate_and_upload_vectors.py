@@ -6,11 +6,17 @@ Generate and upload vectors for all entities (persons, companies, terrorism blac
 import json
 import asyncio
 import aiohttp
+import os
+import sys
 import time
 import numpy as np
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from ai_service.layers.embeddings.indexing.embedding_store import EmbeddingStore
+
 # Try to import sentence transformers
 try:
     from sentence_transformers import SentenceTransformer
@@ -19,17 +25,21 @@ except ImportError:
     TRANSFORMERS_AVAILABLE = False
     print("⚠️  sentence-transformers not available, using mock vectors")
 
+MODEL_NAME = 'paraphrase-multilingual-MiniLM-L12-v2'
+
+
 class VectorGenerator:
-    def __init__(self, es_url="http://95.217.84.234:9200"):
+    def __init__(self, es_url="http://95.217.84.234:9200", embedding_store_path: Optional[str] = None):
         self.es_url = es_url.rstrip("/")
         self.session = None
+        self.store = None
 
         # Initialize sentence transformer model
         if TRANSFORMERS_AVAILABLE:
             print("🔧 Loading sentence-transformers model...")
             import sys
             sys.stdout.flush()
-            self.model = SentenceTransformer('paraphrase-multilingual-MiniLM-L12-v2')  # 384 dimensions
+            self.model = SentenceTransformer(MODEL_NAME)  # 384 dimensions
             self.vector_dim = 384
             print("✅ Model loaded successfully")
             sys.stdout.flush()
@@ -37,6 +47,11 @@ class VectorGenerator:
             self.model = None
             self.vector_dim = 384
 
+        # Reuse vectors of names encoded by earlier runs (mock vectors are never stored)
+        if embedding_store_path and self.model:
+            self.store = EmbeddingStore(embedding_store_path, MODEL_NAME)
+            print(f"♻️  Embedding store {embedding_store_path}: {len(self.store):,} stored vectors")
+
     async def __aenter__(self):
         self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=300))
         return self
@@ -58,6 +73,21 @@ class VectorGenerator:
             np.random.seed(seed)
             return np.random.normal(0, 1, self.vector_dim).tolist()
 
+    def generate_vectors(self, texts: List[str]) -> List[List[float]]:
+        """Generate vectors for many texts, encoding only those not in the embedding store"""
+        if not texts:
+            return []
+        if self.store is None:
+            return [self.generate_vector(text) for text in texts]
+
+        vectors = self.store.get_or_encode(
+            texts, lambda missing: self.model.encode(missing, batch_size=64, show_progress_bar=False)
+        )
+        self.store.save()
+        stats = self.store.get_stats()
+        print(f"♻️  Embedding store: {stats['hits']:,} reused, {stats['misses']:,} encoded so far")
+        return vectors.tolist()
+
     async def create_vectors_index(self):
         """Create vectors index with proper mapping"""
         print("🔧 Creating vectors index...")
@@ -169,15 +199,12 @@ class VectorGenerator:
             # Use primary name for vector generation
             primary_name = names[0] if names else f"Person {person.get('id', i)}"
 
-            # Generate vector
-            vector = self.generate_vector(primary_name)
-
             vectors.append({
                 "entity_id": str(person.get('id', i)),
                 "entity_type": "person",
                 "name": primary_name,
                 "name_variants": names,
-                "vector": vector,
+                "vector": None,
                 "metadata": {
                     "birth_date": person.get('birth_date'),
                     "passport": person.get('passport'),
@@ -187,8 +214,8 @@ class VectorGenerator:
                 "created_at": "2025-09-22T23:00:00Z"
             })
 
-            if (i + 1) % 1000 == 0:
-                print(f"  Generated {i + 1:,}/{len(persons):,} person vectors ({((i+1)/len(persons)*100):.1f}%)")
+        for vector_doc, vector in zip(vectors, self.generate_vectors([v["name"] for v in vectors])):
+            vector_doc["vector"] = vector
 
         print(f"✅ Generated {len(vectors):,} person vectors")
         return vectors
@@ -211,15 +238,12 @@ class VectorGenerator:
             # Use primary name for vector generation
             primary_name = names[0] if names else f"Company {company.get('id', i)}"
 
-            # Generate vector
-            vector = self.generate_vector(primary_name)
-
             vectors.append({
                 "entity_id": str(company.get('id', i)),
                 "entity_type": "company",
                 "name": primary_name,
                 "name_variants": names,
-                "vector": vector,
+                "vector": None,
                 "metadata": {
                     "edrpou": company.get('edrpou'),
                     "inn": company.get('inn'),
@@ -229,8 +253,8 @@ class VectorGenerator:
                 "created_at": "2025-09-22T23:00:00Z"
             })
 
-            if (i + 1) % 1000 == 0:
-                print(f"  Generated {i + 1:,}/{len(companies):,} company vectors ({((i+1)/len(companies)*100):.1f}%)")
+        for vector_doc, vector in zip(vectors, self.generate_vectors([v["name"] for v in vectors])):
+            vector_doc["vector"] = vector
 
         print(f"✅ Generated {len(vectors):,} company vectors")
         return vectors
@@ -253,15 +277,12 @@ class VectorGenerator:
             # Use primary name for vector generation
             primary_name = names[0] if names else f"Terrorism Entry {entry.get('id', i)}"
 
-            # Generate vector
-            vector = self.generate_vector(primary_name)
-
             vectors.append({
                 "entity_id": str(entry.get('id', i)),
                 "entity_type": "terrorism",
                 "name": primary_name,
                 "name_variants": names,
-                "vector": vector,
+                "vector": None,
                 "metadata": {
                     "category": entry.get('category'),
                     "reason": entry.get('reason'),
@@ -270,8 +291,8 @@ class VectorGenerator:
                 "created_at": "2025-09-22T23:00:00Z"
             })
 
-            if (i + 1) % 1000 == 0:
-                print(f"  Generated {i + 1:,}/{len(terrorism):,} terrorism vectors ({((i+1)/len(terrorism)*100):.1f}%)")
+        for vector_doc, vector in zip(vectors, self.generate_vectors([v["name"] for v in vectors])):
+            vector_doc["vector"] = vector
 
         print(f"✅ Generated {len(vectors):,} terrorism vectors")
         return vectors
@@ -321,7 +342,7 @@ async def main():
     print("🚀 Starting vectors generation and upload...")
     print("=" * 60)
 
-    async with VectorGenerator() as generator:
+    async with VectorGenerator(embedding_store_path=os.getenv("EMBEDDING_STORE_PATH")) as generator:
         # Create vectors index
         if not await generator.create_vectors_index():
             return
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Build a memory-mapped AC automaton snapshot for the local AC search stage.
+
+Serializes the Aho-Corasick automaton and pattern metadata into one binary
+``.acsnap`` file inside a versioned snapshot directory and (optionally)
+activates it. Running workers pick the new version up via ``/reload-config``
+or the snapshot watcher (``LOCAL_AC_SNAPSHOT_DIR``).
+
+Usage:
+    python scripts/build_ac_snapshot.py --corpus high_recall_ac_patterns.json --output-dir data/ac_snapshots
+    python scripts/build_ac_snapshot.py --persons-file data/sanctions/sanctioned_persons.json \\
+        --companies-file data/sanctions/sanctioned_companies.json --output-dir data/ac_snapshots
+    python scripts/build_ac_snapshot.py --output-dir data/ac_snapshots --activate-version 20250101120000
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_service.layers.search.ac_snapshot import ACSnapshotManager
+from ai_service.layers.search.local_ac_automaton import LocalACAutomaton
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build a memory-mapped AC automaton snapshot")
+    parser.add_argument("--output-dir", required=True, help="Snapshot directory (LOCAL_AC_SNAPSHOT_DIR)")
+    parser.add_argument("--corpus", help="Corpus JSON from export_high_recall_ac_patterns.py")
+    parser.add_argument("--persons-file", help="Sanctioned persons JSON (generate corpus in-process)")
+    parser.add_argument("--companies-file", help="Sanctioned companies JSON")
+    parser.add_argument("--terrorism-file", help="Terrorism blacklist JSON")
+    parser.add_argument("--version", help="Version label (default: UTC timestamp)")
+    parser.add_argument("--min-pattern-length", type=int, default=3, help="Skip shorter patterns")
+    parser.add_argument("--no-activate", action="store_true", help="Write snapshot without activating it")
+    parser.add_argument("--keep", type=int, default=3, help="Versions to retain (0 keeps all)")
+    parser.add_argument("--activate-version", help="Only switch CURRENT to an existing version")
+    args = parser.parse_args()
+
+    manager = ACSnapshotManager(args.output_dir)
+
+    if args.activate_version:
+        manager.activate(args.activate_version)
+        logger.info(f"✅ Activated AC snapshot {args.activate_version}")
+        return 0
+
+    if args.corpus:
+        automaton = LocalACAutomaton.from_file(args.corpus, min_pattern_length=args.min_pattern_length)
+    elif args.persons_file or args.companies_file or args.terrorism_file:
+        automaton = LocalACAutomaton.from_sanctions_files(
+            persons_file=args.persons_file,
+            companies_file=args.companies_file,
+            terrorism_file=args.terrorism_file,
+            min_pattern_length=args.min_pattern_length,
+        )
+    else:
+        parser.error("either --corpus or at least one sanctions file is required")
+
+    info = manager.publish(
+        automaton,
+        version=args.version,
+        activate=not args.no_activate,
+        keep=args.keep,
+    )
+
+    stats = automaton.get_stats()
+    logger.info(f"📦 Snapshot {info['version']}: {info['bytes']:,} bytes at {info['path']}")
+    logger.info(
+        f"   {stats['patterns_indexed']:,} patterns, {stats['unique_keys']:,} keys, "
+        f"build {stats['build_time_ms']:.0f}ms"
+    )
+    if info.get("pruned"):
+        logger.info(f"   Pruned old versions: {', '.join(info['pruned'])}")
+    if args.no_activate:
+        logger.info("   Not activated (use --activate-version to switch)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Build the precomputed morphology lexicon consulted before pymorphy3.
+
+Collects every Cyrillic name token from ``data/dicts/*_names.py``, the
+diminutive maps (``data/diminutives_*.json`` and ``data/dicts/*diminutives*.py``)
+and the person sanctions lists. By default it also adds every inflected form
+of their name/surname/patronymic lexemes. It then runs each token through
+``MorphologyAdapter._parse_uncached`` for Russian and Ukrainian and writes the
+results to an mmap-able ``.mlex`` file (see ``morphology_lexicon``).
+Single letters are left out: their parses depend on case (initials), so
+``lexicon_key`` sends them to pymorphy3.
+
+Rebuild after upgrading pymorphy3 or its dictionaries; the versions used are
+recorded in the file header.
+
+Usage:
+    python scripts/build_morphology_lexicon.py
+    python scripts/build_morphology_lexicon.py --output data/morphology/names_lexicon.mlex --no-inflections
+"""
+
+import argparse
+import importlib
+import json
+import logging
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Set
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_service.layers.normalization.morphology_adapter import MorphologyAdapter
+from ai_service.layers.normalization.morphology_lexicon import (
+    DEFAULT_LEXICON_PATH,
+    LEXICON_LANGUAGES,
+    MorphologyLexicon,
+    analyzer_metadata,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = Path(__file__).parent.parent
+DICTS_DIR = REPO_ROOT / "src" / "ai_service" / "data" / "dicts"
+DATA_DIR = REPO_ROOT / "data"
+
+NAME_GRAMMEMES = ("Name", "Surn", "Patr")
+SANCTIONS_PERSON_FILES = ("sanctioned_persons.json", "terrorism_black_list.json", "custom_ukraine_russia.json")
+
+_WORD = re.compile(r"[^\W\d_]+(?:[-'ʼ’][^\W\d_]+)*")
+_CYRILLIC = re.compile(r"[Ѐ-ӿ]")
+
+
+def iter_strings(value: Any) -> Iterator[str]:
+    """Every string in a nested structure, dict keys included."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from iter_strings(key)
+            yield from iter_strings(item)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            yield from iter_strings(item)
+
+
+def iter_person_names(value: Any) -> Iterator[str]:
+    """Strings under name-like keys (name, name_ru, aka_name, aliases, ...)."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if "name" in key or key == "aliases":
+                yield from iter_strings(item)
+            else:
+                yield from iter_person_names(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from iter_person_names(item)
+
+
+def add_tokens(tokens: Set[str], texts: Iterable[str]) -> None:
+    for text in texts:
+        for word in _WORD.findall(text):
+            if not _CYRILLIC.search(word):
+                continue
+            tokens.add(word.lower())
+            if "-" in word:
+                tokens.update(part.lower() for part in word.split("-") if part)
+
+
+def collect_tokens() -> Set[str]:
+    tokens: Set[str] = set()
+
+    modules = sorted(path.stem for path in DICTS_DIR.glob("*_names.py"))
+    modules += sorted(path.stem for path in DICTS_DIR.glob("*diminutives*.py"))
+    for module_name in modules:
+        module = importlib.import_module(f"ai_service.data.dicts.{module_name}")
+        before = len(tokens)
+        for attr, value in vars(module).items():
+            if attr.isupper() and isinstance(value, (dict, list, set, tuple)):
+                add_tokens(tokens, iter_strings(value))
+        logger.info(f"  {module_name}: +{len(tokens) - before} tokens")
+
+    for path in sorted(DATA_DIR.glob("diminutives_*.json")):
+        before = len(tokens)
+        add_tokens(tokens, iter_strings(json.loads(path.read_text(encoding="utf-8"))))
+        logger.info(f"  {path.name}: +{len(tokens) - before} tokens")
+
+    for name in SANCTIONS_PERSON_FILES:
+        path = DATA_DIR / "sanctions" / name
+        if not path.exists():
+            logger.warning(f"  {path} not found, skipped")
+            continue
+        before = len(tokens)
+        add_tokens(tokens, iter_person_names(json.loads(path.read_text(encoding="utf-8"))))
+        logger.info(f"  {path.name}: +{len(tokens) - before} tokens")
+
+    return tokens
+
+
+def add_inflections(adapter: MorphologyAdapter, tokens: Set[str]) -> Set[str]:
+    """All forms of the name/surname/patronymic lexemes the tokens belong to."""
+    forms: Set[str] = set()
+    for lang in LEXICON_LANGUAGES:
+        analyzer = adapter._get_analyzer(lang)
+        if analyzer is None:
+            continue
+        for token in tokens:
+            for parse in analyzer.parse(token):
+                if any(grammeme in parse.tag for grammeme in NAME_GRAMMEMES):
+                    forms.update(form.word for form in parse.lexeme)
+    return forms
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the precomputed morphology lexicon")
+    parser.add_argument("--output", default=str(DEFAULT_LEXICON_PATH), help="Output .mlex file")
+    parser.add_argument("--version", help="Version label (default: UTC timestamp)")
+    parser.add_argument("--no-inflections", action="store_true", help="Only the listed tokens, not their inflected forms")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    adapter = MorphologyAdapter()
+    if not any(adapter._get_analyzer(lang) for lang in LEXICON_LANGUAGES):
+        logger.error("pymorphy3 is not available; cannot build the lexicon")
+        return 1
+
+    logger.info("Collecting name tokens")
+    tokens = collect_tokens()
+    logger.info(f"{len(tokens):,} source tokens")
+    if not args.no_inflections:
+        tokens |= add_inflections(adapter, tokens)
+        logger.info(f"{len(tokens):,} tokens with inflected forms")
+
+    entries = (
+        (token, lang, adapter._parse_uncached(token, lang))
+        for lang in LEXICON_LANGUAGES
+        if adapter._get_analyzer(lang) is not None
+        for token in sorted(tokens)
+    )
+    lexicon = MorphologyLexicon().build(entries)
+    info = lexicon.save(args.output, version=args.version, metadata=analyzer_metadata())
+
+    logger.info(f"📦 Lexicon {info['version']}: {info['bytes']:,} bytes at {info['path']}")
+    logger.info(
+        f"   {lexicon.stats['keys']:,} keys, {lexicon.stats['parses']:,} parses, "
+        f"build {time.perf_counter() - start_time:.0f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
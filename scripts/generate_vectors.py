@@ -7,12 +7,14 @@ import json
 import asyncio
 import logging
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import sys
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from ai_service.layers.embeddings.indexing.embedding_store import EmbeddingStore
+
 try:
     from sentence_transformers import SentenceTransformer
     SENTENCE_TRANSFORMERS_AVAILABLE = True
@@ -26,9 +28,11 @@ logger = logging.getLogger(__name__)
 class VectorGenerator:
     """Generate vectors from text patterns."""
 
-    def __init__(self, model_name: str = "sentence-transformers/paraphrase-multilingual-mpnet-base-v2"):
+    def __init__(self, model_name: str = "sentence-transformers/paraphrase-multilingual-mpnet-base-v2",
+                 embedding_store: Optional[Path] = None):
         self.model_name = model_name
         self.model = None
+        self.store = None
 
         if SENTENCE_TRANSFORMERS_AVAILABLE:
             try:
@@ -41,6 +45,26 @@ class VectorGenerator:
         else:
             logger.warning("sentence-transformers not available")
 
+        # Dummy vectors are never persisted
+        if embedding_store and self.model:
+            self.store = EmbeddingStore(embedding_store, model_name)
+            logger.info(f"Reusing stored vectors from {embedding_store} ({len(self.store)} entries)")
+
+    def generate_vectors(self, texts: List[str]) -> List[List[float]]:
+        """Generate vectors for many texts, encoding only those not in the embedding store."""
+        if not texts:
+            return []
+        if self.store is None:
+            return [self.generate_vector(text) for text in texts]
+
+        vectors = self.store.get_or_encode(
+            texts, lambda missing: self.model.encode(missing, batch_size=64, show_progress_bar=False)
+        )
+        self.store.save()
+        stats = self.store.get_stats()
+        logger.info(f"Embedding store: {stats['hits']} reused, {stats['misses']} encoded")
+        return vectors.tolist()
+
     def generate_vector(self, text: str) -> List[float]:
         """Generate vector for a single text."""
         if self.model:
@@ -87,13 +111,10 @@ class VectorGenerator:
                 if not pattern or len(pattern) < 2:
                     continue
 
-                # Generate vector
-                vector = self.generate_vector(pattern)
-
-                # Create vector entry
+                # Create vector entry (vectors are filled in below in one batch)
                 vector_entry = {
                     "name": pattern,
-                    "vector": vector,
+                    "vector": None,
                     "metadata": {
                         "tier": tier_name,
                         "pattern_type": pattern_data.get('pattern_type', 'unknown'),
@@ -105,12 +126,12 @@ class VectorGenerator:
                 vectors.append(vector_entry)
                 pattern_count += 1
 
-                if pattern_count % 1000 == 0:
-                    logger.info(f"Generated {pattern_count} vectors...")
-
             if pattern_count >= max_patterns:
                 break
 
+        for vector_entry, vector in zip(vectors, self.generate_vectors([v["name"] for v in vectors])):
+            vector_entry["vector"] = vector
+
         # Save vectors
         logger.info(f"Saving {len(vectors)} vectors to {output_file}")
         with open(output_file, 'w', encoding='utf-8') as f:
@@ -195,10 +216,12 @@ async def main():
     parser.add_argument("--sample", action="store_true", help="Generate sample vectors instead")
     parser.add_argument("--model", default="sentence-transformers/paraphrase-multilingual-mpnet-base-v2",
                        help="Model name for embeddings")
+    parser.add_argument("--embedding-store", type=Path,
+                       help="Embedding store file; only names not already in it are encoded")
 
     args = parser.parse_args()
 
-    generator = VectorGenerator(args.model)
+    generator = VectorGenerator(args.model, embedding_store=args.embedding_store)
 
     if args.sample:
         # Generate sample vectors
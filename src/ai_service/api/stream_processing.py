@@ -0,0 +1,183 @@
+"""
+NDJSON streaming for the /process-stream endpoint.
+
+The request body is read incrementally, one NDJSON record per line, and each
+record is screened through ``UnifiedOrchestrator.process`` as soon as it is
+parsed. Results are written back as NDJSON in completion order.
+
+Backpressure: at most ``max_in_flight`` records are read ahead of the
+response. A slot is held from the moment a line is parsed until its result
+has been handed to the client, so a slow consumer stalls the workers, which
+in turn stop the body reader. Memory stays bounded by ``max_in_flight``
+regardless of the upload size.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+
+from ..utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Parsed record: (line number, client-supplied id, text or None, parse error or None)
+ParsedLine = Tuple[int, Any, Optional[str], Optional[str]]
+
+_DONE = object()
+
+
+def parse_ndjson_record(line: str, max_length: int) -> Tuple[Any, Optional[str], Optional[str]]:
+    """
+    Parse one NDJSON record into ``(id, text, error)``.
+
+    A record is either a JSON string or an object with a ``text`` field and
+    an optional ``id`` that is echoed back in the result.
+    """
+    try:
+        record = json.loads(line)
+    except ValueError as exc:
+        return None, None, f"Invalid JSON: {exc}"
+
+    record_id = None
+    if isinstance(record, dict):
+        record_id = record.get("id")
+        record = record.get("text")
+    if not isinstance(record, str):
+        return record_id, None, "Record must be a JSON string or an object with a 'text' field"
+    if len(record) > max_length:
+        return record_id, None, f"Text too long: {len(record)} > {max_length}"
+    return record_id, record, None
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterator[bytes],
+    max_length: int,
+    max_line_bytes: Optional[int] = None,
+) -> AsyncIterator[ParsedLine]:
+    """
+    Split a byte stream into parsed NDJSON records.
+
+    Blank lines are skipped but still counted, so line numbers match the
+    uploaded file. A line longer than ``max_line_bytes`` is reported as an
+    error and discarded without buffering the rest of it.
+    """
+    max_line_bytes = max_line_bytes or max_length * 4 + 1024
+    buffer = bytearray()
+    line_number = 0
+    discarding = False
+
+    def _emit(raw: bytes) -> Optional[ParsedLine]:
+        text = raw.decode("utf-8", errors="replace").strip()
+        if not text:
+            return None
+        record_id, value, error = parse_ndjson_record(text, max_length)
+        return line_number, record_id, value, error
+
+    async for chunk in chunks:
+        buffer.extend(chunk)
+        while True:
+            newline = buffer.find(b"\n")
+            if newline < 0:
+                break
+            raw = bytes(buffer[:newline])
+            del buffer[: newline + 1]
+            if discarding:
+                # Tail of an oversized line that was already reported
+                discarding = False
+                continue
+            line_number += 1
+            parsed = _emit(raw)
+            if parsed is not None:
+                yield parsed
+
+        if not discarding and len(buffer) > max_line_bytes:
+            line_number += 1
+            yield line_number, None, None, f"Line exceeds {max_line_bytes} bytes"
+            discarding = True
+            buffer.clear()
+        elif discarding:
+            buffer.clear()
+
+    if buffer and not discarding:
+        line_number += 1
+        parsed = _emit(bytes(buffer))
+        if parsed is not None:
+            yield parsed
+
+
+async def stream_process_results(
+    lines: AsyncIterator[ParsedLine],
+    process: Callable[[str], Awaitable[Any]],
+    format_result: Callable[[Any], Dict[str, Any]],
+    max_in_flight: int = 10,
+) -> AsyncIterator[bytes]:
+    """
+    Screen parsed records concurrently and yield NDJSON result lines.
+
+    Args:
+        lines: Parsed records from ``iter_ndjson_lines``
+        process: Coroutine screening one text (``orchestrator.process``)
+        format_result: Converts a processing result to a JSON-able dict
+        max_in_flight: Records read ahead of the response at most
+
+    Yields:
+        UTF-8 encoded NDJSON lines, one per record, in completion order
+    """
+    slots = asyncio.Semaphore(max(1, max_in_flight))
+    results: asyncio.Queue = asyncio.Queue()
+    workers: set = set()
+
+    async def _screen(line_number: int, record_id: Any, text: Optional[str], error: Optional[str]):
+        payload: Dict[str, Any] = {"line": line_number}
+        if record_id is not None:
+            payload["id"] = record_id
+        if error is not None:
+            payload.update(success=False, errors=[error])
+        else:
+            start_time = time.time()
+            try:
+                payload.update(format_result(await process(text)))
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error(f"Stream item at line {line_number} failed: {exc}")
+                payload.update(
+                    success=False,
+                    original_text=text,
+                    errors=[str(exc)],
+                    processing_time=time.time() - start_time,
+                )
+        await results.put(payload)
+
+    async def _read():
+        try:
+            async for line_number, record_id, text, error in lines:
+                await slots.acquire()
+                task = asyncio.create_task(_screen(line_number, record_id, text, error))
+                workers.add(task)
+                task.add_done_callback(workers.discard)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.error(f"Failed to read NDJSON stream: {exc}")
+            await results.put({"success": False, "errors": [f"Stream aborted: {exc}"]})
+        if workers:
+            await asyncio.gather(*list(workers), return_exceptions=True)
+        await results.put(_DONE)
+
+    reader = asyncio.create_task(_read())
+    try:
+        while True:
+            payload = await results.get()
+            if payload is _DONE:
+                break
+            yield (json.dumps(payload, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+            if "line" in payload:
+                slots.release()
+    finally:
+        # Client went away or the stream finished: stop reading and drop in-flight work
+        reader.cancel()
+        for task in list(workers):
+            task.cancel()
+        await asyncio.gather(reader, *list(workers), return_exceptions=True)
@@ -51,6 +51,7 @@ class ServiceConfig:
     # Feature Flags - управляемые из env
     enable_aho_corasick: bool = field(default_factory=lambda: os.getenv("ENABLE_AHO_CORASICK", "false").lower() == "true")
     aho_corasick_confidence_bonus: float = field(default_factory=lambda: float(os.getenv("AHO_CORASICK_CONFIDENCE_BONUS", "0.3")))
+    aho_corasick_timeout_ms: float = field(default_factory=lambda: float(os.getenv("AHO_CORASICK_TIMEOUT_MS", "200")))
     prioritize_quality: bool = field(default_factory=lambda: os.getenv("PRIORITIZE_QUALITY", "true").lower() == "true")
     enable_faiss_index: bool = field(default_factory=lambda: os.getenv("ENABLE_FAISS_INDEX", "true").lower() == "true")
     enable_smart_filter: bool = field(default_factory=lambda: os.getenv("ENABLE_SMART_FILTER", "true").lower() == "true")
@@ -75,6 +76,7 @@ class ServiceConfig:
             "clean_unicode": self.clean_unicode,
             "enable_aho_corasick": self.enable_aho_corasick,
             "aho_corasick_confidence_bonus": self.aho_corasick_confidence_bonus,
+            "aho_corasick_timeout_ms": self.aho_corasick_timeout_ms,
             "prioritize_quality": self.prioritize_quality,
             "enable_faiss_index": self.enable_faiss_index,
             "enable_smart_filter": self.enable_smart_filter,
@@ -199,6 +201,12 @@ class PerformanceConfig:
     enable_async: bool = True
     worker_timeout: int = 300
     request_timeout: int = 30
+    # End-to-end /process result cache (keyed on text, flags and data version).
+    # Off by default: updates to the Elasticsearch indices do not advance the
+    # data version, so a cached result can lag a new designation by up to the TTL.
+    enable_result_cache: bool = field(default_factory=lambda: os.getenv("ENABLE_RESULT_CACHE", "false").lower() == "true")
+    result_cache_size: int = field(default_factory=lambda: int(os.getenv("RESULT_CACHE_SIZE", "10000")))
+    result_cache_ttl: int = field(default_factory=lambda: int(os.getenv("RESULT_CACHE_TTL", "60")))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -212,6 +220,9 @@ class PerformanceConfig:
             "enable_async": self.enable_async,
             "worker_timeout": self.worker_timeout,
             "request_timeout": self.request_timeout,
+            "enable_result_cache": self.enable_result_cache,
+            "result_cache_size": self.result_cache_size,
+            "result_cache_ttl": self.result_cache_ttl,
         }
 
 
@@ -322,6 +333,7 @@ class EmbeddingConfig(BaseModel):
     enable_index: bool = False  # индексацию оставляем как опцию
     extra_models: List[str] = []  # опционально разрешённые альтернативы
     warmup_on_init: bool = False  # Pre-load model and run dummy encoding on initialization
+    backend: str = Field(default_factory=lambda: os.getenv("EMBEDDING_BACKEND", "torch"))  # torch, torch_int8, onnx_int8
     
     def model_dump(self) -> Dict[str, Any]:
         """Return model as dictionary"""
@@ -331,7 +343,8 @@ class EmbeddingConfig(BaseModel):
             "batch_size": self.batch_size,
             "enable_index": self.enable_index,
             "extra_models": self.extra_models,
-            "warmup_on_init": self.warmup_on_init
+            "warmup_on_init": self.warmup_on_init,
+            "backend": self.backend
         }
 
 
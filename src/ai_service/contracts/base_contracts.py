@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import TYPE_CHECKING
+    from ..utils.text_profile import TextProfile
 
 from pydantic import BaseModel
 
@@ -204,6 +205,7 @@ class ProcessingContext:
     should_process: bool = True
     processing_flags: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    text_profile: Optional["TextProfile"] = None  # shared analysis of sanitized, then unicode-normalized text
 
 
 @dataclass
@@ -0,0 +1,393 @@
+"""
+Offline bulk screening of payment files across a process pool.
+
+The async API server runs morphology-heavy normalization on one core per
+worker. For large CSV/JSONL files this module shards records into chunks and
+screens them in separate processes, each holding one ``UnifiedOrchestrator``
+built through ``OrchestratorFactory``.
+
+- Shared dictionaries: the parent builds an orchestrator once before forking,
+  which loads the module-level caches (lexicons, morphology analyzers, AC
+  patterns). ``gc.freeze()`` then keeps the collector from touching those
+  objects, so forked workers share the pages copy-on-write.
+- Incremental output: results are written chunk by chunk in input order,
+  either to one JSONL file or to a directory of Parquet part files.
+- Resume: after every written chunk a checkpoint records the chunks done and
+  the JSONL byte offset; ``resume=True`` skips those chunks and truncates any
+  partially written tail.
+"""
+
+import asyncio
+import csv
+import gc
+import json
+import multiprocessing
+import os
+import time
+from collections import deque
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from ..api.stream_processing import parse_ndjson_record
+from ..config import SERVICE_CONFIG
+from ..utils.logging_config import get_logger
+from .orchestrator_factory import OrchestratorFactory
+
+logger = get_logger(__name__)
+
+# (record index, client id, text or None, parse error or None)
+Record = Tuple[int, Any, Optional[str], Optional[str]]
+
+DEFAULT_FACTORY_KWARGS: Dict[str, Any] = {
+    "enable_smart_filter": True,
+    "enable_variants": False,
+    "enable_embeddings": False,
+    "enable_decision_engine": True,
+    "enable_search": False,
+}
+
+# Per-process state, set by _init_worker
+_worker_orchestrator = None
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_process_kwargs: Dict[str, Any] = {}
+# Keeps the parent's warm-up orchestrator (and its dictionaries) alive for fork sharing
+_shared_warmup = None
+
+
+def read_records(
+    path: Union[str, Path],
+    text_column: str = "text",
+    id_column: Optional[str] = None,
+) -> Iterator[Record]:
+    """
+    Stream records from a CSV/TSV or JSONL file.
+
+    CSV rows take the text from ``text_column`` and the id from ``id_column``
+    (``None`` when not given; rows are always tagged with their index). JSONL lines are parsed like
+    ``/process-stream`` input: a JSON string or an ``{id, text}`` object.
+    """
+    path = Path(path)
+    max_length = SERVICE_CONFIG.max_input_length
+    suffix = path.suffix.lower()
+
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        if suffix in (".csv", ".tsv"):
+            reader = csv.DictReader(handle, delimiter="\t" if suffix == ".tsv" else ",")
+            if reader.fieldnames is None or text_column not in reader.fieldnames:
+                raise ValueError(f"Column '{text_column}' not found in {path}")
+            for index, row in enumerate(reader):
+                text = row.get(text_column) or ""
+                record_id = row.get(id_column) if id_column else None
+                if len(text) > max_length:
+                    yield index, record_id, None, f"Text too long: {len(text)} > {max_length}"
+                else:
+                    yield index, record_id, text, None
+        else:
+            index = 0
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                record_id, text, error = parse_ndjson_record(line, max_length)
+                yield index, record_id, text, error
+                index += 1
+
+
+def _chunked(records: Iterator[Record], size: int) -> Iterator[List[Record]]:
+    while True:
+        chunk = list(islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _build_orchestrator(factory_kwargs: Dict[str, Any]):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    orchestrator = loop.run_until_complete(OrchestratorFactory.create_orchestrator(**factory_kwargs))
+    return orchestrator, loop
+
+
+def _warm_shared_state(factory_kwargs: Dict[str, Any]) -> None:
+    """Load shared dictionaries in the parent and freeze them before forking."""
+    global _shared_warmup
+    orchestrator, loop = _build_orchestrator(factory_kwargs)
+    loop.run_until_complete(orchestrator.process_batch(["Іван Петренко"], generate_variants=False))
+    loop.close()
+    _shared_warmup = orchestrator
+    gc.collect()
+    gc.freeze()
+
+
+def _init_worker(factory_kwargs: Dict[str, Any], process_kwargs: Dict[str, Any]) -> None:
+    global _worker_orchestrator, _worker_loop, _worker_process_kwargs
+    _worker_orchestrator, _worker_loop = _build_orchestrator(factory_kwargs)
+    _worker_process_kwargs = process_kwargs
+
+
+def _result_row(record: Record, result: Any = None) -> Dict[str, Any]:
+    index, record_id, text, error = record
+    row = {
+        "index": index,
+        "id": record_id,
+        "original_text": text,
+        "success": False,
+        "normalized_text": None,
+        "language": None,
+        "risk_level": None,
+        "risk_score": None,
+        "review_required": None,
+        "processing_time": None,
+        "errors": [error] if error else [],
+    }
+    if result is None:
+        return row
+
+    decision = getattr(result, "decision", None)
+    row.update(
+        success=result.success,
+        normalized_text=result.normalized_text,
+        language=result.language,
+        processing_time=result.processing_time,
+        errors=list(result.errors or []),
+    )
+    if decision is not None:
+        risk = getattr(decision, "risk", None)
+        row.update(
+            risk_level=getattr(risk, "value", risk),
+            risk_score=getattr(decision, "score", None),
+            review_required=getattr(decision, "review_required", None),
+        )
+    return row
+
+
+def _screen_chunk(chunk: List[Record]) -> List[Dict[str, Any]]:
+    """Screen one chunk in the current worker; rows come back in chunk order."""
+    valid = [record for record in chunk if record[3] is None]
+    results = _worker_loop.run_until_complete(
+        _worker_orchestrator.process_batch(
+            [record[2] for record in valid], max_concurrent=1, **_worker_process_kwargs
+        )
+    ) if valid else []
+
+    by_index = {record[0]: result for record, result in zip(valid, results)}
+    return [_result_row(record, by_index.get(record[0])) for record in chunk]
+
+
+class JsonlResultWriter:
+    """Appends result rows to a JSONL file, optionally resuming at a byte offset."""
+
+    def __init__(self, path: Union[str, Path], resume_offset: Optional[int] = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume_offset:
+            # Rows before the checkpoint are not screened again, so they must
+            # still be there; truncate() would pad a short file with NUL bytes
+            size = self.path.stat().st_size if self.path.exists() else None
+            if size is None or size < resume_offset:
+                raise ValueError(
+                    f"Cannot resume: {self.path} is {'missing' if size is None else f'{size} bytes'}, "
+                    f"the checkpoint expects at least {resume_offset} bytes"
+                )
+        if resume_offset is not None and self.path.exists():
+            self._file = self.path.open("r+b")
+            self._file.truncate(resume_offset)  # drop rows written after the last checkpoint
+            self._file.seek(resume_offset)
+        else:
+            self._file = self.path.open("wb")
+
+    def write(self, rows: List[Dict[str, Any]], chunk_index: int) -> None:
+        for row in rows:
+            self._file.write((json.dumps(row, ensure_ascii=False, default=str) + "\n").encode("utf-8"))
+        self._file.flush()
+
+    @property
+    def offset(self) -> int:
+        return self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetResultWriter:
+    """Writes one Parquet part file per chunk into a directory."""
+
+    def __init__(self, directory: Union[str, Path], resume_offset: Optional[int] = None):
+        try:
+            import pyarrow  # noqa: F401
+            import pyarrow.parquet  # noqa: F401
+        except ImportError as exc:
+            raise RuntimeError("Parquet output requires pyarrow (pip install pyarrow)") from exc
+        self.path = Path(directory)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.offset = 0
+
+    def write(self, rows: List[Dict[str, Any]], chunk_index: int) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pylist(
+            [{**row, "id": None if row["id"] is None else str(row["id"])} for row in rows]
+        )
+        part = self.path / f"part-{chunk_index:06d}.parquet"
+        tmp_part = part.with_suffix(".parquet.tmp")
+        pq.write_table(table, tmp_part)
+        os.replace(tmp_part, part)
+
+    def close(self) -> None:
+        pass
+
+
+class ScreeningCheckpoint:
+    """Progress marker written atomically after each chunk."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+
+    def save(self, state: Dict[str, Any]) -> None:
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp-{os.getpid()}")
+        tmp_path.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+def run_bulk_screening(
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = 200,
+    text_column: str = "text",
+    id_column: Optional[str] = None,
+    output_format: Optional[str] = None,
+    checkpoint_path: Optional[Union[str, Path]] = None,
+    resume: bool = False,
+    factory_kwargs: Optional[Dict[str, Any]] = None,
+    generate_variants: bool = False,
+    progress_every: int = 10,
+) -> Dict[str, Any]:
+    """
+    Screen every record of ``input_path`` and write results to ``output_path``.
+
+    Args:
+        input_path: CSV/TSV or JSONL file with payment descriptions
+        output_path: JSONL file, or Parquet directory when ``output_format``
+            is ``"parquet"`` (inferred from a ``.parquet`` suffix)
+        workers: Worker processes (default: CPU count); 0 screens in-process
+        chunk_size: Records per task sent to a worker
+        text_column: CSV column holding the text
+        id_column: CSV column holding the record id
+        checkpoint_path: Checkpoint file (default: ``<output>.checkpoint.json``)
+        resume: Continue from the checkpoint instead of starting over
+        factory_kwargs: ``OrchestratorFactory.create_orchestrator`` options
+        generate_variants: Generate variants for each record
+        progress_every: Log throughput every N chunks
+
+    Returns:
+        Run statistics (records, chunks, elapsed seconds, records per second)
+    """
+    input_path, output_path = Path(input_path), Path(output_path)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    output_format = output_format or ("parquet" if output_path.suffix == ".parquet" else "jsonl")
+    factory_kwargs = {**DEFAULT_FACTORY_KWARGS, **(factory_kwargs or {})}
+    process_kwargs = {"generate_variants": generate_variants, "generate_embeddings": False}
+
+    checkpoint = ScreeningCheckpoint(
+        checkpoint_path or output_path.with_name(output_path.name + ".checkpoint.json")
+    )
+    state = {
+        "input": str(input_path.resolve()),
+        "chunk_size": chunk_size,
+        "chunks_done": 0,
+        "records_done": 0,
+        "output_offset": 0,
+    }
+    resume_offset = None
+    if resume:
+        saved = checkpoint.load()
+        if saved:
+            if saved.get("input") != state["input"] or saved.get("chunk_size") != chunk_size:
+                raise ValueError("Checkpoint was written for a different input or chunk size")
+            state = saved
+            resume_offset = saved["output_offset"]
+            logger.info(
+                f"Resuming bulk screening after {state['chunks_done']} chunks "
+                f"({state['records_done']} records)"
+            )
+
+    writer_cls = ParquetResultWriter if output_format == "parquet" else JsonlResultWriter
+    writer = writer_cls(output_path, resume_offset=resume_offset)
+
+    records = read_records(input_path, text_column=text_column, id_column=id_column)
+    chunks = enumerate(_chunked(records, chunk_size))
+    for _ in islice(chunks, state["chunks_done"]):
+        pass
+
+    start_time = time.time()
+    screened = 0
+
+    def _commit(chunk_index: int, rows: List[Dict[str, Any]]) -> None:
+        nonlocal screened
+        writer.write(rows, chunk_index)
+        screened += len(rows)
+        state.update(
+            chunks_done=chunk_index + 1,
+            records_done=state["records_done"] + len(rows),
+            output_offset=writer.offset,
+            updated_at=time.time(),
+        )
+        checkpoint.save(state)
+        if progress_every and (chunk_index + 1) % progress_every == 0:
+            elapsed = time.time() - start_time
+            logger.info(
+                f"Screened {state['records_done']} records "
+                f"({screened / elapsed if elapsed else 0.0:.1f} rec/s)"
+            )
+
+    try:
+        if workers <= 0:
+            _init_worker(factory_kwargs, process_kwargs)
+            for chunk_index, chunk in chunks:
+                _commit(chunk_index, _screen_chunk(chunk))
+        else:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+            if context.get_start_method() == "fork":
+                _warm_shared_state(factory_kwargs)
+            with context.Pool(workers, initializer=_init_worker, initargs=(factory_kwargs, process_kwargs)) as pool:
+                # Bounded read-ahead: memory stays flat regardless of input size
+                pending: deque = deque()
+                for chunk_index, chunk in chunks:
+                    pending.append((chunk_index, pool.apply_async(_screen_chunk, (chunk,))))
+                    if len(pending) >= workers * 2:
+                        index, task = pending.popleft()
+                        _commit(index, task.get())
+                while pending:
+                    index, task = pending.popleft()
+                    _commit(index, task.get())
+    finally:
+        writer.close()
+
+    elapsed = time.time() - start_time
+    stats = {
+        "records": state["records_done"],
+        "records_this_run": screened,
+        "chunks": state["chunks_done"],
+        "elapsed_seconds": round(elapsed, 3),
+        "records_per_second": round(screened / elapsed, 1) if elapsed else 0.0,
+        "workers": workers,
+        "output": str(output_path),
+        "checkpoint": str(checkpoint.path),
+    }
+    logger.info(
+        f"Bulk screening finished: {screened} records in {elapsed:.1f}s "
+        f"({stats['records_per_second']} rec/s, {workers} workers)"
+    )
+    return stats
@@ -0,0 +1,125 @@
+"""
+End-to-end screening result cache for the orchestrator.
+
+Payment descriptions repeat heavily (payroll, utility payees), so the full
+``process()`` result is cached under:
+
+- the sanitized text,
+- a hash of the effective ``FeatureFlags`` and processing options,
+- the screening data stamp from ``utils.data_version``.
+
+Reloading sanctions data, AC patterns, the INN cache or the watchlist index
+advances the data stamp. Entries built on older data are then unreachable,
+and the cache drops them on its next access.
+
+Updates to the Elasticsearch indices do not advance the stamp; only the TTL
+bounds how long a result can lag them. The cache is therefore disabled by
+default (ENABLE_RESULT_CACHE) and its default TTL is short.
+"""
+
+import threading
+from copy import deepcopy
+from typing import Any, Dict, Optional, Tuple
+
+from ..utils.data_version import get_data_stamp, get_data_versions
+from ..utils.feature_flags import FeatureFlags
+from ..utils.lru_cache_ttl import LruTtlCache, create_flags_hash
+
+ResultCacheKey = Tuple[str, str, str, int]
+
+
+class ProcessingResultCache:
+    """Bounded LRU/TTL cache of successful processing results."""
+
+    def __init__(self, maxsize: int = 10000, ttl_seconds: int = 60):
+        """
+        Initialize result cache.
+
+        Args:
+            maxsize: Maximum number of cached results
+            ttl_seconds: Time to live for cached results in seconds
+        """
+        self._cache = LruTtlCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+        self._lock = threading.Lock()
+        self._data_stamp = get_data_stamp()
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._invalidations = 0
+
+    def make_key(
+        self, sanitized_text: str, feature_flags: FeatureFlags, options: Dict[str, Any]
+    ) -> ResultCacheKey:
+        """Build the cache key for one request."""
+        return (
+            sanitized_text,
+            create_flags_hash(feature_flags.to_dict()),
+            create_flags_hash(options),
+            get_data_stamp(),
+        )
+
+    def get(self, key: ResultCacheKey, original_text: Optional[str] = None) -> Optional[Any]:
+        """
+        Return a copy of the cached result, or None.
+
+        Args:
+            key: Key from ``make_key``
+            original_text: Text of the current request; inputs that sanitize
+                to the same key share an entry but keep their own original text
+        """
+        self._check_data_stamp()
+        hit, result = self._cache.get(key)
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+        if not hit:
+            return None
+        # Deep copy: callers overwrite fields such as processing_time and may
+        # mutate candidates, trace or tokens
+        result = deepcopy(result)
+        if original_text is not None:
+            result.original_text = original_text
+        return result
+
+    def set(self, key: ResultCacheKey, result: Any) -> None:
+        """Store a result unless the data changed while it was being computed."""
+        if key[-1] != get_data_stamp():
+            return
+        # The caller keeps and may mutate the result it just computed
+        self._cache.set(key, deepcopy(result))
+        with self._lock:
+            self._stores += 1
+
+    def clear(self) -> None:
+        """Drop all cached results (counters are kept)."""
+        self._cache.clear()
+
+    def _check_data_stamp(self) -> None:
+        stamp = get_data_stamp()
+        if stamp == self._data_stamp:
+            return
+        with self._lock:
+            if stamp == self._data_stamp:
+                return
+            self._data_stamp = stamp
+            self._invalidations += 1
+        self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit ratio, size and the data versions current entries were built on."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._cache),
+                "maxsize": self._cache.maxsize,
+                "ttl_seconds": self._cache.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "stores": self._stores,
+                "invalidations": self._invalidations,
+                "data_stamp": self._data_stamp,
+                "data_versions": get_data_versions(),
+            }
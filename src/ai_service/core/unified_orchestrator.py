@@ -19,10 +19,12 @@ Layers implemented:
 
 import asyncio
 import time
+from copy import copy
 from typing import Any, Dict, List, Optional
 
-from ..config import SERVICE_CONFIG
+from ..config import PERFORMANCE_CONFIG, SERVICE_CONFIG
 from ..utils.feature_flags import FeatureFlags
+from ..utils.text_profile import TextProfile
 from ..contracts.base_contracts import (
     EmbeddingsServiceInterface,
     LanguageDetectionInterface,
@@ -56,6 +58,7 @@ from ..contracts.decision_contracts import (
 )
 from ..contracts.trace_models import SearchTrace, SearchTraceBuilder
 from ..core.decision_engine import DecisionEngine
+from ..core.result_cache import ProcessingResultCache
 from ..config.settings import DecisionConfig
 from ..layers.normalization.homoglyph_detector import HomoglyphDetector
 from ..exceptions import InternalServerError, ServiceInitializationError
@@ -64,6 +67,9 @@ from ..monitoring.metrics_service import MetricsService, MetricType, AlertSeveri
 
 logger = get_logger(__name__)
 
+# Maximum homoglyph permutation searches in flight per request
+HOMOGLYPH_SEARCH_CONCURRENCY = 4
+
 
 class UnifiedOrchestrator:
     """
@@ -96,6 +102,7 @@ class UnifiedOrchestrator:
         enable_decision_engine: Optional[bool] = None,
         enable_search: Optional[bool] = None,
         allow_smart_filter_skip: Optional[bool] = None,
+        result_cache: Optional[ProcessingResultCache] = None,
     ):
         # Validate required services are not None
         if validation_service is None:
@@ -150,6 +157,14 @@ class UnifiedOrchestrator:
 
         self.default_feature_flags = default_feature_flags or FeatureFlags()
 
+        # End-to-end result cache, used by process(cache_result=True)
+        if result_cache is None and PERFORMANCE_CONFIG.enable_result_cache:
+            result_cache = ProcessingResultCache(
+                maxsize=PERFORMANCE_CONFIG.result_cache_size,
+                ttl_seconds=PERFORMANCE_CONFIG.result_cache_ttl,
+            )
+        self.result_cache = result_cache
+
         # Initialize homoglyph detector for search query normalization
         self.homoglyph_detector = HomoglyphDetector()
 
@@ -258,6 +273,8 @@ class UnifiedOrchestrator:
 
         validation_result = await self._maybe_await(self.validation_service.validate_and_sanitize(text))
         context.sanitized_text = validation_result.get("sanitized_text", text)
+        # Computed lazily; the normalization layers read it instead of rescanning the text
+        context.text_profile = TextProfile(context.sanitized_text or "")
 
         # Debug trace for lengths
         logger.debug(f"Validation: input_len={self._safe_len(text)}, sanitized_len={self._safe_len(context.sanitized_text)}")
@@ -324,7 +341,8 @@ class UnifiedOrchestrator:
         from ..config import LANGUAGE_CONFIG
         lang_raw = await self._maybe_await(self.language_service.detect_language_config_driven(
             context.sanitized_text,  # Use original text to preserve Ukrainian/Russian markers
-            LANGUAGE_CONFIG
+            LANGUAGE_CONFIG,
+            profile=context.text_profile,
         ))
 
         # Coerce language result to dict format
@@ -365,6 +383,8 @@ class UnifiedOrchestrator:
             text_u = unicode_result
         else:
             text_u = unicode_result.get("normalized", text_in)
+        # Later layers work on text_u; keep the profile if normalization left the text as is
+        context.text_profile = TextProfile.for_text(text_u or "", context.text_profile)
 
         # Debug trace for lengths
         logger.debug(f"Unicode: input_len={self._safe_len(text_in)}, normalized_len={self._safe_len(text_u)}")
@@ -431,6 +451,7 @@ class UnifiedOrchestrator:
             preserve_names=preserve_names,
             enable_advanced_features=enable_advanced_features,
             feature_flags=feature_flags,
+            text_profile=context.text_profile,
         ))
 
         # Record normalization metrics
@@ -650,11 +671,14 @@ class UnifiedOrchestrator:
 
                 if self.homoglyph_detector and query.strip():
                     original_query = query
+                    query_profile = TextProfile(query)
                     # Detect homoglyphs first
-                    homoglyph_result = self.homoglyph_detector.detect_homoglyphs(query)
+                    homoglyph_result = self.homoglyph_detector.detect_homoglyphs(query, query_profile)
                     if homoglyph_result and homoglyph_result.get('has_homoglyphs', False):
                         # Normalize homoglyphs for search
-                        normalized_query, transformations = self.homoglyph_detector.normalize_homoglyphs(query)
+                        normalized_query, transformations = self.homoglyph_detector.normalize_homoglyphs(
+                            query, query_profile
+                        )
                         if normalized_query != original_query:
                             query = normalized_query
                             is_homoglyph_case = True
@@ -696,37 +720,28 @@ class UnifiedOrchestrator:
                             if is_homoglyph_case and len(search_queries) > 1:
                                 # Try all permutations for homoglyph cases
                                 print(f"🔄 HOMOGLYPH MULTI-SEARCH: Trying {len(search_queries)} permutations")
-                                all_results = []
                                 best_candidates = []
                                 best_score = 0.0
 
-                                for i, search_query in enumerate(search_queries):
-                                    # Create modified normalization result for this query
-                                    modified_norm_result = self._create_modified_norm_result(norm_result, search_query)
-
-                                    try:
-                                        perm_candidates = await self.search_service.find_candidates(
-                                            normalized=modified_norm_result,
-                                            text=original_text,
-                                            opts=search_opts
-                                        )
-
-                                        if perm_candidates:
-                                            # Get best score from this permutation
-                                            max_score = max((getattr(c, 'score', 0.0) or getattr(c, 'final_score', 0.0))
-                                                          for c in perm_candidates)
-                                            print(f"   Permutation {i+1}: '{search_query}' → {len(perm_candidates)} results, best score: {max_score:.3f}")
-
-                                            # Keep best results
-                                            if max_score > best_score:
-                                                best_score = max_score
-                                                best_candidates = perm_candidates
-                                                print(f"   🏆 NEW BEST: '{search_query}' with score {max_score:.3f}")
-                                        else:
-                                            print(f"   Permutation {i+1}: '{search_query}' → No results")
-
-                                    except Exception as perm_e:
-                                        print(f"   Permutation {i+1}: '{search_query}' → Error: {perm_e}")
+                                perm_results = await self._search_permutations(
+                                    norm_result, search_queries, original_text, search_opts
+                                )
+                                for i, (search_query, perm_candidates) in enumerate(zip(search_queries, perm_results)):
+                                    if isinstance(perm_candidates, BaseException):
+                                        print(f"   Permutation {i+1}: '{search_query}' → Error: {perm_candidates}")
+                                    elif perm_candidates:
+                                        # Get best score from this permutation
+                                        max_score = max((getattr(c, 'score', 0.0) or getattr(c, 'final_score', 0.0))
+                                                      for c in perm_candidates)
+                                        print(f"   Permutation {i+1}: '{search_query}' → {len(perm_candidates)} results, best score: {max_score:.3f}")
+
+                                        # Keep best results
+                                        if max_score > best_score:
+                                            best_score = max_score
+                                            best_candidates = perm_candidates
+                                            print(f"   🏆 NEW BEST: '{search_query}' with score {max_score:.3f}")
+                                    else:
+                                        print(f"   Permutation {i+1}: '{search_query}' → No results")
 
                                 candidates.extend(best_candidates)
                                 print(f"✅ HOMOGLYPH SEARCH COMPLETED: {len(best_candidates)} candidates, best score: {best_score:.3f}")
@@ -1014,6 +1029,31 @@ class UnifiedOrchestrator:
             if validation_result is not None:  # Early return if validation failed
                 return validation_result
 
+            # Result cache lookup, keyed on the sanitized text
+            result_cache_key = None
+            if cache_result and self.result_cache is not None:
+                result_cache_key = self.result_cache.make_key(
+                    context.sanitized_text or text,
+                    effective_flags,
+                    {
+                        "remove_stop_words": remove_stop_words,
+                        "preserve_names": preserve_names,
+                        "enable_advanced_features": enable_advanced_features,
+                        "language_hint": language_hint,
+                        "generate_variants": generate_variants,
+                        "generate_embeddings": generate_embeddings,
+                        "search_trace_enabled": search_trace_enabled,
+                    },
+                )
+                cached_result = self.result_cache.get(result_cache_key, context.original_text)
+                if cached_result is not None:
+                    cached_result.processing_time = time.time() - start_time
+                    if self.metrics_service:
+                        self.metrics_service.record_counter('processing.result_cache.hits', 1)
+                        self.metrics_service.record_gauge('processing.requests.active', -1)
+                    self.update_stats(cached_result.processing_time, cache_hit=True, error=False)
+                    return cached_result
+
             # ================================================================
             # Layer 2: Smart Filter (optional skip)
             # ================================================================
@@ -1136,6 +1176,11 @@ class UnifiedOrchestrator:
                     self.cache_service.set(cache_key, result)
                 except Exception as e:
                     logger.debug(f"Cache set failed: {e}")
+            if result_cache_key is not None and result.success:
+                try:
+                    self.result_cache.set(result_cache_key, result)
+                except Exception as e:
+                    logger.debug(f"Result cache set failed: {e}")
 
             return result
 
@@ -1486,6 +1531,8 @@ class UnifiedOrchestrator:
     # Legacy compatibility methods for old tests
     def clear_cache(self):
         """Legacy method for cache clearing"""
+        if self.result_cache is not None:
+            self.result_cache.clear()
         if hasattr(self.cache_service, 'clear'):
             self.cache_service.clear()
         logger.warning("clear_cache is deprecated. Use cache_service directly.")
@@ -1548,26 +1595,97 @@ class UnifiedOrchestrator:
         """Legacy method alias for updating statistics"""
         self.update_stats(processing_time, cache_hit, error)
 
-    async def process_batch(self, texts: List[str], **kwargs) -> List[UnifiedProcessingResult]:
-        """Legacy method for batch processing"""
-        logger.warning("process_batch is deprecated. Use individual process() calls with asyncio.gather.")
-        results = []
-        for text in texts:
-            try:
-                result = await self.process(text, **kwargs)
-                results.append(result)
-            except Exception as e:
-                # Create error result
-                error_result = UnifiedProcessingResult(
-                    original_text=text,
-                    language="en",
-                    language_confidence=0.0,
-                    normalized_text=text,
-                    success=False,
-                    errors=[str(e)]
-                )
-                results.append(error_result)
-        return results
+    async def process_batch(
+        self, texts: List[str], max_concurrent: Optional[int] = None, **kwargs
+    ) -> List[UnifiedProcessingResult]:
+        """
+        Process a batch of texts concurrently.
+
+        Items run through ``process()`` with at most ``max_concurrent`` in
+        flight (default PERFORMANCE_CONFIG.max_concurrent_requests). The
+        embedding stage is taken out of the per-item pipeline and run as one
+        ``encode_batch`` call over all normalized texts. ES searches issued by
+        concurrent items are coalesced into ``_msearch`` when the search layer
+        has ``enable_msearch_batching`` set.
+
+        Args:
+            texts: Texts to process
+            max_concurrent: Maximum items processed at the same time
+            **kwargs: Options passed to ``process()``
+
+        Returns:
+            One result per text, in input order. A failing item yields a
+            ``success=False`` result with its error instead of failing the batch.
+        """
+        limit = max(1, max_concurrent or PERFORMANCE_CONFIG.max_concurrent_requests)
+        semaphore = asyncio.Semaphore(limit)
+
+        generate_embeddings = kwargs.pop("generate_embeddings", None)
+        if kwargs.get("embeddings") is not None:
+            generate_embeddings = kwargs.pop("embeddings")
+        batch_embeddings = (
+            (generate_embeddings is True or (generate_embeddings is None and self.enable_embeddings))
+            and self.embeddings_service is not None
+            and hasattr(self.embeddings_service, "encode_batch")
+        )
+        if batch_embeddings:
+            generate_embeddings = False
+
+        async def process_one(text: str) -> UnifiedProcessingResult:
+            async with semaphore:
+                try:
+                    return await self.process(text, generate_embeddings=generate_embeddings, **kwargs)
+                except Exception as e:
+                    return UnifiedProcessingResult(
+                        original_text=text,
+                        language="en",
+                        language_confidence=0.0,
+                        normalized_text=text,
+                        success=False,
+                        errors=[str(e)]
+                    )
+
+        results = await asyncio.gather(*(process_one(text) for text in texts))
+
+        if batch_embeddings:
+            await self._embed_batch_results(results)
+
+        return list(results)
+
+    async def _embed_batch_results(self, results: List[UnifiedProcessingResult]) -> None:
+        """Attach embeddings to batch results with a single encode_batch call."""
+        targets = [r for r in results if r.success and r.normalized_text]
+        if not targets:
+            return
+
+        layer_start = time.time()
+        vectors = None
+        try:
+            loop = asyncio.get_running_loop()
+            vectors = await loop.run_in_executor(
+                None, self.embeddings_service.encode_batch, [r.normalized_text for r in targets]
+            )
+        except Exception as e:
+            logger.warning(f"Batch embedding generation failed: {e}")
+
+        if vectors is not None and len(vectors) == len(targets):
+            for result, vector in zip(targets, vectors):
+                result.embeddings = vector
+        else:
+            # encode_batch skips texts that preprocess to nothing, so vectors
+            # can't be matched back to items; embed them one by one instead
+            for result in targets:
+                try:
+                    result.embeddings = await self._maybe_await(
+                        self.embeddings_service.generate_embeddings(result.normalized_text)
+                    )
+                except Exception as e:
+                    # Same as process(): embeddings are optional, the item still succeeds
+                    logger.warning(f"Embedding generation failed: {e}")
+                    result.errors.append(f"Embeddings: {str(e)}")
+
+        if self.metrics_service:
+            self.metrics_service.record_timer('processing.layer.embeddings', time.time() - layer_start)
 
     def _validate_and_normalize_flags(self, feature_flags: Optional[FeatureFlags]) -> FeatureFlags:
         """
@@ -1836,16 +1954,41 @@ class UnifiedOrchestrator:
             logger.error(f"Emergency fuzzy search completely failed: {e}")
             return []
 
+    async def _search_permutations(self, norm_result, search_queries, original_text, search_opts):
+        """
+        Run find_candidates for every homoglyph permutation concurrently.
+
+        At most HOMOGLYPH_SEARCH_CONCURRENCY searches are in flight, so a
+        spoofed input costs roughly one search round-trip instead of N.
+
+        Returns:
+            One entry per query, in order: candidate list or the raised
+            exception (a BaseException, e.g. CancelledError for a cancelled search)
+        """
+        semaphore = asyncio.Semaphore(HOMOGLYPH_SEARCH_CONCURRENCY)
+
+        async def search_one(search_query):
+            async with semaphore:
+                return await self.search_service.find_candidates(
+                    normalized=self._create_modified_norm_result(norm_result, search_query),
+                    text=original_text,
+                    opts=search_opts
+                )
+
+        return await asyncio.gather(
+            *(search_one(search_query) for search_query in search_queries),
+            return_exceptions=True,
+        )
+
     def _create_modified_norm_result(self, norm_result, new_normalized_text):
         """
         Create modified normalization result with different normalized text.
 
         Used for homoglyph permutation searches to try different name orders.
         """
-        from copy import deepcopy
-
-        # Create a copy of the normalization result
-        modified_result = deepcopy(norm_result)
+        # Shallow copy: only ``normalized`` and ``tokens`` are replaced below,
+        # everything else (trace, spans, ...) is shared read-only with the original
+        modified_result = copy(norm_result)
 
         # Update the normalized text
         modified_result.normalized = new_normalized_text
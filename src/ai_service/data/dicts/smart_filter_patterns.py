@@ -1137,6 +1137,192 @@ COMPANY_KEYWORDS = {
     ],
 }
 
+# Банковские и финансовые термины для определения компаний
+BANKING_TERMS = {
+    "ukrainian": [
+        "банк",
+        "банківська",
+        "банківський",
+        "банківське",
+        "кредитний",
+        "кредитна",
+        "кредитне",
+        "фінансовий",
+        "фінансова",
+        "фінансове",
+        "фінансові",
+        "операції",
+        "програми",
+        "інвестиційний",
+        "інвестиційна",
+        "інвестиційне",
+        "страховий",
+        "страхова",
+        "страхове",
+        "лізинговий",
+        "лізингова",
+        "лізингове",
+        "факторинговий",
+        "факторингова",
+        "факторингове",
+        "мікрофінанс",
+        "мікрокредит",
+        "платіжний",
+        "платіжна",
+        "платіжне",
+        "розрахунковий",
+        "розрахункова",
+        "розрахункове",
+        "депозитний",
+        "депозитна",
+        "депозитне",
+        "валютний",
+        "валютна",
+        "валютне",
+        "біржовий",
+        "біржова",
+        "біржове",
+        "брокерський",
+        "брокерська",
+        "брокерське",
+        "трастовий",
+        "трастова",
+        "трастове",
+        "клірингова",
+        "клірингове",
+        "клірингової",
+        "національний банк",
+        "центральний банк",
+        "комерційний банк",
+        "ощадний банк",
+        "приват банк",
+        "альфа банк",
+        "укрексімбанк",
+        "ощадбанк",
+        "райффайзен",
+        "кредитспілка",
+        "кредитна спілка",
+        "ломбард",
+        "мікрофінансова організація",
+    ],
+    "russian": [
+        "банк",
+        "банковская",
+        "банковский",
+        "банковское",
+        "кредитный",
+        "кредитная",
+        "кредитное",
+        "финансовый",
+        "финансовая",
+        "финансовое",
+        "инвестиционный",
+        "инвестиционная",
+        "инвестиционное",
+        "страховой",
+        "страховая",
+        "страховое",
+        "лизинговый",
+        "лизинговая",
+        "лизинговое",
+        "факторинговый",
+        "факторинговая",
+        "факторинговое",
+        "микрофинанс",
+        "микрокредит",
+        "платежный",
+        "платежная",
+        "платежное",
+        "расчетный",
+        "расчетная",
+        "расчетное",
+        "депозитный",
+        "депозитная",
+        "депозитное",
+        "валютный",
+        "валютная",
+        "валютное",
+        "биржевой",
+        "биржевая",
+        "биржевое",
+        "брокерский",
+        "брокерская",
+        "брокерское",
+        "трастовый",
+        "трастовая",
+        "трастовое",
+        "клиринговая",
+        "клиринговое",
+        "клиринговой",
+        "национальный банк",
+        "центральный банк",
+        "коммерческий банк",
+        "сберегательный банк",
+        "приват банк",
+        "альфа банк",
+        "сбербанк",
+        "втб",
+        "газпромбанк",
+        "россельхозбанк",
+        "кредитный союз",
+        "ломбард",
+        "микрофинансовая организация",
+    ],
+    "english": [
+        "bank",
+        "banking",
+        "financial",
+        "finance",
+        "investment",
+        "credit",
+        "loan",
+        "insurance",
+        "leasing",
+        "factoring",
+        "microfinance",
+        "microcredit",
+        "payment",
+        "settlement",
+        "deposit",
+        "currency",
+        "exchange",
+        "trading",
+        "brokerage",
+        "trust",
+        "clearing",
+        "custodial",
+        "wealth",
+        "asset",
+        "fund",
+        "capital",
+        "national bank",
+        "central bank",
+        "commercial bank",
+        "savings bank",
+        "investment bank",
+        "private bank",
+        "retail bank",
+        "corporate bank",
+        "development bank",
+        "jpmorgan",
+        "goldman sachs",
+        "morgan stanley",
+        "wells fargo",
+        "bank of america",
+        "credit union",
+        "credit card",
+        "debit card",
+        "atm",
+        "swift",
+        "wire transfer",
+        "correspondent bank",
+        "nostro",
+        "vostro",
+        "clearing house",
+        "settlement system",
+    ],
+}
+
 # Паттерны для определения компаний
 COMPANY_PATTERNS = {
     "legal_entities": [
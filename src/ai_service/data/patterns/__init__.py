@@ -38,6 +38,13 @@ from .identifiers import (
     validate_vat,
 )
 
+from .identifier_scanner import (
+    IdentifierScan,
+    IdentifierScanner,
+    get_identifier_scanner,
+    scan_identifiers,
+)
+
 from .dates import (
     DATE_PATTERNS,
     MONTH_NAMES,
@@ -80,6 +87,12 @@ __all__ = [
     "validate_ssn",
     "validate_swift_bic",
     "validate_vat",
+
+    # Identifier scanner
+    "IdentifierScan",
+    "IdentifierScanner",
+    "get_identifier_scanner",
+    "scan_identifiers",
     
     # Dates
     "DATE_PATTERNS",
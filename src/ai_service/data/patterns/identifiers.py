@@ -40,6 +40,10 @@ class IdentifierPattern:
     pattern: str
     description: str
     validation_func: str = None
+    # Lowercase keywords of which at least one must occur in the text for the
+    # pattern to match (empty for context-free patterns). IdentifierScanner
+    # uses them to skip patterns that cannot match.
+    cues: Tuple[str, ...] = ()
 
 
 # Identifier patterns by type
@@ -49,31 +53,36 @@ IDENTIFIER_PATTERNS = [
         name="INN_UA_8",
         type="inn",
         pattern=r"\b(?:ИНН|інн|ІПН|inn|ідентифікаційний\s+номер)[:\s]*(\d{8})\b",
-        description="Ukrainian INN 8 digits"
+        description="Ukrainian INN 8 digits",
+        cues=("инн", "інн", "іпн", "inn", "ідентифікаційний")
     ),
     IdentifierPattern(
         name="INN_UA_10", 
         type="inn",
         pattern=r"\b(?:ИНН|інн|ІПН|inn|ідентифікаційний\s+номер)[:\s]*(\d{10})\b",
-        description="Ukrainian INN 10 digits"
+        description="Ukrainian INN 10 digits",
+        cues=("инн", "інн", "іпн", "inn", "ідентифікаційний")
     ),
     IdentifierPattern(
         name="INN_UA_12",
         type="inn", 
         pattern=r"\b(?:ИНН|інн|ІПН|inn|ідентифікаційний\s+номер)[:\s]*(\d{12})\b",
-        description="Ukrainian INN 12 digits"
+        description="Ukrainian INN 12 digits",
+        cues=("инн", "інн", "іпн", "inn", "ідентифікаційний")
     ),
     IdentifierPattern(
         name="EDRPOU_6",
         type="edrpou",
         pattern=r"\b(?:ЄДРПОУ|едрпou|edrpou|єдиний\s+державний\s+реєстр)[:\s]*(\d{6})\b",
-        description="Ukrainian EDRPOU 6 digits"
+        description="Ukrainian EDRPOU 6 digits",
+        cues=("єдрпоу", "едрпou", "edrpou", "єдиний")
     ),
     IdentifierPattern(
         name="EDRPOU_8",
         type="edrpou", 
         pattern=r"\b(?:ЄДРПОУ|едрпou|edrpou|єдиний\s+державний\s+реєстр)[:\s]*(\d{8})\b",
-        description="Ukrainian EDRPOU 8 digits"
+        description="Ukrainian EDRPOU 8 digits",
+        cues=("єдрпоу", "едрпou", "edrpou", "єдиний")
     ),
     
     # Russian patterns
@@ -81,25 +90,29 @@ IDENTIFIER_PATTERNS = [
         name="INN_RU_10",
         type="inn",
         pattern=r"\b(?:ИНН|инн|inn|идентификационный\s+номер)[:\s]*(\d{10})\b",
-        description="Russian INN 10 digits"
+        description="Russian INN 10 digits",
+        cues=("инн", "inn", "идентификационный")
     ),
     IdentifierPattern(
         name="INN_RU_12",
         type="inn",
         pattern=r"\b(?:ИНН|инн|inn|идентификационный\s+номер)[:\s]*(\d{12})\b", 
-        description="Russian INN 12 digits"
+        description="Russian INN 12 digits",
+        cues=("инн", "inn", "идентификационный")
     ),
     IdentifierPattern(
         name="OGRN_13",
         type="ogrn",
         pattern=r"\b(?:ОГРН|огрн|ogrn|основной\s+государственный\s+регистрационный\s+номер)[:\s]*(\d{13})\b",
-        description="Russian OGRN 13 digits"
+        description="Russian OGRN 13 digits",
+        cues=("огрн", "ogrn", "основной")
     ),
     IdentifierPattern(
         name="OGRNIP_15",
         type="ogrnip",
         pattern=r"\b(?:ОГРНИП|огрнип|ogrnip|основной\s+государственный\s+регистрационный\s+номер\s+индивидуального\s+предпринимателя)[:\s]*(\d{15})\b",
-        description="Russian OGRNIP 15 digits"
+        description="Russian OGRNIP 15 digits",
+        cues=("огрнип", "ogrnip", "основной")
     ),
     
     # International patterns
@@ -107,7 +120,8 @@ IDENTIFIER_PATTERNS = [
         name="VAT_EU",
         type="vat",
         pattern=r"\b(?:VAT|vat|НДС|ндс|пдв|ПДВ)[:\s]*([A-Z]{2}\d{8,12})\b",
-        description="EU VAT number"
+        description="EU VAT number",
+        cues=("vat", "ндс", "пдв")
     ),
     IdentifierPattern(
         name="LEI",
@@ -125,13 +139,15 @@ IDENTIFIER_PATTERNS = [
         name="SWIFT_BIC",
         type="swift_bic",
         pattern=r"\b(?:SWIFT|BIC|SWIFT/BIC|МФО|MFO)[:\s]*([A-Z]{4}[A-Z]{2}[A-Z0-9]{2}(?:[A-Z0-9]{3})?)\b",
-        description="SWIFT/BIC code"
+        description="SWIFT/BIC code",
+        cues=("swift", "bic", "мфо", "mfo")
     ),
     IdentifierPattern(
         name="EIN_US",
         type="ein",
         pattern=r"\b(?:EIN|ein|федеральный\s+налоговый\s+номер)[:\s]*(\d{2}-\d{7})\b",
-        description="US Employer Identification Number"
+        description="US Employer Identification Number",
+        cues=("ein", "федеральный")
     ),
 
     # TIN patterns (Taxpayer Identification Number)
@@ -139,13 +155,15 @@ IDENTIFIER_PATTERNS = [
         name="TIN_US_9",
         type="inn",
         pattern=r"\b(?:TIN|tin|taxpayer\s+identification\s+number)[:\s]*(\d{9})\b",
-        description="US TIN 9 digits"
+        description="US TIN 9 digits",
+        cues=("tin", "taxpayer")
     ),
     IdentifierPattern(
         name="TIN_US_10",
         type="inn",
         pattern=r"\b(?:TIN|tin|taxpayer\s+identification\s+number)[:\s]*(\d{10})\b",
-        description="US TIN 10 digits"
+        description="US TIN 10 digits",
+        cues=("tin", "taxpayer")
     ),
 
     IdentifierPattern(
@@ -160,37 +178,43 @@ IDENTIFIER_PATTERNS = [
         name="PASSPORT_RF_DIRECT",
         type="passport_rf",
         pattern=r"\b(?:паспорт|серия|passport|series)[:\s]*([А-ЯA-Z]{2}\s*\d{6})\b",
-        description="Russian passport with direct context"
+        description="Russian passport with direct context",
+        cues=("паспорт", "серия", "passport", "series")
     ),
     IdentifierPattern(
         name="PASSPORT_RF_SERIES_NUMBER",
         type="passport_rf",
         pattern=r"\bсерия\s+([А-ЯA-Z]{2})\s+номер\s+(\d{6})\b",
-        description="Russian passport series AA номер ######"
+        description="Russian passport series AA номер ######",
+        cues=("серия",)
     ),
     IdentifierPattern(
         name="PASSPORT_RF_CONTEXT",
         type="passport_rf",
         pattern=r"(?:паспорт|документ|series|passport).*?([А-ЯA-Z]{2}\s*\d{6})",
-        description="Russian passport in sentence context"
+        description="Russian passport in sentence context",
+        cues=("паспорт", "документ", "series", "passport")
     ),
     IdentifierPattern(
         name="PASSPORT_UA_DIRECT",
         type="passport_ua",
         pattern=r"\b(?:паспорт|серія|passport)[:\s]*([А-ЯA-Z]{2}\s*\d{6})\b",
-        description="Ukrainian passport series-number (old format)"
+        description="Ukrainian passport series-number (old format)",
+        cues=("паспорт", "серія", "passport")
     ),
     IdentifierPattern(
         name="PASSPORT_UA_ID_CARD",
         type="passport_ua",
         pattern=r"\b(?:ID[\s-]?карт[аи]|айді[\s-]?карт[аи]|паспорт|id[\s-]?card)[:\s]*(\d{9})\b",
-        description="Ukrainian ID card (9 digits)"
+        description="Ukrainian ID card (9 digits)",
+        cues=("карт", "паспорт", "card")
     ),
     IdentifierPattern(
         name="PASSPORT_UA_GENERIC_9",
         type="passport_ua",
         pattern=r"\b(\d{9})\b(?=.*(?:паспорт|серія|passport|карт|id|документ))",
-        description="Ukrainian ID card number in context"
+        description="Ukrainian ID card number in context",
+        cues=("паспорт", "серія", "passport", "карт", "id", "документ")
     ),
 
     # Generic patterns (context-free)
@@ -198,31 +222,36 @@ IDENTIFIER_PATTERNS = [
         name="INN_GENERIC_8",
         type="inn",
         pattern=r"\b(\d{8})\b(?=.*(?:ИНН|інн|ІПН|inn|tin|идентификационный|ідентифікаційний))",
-        description="Generic 8-digit INN in context"
+        description="Generic 8-digit INN in context",
+        cues=("инн", "інн", "іпн", "inn", "tin", "идентификационный", "ідентифікаційний")
     ),
     IdentifierPattern(
         name="INN_GENERIC_10",
         type="inn", 
         pattern=r"\b(\d{10})\b(?=.*(?:ИНН|інн|ІПН|inn|tin|идентификационный|ідентифікаційний))",
-        description="Generic 10-digit INN in context"
+        description="Generic 10-digit INN in context",
+        cues=("инн", "інн", "іпн", "inn", "tin", "идентификационный", "ідентифікаційний")
     ),
     IdentifierPattern(
         name="INN_GENERIC_12",
         type="inn",
         pattern=r"\b(\d{12})\b(?=.*(?:ИНН|інн|ІПН|inn|tin|идентификационный|ідентифікаційний))",
-        description="Generic 12-digit INN in context"
+        description="Generic 12-digit INN in context",
+        cues=("инн", "інн", "іпн", "inn", "tin", "идентификационный", "ідентифікаційний")
     ),
     IdentifierPattern(
         name="EDRPOU_GENERIC_6",
         type="edrpou",
         pattern=r"\b(\d{6})\b(?=.*(?:ЄДРПОУ|едрпou|edrpou|єдиний|единый))",
-        description="Generic 6-digit EDRPOU in context"
+        description="Generic 6-digit EDRPOU in context",
+        cues=("єдрпоу", "едрпou", "edrpou", "єдиний", "единый")
     ),
     IdentifierPattern(
         name="EDRPOU_GENERIC_8", 
         type="edrpou",
         pattern=r"\b(\d{8})\b(?=.*(?:ЄДРПОУ|едрпou|edrpou|єдиний|единый))",
-        description="Generic 8-digit EDRPOU in context"
+        description="Generic 8-digit EDRPOU in context",
+        cues=("єдрпоу", "едрпou", "edrpou", "єдиний", "единый")
     ),
 ]
 
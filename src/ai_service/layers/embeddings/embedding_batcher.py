@@ -0,0 +1,139 @@
+"""
+Coalesce concurrent embedding requests into batched encodes.
+
+Every search that escalates to the vector stage embeds its query on its own:
+one ``model.encode`` call with a single text, run in an executor. Under load
+those calls compete for the same CPU cores, while a sentence-transformer
+encodes a batch of texts in little more than the time of one.
+``EmbeddingBatcher`` queues texts for a short window (or until
+``max_batch_size`` texts are waiting), encodes them in one call and resolves
+each caller with its own vector. A lone request waits at most ``window_ms``
+before it is encoded.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ...utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+EncodeFn = Callable[[List[str]], Sequence[Optional[Sequence[float]]]]
+
+
+class EmbeddingBatchError(Exception):
+    """The batched encode returned no vector for a queued text."""
+
+
+class EmbeddingBatcher:
+    """Queues texts and encodes them in batches through ``encode``."""
+
+    def __init__(
+        self,
+        encode: EncodeFn,
+        max_batch_size: int = 32,
+        window_ms: float = 2.0,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Args:
+            encode: Blocking function mapping a list of texts to one vector per
+                text, in order. Runs in ``executor``.
+            max_batch_size: Texts per encode; a full queue is flushed at once
+            window_ms: How long a text waits for others to join its batch
+            executor: Executor for ``encode`` (the loop default if None)
+        """
+        self.encode = encode
+        self.max_batch_size = max_batch_size
+        self.window_seconds = window_ms / 1000
+        self.executor = executor
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._inflight: set = set()
+        self.stats = {
+            "requests": 0,
+            "encode_calls": 0,
+            "encoded_texts": 0,
+            "largest_batch": 0,
+            "failed_batches": 0,
+        }
+
+    async def embed(self, text: str) -> List[float]:
+        """
+        Queue ``text`` and wait for its vector from the next batched encode.
+
+        Raises:
+            EmbeddingBatchError: If the encode returned no vector for ``text``
+            Exception: Whatever ``encode`` raised for the whole batch
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+        self.stats["requests"] += 1
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_seconds, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._encode(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _encode(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        # Identical texts in one window (the same name screened by several
+        # requests) are encoded once
+        texts = list(dict.fromkeys(text for text, _ in batch))
+
+        self.stats["encode_calls"] += 1
+        self.stats["encoded_texts"] += len(texts)
+        self.stats["largest_batch"] = max(self.stats["largest_batch"], len(texts))
+
+        loop = asyncio.get_running_loop()
+        try:
+            vectors = await loop.run_in_executor(self.executor, self.encode, texts)
+        except BaseException as exc:
+            # Cancellation (shutdown, loop teardown) must not leave callers
+            # waiting forever either: their futures are cancelled with it
+            self.stats["failed_batches"] += 1
+            if isinstance(exc, Exception):
+                logger.error(f"Batched encode of {len(texts)} texts failed: {exc}")
+            for _, future in batch:
+                if future.done():
+                    continue
+                if isinstance(exc, Exception):
+                    future.set_exception(exc)
+                else:
+                    future.cancel()
+            if not isinstance(exc, Exception):
+                raise
+            return
+
+        by_text = dict(zip(texts, vectors or []))
+        for text, future in batch:
+            if future.done():  # caller was cancelled
+                continue
+            vector = by_text.get(text)
+            if vector is None or len(vector) == 0:
+                future.set_exception(EmbeddingBatchError("missing embedding in batched encode"))
+            else:
+                future.set_result(list(vector))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "max_batch_size": self.max_batch_size,
+            "window_ms": self.window_seconds * 1000,
+            "pending": len(self._pending),
+            **self.stats,
+        }
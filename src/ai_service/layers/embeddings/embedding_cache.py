@@ -0,0 +1,222 @@
+"""
+LRU cache of embedding vectors in a preallocated float32 buffer.
+
+``get_embedding_cache()`` returns the process-wide instance that
+``HybridSearchService`` (query vectors) and ``OptimizedEmbeddingService``
+(model outputs) share, each under its own key namespace. Compared with the
+dicts of Python float lists they used before:
+
+- vectors live in one ``(capacity, dimension)`` float32 array, allocated on
+  the first insert; an entry costs ``4 * dimension`` bytes instead of a list
+  of boxed floats;
+- eviction pops the least recently used entry from an ``OrderedDict`` and
+  reuses its row, O(1) instead of scanning every timestamp;
+- keys are 16-byte BLAKE2b digests of namespace (model name) and full text,
+  so two texts never share an entry the way ``hash(text)`` keys could;
+- an optional shared L2 tier (``utils.shared_cache``) lets uvicorn workers
+  reuse each other's vectors, stored as raw float32 bytes.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ...utils.logging_config import get_logger
+
+if TYPE_CHECKING:
+    from ...utils.shared_cache import SharedCacheNamespace
+
+logger = get_logger(__name__)
+
+
+class EmbeddingCache:
+    """Thread-safe LRU cache of fixed-dimension float32 vectors with optional TTL."""
+
+    def __init__(
+        self,
+        capacity: int,
+        dimension: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        shared: Optional["SharedCacheNamespace"] = None,
+    ):
+        """
+        Args:
+            capacity: Maximum number of vectors
+            dimension: Vector dimension; taken from the first insert if None
+            ttl_seconds: Entries older than this are misses (no expiry if None)
+            shared: Optional cross-process L2 tier, consulted on misses
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.dimension = dimension
+        self.ttl_seconds = ttl_seconds
+        self.shared = shared
+
+        self._lock = threading.Lock()
+        self._slots: "OrderedDict[bytes, int]" = OrderedDict()  # key -> row, oldest first
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+        self._vectors: Optional[np.ndarray] = None
+        self._stored_at = np.zeros(capacity, dtype=np.float64)
+        if dimension is not None:
+            self._vectors = np.zeros((capacity, dimension), dtype=np.float32)
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._rejected = 0
+        self._shared_hits = 0
+
+    @staticmethod
+    def make_key(text: str, namespace: str = "") -> bytes:
+        """Collision-safe key for ``text`` within ``namespace``."""
+        digest = blake2b(namespace.encode("utf-8"), digest_size=16)
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return digest.digest()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def get(self, text: str, namespace: str = "") -> Optional[np.ndarray]:
+        """Copy of the cached vector for ``text``, or None."""
+        key = self.make_key(text, namespace)
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is not None:
+                if self.ttl_seconds is None or time.monotonic() - self._stored_at[slot] < self.ttl_seconds:
+                    self._slots.move_to_end(key)
+                    self._hits += 1
+                    return self._vectors[slot].copy()
+                del self._slots[key]
+                self._free.append(slot)
+                self._expirations += 1
+            if self.shared is None:
+                self._misses += 1
+                return None
+
+        hit, blob = self.shared.get(key)
+        vector = np.frombuffer(blob, dtype=np.float32) if hit else None
+        with self._lock:
+            if vector is None or not self._store(key, vector):
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._shared_hits += 1
+            return vector.copy()
+
+    def put(self, text: str, vector: Sequence[float], namespace: str = "") -> bool:
+        """
+        Store ``vector`` for ``text``, evicting the least recently used entry
+        when full.
+
+        Returns:
+            False if the vector does not match the cache dimension
+        """
+        vector = np.asarray(vector, dtype=np.float32).ravel()
+        key = self.make_key(text, namespace)
+        with self._lock:
+            stored = self._store(key, vector)
+        if stored and self.shared is not None:
+            self.shared.set(key, vector.tobytes())
+        return stored
+
+    def _store(self, key: bytes, vector: np.ndarray) -> bool:
+        """Write ``vector`` into a slot (caller holds the lock)."""
+        if self._vectors is None:
+            self.dimension = vector.shape[0]
+            self._vectors = np.zeros((self.capacity, self.dimension), dtype=np.float32)
+        if vector.shape[0] != self.dimension:
+            self._rejected += 1
+            logger.debug(f"Not caching {vector.shape[0]}-dim vector in {self.dimension}-dim cache")
+            return False
+
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._slots.move_to_end(key)
+        elif self._free:
+            slot = self._free.pop()
+            self._slots[key] = slot
+        else:
+            _, slot = self._slots.popitem(last=False)
+            self._slots[key] = slot
+            self._evictions += 1
+
+        self._vectors[slot] = vector
+        self._stored_at[slot] = time.monotonic()
+        return True
+
+    def clear(self) -> None:
+        """Drop all entries; the buffer is kept for reuse (the shared tier is left to other workers)."""
+        with self._lock:
+            self._slots.clear()
+            self._free = list(range(self.capacity - 1, -1, -1))
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            slots = np.fromiter(self._slots.values(), dtype=np.int64, count=len(self._slots))
+            ages = time.monotonic() - self._stored_at[slots] if len(slots) else np.zeros(0)
+            stats = {
+                "size": len(self._slots),
+                "capacity": self.capacity,
+                "dimension": self.dimension,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "rejected": self._rejected,
+                "memory_bytes": (self._vectors.nbytes if self._vectors is not None else 0) + self._stored_at.nbytes,
+                "avg_age_seconds": float(ages.mean()) if len(ages) else 0.0,
+                "max_age_seconds": float(ages.max()) if len(ages) else 0.0,
+            }
+            if self.shared is not None:
+                stats["shared_hits"] = self._shared_hits
+                stats["shared"] = self.shared.get_stats()
+            return stats
+
+
+# Process-wide instance shared by the search and embedding services
+_global_embedding_cache: Optional[EmbeddingCache] = None
+_global_embedding_cache_lock = threading.Lock()
+
+
+def get_embedding_cache(capacity: Optional[int] = None, ttl_seconds: Optional[float] = None) -> EmbeddingCache:
+    """
+    Get the process-wide embedding cache.
+
+    The first call creates it; capacity and TTL come from the arguments, else
+    EMBEDDING_CACHE_SIZE and EMBEDDING_CACHE_TTL_SECONDS. Later calls return
+    the same instance. With ENABLE_SHARED_CACHE the cache gets the
+    cross-process L2 tier.
+    """
+    global _global_embedding_cache
+    if _global_embedding_cache is None:
+        with _global_embedding_cache_lock:
+            if _global_embedding_cache is None:
+                from ...utils.shared_cache import get_shared_cache_store, shared_cache_enabled
+
+                capacity = capacity or int(os.getenv("EMBEDDING_CACHE_SIZE", "1000"))
+                if ttl_seconds is None:
+                    ttl_seconds = float(os.getenv("EMBEDDING_CACHE_TTL_SECONDS", "3600"))
+                shared = None
+                if shared_cache_enabled():
+                    # Vectors are reused by every worker on the host
+                    shared = get_shared_cache_store().namespace("embeddings", ttl_seconds=ttl_seconds)
+                _global_embedding_cache = EmbeddingCache(capacity, ttl_seconds=ttl_seconds, shared=shared)
+    return _global_embedding_cache
+
+
+def reset_embedding_cache() -> None:
+    """Drop the process-wide embedding cache (the next call creates a new one)."""
+    global _global_embedding_cache
+    with _global_embedding_cache_lock:
+        _global_embedding_cache = None
@@ -43,6 +43,8 @@ from ...config import EmbeddingConfig
 from ...core.base_service import BaseService
 from ...services.embedding_preprocessor import EmbeddingPreprocessor
 from ...utils.logging_config import get_logger
+from .models.model_backends import load_sentence_transformer
+from .models.model_config import ModelBackend, get_model_config
 
 # Public API - only expose vector generation methods
 __all__ = [
@@ -67,6 +69,7 @@ class EmbeddingService(BaseService):
 
         # Add expected attributes for backward compatibility
         self.model_cache: Dict[str, Any] = {}  # SentenceTransformer models, loaded lazily
+        self.parity_reports: Dict[str, Dict[str, Any]] = {}  # int8 backends vs fp32
         self.default_model = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
 
         # Performance optimizations
@@ -122,7 +125,15 @@ class EmbeddingService(BaseService):
 
         # Load new model
         self.logger.info(f"Loading embedding model: {model_name}")
-        model = SentenceTransformer(model_name, device=self.config.device)
+        backend = getattr(self.config, "backend", None)
+        if backend and ModelBackend(backend) != ModelBackend.TORCH:
+            model, parity = load_sentence_transformer(
+                model_name, get_model_config(model_name, backend), device=self.config.device
+            )
+            if parity is not None:
+                self.parity_reports[model_name] = parity
+        else:
+            model = SentenceTransformer(model_name, device=self.config.device)
         
         # Cache the model
         self.model_cache[model_name] = model
@@ -434,6 +445,8 @@ class EmbeddingService(BaseService):
             "device": str(model.device),
             "embedding_dimension": model.get_sentence_embedding_dimension(),
             "max_seq_length": getattr(model, "max_seq_length", 512),
+            "backend": getattr(self.config, "backend", ModelBackend.TORCH.value),
+            "parity": self.parity_reports.get(self.config.model_name),
         }
 
     # Hide inherited methods from BaseService and LoggingMixin to maintain clean API
@@ -0,0 +1,248 @@
+"""
+Persistent, content-addressed store of watchlist embeddings.
+
+Rebuilding the semantic index or the Elasticsearch ``vectors`` index used to
+re-encode every sanctioned name, although a daily list refresh changes only
+a few hundred. ``EmbeddingStore`` keeps every vector it has produced, keyed
+by a digest of model version and normalized text, so a rebuild encodes only
+names the store has not seen with that model.
+
+File layout (``.embstore``, same conventions as the AC snapshot and the
+sanctions dataset cache: magic, format version, JSON header, 8-byte aligned
+sections):
+
+- ``keys``: sorted 16-byte BLAKE2b digests, binary-searched with numpy;
+- ``vectors``: ``(count, dimension)`` float32 matrix, row ``i`` for ``keys[i]``.
+
+The file is mapped read-only; new vectors are held in memory until ``save``
+merges them into a fresh file moved into place with ``os.replace``.
+"""
+
+import json
+import mmap
+import os
+import re
+import sys
+import time
+import unicodedata
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from ....utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+STORE_MAGIC = b"AIEMBST1"
+STORE_FORMAT_VERSION = 1
+
+_SECTION_ALIGN = 8
+_KEY_DTYPE = np.dtype("S16")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _align(offset: int) -> int:
+    return (offset + _SECTION_ALIGN - 1) // _SECTION_ALIGN * _SECTION_ALIGN
+
+
+def normalize_store_text(text: str) -> str:
+    """NFC with collapsed whitespace; case is kept (the models are case-sensitive)."""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+class EmbeddingStore:
+    """Embeddings of one model version, mapped from disk plus unsaved additions."""
+
+    def __init__(self, path: Union[str, Path], model_version: str):
+        """
+        Args:
+            path: Store file; created on the first ``save`` if missing
+            model_version: Identifies the model (and backend) the vectors come
+                from. A file written for another version is ignored.
+        """
+        self.path = Path(path)
+        self.model_version = model_version
+        self.dimension: Optional[int] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._keys = np.empty(0, dtype=_KEY_DTYPE)
+        self._vectors = np.empty((0, 0), dtype=np.float32)
+        self._pending: Dict[bytes, np.ndarray] = {}
+        self.stats = {"hits": 0, "misses": 0, "encoded": 0, "saves": 0}
+        if self.path.exists():
+            self._open()
+
+    def _open(self) -> None:
+        try:
+            with open(self.path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable embedding store {self.path}: {exc}")
+            return
+        try:
+            if mapped[:8] != STORE_MAGIC:
+                raise ValueError("bad magic")
+            format_version = int.from_bytes(mapped[8:12], "little")
+            if format_version != STORE_FORMAT_VERSION:
+                raise ValueError(f"unsupported format {format_version}")
+            header_len = int.from_bytes(mapped[12:16], "little")
+            header = json.loads(mapped[16:16 + header_len].decode("utf-8"))
+            if header["byteorder"] != sys.byteorder:
+                raise ValueError(f"byte order {header['byteorder']} does not match host")
+        except Exception as exc:
+            mapped.close()
+            logger.warning(f"Ignoring unreadable embedding store {self.path}: {exc}")
+            return
+
+        if header["model_version"] != self.model_version:
+            mapped.close()
+            logger.info(
+                f"Embedding store {self.path} was built for {header['model_version']}, "
+                f"not {self.model_version}; starting empty"
+            )
+            return
+
+        data_start = _align(16 + header_len)
+        count, dimension = header["count"], header["dimension"]
+        keys_offset = data_start + header["sections"]["keys"][0]
+        vectors_offset = data_start + header["sections"]["vectors"][0]
+        self._mmap = mapped
+        self.dimension = dimension
+        self._keys = np.frombuffer(mapped, dtype=_KEY_DTYPE, count=count, offset=keys_offset)
+        self._vectors = np.frombuffer(
+            mapped, dtype=np.float32, count=count * dimension, offset=vectors_offset
+        ).reshape(count, dimension)
+
+    def make_key(self, text: str) -> bytes:
+        digest = blake2b(self.model_version.encode("utf-8"), digest_size=16)
+        digest.update(b"\0")
+        digest.update(normalize_store_text(text).encode("utf-8"))
+        return digest.digest()
+
+    def __len__(self) -> int:
+        return len(self._keys) + len(self._pending)
+
+    def _find(self, keys: np.ndarray) -> np.ndarray:
+        """Row in the mapped matrix for each key, -1 where absent."""
+        if not len(self._keys):
+            return np.full(len(keys), -1, dtype=np.int64)
+        positions = np.searchsorted(self._keys, keys)
+        clipped = np.minimum(positions, len(self._keys) - 1)
+        return np.where(self._keys[clipped] == keys, clipped, -1)
+
+    def get_or_encode(
+        self,
+        texts: Sequence[str],
+        encode: Callable[[List[str]], Any],
+    ) -> np.ndarray:
+        """
+        Vectors for ``texts`` in order, encoding only texts not in the store.
+
+        Args:
+            texts: Texts to embed
+            encode: Maps a list of texts to one vector per text (array-like);
+                called at most once, with each missing normalized text once
+
+        Returns:
+            ``(len(texts), dimension)`` float32 matrix
+        """
+        raw_keys = [self.make_key(text) for text in texts]
+        rows = self._find(np.array(raw_keys, dtype=_KEY_DTYPE))
+
+        missing: Dict[bytes, str] = {}
+        for key, row, text in zip(raw_keys, rows, texts):
+            if row < 0 and key not in self._pending:
+                missing.setdefault(key, normalize_store_text(text))
+
+        if missing:
+            encoded = np.asarray(encode(list(missing.values())), dtype=np.float32)
+            if encoded.ndim != 2 or len(encoded) != len(missing):
+                raise ValueError(f"encode returned shape {encoded.shape} for {len(missing)} texts")
+            if self.dimension is None:
+                self.dimension = encoded.shape[1]
+            elif encoded.shape[1] != self.dimension:
+                raise ValueError(f"encode returned {encoded.shape[1]}-dim vectors, store holds {self.dimension}")
+            self._pending.update(zip(missing, encoded))
+            self.stats["encoded"] += len(missing)
+
+        result = np.empty((len(texts), self.dimension or 0), dtype=np.float32)
+        found = rows >= 0
+        if found.any():
+            result[found] = self._vectors[rows[found]]
+        for position in np.flatnonzero(~found):
+            result[position] = self._pending[raw_keys[position]]
+
+        misses = sum(1 for key in raw_keys if key in missing)
+        self.stats["hits"] += len(texts) - misses
+        self.stats["misses"] += misses
+        return result
+
+    def save(self) -> Dict[str, Any]:
+        """Merge unsaved vectors into the store file (atomic replace) and remap it."""
+        if not self._pending:
+            return {"path": str(self.path), "count": len(self._keys), "added": 0}
+
+        pending_keys = np.array(list(self._pending), dtype=_KEY_DTYPE)
+        pending_vectors = np.stack(list(self._pending.values()))
+        keys = np.concatenate([self._keys, pending_keys])
+        vectors = np.concatenate([self._vectors.reshape(-1, self.dimension), pending_vectors])
+        order = np.argsort(keys, kind="stable")
+        keys, vectors = keys[order], np.ascontiguousarray(vectors[order])
+
+        keys_len = keys.nbytes
+        vectors_offset = _align(keys_len)
+        header = {
+            "created_at": time.time(),
+            "model_version": self.model_version,
+            "byteorder": sys.byteorder,
+            "count": len(keys),
+            "dimension": self.dimension,
+            "sections": {"keys": [0, keys_len], "vectors": [vectors_offset, vectors.nbytes]},
+        }
+        header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+        data_start = _align(16 + len(header_bytes))
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp-{os.getpid()}")
+        with open(tmp_path, "wb") as f:
+            f.write(STORE_MAGIC)
+            f.write(STORE_FORMAT_VERSION.to_bytes(4, "little"))
+            f.write(len(header_bytes).to_bytes(4, "little"))
+            f.write(header_bytes)
+            f.write(b"\0" * (data_start - f.tell()))
+            f.write(keys.tobytes())
+            f.write(b"\0" * (data_start + vectors_offset - f.tell()))
+            f.write(vectors.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+        added = len(self._pending)
+        self.close()
+        self._open()
+        self.stats["saves"] += 1
+        logger.info(f"Embedding store saved: {self.path} ({len(keys)} vectors, {added} new)")
+        return {"path": str(self.path), "count": len(keys), "added": added}
+
+    def close(self) -> None:
+        """Drop the mapping and unsaved vectors."""
+        self._keys = np.empty(0, dtype=_KEY_DTYPE)
+        self._vectors = np.empty((0, 0), dtype=np.float32)
+        self._pending.clear()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:  # a caller still holds a view; unmapped when it is released
+                pass
+            self._mmap = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "model_version": self.model_version,
+            "dimension": self.dimension,
+            "stored": len(self._keys),
+            "pending": len(self._pending),
+            **self.stats,
+        }
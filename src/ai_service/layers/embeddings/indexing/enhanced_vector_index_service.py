@@ -25,7 +25,9 @@ from sklearn.preprocessing import normalize
 
 from ....utils.logging_config import get_logger
 from .vector_index_service import VectorIndexConfig, CharTfidfVectorIndex
+from ..models.model_config import get_model_config
 from ..optimized_embedding_service import OptimizedEmbeddingService
+from .embedding_store import EmbeddingStore
 
 
 @dataclass
@@ -37,6 +39,7 @@ class EnhancedVectorIndexConfig(VectorIndexConfig):
     enable_hybrid_search: bool = True
     min_semantic_similarity: float = 0.3
     max_candidates_for_reranking: int = 100
+    embedding_store_path: Optional[str] = None  # reuse vectors of unchanged names across rebuilds
 
 
 class EnhancedVectorIndex(CharTfidfVectorIndex):
@@ -53,6 +56,7 @@ class EnhancedVectorIndex(CharTfidfVectorIndex):
         self.embedding_service = None
         self.semantic_embeddings: Optional[np.ndarray] = None
         self.semantic_faiss_index = None
+        self.embedding_store: Optional[EmbeddingStore] = None
 
         # Performance optimization
         self.index_lock = threading.RLock()
@@ -96,16 +100,13 @@ class EnhancedVectorIndex(CharTfidfVectorIndex):
         try:
             texts = [doc[1] for doc in docs]
 
-            # Generate embeddings
-            embedding_result = self.embedding_service.get_embeddings_optimized(
-                texts, batch_size=64, use_cache=True
-            )
-
-            if not embedding_result["success"]:
-                self.logger.error("Failed to generate semantic embeddings")
-                return
-
-            embeddings = np.array(embedding_result["embeddings"], dtype=np.float32)
+            if self.cfg.embedding_store_path:
+                # Only names the store has not seen with this model are encoded
+                store = self._get_embedding_store()
+                embeddings = store.get_or_encode(texts, self._encode_texts)
+                store.save()
+            else:
+                embeddings = self._encode_texts(texts, use_cache=True)
 
             # L2 normalize embeddings for cosine similarity
             embeddings = normalize(embeddings, norm='l2')
@@ -120,6 +121,21 @@ class EnhancedVectorIndex(CharTfidfVectorIndex):
             self.semantic_embeddings = None
             self.semantic_faiss_index = None
 
+    def _encode_texts(self, texts: List[str], use_cache: bool = False) -> np.ndarray:
+        embedding_result = self.embedding_service.get_embeddings_optimized(
+            texts, batch_size=64, use_cache=use_cache
+        )
+        if not embedding_result["success"]:
+            raise RuntimeError(f"Failed to generate semantic embeddings: {embedding_result.get('error')}")
+        return np.array(embedding_result["embeddings"], dtype=np.float32)
+
+    def _get_embedding_store(self) -> EmbeddingStore:
+        backend = get_model_config(self.cfg.embedding_model, getattr(self.embedding_service, "backend", None)).backend
+        model_version = f"{self.cfg.embedding_model}@{backend.value}"
+        if self.embedding_store is None or self.embedding_store.model_version != model_version:
+            self.embedding_store = EmbeddingStore(self.cfg.embedding_store_path, model_version)
+        return self.embedding_store
+
     def _build_semantic_faiss_index(self, embeddings: np.ndarray) -> None:
         """Build FAISS index for semantic embeddings"""
         try:
@@ -176,6 +192,53 @@ class EnhancedVectorIndex(CharTfidfVectorIndex):
             # Fallback to lexical search
             return super().search(query, top_k)
 
+    def search_many(self, queries: List[str], top_k: int = 10) -> List[List[Tuple[str, float]]]:
+        """
+        Batch version of ``search``: queries are encoded and searched together
+        (one TF-IDF/SVD transform, one embedding batch, one matrix search).
+        """
+        if not queries:
+            return []
+        if not self.doc_ids:
+            return [[] for _ in queries]
+
+        start_time = time.time()
+
+        try:
+            with self.index_lock:
+                if self.cfg.enable_hybrid_search and self.cfg.use_semantic_embeddings:
+                    candidate_k = min(self.cfg.max_candidates_for_reranking, max(top_k * 3, 50))
+                    lexical = super().search_many(queries, candidate_k)
+                    semantic = self._semantic_search_many(queries, candidate_k)
+                    results = [
+                        self._combine_and_rerank(lexical_results, semantic_results, top_k)
+                        for lexical_results, semantic_results in zip(lexical, semantic)
+                    ]
+                    self.search_metrics["hybrid_searches"] += len(queries)
+                elif self.cfg.use_semantic_embeddings and self.semantic_embeddings is not None:
+                    results = self._semantic_search_many(queries, top_k)
+                    self.search_metrics["semantic_searches"] += len(queries)
+                else:
+                    results = super().search_many(queries, top_k)
+                    self.search_metrics["lexical_searches"] += len(queries)
+
+            # Update metrics, counting each query at the batch's mean time
+            per_query_time = (time.time() - start_time) / len(queries)
+            previous_total = self.search_metrics["total_searches"]
+            total = previous_total + len(queries)
+            self.search_metrics["total_searches"] = total
+            current_avg = self.search_metrics["avg_search_time"]
+            self.search_metrics["avg_search_time"] = (
+                current_avg * previous_total + per_query_time * len(queries)
+            ) / total
+
+            return results
+
+        except Exception as e:
+            self.logger.error(f"Enhanced batch search failed: {e}")
+            # Fallback to lexical search
+            return super().search_many(queries, top_k)
+
     def _semantic_search(self, query: str, top_k: int) -> List[Tuple[str, float]]:
         """Pure semantic search using embeddings"""
         if not self.embedding_service or self.semantic_embeddings is None:
@@ -218,6 +281,49 @@ class EnhancedVectorIndex(CharTfidfVectorIndex):
             self.logger.error(f"Semantic search failed: {e}")
             return []
 
+    def _semantic_search_many(self, queries: List[str], top_k: int) -> List[List[Tuple[str, float]]]:
+        """Semantic search for a batch of queries with one embedding call"""
+        empty: List[List[Tuple[str, float]]] = [[] for _ in queries]
+        if not self.embedding_service or self.semantic_embeddings is None:
+            return empty
+
+        try:
+            query_result = self.embedding_service.get_embeddings_optimized(queries)
+            if not query_result["success"]:
+                return empty
+
+            query_embeddings = normalize(np.array(query_result["embeddings"], dtype=np.float32), norm='l2')
+
+            if self.semantic_faiss_index is not None:
+                scores, indices = self.semantic_faiss_index.search(
+                    query_embeddings, min(top_k, len(self.doc_ids))
+                )
+                return [
+                    [
+                        (self.doc_ids[idx], float(score))
+                        for score, idx in zip(row_scores, row_indices)
+                        if idx >= 0 and score >= self.cfg.min_semantic_similarity
+                    ]
+                    for row_scores, row_indices in zip(scores, indices)
+                ]
+
+            # Fallback to brute force
+            similarities = query_embeddings @ self.semantic_embeddings.T
+            results = []
+            for row in similarities:
+                valid_indices = np.where(row >= self.cfg.min_semantic_similarity)[0]
+                valid_similarities = row[valid_indices]
+                sorted_indices = np.argsort(-valid_similarities)[:top_k]
+                results.append([
+                    (self.doc_ids[valid_indices[i]], float(valid_similarities[i]))
+                    for i in sorted_indices
+                ])
+            return results
+
+        except Exception as e:
+            self.logger.error(f"Batch semantic search failed: {e}")
+            return empty
+
     def _hybrid_search(self, query: str, top_k: int) -> List[Tuple[str, float]]:
         """Hybrid search combining lexical and semantic results"""
         try:
@@ -309,6 +415,8 @@ class EnhancedVectorIndex(CharTfidfVectorIndex):
         # Add embedding service metrics if available
         if self.embedding_service:
             stats["embedding_metrics"] = self.embedding_service.get_performance_metrics()
+        if self.embedding_store is not None:
+            stats["embedding_store"] = self.embedding_store.get_stats()
 
         return stats
 
@@ -111,9 +111,13 @@ class CharTfidfVectorIndex:
             self.faiss_index = None
 
     def _encode(self, text: str) -> Optional[np.ndarray]:
+        return self._encode_many([text])
+
+    def _encode_many(self, texts: List[str]) -> Optional[np.ndarray]:
+        """Encode texts into one L2-normalized (n, dim) matrix."""
         if not self.vectorizer:
             return None
-        Xq = self.vectorizer.transform([text])
+        Xq = self.vectorizer.transform(texts)
         if self.cfg.use_svd and self.svd is not None:
             Xqr = self.svd.transform(Xq)
         else:
@@ -144,3 +148,55 @@ class CharTfidfVectorIndex:
         sims = (self.X_vec @ q.T).reshape(-1)
         order = np.argsort(-sims)[:top_k]
         return [(self.doc_ids[i], float(sims[i])) for i in order]
+
+    def search_many(
+        self, queries: List[str], top_k: int = 10, max_block_bytes: int = 64 << 20
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Search many queries at once.
+
+        All queries are encoded with a single vectorizer/SVD transform, then
+        searched with one FAISS call or one matmul per block of queries
+        (blocks keep the query x doc score matrix under ``max_block_bytes``).
+
+        Returns:
+            One (doc_id, score) list per query, as ``search`` would return
+        """
+        if not queries:
+            return []
+        if not self.doc_ids or self.X_vec is None:
+            return [[] for _ in queries]
+        Q = self._encode_many(queries)
+        if Q is None:
+            return [[] for _ in queries]
+        k = min(top_k, len(self.doc_ids))
+        if k <= 0:
+            return [[] for _ in queries]
+
+        if self.faiss_index is not None:
+            try:
+                scores, idx = self.faiss_index.search(Q, k)
+                return [
+                    [(self.doc_ids[i], float(s)) for i, s in zip(row_idx, row_scores) if i >= 0]
+                    for row_idx, row_scores in zip(idx, scores)
+                ]
+            except Exception as e:
+                self.logger.warning(
+                    f"FAISS batch search failed, fallback to brute-force: {e}"
+                )
+
+        results: List[List[Tuple[str, float]]] = []
+        block = max(1, max_block_bytes // (4 * len(self.doc_ids)))
+        for start in range(0, len(Q), block):
+            sims = Q[start:start + block] @ self.X_vec.T
+            if k < sims.shape[1]:
+                top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+            else:
+                top = np.broadcast_to(np.arange(sims.shape[1]), sims.shape)
+            top_sims = np.take_along_axis(sims, top, axis=1)
+            order = np.argsort(-top_sims, axis=1)
+            top = np.take_along_axis(top, order, axis=1)
+            top_sims = np.take_along_axis(top_sims, order, axis=1)
+            for row_idx, row_sims in zip(top, top_sims):
+                results.append([(self.doc_ids[i], float(s)) for i, s in zip(row_idx, row_sims)])
+        return results
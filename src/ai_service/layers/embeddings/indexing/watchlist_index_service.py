@@ -12,10 +12,11 @@ import os
 import pickle
 import time
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from ....utils.data_version import bump_data_version
 from ....utils.logging_config import get_logger
 from ....contracts.trace_models import SearchTrace, SearchTraceHit, SearchTraceStep
 from .vector_index_service import CharTfidfVectorIndex, VectorIndexConfig
@@ -57,6 +58,7 @@ class WatchlistIndexService:
             for (doc_id, text, et, md) in corpus
         }
         self._active_id = index_id or "in-memory"
+        bump_data_version("watchlist")
         self.logger.info(
             f"Watchlist active index built: {len(self._docs)} docs, id={self._active_id}"
         )
@@ -73,6 +75,7 @@ class WatchlistIndexService:
             for (doc_id, text, et, md) in corpus
         }
         self._overlay_id = overlay_id or "overlay"
+        bump_data_version("watchlist")
         self.logger.info(
             f"Watchlist overlay set: {len(self._overlay_docs)} docs, id={self._overlay_id}"
         )
@@ -81,6 +84,7 @@ class WatchlistIndexService:
         self._overlay = None
         self._overlay_docs = {}
         self._overlay_id = None
+        bump_data_version("watchlist")
 
     def search(self, query: str, top_k: int = 50, trace: Optional[SearchTrace] = None) -> List[Tuple[str, float]]:
         """Search overlay then active; merge unique doc_ids preserving best score."""
@@ -94,8 +98,16 @@ class WatchlistIndexService:
                 trace.note("Watchlist index not ready - empty index")
                 return []
             
+            if not trace.enabled:
+                overlay_results = (
+                    self._overlay.search(query, top_k=min(top_k, 200)) if self._overlay is not None else []
+                )
+                active_results = self._active.search(query, top_k=min(top_k, 200))
+                return self._merge_results(overlay_results, active_results, top_k)
+            
             results: Dict[str, float] = {}
-            all_hits: List[SearchTraceHit] = []
+            # Signals of the first hit per doc_id (overlay hits come first)
+            best_signals: Dict[str, Dict[str, Any]] = {}
             
             # Overlay search
             if self._overlay is not None:
@@ -111,6 +123,7 @@ class WatchlistIndexService:
                     # Extract signals from metadata if available
                     doc_metadata = self._overlay_docs.get(doc_id, WatchlistDoc("", "", "", {}))
                     signals = self._extract_signals(doc_id, doc_metadata, query)
+                    best_signals.setdefault(doc_id, signals)
                     
                     hit = SearchTraceHit(
                         doc_id=doc_id,
@@ -120,7 +133,6 @@ class WatchlistIndexService:
                         signals=signals
                     )
                     overlay_hits.append(hit)
-                    all_hits.append(hit)
                 
                 # Add overlay step to trace
                 trace.add_step(SearchTraceStep(
@@ -152,6 +164,7 @@ class WatchlistIndexService:
                 # Extract signals from metadata if available
                 doc_metadata = self._docs.get(doc_id, WatchlistDoc("", "", "", {}))
                 signals = self._extract_signals(doc_id, doc_metadata, query)
+                best_signals.setdefault(doc_id, signals)
                 
                 hit = SearchTraceHit(
                     doc_id=doc_id,
@@ -161,7 +174,6 @@ class WatchlistIndexService:
                     signals=signals
                 )
                 active_hits.append(hit)
-                all_hits.append(hit)
             
             # Add active step to trace
             trace.add_step(SearchTraceStep(
@@ -186,16 +198,12 @@ class WatchlistIndexService:
             # Convert final results to SearchTraceHit for rerank step
             rerank_hits = []
             for rank, (doc_id, score) in enumerate(items, 1):
-                # Get the best hit from all_hits for this doc_id
-                best_hit = next((h for h in all_hits if h.doc_id == doc_id), None)
-                signals = best_hit.signals if best_hit else {}
-                
                 hit = SearchTraceHit(
                     doc_id=doc_id,
                     score=score,
                     rank=rank,
                     source="RERANK",
-                    signals=signals
+                    signals=best_signals.get(doc_id, {})
                 )
                 rerank_hits.append(hit)
             
@@ -226,6 +234,49 @@ class WatchlistIndexService:
             self.logger.error(f"Watchlist search failed for query '{query}': {e}")
             return []
 
+    def search_many(self, queries: List[str], top_k: int = 50) -> List[List[Tuple[str, float]]]:
+        """
+        Search many queries against overlay and active indexes at once.
+
+        Each index encodes all queries in one transform and searches them with
+        one FAISS call or matmul; no trace is built. Results per query match
+        ``search`` without a trace.
+        """
+        if not queries:
+            return []
+        if not self.ready():
+            return [[] for _ in queries]
+
+        try:
+            k = min(top_k, 200)
+            active = self._active.search_many(queries, top_k=k)
+            overlay = (
+                self._overlay.search_many(queries, top_k=k)
+                if self._overlay is not None
+                else [[] for _ in queries]
+            )
+            return [
+                self._merge_results(overlay_results, active_results, top_k)
+                for overlay_results, active_results in zip(overlay, active)
+            ]
+        except Exception as e:
+            self.logger.error(f"Watchlist batch search failed for {len(queries)} queries: {e}")
+            return [[] for _ in queries]
+
+    @staticmethod
+    def _merge_results(
+        overlay_results: List[Tuple[str, float]],
+        active_results: List[Tuple[str, float]],
+        top_k: int,
+    ) -> List[Tuple[str, float]]:
+        """Unique doc_ids with their best score, highest first."""
+        results: Dict[str, float] = {}
+        for doc_id, score in overlay_results:
+            results[doc_id] = max(results.get(doc_id, 0.0), float(score))
+        for doc_id, score in active_results:
+            results[doc_id] = max(results.get(doc_id, 0.0), float(score))
+        return sorted(results.items(), key=lambda x: x[1], reverse=True)[:top_k]
+
     def _extract_signals(self, doc_id: str, doc_metadata: WatchlistDoc, query: str) -> Dict[str, Any]:
         """Extract signals from document metadata for search trace."""
         signals = {}
@@ -446,6 +497,7 @@ class WatchlistIndexService:
                 }
                 trace.note(f"Active snapshot loaded: {len(self._docs)} documents")
             
+            bump_data_version("watchlist")
             self.logger.info(f"Watchlist snapshot loaded: {info}")
             return info
             
@@ -44,7 +44,8 @@ def _get_torch():
     import torch
     return torch
 
-from .model_config import ModelConfig, get_model_config
+from .model_backends import load_sentence_transformer
+from .model_config import ModelBackend, ModelConfig, get_model_config
 
 
 class EmbeddingModelManager:
@@ -76,6 +77,7 @@ class EmbeddingModelManager:
         self._models: Dict[str, Any] = {}
         self._model_configs: Dict[str, ModelConfig] = {}
         self._model_usage: Dict[str, float] = {}  # Last access time
+        self._parity_reports: Dict[str, Dict[str, Any]] = {}  # int8 backends only
         self._lock = threading.RLock()
         
         # Thread pool for async model loading
@@ -132,21 +134,21 @@ class EmbeddingModelManager:
             if not _check_sentence_transformers_availability():
                 raise ImportError("sentence-transformers not available")
 
-            # Lazy import of sentence-transformers
-            from sentence_transformers import SentenceTransformer
-
             # Configure device
             device = config.device if config.device != "cpu" else self.device
 
-            # Load model
-            model = SentenceTransformer(
+            # Load model with the configured backend
+            model, parity = load_sentence_transformer(
                 config.model_path or model_name,
+                config,
                 device=device,
-                cache_folder=self.cache_dir
+                cache_dir=config.cache_dir or self.cache_dir,
             )
+            if parity is not None:
+                self._parity_reports[model_name] = parity
             
             # Apply model-specific configurations
-            if config.use_fp16 and device != "cpu":
+            if config.use_fp16 and device != "cpu" and config.backend == ModelBackend.TORCH:
                 try:
                     model = model.half()
                     self.logger.info(f"Enabled FP16 for {model_name}")
@@ -161,7 +163,7 @@ class EmbeddingModelManager:
             # Cleanup if we have too many models
             self._cleanup_models()
             
-            self.logger.info(f"Model {model_name} loaded successfully on {device}")
+            self.logger.info(f"Model {model_name} loaded successfully on {device} ({config.backend.value})")
             return model
             
         except Exception as e:
@@ -190,6 +192,7 @@ class EmbeddingModelManager:
             del self._models[model_name]
             del self._model_configs[model_name]
             del self._model_usage[model_name]
+            self._parity_reports.pop(model_name, None)
             
             # Force garbage collection
             gc.collect()
@@ -219,6 +222,8 @@ class EmbeddingModelManager:
                 "loaded": True,
                 "config": config.__dict__ if config else None,
                 "last_used": usage_time,
+                "backend": config.backend.value if config else None,
+                "parity": self._parity_reports.get(model_name),
                 "device": getattr(self._models[model_name], 'device', 'unknown')
             }
     
@@ -233,6 +238,7 @@ class EmbeddingModelManager:
             self._models.clear()
             self._model_configs.clear()
             self._model_usage.clear()
+            self._parity_reports.clear()
             gc.collect()
             self.logger.info("Model cache cleared")
     
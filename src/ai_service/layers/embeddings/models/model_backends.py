@@ -0,0 +1,227 @@
+"""
+Inference backends for sentence-transformer models.
+
+``ModelBackend.TORCH`` loads the full-precision PyTorch model. The int8
+backends target CPU-only workers, where fp16 does not apply:
+
+- ``TORCH_INT8``: PyTorch dynamic quantization of the ``Linear`` layers.
+  No export step; weights are quantized on load.
+- ``ONNX_INT8``: an int8-quantized ONNX export run by ONNX Runtime. The
+  published ``onnx/model_qint8_<config>.onnx`` file is used when the model
+  repository has one; otherwise it is exported once into ``export_dir``.
+  ``<config>`` is detected from the CPU (``onnx_quantization="auto"``).
+  Needs the ``onnx`` extra (``optimum[onnxruntime]``); without it, or on a
+  CPU without int8 kernels, the fp32 model is used.
+
+Both int8 backends encode a fixed set of names with the fp32 model and with
+the quantized one and compare them (``embedding_parity``). A model whose
+worst cosine falls below ``ModelConfig.parity_min_cosine`` is not used; the
+fp32 model is returned instead, so screening recall never silently drops.
+"""
+
+import logging
+import os
+import platform
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .model_config import ModelBackend, ModelConfig
+
+logger = logging.getLogger(__name__)
+
+# Names in the scripts and forms the screening pipeline embeds
+PARITY_TEXTS = [
+    "Ivan Petrov",
+    "Іванов Іван Іванович",
+    "Иванова Анна Сергеевна",
+    "ТОВ Ромашка",
+    "ООО Рога и Копыта",
+    "Acme Trading Ltd",
+    "Kovalenko Andrii Viktorovych",
+    "Шевченко Тарас Григорович",
+    "Oleksandr Shevchenko",
+    "Mohammed bin Salman Al Saud",
+]
+
+
+def embedding_parity(
+    reference: Sequence[Sequence[float]],
+    candidate: Sequence[Sequence[float]],
+    min_cosine: float,
+) -> Dict[str, Any]:
+    """
+    Compare candidate embeddings with reference (fp32) embeddings row by row.
+
+    Returns:
+        Dict with ``min_cosine``, ``mean_cosine``, ``texts`` and ``passed``
+    """
+    reference = np.asarray(reference, dtype=np.float64)
+    candidate = np.asarray(candidate, dtype=np.float64)
+    if reference.shape != candidate.shape:
+        return {"passed": False, "error": f"shape {candidate.shape} != fp32 shape {reference.shape}"}
+
+    norms = np.linalg.norm(reference, axis=1) * np.linalg.norm(candidate, axis=1)
+    cosines = np.einsum("ij,ij->i", reference, candidate) / np.where(norms > 0, norms, 1.0)
+    return {
+        "min_cosine": float(cosines.min()),
+        "mean_cosine": float(cosines.mean()),
+        "texts": len(cosines),
+        "threshold": min_cosine,
+        "passed": bool(cosines.min() >= min_cosine),
+    }
+
+
+def _encode(model: Any, texts: List[str], normalize: bool) -> np.ndarray:
+    return model.encode(
+        texts,
+        batch_size=len(texts),
+        show_progress_bar=False,
+        normalize_embeddings=normalize,
+        convert_to_numpy=True,
+    )
+
+
+def detect_onnx_quantization() -> Optional[str]:
+    """
+    ONNX int8 quantization config matching this CPU.
+
+    Returns:
+        ``arm64``, ``avx512_vnni``, ``avx512`` or ``avx2``; None if the CPU
+        has none of these instruction sets
+    """
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return "arm64"
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            flags = next((line.split(":", 1)[1].split() for line in f if line.startswith("flags")), [])
+    except OSError:
+        return None
+    if "avx512_vnni" in flags:
+        return "avx512_vnni"
+    if "avx512f" in flags and "avx512bw" in flags:
+        return "avx512"
+    if "avx2" in flags:
+        return "avx2"
+    return None
+
+
+def _require_onnx_runtime() -> None:
+    try:
+        import onnxruntime  # noqa: F401
+        import optimum.onnxruntime  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            f"onnx_int8 needs ONNX Runtime and Optimum (install the 'onnx' extra): {exc}"
+        ) from exc
+
+
+def _default_export_dir() -> Path:
+    return Path(os.getenv("EMBEDDING_ONNX_DIR", Path.home() / ".cache" / "ai_service" / "onnx"))
+
+
+def _load_onnx_int8(
+    model_path: str, quantization: str, cache_dir: Optional[str], export_dir: Path
+) -> Any:
+    _require_onnx_runtime()
+    from sentence_transformers import SentenceTransformer
+
+    file_name = f"onnx/model_qint8_{quantization}.onnx"
+    try:
+        return SentenceTransformer(
+            model_path, device="cpu", cache_folder=cache_dir, backend="onnx",
+            model_kwargs={"file_name": file_name},
+        )
+    except Exception as exc:
+        logger.info(f"No published {file_name} for {model_path} ({exc}); exporting")
+
+    from sentence_transformers import export_dynamic_quantized_onnx_model
+
+    target = export_dir / model_path.strip("/").replace("/", "--")
+    if not (target / file_name).exists():
+        onnx_model = SentenceTransformer(model_path, device="cpu", cache_folder=cache_dir, backend="onnx")
+        onnx_model.save(str(target))
+        export_dynamic_quantized_onnx_model(onnx_model, quantization, str(target))
+        logger.info(f"Exported int8 ONNX model for {model_path} to {target}")
+    return SentenceTransformer(
+        str(target), device="cpu", backend="onnx", model_kwargs={"file_name": file_name},
+    )
+
+
+def _quantize_torch_int8(model: Any) -> Any:
+    import torch
+
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def load_sentence_transformer(
+    model_path: str,
+    config: ModelConfig,
+    device: str = "cpu",
+    cache_dir: Optional[str] = None,
+    export_dir: Optional[Path] = None,
+) -> Tuple[Any, Optional[Dict[str, Any]]]:
+    """
+    Load a sentence-transformer model with the backend selected in ``config``.
+
+    Args:
+        model_path: Hub name or local path of the model
+        config: Model configuration (``backend``, parity settings)
+        device: Device for the full-precision backend; int8 backends run on CPU
+        cache_dir: Hugging Face cache folder
+        export_dir: Where int8 ONNX exports are written (``EMBEDDING_ONNX_DIR``
+            or ``~/.cache/ai_service/onnx`` if None)
+
+    Returns:
+        Tuple of the model and the parity report (None for ``TORCH``)
+    """
+    from sentence_transformers import SentenceTransformer
+
+    if config.backend == ModelBackend.TORCH:
+        return SentenceTransformer(model_path, device=device, cache_folder=cache_dir), None
+
+    reference = SentenceTransformer(model_path, device="cpu", cache_folder=cache_dir)
+    if config.backend == ModelBackend.TORCH_INT8:
+        model = _quantize_torch_int8(reference)
+    else:
+        quantization = config.onnx_quantization
+        if quantization == "auto":
+            quantization = detect_onnx_quantization()
+        try:
+            if quantization is None:
+                raise ImportError("no int8 ONNX kernels for this CPU (needs arm64, avx2 or avx512)")
+            model = _load_onnx_int8(model_path, quantization, cache_dir, export_dir or _default_export_dir())
+        except ImportError as exc:
+            logger.warning(f"{config.backend.value} backend unavailable for {model_path} ({exc}); using fp32")
+            report = {"backend": config.backend.value, "passed": False, "error": str(exc)}
+            return _fp32_fallback(reference, device, report), report
+
+    if not config.parity_check:
+        return model, None
+
+    report = embedding_parity(
+        _encode(reference, PARITY_TEXTS, config.normalize_embeddings),
+        _encode(model, PARITY_TEXTS, config.normalize_embeddings),
+        config.parity_min_cosine,
+    )
+    report["backend"] = config.backend.value
+    if report["passed"]:
+        logger.info(
+            f"{config.backend.value} parity for {model_path}: min cosine {report['min_cosine']:.4f}, "
+            f"mean {report['mean_cosine']:.4f}"
+        )
+        return model, report
+
+    logger.warning(
+        f"{config.backend.value} model for {model_path} failed parity "
+        f"({report.get('min_cosine', report.get('error'))} < {config.parity_min_cosine}); using fp32"
+    )
+    return _fp32_fallback(reference, device, report), report
+
+
+def _fp32_fallback(reference: Any, device: str, report: Dict[str, Any]) -> Any:
+    report["fallback"] = ModelBackend.TORCH.value
+    if device != "cpu":
+        reference = reference.to(device)
+    return reference
@@ -2,7 +2,8 @@
 Model Configuration for Embedding Services
 """
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, replace
 from typing import Dict, List, Optional, Any
 from enum import Enum
 
@@ -14,6 +15,13 @@ class ModelType(str, Enum):
     CUSTOM = "custom"
 
 
+class ModelBackend(str, Enum):
+    """Inference backends for sentence-transformer models"""
+    TORCH = "torch"            # full-precision PyTorch (fp16 on GPU if enabled)
+    TORCH_INT8 = "torch_int8"  # PyTorch dynamic int8 quantization of Linear layers (CPU)
+    ONNX_INT8 = "onnx_int8"    # int8-quantized ONNX export run by ONNX Runtime (CPU)
+
+
 @dataclass
 class ModelConfig:
     """Configuration for embedding models"""
@@ -29,6 +37,12 @@ class ModelConfig:
     use_fp16: bool = False
     cache_dir: Optional[str] = None
     
+    # Inference backend; int8 backends are checked against fp32 embeddings on load
+    backend: ModelBackend = ModelBackend.TORCH
+    onnx_quantization: str = "auto"  # auto (detect from CPU), arm64, avx2, avx512 or avx512_vnni
+    parity_check: bool = True
+    parity_min_cosine: float = 0.98  # fall back to fp32 below this
+    
     # Performance settings
     enable_gpu: bool = False
     thread_pool_size: int = 4
@@ -44,6 +58,8 @@ class ModelConfig:
         
         if not self.model_path and self.name:
             self.model_path = self.name
+        
+        self.backend = ModelBackend(self.backend)
 
 
 # Predefined model configurations
@@ -69,15 +85,27 @@ DEFAULT_MODELS = {
 }
 
 
-def get_model_config(model_name: str) -> ModelConfig:
-    """Get model configuration by name"""
+def get_model_config(model_name: str, backend: Optional[str] = None) -> ModelConfig:
+    """
+    Get model configuration by name
+
+    ``backend`` (or the ``EMBEDDING_BACKEND`` environment variable) selects
+    the inference backend; the default is full-precision PyTorch.
+    ``EMBEDDING_ONNX_QUANTIZATION`` overrides the CPU-detected int8 ONNX
+    quantization config.
+    """
+    backend = ModelBackend(backend or os.getenv("EMBEDDING_BACKEND") or ModelBackend.TORCH)
+    onnx_quantization = os.getenv("EMBEDDING_ONNX_QUANTIZATION", "auto")
+
     if model_name in DEFAULT_MODELS:
-        return DEFAULT_MODELS[model_name]
+        return replace(DEFAULT_MODELS[model_name], backend=backend, onnx_quantization=onnx_quantization)
     
     # Create default config for unknown models
     return ModelConfig(
         name=model_name,
         model_path=model_name,
         dimension=384,  # Default dimension
-        normalize_embeddings=True
+        normalize_embeddings=True,
+        backend=backend,
+        onnx_quantization=onnx_quantization,
     )
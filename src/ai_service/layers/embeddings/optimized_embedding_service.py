@@ -8,7 +8,7 @@ import time
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, Union, Tuple
+from typing import Any, Dict, List, Optional, Union
 import threading
 from collections import deque
 
@@ -20,6 +20,7 @@ except ImportError:
     faiss = None
 
 from ...utils.logging_config import get_logger
+from .embedding_cache import EmbeddingCache, get_embedding_cache
 from .embedding_service import EmbeddingService
 from .models.embedding_model_manager import EmbeddingModelManager
 from .models.model_config import ModelConfig, get_model_config
@@ -31,22 +32,28 @@ class OptimizedEmbeddingService(EmbeddingService):
     def __init__(
         self,
         default_model: str = "sentence-transformers/all-MiniLM-L6-v2",
-        max_cache_size: int = 1000,
+        max_cache_size: Optional[int] = None,
         enable_batch_optimization: bool = True,
         enable_gpu: bool = True,
         thread_pool_size: int = 4,
         precompute_common_patterns: bool = True,
+        backend: Optional[str] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
     ):
         """
         Initialize optimized embedding service
 
         Args:
             default_model: Default model
-            max_cache_size: Maximum cache size for embeddings
+            max_cache_size: Size of a private embedding cache; the process-wide
+                cache is used if None
             enable_batch_optimization: Enable automatic batch optimization
             enable_gpu: Enable GPU acceleration if available
             thread_pool_size: Size of thread pool for parallel processing
             precompute_common_patterns: Precompute embeddings for common patterns
+            backend: Inference backend (torch, torch_int8, onnx_int8); defaults
+                to EMBEDDING_BACKEND or torch
+            embedding_cache: Embedding cache to use (overrides max_cache_size)
         """
         # Create a mock config object for the parent class
         from types import SimpleNamespace
@@ -66,14 +73,21 @@ class OptimizedEmbeddingService(EmbeddingService):
         # Initialize model cache
         self.model_cache = {}
 
-        self.max_cache_size = max_cache_size
         self.enable_batch_optimization = enable_batch_optimization
         self.enable_gpu = enable_gpu
         self.thread_pool_size = thread_pool_size
         self.precompute_common_patterns = precompute_common_patterns
+        self.backend = backend
 
         # Performance optimization features
-        self.embedding_cache: Dict[str, Tuple[List[float], float]] = {}  # text -> (embedding, timestamp)
+        if embedding_cache is None:
+            embedding_cache = (
+                EmbeddingCache(max_cache_size, ttl_seconds=3600)
+                if max_cache_size is not None
+                else get_embedding_cache()
+            )
+        self.embedding_cache = embedding_cache
+        self.max_cache_size = embedding_cache.capacity
         self.cache_lock = threading.RLock()
 
         # Batch processing queue
@@ -102,7 +116,7 @@ class OptimizedEmbeddingService(EmbeddingService):
 
         self.logger.info(
             f"OptimizedEmbeddingService initialized (GPU: {self.gpu_available}, "
-            f"Cache: {max_cache_size}, Threads: {thread_pool_size})"
+            f"Cache: {self.max_cache_size}, Threads: {thread_pool_size})"
         )
 
     def _check_gpu_availability(self) -> bool:
@@ -137,12 +151,8 @@ class OptimizedEmbeddingService(EmbeddingService):
             if result["success"]:
                 # Cache the embeddings
                 embeddings = result["embeddings"]
-                timestamp = time.time()
-
-                with self.cache_lock:
-                    for i, pattern in enumerate(common_patterns):
-                        cache_key = self._get_cache_key(pattern, self.default_model)
-                        self.embedding_cache[cache_key] = (embeddings[i], timestamp)
+                for pattern, embedding in zip(common_patterns, embeddings):
+                    self._cache_embedding(pattern, self.default_model, embedding)
 
                 precompute_time = time.time() - start_time
                 self.logger.info(f"Precomputed {len(common_patterns)} patterns in {precompute_time:.3f}s")
@@ -150,51 +160,26 @@ class OptimizedEmbeddingService(EmbeddingService):
         except Exception as e:
             self.logger.warning(f"Failed to precompute common patterns: {e}")
 
-    def _get_cache_key(self, text: str, model_name: str) -> str:
+    def _get_cache_key(self, text: str, model_name: str) -> bytes:
         """Generate cache key for text and model"""
-        return f"{model_name}:{hash(text)}"
+        return EmbeddingCache.make_key(text, model_name)
 
     def _get_cached_embedding(self, text: str, model_name: str) -> Optional[List[float]]:
-        """Get cached embedding if available and not expired"""
-        cache_key = self._get_cache_key(text, model_name)
-
+        """Get cached embedding if available and not expired (1 hour expiry)"""
+        embedding = self.embedding_cache.get(text, model_name)
         with self.cache_lock:
-            if cache_key in self.embedding_cache:
-                embedding, timestamp = self.embedding_cache[cache_key]
-
-                # Check if cache entry is not too old (1 hour expiry)
-                if time.time() - timestamp < 3600:
-                    self.performance_metrics["cache_hits"] += 1
-                    return embedding
-                else:
-                    # Remove expired entry
-                    del self.embedding_cache[cache_key]
-
-        self.performance_metrics["cache_misses"] += 1
-        return None
+            self.performance_metrics["cache_hits" if embedding is not None else "cache_misses"] += 1
+        return embedding.tolist() if embedding is not None else None
 
     def _cache_embedding(self, text: str, model_name: str, embedding: List[float]):
         """Cache embedding with LRU eviction"""
-        cache_key = self._get_cache_key(text, model_name)
-        timestamp = time.time()
-
-        with self.cache_lock:
-            # LRU eviction if cache is full
-            if len(self.embedding_cache) >= self.max_cache_size:
-                # Remove oldest entry
-                oldest_key = min(
-                    self.embedding_cache.keys(),
-                    key=lambda k: self.embedding_cache[k][1]
-                )
-                del self.embedding_cache[oldest_key]
-
-            self.embedding_cache[cache_key] = (embedding, timestamp)
+        self.embedding_cache.put(text, embedding, model_name)
 
     def _load_model_optimized(self, model_name: str):
         """Load model with GPU acceleration if available"""
         try:
             # Use model manager for optimized loading
-            model_config = get_model_config(model_name)
+            model_config = get_model_config(model_name, self.backend)
             model_config.enable_gpu = self.enable_gpu
             model_config.use_fp16 = self.enable_gpu
             
@@ -537,12 +522,17 @@ class OptimizedEmbeddingService(EmbeddingService):
                 "cache_hit_rate": cache_hit_rate,
                 "cache_size": len(self.embedding_cache),
                 "max_cache_size": self.max_cache_size,
+                "embedding_cache": self.embedding_cache.get_stats(),
                 "gpu_available": self.gpu_available,
                 "gpu_accelerated_embeddings": self.performance_metrics["gpu_accelerated"],
                 "batch_optimizations": self.performance_metrics["batch_optimizations"],
                 "total_embeddings_generated": self.performance_metrics["total_embeddings_generated"],
                 "average_processing_time": avg_processing_time,
                 "total_processing_time": self.performance_metrics["total_processing_time"],
+                "models": {
+                    name: self.model_manager.get_model_info(name)
+                    for name in self.model_manager.list_loaded_models()
+                },
             }
 
     def clear_cache(self):
@@ -18,6 +18,7 @@ except ImportError:
 from ...config import SERVICE_CONFIG, LANGUAGE_CONFIG
 from ...exceptions import LanguageDetectionError
 from ...utils.logging_config import get_logger
+from ...utils.text_profile import ScriptHistogram, TextProfile
 from ...utils.types import LanguageDetectionResult
 
 
@@ -181,13 +182,16 @@ class LanguageDetectionService:
         self._update_stats(0.5, "default")
         return default_result
 
-    def detect_language_config_driven(self, text: str, config: Optional[Any] = None) -> LanguageDetectionResult:
+    def detect_language_config_driven(
+        self, text: str, config: Optional[Any] = None, profile: Optional[TextProfile] = None
+    ) -> LanguageDetectionResult:
         """
         Config-driven language detection with detailed analysis
         
         Args:
             text: Input text to analyze
             config: LanguageConfig instance (uses LANGUAGE_CONFIG if None)
+            profile: Shared profile of ``text``; its script counts are reused
             
         Returns:
             LanguageDetectionResult with detailed analysis
@@ -226,12 +230,13 @@ class LanguageDetectionService:
                 }
             )
         
-        # Extract alphabetic characters for analysis
-        text_alpha = re.sub(r'[^a-zA-Zа-яёіїєґА-ЯЁІЇЄҐ]', '', text)
+        # Alphabetic (Cyrillic/Latin) and non-alphabetic, non-space character counts
+        scripts = TextProfile.for_text(text, profile).scripts
+        alpha_count = scripts.letters
         
         # Edge case 2: Check for numeric/punctuation dominance (>70%) - check this first
         total_chars = len(text)
-        non_alpha_chars = len(re.findall(r'[^a-zA-Zа-яёіїєґА-ЯЁІЇЄҐ\s]', text))
+        non_alpha_chars = scripts.digits + scripts.other
         if total_chars > 0 and (non_alpha_chars / total_chars) >= 0.7:
             return LanguageDetectionResult(
                 language="unknown",
@@ -244,7 +249,7 @@ class LanguageDetectionService:
                     "lat_ratio": 0.0,
                     "uk_chars": 0,
                     "ru_chars": 0,
-                    "total_letters": len(text_alpha),
+                    "total_letters": alpha_count,
                     "digits": 0,
                     "punct": 0,
                     "uppercase_chars": 0,
@@ -258,13 +263,13 @@ class LanguageDetectionService:
                         "uppercase_ratio": 0.0,
                         "is_likely_acronym": False,
                         "total_processing_chars": len(text),
-                        "alphabetic_chars": len(text_alpha)
+                        "alphabetic_chars": alpha_count
                     }
                 }
             )
         
         # Edge case 1: Check for short text (less than 3 alphabetic characters)
-        if len(text_alpha) < 3:
+        if alpha_count < 3:
             return LanguageDetectionResult(
                 language="unknown",
                 confidence=0.3,
@@ -276,7 +281,7 @@ class LanguageDetectionService:
                     "lat_ratio": 0.0,
                     "uk_chars": 0,
                     "ru_chars": 0,
-                    "total_letters": len(text_alpha),
+                    "total_letters": alpha_count,
                     "digits": 0,
                     "punct": 0,
                     "uppercase_chars": 0,
@@ -290,18 +295,18 @@ class LanguageDetectionService:
                         "uppercase_ratio": 0.0,
                         "is_likely_acronym": False,
                         "total_processing_chars": len(text),
-                        "alphabetic_chars": len(text_alpha)
+                        "alphabetic_chars": alpha_count
                     }
                 }
             )
         
         # Calculate character ratios
-        details = self._calculate_character_ratios(text)
+        details = self._calculate_character_ratios(text, scripts)
         
         # Edge case 3: Check for uppercase/acronym dominance
-        uppercase_ratio = details["uppercase_chars"] / len(text_alpha) if len(text_alpha) > 0 else 0
+        uppercase_ratio = details["uppercase_chars"] / alpha_count if alpha_count > 0 else 0
         is_likely_acronym = (uppercase_ratio > 0.9 and 
-                           len(text_alpha) <= 10 and 
+                           alpha_count <= 10 and 
                            bool(re.match(r'^[A-ZА-ЯЁІЇЄҐ]+$', text.strip())))
         
         # Determine primary language based on config thresholds
@@ -350,7 +355,7 @@ class LanguageDetectionService:
                 "uppercase_ratio": uppercase_ratio,
                 "is_likely_acronym": is_likely_acronym,
                 "total_processing_chars": len(text),
-                "alphabetic_chars": len(text_alpha)
+                "alphabetic_chars": alpha_count
             }
         })
         
@@ -360,39 +365,12 @@ class LanguageDetectionService:
             details=details
         )
     
-    def _calculate_character_ratios(self, text: str) -> Dict[str, Any]:
-        """Calculate character ratios and counts in single pass for performance"""
-        # Initialize counters
-        cyr_chars = 0
-        lat_chars = 0
-        uk_chars = 0
-        ru_chars = 0
-        digits = 0
-        punct = 0
-        uppercase_chars = 0
-        
-        # Single pass through text
-        for char in text:
-            if 'а' <= char <= 'я' or 'А' <= char <= 'Я' or char in 'ёЁіїєґІЇЄҐ':
-                cyr_chars += 1
-                # Check for specific Ukrainian characters
-                if char in 'іїєґІЇЄҐ':
-                    uk_chars += 1
-                # Check for specific Russian characters
-                elif char in 'ёъыэЁЪЫЭ':
-                    ru_chars += 1
-                # Check for uppercase
-                if char.isupper():
-                    uppercase_chars += 1
-            elif 'a' <= char <= 'z' or 'A' <= char <= 'Z':
-                lat_chars += 1
-                # Check for uppercase
-                if char.isupper():
-                    uppercase_chars += 1
-            elif '0' <= char <= '9':
-                digits += 1
-            elif not char.isspace():
-                punct += 1
+    def _calculate_character_ratios(self, text: str, scripts: Optional[ScriptHistogram] = None) -> Dict[str, Any]:
+        """Calculate character ratios and counts from the text's script histogram"""
+        if scripts is None:
+            scripts = TextProfile(text).scripts
+        cyr_chars = scripts.cyrillic
+        lat_chars = scripts.latin
         
         # Calculate total letters (excluding digits and punctuation)
         total_letters = cyr_chars + lat_chars
@@ -406,12 +384,12 @@ class LanguageDetectionService:
             "lat_chars": lat_chars,
             "cyr_ratio": cyr_ratio,
             "lat_ratio": lat_ratio,
-            "uk_chars": uk_chars,
-            "ru_chars": ru_chars,
+            "uk_chars": scripts.ukrainian,
+            "ru_chars": scripts.russian,
             "total_letters": total_letters,
-            "digits": digits,
-            "punct": punct,
-            "uppercase_chars": uppercase_chars,
+            "digits": scripts.digits,
+            "punct": scripts.other,
+            "uppercase_chars": scripts.uppercase,
             "bonuses": {}
         }
     
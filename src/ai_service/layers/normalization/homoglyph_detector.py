@@ -7,8 +7,9 @@ for security attacks or bypassing filters.
 
 import re
 import unicodedata
-from typing import Dict, List, Tuple, Set
+from typing import Dict, List, Optional, Tuple, Set
 from ...utils.logging_config import get_logger
+from ...utils.text_profile import TextProfile
 
 logger = get_logger(__name__)
 
@@ -73,6 +74,7 @@ class HomoglyphDetector:
     def __init__(self):
         """Initialize the homoglyph detector."""
         self.homoglyph_map = ALL_HOMOGLYPHS
+        self._homoglyph_chars = frozenset(ALL_HOMOGLYPHS)
         self.suspicious_patterns = self._compile_suspicious_patterns()
 
     def _compile_suspicious_patterns(self) -> List[re.Pattern]:
@@ -87,17 +89,19 @@ class HomoglyphDetector:
 
         return patterns
 
-    def detect_homoglyphs(self, text: str) -> Dict[str, any]:
+    def detect_homoglyphs(self, text: str, profile: Optional[TextProfile] = None) -> Dict[str, any]:
         """
         Detect potential homoglyph attacks in text.
 
         Args:
             text: Input text to analyze
+            profile: Shared profile of ``text``; single-script texts are
+                answered from its script counts without scanning words
 
         Returns:
             Dictionary with detection results
         """
-        if not text:
+        if not text or self._is_single_script(text, profile):
             return {
                 'has_homoglyphs': False,
                 'suspicious_chars': [],
@@ -111,7 +115,7 @@ class HomoglyphDetector:
         details = []
 
         # Check for mixed-script words first (this is the real attack)
-        words = text.split()
+        words = profile.tokens if profile is not None and profile.text == text else text.split()
         text_scripts = set()
 
         for word_idx, word in enumerate(words):
@@ -164,18 +168,21 @@ class HomoglyphDetector:
             'details': details
         }
 
-    def normalize_homoglyphs(self, text: str) -> Tuple[str, List[str]]:
+    def normalize_homoglyphs(self, text: str, profile: Optional[TextProfile] = None) -> Tuple[str, List[str]]:
         """
         Normalize homoglyphs to their canonical forms.
 
         Args:
             text: Input text with potential homoglyphs
+            profile: Shared profile of ``text``
 
         Returns:
             Tuple of (normalized_text, applied_transformations)
         """
         if not text:
             return text, []
+        if profile is not None and profile.text == text and not profile.char_positions(self._homoglyph_chars):
+            return text, []
 
         normalized = text
         transformations = []
@@ -193,6 +200,12 @@ class HomoglyphDetector:
 
         return normalized, transformations
 
+    def _is_single_script(self, text: str, profile: Optional[TextProfile]) -> bool:
+        """Whether the profile shows no mixed script is possible (needs both A-z and А-я)."""
+        if profile is None or profile.text != text:
+            return False
+        return not (profile.scripts.latin_block and profile.scripts.cyrillic_basic)
+
     def _is_mixed_script(self, word: str) -> bool:
         """Check if word contains mixed scripts (Latin + Cyrillic)."""
         has_latin = any('\u0041' <= char <= '\u007A' for char in word)  # A-Z, a-z
@@ -242,11 +255,10 @@ class HomoglyphDetector:
         if not text:
             return text, {'safe': True, 'transformations': [], 'warnings': []}
 
-        # Detect homoglyphs
-        detection = self.detect_homoglyphs(text)
-
-        # Normalize homoglyphs
-        normalized, transformations = self.normalize_homoglyphs(text)
+        # Detect and normalize homoglyphs from one profile of the text
+        profile = TextProfile(text)
+        detection = self.detect_homoglyphs(text, profile)
+        normalized, transformations = self.normalize_homoglyphs(text, profile)
 
         # Generate warnings
         warnings = []
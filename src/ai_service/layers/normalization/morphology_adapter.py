@@ -15,10 +15,11 @@ from ...utils.memory_aware_cache import memory_aware_lru_cache
 from typing import Dict, List, Optional, Tuple, Any, TYPE_CHECKING
 
 from ...utils.logging_config import get_logger
+from ...utils.lru_cache_ttl import LruTtlCache
 
 if TYPE_CHECKING:
-    from ...utils.lru_cache_ttl import LruTtlCache
     from ...utils.feature_flags import FeatureFlags
+    from .morphology_lexicon import MorphologyLexicon
 
 
 @dataclass(frozen=True)
@@ -43,20 +44,30 @@ class MorphologyAdapter:
     - Fallback behavior for missing UK dictionary
     - Warmup functionality for common names
     - Graceful degradation when pymorphy3 is unavailable
+    - Precomputed mmap lexicon of known names consulted before pymorphy3
     """
 
-    def __init__(self, cache_size: int = 100000, cache: Optional[LruTtlCache] = None):
+    def __init__(
+        self,
+        cache_size: int = 100000,
+        cache: Optional[LruTtlCache] = None,
+        lexicon: Optional["MorphologyLexicon"] = None,
+    ):
         """
         Initialize morphology adapter.
         
         Args:
             cache_size: Maximum number of cached parse results
-            cache: Optional external cache instance
+            cache: Optional external cache for parse results, consulted before
+                pymorphy3 (e.g. one backed by the shared L2 tier)
+            lexicon: Optional precomputed lexicon of known names, consulted
+                before pymorphy3 (see morphology_lexicon.get_morphology_lexicon)
         """
         self._logger = get_logger(__name__)
         self._cache_size = cache_size
         self._lock = threading.RLock()
         self.cache = cache
+        self.lexicon = lexicon
         
         # Analyzers for each language
         self._analyzers: Dict[str, Any] = {}
@@ -67,9 +78,11 @@ class MorphologyAdapter:
         self._initialize_analyzers()
         
         # Create memory-aware cached methods with pressure handling
-        self._parse_cached = memory_aware_lru_cache(maxsize=cache_size)(self._parse_uncached)
+        self._parse_cached = memory_aware_lru_cache(maxsize=cache_size)(self._parse_external_cached)
         self._to_nominative_cached = memory_aware_lru_cache(maxsize=cache_size)(self._to_nominative_uncached)
         self._detect_gender_cached = memory_aware_lru_cache(maxsize=cache_size)(self._detect_gender_uncached)
+        # Keyed by flags as well as token, so it cannot use the lru_cache wrappers
+        self._to_nominative_cached_with_flags = LruTtlCache(maxsize=cache_size, ttl_seconds=3600)
 
     def parse(self, token: str, lang: str) -> List[MorphParse]:
         """
@@ -130,10 +143,9 @@ class MorphologyAdapter:
         )
 
         # Check cache first
-        if hasattr(self, '_to_nominative_cached_with_flags'):
-            cached_result = self._to_nominative_cached_with_flags.get(cache_key)
-            if cached_result is not None:
-                return cached_result
+        hit, cached_result = self._to_nominative_cached_with_flags.get(cache_key)
+        if hit:
+            return cached_result
 
         # Process token
         normalized = unicodedata.normalize("NFC", token)
@@ -142,9 +154,7 @@ class MorphologyAdapter:
         )
         
         # Cache result
-        if not hasattr(self, '_to_nominative_cached_with_flags'):
-            self._to_nominative_cached_with_flags = {}
-        self._to_nominative_cached_with_flags[cache_key] = (result, trace_note)
+        self._to_nominative_cached_with_flags.set(cache_key, (result, trace_note))
         
         return result, trace_note
 
@@ -456,6 +466,7 @@ class MorphologyAdapter:
             self._parse_cached.cache_clear()
             self._to_nominative_cached.cache_clear()
             self._detect_gender_cached.cache_clear()
+            self._to_nominative_cached_with_flags.clear()
         self._logger.info("Morphology cache cleared")
 
     def get_cache_stats(self) -> Dict[str, int]:
@@ -470,6 +481,9 @@ class MorphologyAdapter:
             "parse_cache_misses": getattr(parse_info, 'misses', parse_info.get('misses', 0) if isinstance(parse_info, dict) else 0),
             "nominative_cache_size": getattr(nominative_info, 'currsize', nominative_info.get('currsize', 0) if isinstance(nominative_info, dict) else 0),
             "gender_cache_size": getattr(gender_info, 'currsize', gender_info.get('currsize', 0) if isinstance(gender_info, dict) else 0),
+            "nominative_flags_cache_size": len(self._to_nominative_cached_with_flags),
+            "lexicon_keys": len(self.lexicon) if self.lexicon is not None else 0,
+            "lexicon_hits": self.lexicon.stats["hits"] if self.lexicon is not None else 0,
         }
     
     def get_stats(self) -> Dict[str, int]:
@@ -528,8 +542,28 @@ class MorphologyAdapter:
         with self._lock:
             return self._analyzers.get(lang)
 
+    def _parse_external_cached(self, token: str, lang: str) -> List[MorphParse]:
+        """Parse through the external cache, if one was given."""
+        if self.cache is None or not self.cache:
+            return self._parse_uncached(token, lang)
+
+        cache_key = ("parse", lang, token)
+        hit, parses = self.cache.get(cache_key)
+        if hit:
+            return parses
+
+        parses = self._parse_uncached(token, lang)
+        self.cache.set(cache_key, parses)
+        return parses
+
     def _parse_uncached(self, token: str, lang: str) -> List[MorphParse]:
         """Uncached parse implementation."""
+        # Known names were analyzed offline; skip the pymorphy3 dictionary
+        if self.lexicon is not None:
+            parses = self.lexicon.lookup(token, lang)
+            if parses is not None:
+                return parses
+
         analyzer = self._get_analyzer(lang)
         if not analyzer:
             return []
@@ -578,7 +612,7 @@ class MorphologyAdapter:
 
     def _to_nominative_uncached(self, token: str, lang: str) -> str:
         """Uncached nominative conversion."""
-        parses = self._parse_uncached(token, lang)
+        parses = self._parse_external_cached(token, lang)
         
         # Look for explicit nominative case first
         for parse in parses:
@@ -711,7 +745,7 @@ class MorphologyAdapter:
             base_token = token
             trace_note = None
 
-        parses = self._parse_uncached(base_token, lang)
+        parses = self._parse_external_cached(base_token, lang)
         if not parses:
             if lang == "uk":
                 fallback = self._fallback_ukrainian_nominative(base_token)
@@ -959,7 +993,7 @@ class MorphologyAdapter:
 
     def _detect_gender_uncached(self, token: str, lang: str) -> str:
         """Uncached gender detection."""
-        parses = self._parse_uncached(token, lang)
+        parses = self._parse_external_cached(token, lang)
         
         # Find best parse by score
         best_parse = self._best_parse(parses)
@@ -1068,17 +1102,18 @@ _adapter_lock = threading.Lock()
 def get_global_adapter(cache_size: int = 100000) -> MorphologyAdapter:
     """Get global morphology adapter instance."""
     global _global_adapter
+    from .morphology_lexicon import get_morphology_lexicon
     
     if _global_adapter is None:
         with _adapter_lock:
             if _global_adapter is None:
-                _global_adapter = MorphologyAdapter(cache_size)
+                _global_adapter = MorphologyAdapter(cache_size, lexicon=get_morphology_lexicon())
     else:
         # If adapter exists but with different cache size, recreate it
         if _global_adapter._cache_size != cache_size:
             with _adapter_lock:
                 if _global_adapter._cache_size != cache_size:
-                    _global_adapter = MorphologyAdapter(cache_size)
+                    _global_adapter = MorphologyAdapter(cache_size, lexicon=get_morphology_lexicon())
     
     return _global_adapter
 
@@ -0,0 +1,416 @@
+"""
+Precomputed, read-only morphology lexicon for known name tokens.
+
+``MorphologyAdapter._parse_uncached`` calls pymorphy3 ``parse`` and
+``inflect({"nomn"})`` for every cache miss, and each worker keeps its own
+parse caches. Names we expect to see (name dictionaries, diminutive maps,
+sanctions lists and their inflected forms) are analyzed once offline by
+``scripts/build_morphology_lexicon.py`` and written here as flat columns:
+
+- sorted ``lang:token`` keys, found by binary search over a UTF-8 blob;
+- per key, a run of parse rows holding normal form, nominative, tag, score,
+  gender, case and a patronymic flag, in pymorphy3's order.
+
+The file uses the same section layout as the local AC snapshot and is
+mapped read-only with ``mmap``, so all uvicorn workers share its pages and
+lookups allocate only the returned ``MorphParse`` objects. The header records
+the pymorphy3 and dictionary versions it was built with; a lexicon from other
+versions is not used.
+"""
+
+import json
+import mmap
+import os
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from ...utils.logging_config import get_logger
+from .morphology_adapter import MorphParse
+
+logger = get_logger(__name__)
+
+LEXICON_MAGIC = b"AIMLEX01"
+LEXICON_FORMAT_VERSION = 1
+
+DEFAULT_LEXICON_PATH = Path(__file__).resolve().parents[4] / "data" / "morphology" / "names_lexicon.mlex"
+LEXICON_LANGUAGES = ("ru", "uk")
+
+# Column name -> array typecode. Order is the on-disk section order.
+_COLUMNS = {
+    "key_refs": "I",         # (offset, length) pairs into strings, sorted by key bytes
+    "key_parse_offsets": "I",  # n_keys + 1 offsets into parse rows
+    "parse_string_refs": "I",  # (offset, length) pairs: normal, nominative, tag
+    "parse_scores": "d",
+    "parse_genders": "B",      # index into header["genders"]
+    "parse_cases": "B",        # index into header["cases"]
+    "parse_flags": "B",
+}
+_STRINGS_PER_PARSE = 3
+
+FLAG_PATRONYMIC = 1
+FLAG_NO_NOMINATIVE = 2
+
+
+def lexicon_key(token: str, lang: str) -> Optional[str]:
+    """
+    Lookup key, or None for tokens the lexicon does not cover.
+
+    Dictionary parses do not depend on case, so keys are lowercased. pymorphy3
+    adds initial readings (``Name,Abbr,Init``) for uppercase letters, though,
+    so single-letter and all-uppercase tokens always go to pymorphy3.
+    """
+    if len(token) == 1 or token.isupper():
+        return None
+    return f"{lang}:{token.lower()}"
+
+
+class MorphologyLexicon:
+    """Read-only ``lang:token`` -> ``List[MorphParse]`` table, built offline."""
+
+    def __init__(self):
+        self.version: Optional[str] = None
+        self.metadata: Dict[str, Any] = {}
+        self._mmap: Optional[mmap.mmap] = None
+        self._columns: Dict[str, Any] = {name: array(code) for name, code in _COLUMNS.items()}
+        self._blob: Union[bytearray, memoryview] = bytearray()
+        self._genders: List[Optional[str]] = [None]
+        self._cases: List[Optional[str]] = [None]
+        self.stats: Dict[str, Any] = {
+            "keys": 0,
+            "parses": 0,
+            "lookups": 0,
+            "hits": 0,
+            "mmap_bytes": 0,
+        }
+
+    def __len__(self) -> int:
+        return max(len(self._columns["key_parse_offsets"]) - 1, 0)
+
+    @property
+    def is_mapped(self) -> bool:
+        return self._mmap is not None
+
+    def build(self, entries: Iterable[Tuple[str, str, List[MorphParse]]]) -> "MorphologyLexicon":
+        """
+        Build the lexicon from analyzed tokens.
+
+        Args:
+            entries: (token, lang, parses) triples; parses as returned by
+                ``MorphologyAdapter._parse_uncached``. Later duplicates of a
+                key are ignored.
+
+        Returns:
+            self, for chaining
+        """
+        by_key: Dict[bytes, List[MorphParse]] = {}
+        for token, lang, parses in entries:
+            key = lexicon_key(token, lang)
+            if key is not None:
+                by_key.setdefault(key.encode("utf-8"), list(parses))
+
+        cols = {name: array(code) for name, code in _COLUMNS.items()}
+        blob = bytearray()
+        string_refs: Dict[str, Tuple[int, int]] = {}
+        gender_codes: Dict[Optional[str], int] = {None: 0}
+        case_codes: Dict[Optional[str], int] = {None: 0}
+
+        def add_string(column: str, value: str) -> None:
+            ref = string_refs.get(value)
+            if ref is None:
+                encoded = value.encode("utf-8")
+                ref = (len(blob), len(encoded))
+                blob.extend(encoded)
+                string_refs[value] = ref
+            cols[column].extend(ref)
+
+        cols["key_parse_offsets"].append(0)
+        # UTF-8 byte order is code point order, so lookups can compare raw bytes
+        for key in sorted(by_key):
+            add_string("key_refs", key.decode("utf-8"))
+            for parse in by_key[key]:
+                add_string("parse_string_refs", parse.normal)
+                add_string("parse_string_refs", parse.nominative or "")
+                add_string("parse_string_refs", parse.tag)
+                cols["parse_scores"].append(parse.score)
+                cols["parse_genders"].append(gender_codes.setdefault(parse.gender, len(gender_codes)))
+                cols["parse_cases"].append(case_codes.setdefault(parse.case, len(case_codes)))
+                flags = 0
+                if "Patr" in parse.tag:
+                    flags |= FLAG_PATRONYMIC
+                if parse.nominative is None:
+                    flags |= FLAG_NO_NOMINATIVE
+                cols["parse_flags"].append(flags)
+            cols["key_parse_offsets"].append(len(cols["parse_scores"]))
+
+        self._columns = cols
+        self._blob = blob
+        self._genders = list(gender_codes)
+        self._cases = list(case_codes)
+        self.stats["keys"] = len(by_key)
+        self.stats["parses"] = len(cols["parse_scores"])
+        return self
+
+    def lookup(self, token: str, lang: str) -> Optional[List[MorphParse]]:
+        """
+        Parses for a token.
+
+        Returns:
+            The stored parse list (possibly empty), or None if the token is
+            not in the lexicon
+        """
+        self.stats["lookups"] += 1
+        index = self._find_token(token, lang)
+        if index is None:
+            return None
+        self.stats["hits"] += 1
+
+        offsets = self._columns["key_parse_offsets"]
+        return [self._make_parse(row) for row in range(offsets[index], offsets[index + 1])]
+
+    def is_patronymic(self, token: str, lang: str) -> Optional[bool]:
+        """Whether any stored parse is a patronymic; None if the token is unknown."""
+        index = self._find_token(token, lang)
+        if index is None:
+            return None
+        offsets = self._columns["key_parse_offsets"]
+        flags = self._columns["parse_flags"]
+        return any(flags[row] & FLAG_PATRONYMIC for row in range(offsets[index], offsets[index + 1]))
+
+    def __contains__(self, item: Tuple[str, str]) -> bool:
+        token, lang = item
+        return self._find_token(token, lang) is not None
+
+    def _find_token(self, token: str, lang: str) -> Optional[int]:
+        key = lexicon_key(token, lang)
+        return None if key is None else self._find(key.encode("utf-8"))
+
+    def _find(self, key: bytes) -> Optional[int]:
+        refs = self._columns["key_refs"]
+        blob = self._blob
+        lo, hi = 0, len(refs) // 2
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset, length = refs[2 * mid], refs[2 * mid + 1]
+            probe = bytes(blob[offset:offset + length])
+            if probe < key:
+                lo = mid + 1
+            elif probe > key:
+                hi = mid
+            else:
+                return mid
+        return None
+
+    def _string(self, ref: int) -> str:
+        refs = self._columns["parse_string_refs"]
+        offset, length = refs[2 * ref], refs[2 * ref + 1]
+        return str(self._blob[offset:offset + length], "utf-8")
+
+    def _make_parse(self, row: int) -> MorphParse:
+        cols = self._columns
+        base = row * _STRINGS_PER_PARSE
+        flags = cols["parse_flags"][row]
+        return MorphParse(
+            normal=self._string(base),
+            tag=self._string(base + 2),
+            score=cols["parse_scores"][row],
+            case=self._cases[cols["parse_cases"][row]],
+            gender=self._genders[cols["parse_genders"][row]],
+            nominative=None if flags & FLAG_NO_NOMINATIVE else self._string(base + 1),
+        )
+
+    def save(self, path: Union[str, Path], version: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Serialize the lexicon into one binary file.
+
+        Written to a temporary sibling and moved into place with
+        ``os.replace`` so readers never observe a partial file.
+        """
+        path = Path(path)
+        payloads = [(name, memoryview(self._columns[name]).cast("B")) for name in _COLUMNS]
+        payloads.append(("strings", memoryview(self._blob)))
+
+        header = {
+            "version": version or self.version or time.strftime("%Y%m%d%H%M%S"),
+            "created_at": time.time(),
+            "byteorder": sys.byteorder,
+            "itemsizes": {code: array(code).itemsize for code in set(_COLUMNS.values())},
+            "genders": self._genders,
+            "cases": self._cases,
+            "metadata": metadata or self.metadata,
+            "stats": {k: self.stats[k] for k in ("keys", "parses")},
+            "sections": {},
+        }
+
+        # Section offsets are relative to the aligned start of the data area
+        relative = 0
+        for name, payload in payloads:
+            relative = _align(relative)
+            header["sections"][name] = [relative, payload.nbytes]
+            relative += payload.nbytes
+
+        header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+        data_start = _align(16 + len(header_bytes))
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+        with open(tmp_path, "wb") as f:
+            f.write(LEXICON_MAGIC)
+            f.write(LEXICON_FORMAT_VERSION.to_bytes(4, "little"))
+            f.write(len(header_bytes).to_bytes(4, "little"))
+            f.write(header_bytes)
+            for name, payload in payloads:
+                offset = data_start + header["sections"][name][0]
+                f.write(b"\0" * (offset - f.tell()))
+                f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+        self.version = header["version"]
+        self.metadata = header["metadata"]
+        size = path.stat().st_size
+        logger.info(f"Morphology lexicon written: {path} ({size} bytes, {self.stats['keys']} keys, version={self.version})")
+        return {"path": str(path), "version": self.version, "bytes": size}
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "MorphologyLexicon":
+        """Map a lexicon file read-only."""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(mapped)
+        if bytes(view[:8]) != LEXICON_MAGIC:
+            raise ValueError(f"Not a morphology lexicon: {path}")
+        format_version = int.from_bytes(view[8:12], "little")
+        if format_version != LEXICON_FORMAT_VERSION:
+            raise ValueError(f"Unsupported morphology lexicon format {format_version}: {path}")
+        header_len = int.from_bytes(view[12:16], "little")
+        header = json.loads(bytes(view[16:16 + header_len]).decode("utf-8"))
+        data_start = _align(16 + header_len)
+
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"Morphology lexicon byte order {header['byteorder']} does not match host")
+        for code, size in header["itemsizes"].items():
+            if array(code).itemsize != size:
+                raise ValueError(f"Morphology lexicon item size mismatch for '{code}'")
+
+        def section(name: str) -> memoryview:
+            offset, length = header["sections"][name]
+            offset += data_start
+            return view[offset:offset + length]
+
+        lexicon = cls()
+        lexicon._mmap = mapped
+        lexicon._columns = {name: section(name).cast(code) for name, code in _COLUMNS.items()}
+        lexicon._blob = section("strings")
+        lexicon._genders = header["genders"]
+        lexicon._cases = header["cases"]
+        lexicon.version = header["version"]
+        lexicon.metadata = header.get("metadata", {})
+        lexicon.stats.update(header["stats"])
+        lexicon.stats["mmap_bytes"] = len(mapped)
+
+        logger.info(f"Morphology lexicon mapped: {path} (version={lexicon.version}, {len(lexicon)} keys)")
+        return lexicon
+
+    def analyzer_mismatch(self, current: Dict[str, Any]) -> Optional[str]:
+        """
+        Compare the versions the lexicon was built with against ``current``
+        (see ``analyzer_metadata``).
+
+        Returns:
+            Description of the first difference, or None if they match
+        """
+        built = self.metadata or {}
+        if built.get("pymorphy3") != current.get("pymorphy3"):
+            return f"pymorphy3 {built.get('pymorphy3')} (running {current.get('pymorphy3')})"
+        built_dicts = built.get("dictionaries") or {}
+        for lang, meta in current.get("dictionaries", {}).items():
+            if lang in built_dicts and built_dicts[lang] != meta:
+                return f"{lang} dictionary {built_dicts[lang]} (running {meta})"
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get lexicon statistics."""
+        lookups = self.stats["lookups"]
+        return {
+            **self.stats,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+            "mapped": self.is_mapped,
+            "version": self.version,
+        }
+
+
+_default_lexicon: Optional[MorphologyLexicon] = None
+_default_lexicon_loaded = False
+
+
+def analyzer_metadata(languages: Iterable[str] = LEXICON_LANGUAGES) -> Dict[str, Any]:
+    """
+    pymorphy3 and installed dictionary versions, as recorded in lexicon headers.
+
+    Read from the dictionaries' meta.json, without loading an analyzer.
+
+    Raises:
+        ImportError: pymorphy3 is not installed
+    """
+    import pymorphy3
+    from pymorphy3.analyzer import lang_dict_path
+    from pymorphy3.opencorpora_dict.storage import load_meta
+
+    metadata: Dict[str, Any] = {"pymorphy3": pymorphy3.__version__, "dictionaries": {}}
+    for lang in languages:
+        try:
+            meta = load_meta(os.path.join(lang_dict_path(lang), "meta.json"))
+        except (ValueError, OSError):
+            continue  # no dictionary for this language
+        metadata["dictionaries"][lang] = {
+            "lang": lang,
+            "source_version": meta.get("source_version"),
+            "source_revision": meta.get("source_revision"),
+        }
+    return metadata
+
+
+def get_morphology_lexicon() -> Optional[MorphologyLexicon]:
+    """
+    Process-wide lexicon from MORPHOLOGY_LEXICON_PATH (default
+    data/morphology/names_lexicon.mlex), or None if it is disabled
+    (ENABLE_MORPHOLOGY_LEXICON=false), missing, unreadable or built with
+    other pymorphy3 or dictionary versions than the installed ones.
+    """
+    global _default_lexicon, _default_lexicon_loaded
+    if _default_lexicon_loaded:
+        return _default_lexicon
+    _default_lexicon_loaded = True
+
+    if os.getenv("ENABLE_MORPHOLOGY_LEXICON", "true").lower() != "true":
+        return None
+    path = Path(os.getenv("MORPHOLOGY_LEXICON_PATH") or DEFAULT_LEXICON_PATH)
+    if not path.exists():
+        logger.debug(f"Morphology lexicon not found at {path}; using pymorphy3 only")
+        return None
+    try:
+        lexicon = MorphologyLexicon.load(path)
+        mismatch = lexicon.analyzer_mismatch(analyzer_metadata())
+    except ImportError:
+        logger.debug("pymorphy3 is not available; not using the morphology lexicon")
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to load morphology lexicon {path}: {e}")
+        return None
+    if mismatch:
+        logger.warning(
+            f"Ignoring morphology lexicon {path}: built with {mismatch}; "
+            "rebuild it with scripts/build_morphology_lexicon.py"
+        )
+        return None
+    _default_lexicon = lexicon
+    return _default_lexicon
+
+
+def _align(offset: int, boundary: int = 8) -> int:
+    return (offset + boundary - 1) // boundary * boundary
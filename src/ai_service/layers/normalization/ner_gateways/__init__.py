@@ -10,6 +10,7 @@ from .unified_spacy_gateway import (
     create_ukrainian_gateway,
     create_english_gateway
 )
+from .batched_spacy_gateway import BatchedSpacyGateway, get_batched_gateway
 
 # Backward compatibility wrappers
 def get_spacy_ru_ner():
@@ -55,6 +56,7 @@ def clear_spacy_en_ner():
 
 __all__ = [
     "UnifiedSpacyGateway",
+    "BatchedSpacyGateway",
     "SupportedLanguage",
     "SpacyUkNER",
     "SpacyEnNER",
@@ -67,6 +69,7 @@ __all__ = [
     "get_spacy_en_ner",
     "get_spacy_ru_ner",
     "get_global_gateway",
+    "get_batched_gateway",
     "clear_ner_cache",
     "clear_spacy_en_ner",
     "clear_spacy_ru_ner"
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Batched spaCy NER gateway.
+
+``UnifiedSpacyGateway.extract_entities`` runs one document at a time in the
+caller's thread, which blocks the event loop for the whole spaCy call. This
+gateway queues NER requests per language instead; a worker thread per
+language collects them into batches and runs ``nlp.pipe(batch_size=...)``.
+
+- models are loaded lazily, by the worker of the first request in that
+  language, so the event loop never waits for ``spacy.load``;
+- every request has a time budget; a caller that runs out of budget gets
+  no entities (NER hints are optional) and the worker skips the request
+  if it has not started on it yet;
+- a full queue also degrades to no entities instead of blocking.
+"""
+
+import asyncio
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional, Tuple
+
+from ....utils.logging_config import get_logger
+from .unified_spacy_gateway import (
+    NEREntity,
+    NERHints,
+    SupportedLanguage,
+    UnifiedSpacyGateway,
+    get_global_gateway,
+)
+
+logger = get_logger(__name__)
+
+# Queue item asking a worker to exit
+_STOP = object()
+
+
+class BatchedSpacyGateway:
+    """
+    NER gateway that batches concurrent requests through ``nlp.pipe``.
+
+    Thread-safe; the async methods can be awaited from the event loop
+    without blocking it.
+    """
+
+    def __init__(
+        self,
+        gateway: Optional[UnifiedSpacyGateway] = None,
+        batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        time_budget_ms: float = 100.0,
+        max_queue_size: int = 1000,
+    ):
+        """
+        Initialize batched gateway.
+
+        Args:
+            gateway: Gateway that owns the spaCy models (default: the global one)
+            batch_size: Maximum number of texts per ``nlp.pipe`` call
+            max_wait_ms: How long a worker waits to fill a batch after its first request
+            time_budget_ms: Default per-request time budget
+            max_queue_size: Pending requests per language before new ones are dropped
+        """
+        self.gateway = gateway or get_global_gateway()
+        self.batch_size = max(1, batch_size)
+        self.max_wait_ms = max_wait_ms
+        self.time_budget_ms = time_budget_ms
+        self.max_queue_size = max_queue_size
+
+        self._queues: Dict[SupportedLanguage, queue.Queue] = {}
+        self._workers: Dict[SupportedLanguage, threading.Thread] = {}
+        self._lock = threading.Lock()
+
+        # Metrics
+        self._submitted = 0
+        self._completed = 0
+        self._timeouts = 0
+        self._expired = 0
+        self._dropped = 0
+        self._batches = 0
+        self._batched_texts = 0
+
+    def submit(
+        self, text: str, language: SupportedLanguage, time_budget_ms: Optional[float] = None
+    ) -> Future:
+        """
+        Queue a NER request.
+
+        Args:
+            text: Text to process
+            language: Language of the text
+            time_budget_ms: Time budget for this request (default: time_budget_ms)
+
+        Returns:
+            Future resolving to the list of extracted entities
+        """
+        future: Future = Future()
+        if not text or not text.strip() or not self.gateway.is_available(language, load=False):
+            future.set_result([])
+            return future
+
+        budget = self.time_budget_ms if time_budget_ms is None else time_budget_ms
+        deadline = time.monotonic() + budget / 1000
+        try:
+            self._queue(language).put_nowait((text, future, deadline))
+        except queue.Full:
+            self._count("_dropped")
+            future.set_result([])
+            return future
+
+        self._count("_submitted")
+        return future
+
+    def extract_entities(
+        self, text: str, language: SupportedLanguage, time_budget_ms: Optional[float] = None
+    ) -> List[NEREntity]:
+        """
+        Extract named entities, blocking for at most the time budget.
+
+        Returns:
+            List of extracted entities (empty if the budget ran out)
+        """
+        budget = self.time_budget_ms if time_budget_ms is None else time_budget_ms
+        future = self.submit(text, language, budget)
+        try:
+            return future.result(timeout=budget / 1000)
+        except FutureTimeoutError:
+            future.cancel()
+            self._count("_timeouts")
+            return []
+
+    async def extract_entities_async(
+        self, text: str, language: SupportedLanguage, time_budget_ms: Optional[float] = None
+    ) -> List[NEREntity]:
+        """
+        Extract named entities without blocking the event loop.
+
+        Returns:
+            List of extracted entities (empty if the budget ran out)
+        """
+        budget = self.time_budget_ms if time_budget_ms is None else time_budget_ms
+        future = self.submit(text, language, budget)
+        try:
+            # Cancelling the wrapper on timeout cancels the queued request too
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=budget / 1000)
+        except asyncio.TimeoutError:
+            self._count("_timeouts")
+            return []
+
+    async def get_ner_hints_async(
+        self, text: str, language: SupportedLanguage, time_budget_ms: Optional[float] = None
+    ) -> NERHints:
+        """Get NER hints for role tagging without blocking the event loop."""
+        entities = await self.extract_entities_async(text, language, time_budget_ms)
+        return UnifiedSpacyGateway.hints_from_entities(entities)
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Stop the worker threads after they finish the queued requests."""
+        with self._lock:
+            workers = list(self._workers.items())
+            self._workers.clear()
+        for language, _ in workers:
+            self._queues[language].put(_STOP)
+        for _, worker in workers:
+            worker.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching statistics."""
+        with self._lock:
+            return {
+                'batch_size': self.batch_size,
+                'max_wait_ms': self.max_wait_ms,
+                'time_budget_ms': self.time_budget_ms,
+                'workers': sorted(language.value for language in self._workers),
+                'pending': {language.value: q.qsize() for language, q in self._queues.items()},
+                'submitted': self._submitted,
+                'completed': self._completed,
+                'timeouts': self._timeouts,
+                'expired': self._expired,
+                'dropped': self._dropped,
+                'batches': self._batches,
+                'avg_batch_size': (self._batched_texts / self._batches) if self._batches > 0 else 0.0,
+            }
+
+    def _queue(self, language: SupportedLanguage) -> queue.Queue:
+        with self._lock:
+            requests = self._queues.get(language)
+            if requests is None:
+                requests = queue.Queue(maxsize=self.max_queue_size)
+                self._queues[language] = requests
+            if language not in self._workers:
+                worker = threading.Thread(
+                    target=self._run,
+                    args=(language, requests),
+                    name=f"spacy-ner-{language.value}",
+                    daemon=True,
+                )
+                self._workers[language] = worker
+                worker.start()
+            return requests
+
+    def _run(self, language: SupportedLanguage, requests: queue.Queue) -> None:
+        # Lazy per-language model load, off the callers' threads
+        try:
+            _, available = self.gateway._load_spacy_model(language)
+        except Exception as e:
+            logger.error(f"Failed to load spaCy model for {language.value}: {e}")
+            available = False
+
+        while True:
+            batch, stop = self._next_batch(requests)
+            if batch:
+                self._process(language, batch, available)
+            if stop:
+                return
+
+    def _next_batch(self, requests: queue.Queue) -> Tuple[List[Tuple[str, Future, float]], bool]:
+        """Block for one request, then collect more for up to max_wait_ms."""
+        item = requests.get()
+        if item is _STOP:
+            return [], True
+
+        batch = [item]
+        fill_deadline = time.monotonic() + self.max_wait_ms / 1000
+        while len(batch) < self.batch_size:
+            remaining = fill_deadline - time.monotonic()
+            try:
+                item = requests.get(timeout=remaining) if remaining > 0 else requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _process(
+        self, language: SupportedLanguage, batch: List[Tuple[str, Future, float]], available: bool
+    ) -> None:
+        now = time.monotonic()
+        texts: List[str] = []
+        futures: List[Future] = []
+        for text, future, deadline in batch:
+            if not future.set_running_or_notify_cancel():
+                # Caller ran out of budget while the request was queued
+                self._count("_expired")
+            elif not available:
+                future.set_result([])
+            elif deadline <= now:
+                self._count("_expired")
+                future.set_result([])
+            else:
+                texts.append(text)
+                futures.append(future)
+
+        if not texts:
+            return
+
+        results = self.gateway.extract_entities_batch(texts, language, batch_size=self.batch_size)
+        for future, entities in zip(futures, results):
+            future.set_result(entities)
+
+        with self._lock:
+            self._batches += 1
+            self._batched_texts += len(texts)
+            self._completed += len(texts)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+# Global instance for shared use
+_global_batched_gateway: Optional[BatchedSpacyGateway] = None
+_global_batched_gateway_lock = threading.Lock()
+
+
+def get_batched_gateway() -> BatchedSpacyGateway:
+    """
+    Get shared batched spaCy gateway instance.
+
+    Batch size, batch fill wait and default time budget come from
+    SPACY_NER_BATCH_SIZE, SPACY_NER_MAX_WAIT_MS and SPACY_NER_TIME_BUDGET_MS.
+    """
+    global _global_batched_gateway
+    if _global_batched_gateway is None:
+        with _global_batched_gateway_lock:
+            if _global_batched_gateway is None:
+                _global_batched_gateway = BatchedSpacyGateway(
+                    batch_size=int(os.getenv("SPACY_NER_BATCH_SIZE", "32")),
+                    max_wait_ms=float(os.getenv("SPACY_NER_MAX_WAIT_MS", "5")),
+                    time_budget_ms=float(os.getenv("SPACY_NER_TIME_BUDGET_MS", "100")),
+                )
+    return _global_batched_gateway
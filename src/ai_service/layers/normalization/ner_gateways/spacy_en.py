@@ -10,6 +10,7 @@ from typing import List, Tuple, Optional
 from dataclasses import dataclass
 
 from ....utils.logging_config import get_logger
+from .unified_spacy_gateway import load_ner_model
 
 logger = get_logger(__name__)
 
@@ -25,10 +26,9 @@ def _load_spacy_en():
         return _nlp_en, SPACY_EN_AVAILABLE
     
     try:
-        import spacy
         # Load the English model
         # This model needs to be downloaded separately: python -m spacy download en_core_web_sm
-        _nlp_en = spacy.load("en_core_web_sm")
+        _nlp_en = load_ner_model("en_core_web_sm")
         SPACY_EN_AVAILABLE = True
     except ImportError:
         logger.warning("spaCy not installed. English NER will be unavailable.")
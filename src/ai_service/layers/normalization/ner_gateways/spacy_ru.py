@@ -11,6 +11,7 @@ from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
 from ....utils.logging_config import get_logger
+from .unified_spacy_gateway import load_ner_model
 
 logger = logging.getLogger(__name__)
 
@@ -48,8 +49,7 @@ class SpacyRuNER:
         self._model_available = False
         
         try:
-            import spacy
-            self._model = spacy.load("ru_core_news_sm")
+            self._model = load_ner_model("ru_core_news_sm")
             self._model_available = True
             self.logger.info("Russian spaCy NER model loaded successfully")
         except OSError as e:
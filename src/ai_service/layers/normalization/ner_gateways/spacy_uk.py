@@ -11,6 +11,7 @@ from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
 from ....utils.logging_config import get_logger
+from .unified_spacy_gateway import load_ner_model
 
 logger = logging.getLogger(__name__)
 
@@ -56,10 +57,8 @@ class SpacyUkNER:
     def _initialize_model(self):
         """Initialize the spaCy Ukrainian model."""
         try:
-            import spacy
-            
             # Try to load the Ukrainian model
-            self._model = spacy.load("uk_core_news_sm")
+            self._model = load_ner_model("uk_core_news_sm")
             self._model_available = True
             self.logger.info("spaCy Ukrainian model (uk_core_news_sm) loaded successfully")
             
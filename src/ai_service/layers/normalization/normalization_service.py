@@ -21,6 +21,7 @@ from ...data.patterns.identifiers import (
 )
 from ...utils.logging_config import get_logger
 from ...utils.feature_flags import get_feature_flag_manager, FeatureFlags
+from ...utils.text_profile import TextProfile
 from ..language.language_detection_service import LanguageDetectionService
 from ..unicode.unicode_service import UnicodeService
 from .morphology.gender_rules import prefer_feminine_form
@@ -106,8 +107,10 @@ class NormalizationService:
         # Consider token Latin if it has Latin chars and more Latin than Cyrillic
         return latin_chars > 0 and latin_chars > cyrillic_chars
 
-    def _has_mixed_scripts(self, text: str) -> bool:
+    def _has_mixed_scripts(self, text: str, profile: Optional[TextProfile] = None) -> bool:
         """Check if text contains both Latin and Cyrillic characters."""
+        if profile is not None and profile.text == text:
+            return profile.has_mixed_scripts
         has_latin = any('A' <= c <= 'Z' or 'a' <= c <= 'z' for c in text)
         has_cyrillic = any('\u0400' <= c <= '\u04FF' or c in 'ЁёІіЇїЄєҐґ' for c in text)
         return has_latin and has_cyrillic
@@ -221,9 +224,9 @@ class NormalizationService:
 
         return False
 
-    def _has_mixed_personal_names(self, text: str) -> bool:
+    def _has_mixed_personal_names(self, text: str, profile: Optional[TextProfile] = None) -> bool:
         """Check if text likely contains both Latin and Cyrillic personal names."""
-        if not self._has_mixed_scripts(text):
+        if not self._has_mixed_scripts(text, profile):
             return False
 
         # Look for connecting words that suggest multiple people (not business/payment contexts)
@@ -408,6 +411,7 @@ class NormalizationService:
         enable_spacy_ru_ner: bool = False,
         # Feature flags for safe rollout
         feature_flags: Optional[FeatureFlags] = None,
+        text_profile: Optional[TextProfile] = None,
     ) -> NormalizationResult:
         """
         Async normalization entrypoint.
@@ -428,6 +432,7 @@ class NormalizationService:
             ru_yo_strategy: Russian 'ё' policy ('preserve' or 'fold')
             enable_ru_nickname_expansion: Expand Russian nicknames
             enable_spacy_ru_ner: Enable spaCy Russian NER
+            text_profile: Shared profile of ``text`` (script counts, tokens)
 
         Returns:
             NormalizationResult with normalized text and metadata
@@ -446,7 +451,7 @@ class NormalizationService:
                 return validation_result
 
             # Homoglyph detection and normalization (security preprocessing)
-            homoglyph_analysis = self.homoglyph_detector.detect_homoglyphs(text)
+            homoglyph_analysis = self.homoglyph_detector.detect_homoglyphs(text, text_profile)
             normalized_text = text  # Keep original text for now
             if homoglyph_analysis.get('has_homoglyphs', False):
                 # Log security warnings for potential homoglyph attacks
@@ -458,7 +463,7 @@ class NormalizationService:
             text = normalized_text
 
             # Language detection
-            detected_language = self._detect_language(text, language)
+            detected_language = self._detect_language(text, language, text_profile)
             # Safe increment for languages_detected stats
             if detected_language in self._stats['languages_detected']:
                 self._stats['languages_detected'][detected_language] += 1
@@ -725,13 +730,13 @@ class NormalizationService:
 
         return None  # Valid input
 
-    def _detect_language(self, text: str, language: Optional[str]) -> str:
+    def _detect_language(self, text: str, language: Optional[str], profile: Optional[TextProfile] = None) -> str:
         """Detect language or use provided language."""
         if language and language != "auto":
             return language
 
         try:
-            lang_result = self.language_service.detect_language_config_driven(text, LANGUAGE_CONFIG)
+            lang_result = self.language_service.detect_language_config_driven(text, LANGUAGE_CONFIG, profile=profile)
             return lang_result.language
         except Exception as e:
             self.logger.warning(f"Language detection failed: {e}")
@@ -1136,6 +1141,8 @@ class NormalizationService:
         result.trace = unique_traces
         
         # Collect personal sequence from unique traces
+        original_text = getattr(result, 'original_text', '')
+        original_profile = TextProfile(original_text or "")
         for trace in result.trace:
             role = trace.role
             if role in personal_roles:
@@ -1150,8 +1157,7 @@ class NormalizationService:
                 # Skip Latin tokens in Cyrillic languages (mixed script filtering)
                 # But allow Latin tokens if: 1) mixed personal names context OR 2) organizational context with clear names
                 if lang in ("ru", "uk") and self._is_latin_token(trace.output):
-                    original_text = getattr(result, 'original_text', '')
-                    is_mixed_context = self._has_mixed_personal_names(original_text)
+                    is_mixed_context = self._has_mixed_personal_names(original_text, original_profile)
                     is_personal_name = self._could_be_personal_name(trace.output)
 
                     # More conservative: require mixed context AND personal name,
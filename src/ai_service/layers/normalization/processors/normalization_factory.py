@@ -7,7 +7,7 @@ import json
 import unicodedata
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Tuple, Any, Literal
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, is_dataclass
 from ....utils.logging_config import get_logger
 from ....utils.perf_timer import PerfTimer
 from ....utils.feature_flags import get_feature_flag_manager, FeatureFlags
@@ -15,6 +15,8 @@ from ....utils.profiling import profile_function, profile_time, get_profiling_st
 from ....utils.lru_cache_ttl import CacheManager, create_flags_hash
 from ..tokenizer_service import TokenizerService, CachedTokenizerService
 from ..morphology_adapter import MorphologyAdapter
+from ..morphology_lexicon import get_morphology_lexicon
+from ..ner_gateways.unified_spacy_gateway import SupportedLanguage
 from ....monitoring.cache_metrics import CacheMetrics, MetricsCollector
 from ....contracts.base_contracts import NormalizationResult, TokenTrace
 from ..error_handling import ErrorReportingMixin
@@ -101,6 +103,7 @@ class NormalizationConfig:
     ru_yo_strategy: str = "preserve"  # Russian 'ё' policy ('preserve' or 'fold')
     enable_ru_nickname_expansion: bool = True  # Expand Russian nicknames
     enable_spacy_ru_ner: bool = False  # Enable spaCy Russian NER
+    ner_time_budget_ms: Optional[float] = None  # Per-request spaCy NER budget (None: SPACY_NER_TIME_BUDGET_MS)
     # Unicode normalization flags
     normalize_homoglyphs: bool = False  # Normalize Cyrillic/Latin homoglyphs to dominant alphabet
     yo_strategy: Literal["fold", "preserve"] = "fold"  # Russian 'ё' strategy ('fold' or 'preserve')
@@ -136,7 +139,13 @@ class NormalizationFactory(ErrorReportingMixin):
             fix_initials_double_dot=self.feature_flags._flags.fix_initials_double_dot,
             preserve_hyphenated_case=self.feature_flags._flags.preserve_hyphenated_case
         )
-        self.morphology_adapter = MorphologyAdapter()
+        # Parses go through the morphology cache only when it is backed by the
+        # shared tier; in-process the adapter's own LRU caches are enough.
+        # Known names are served from the precomputed lexicon when it is built.
+        self.morphology_adapter = MorphologyAdapter(
+            cache=self.cache_manager.get_morphology_cache() if self.cache_manager.shared_enabled else None,
+            lexicon=get_morphology_lexicon(),
+        )
 
         # Initialize processors
         self.token_processor = TokenProcessor()
@@ -154,13 +163,16 @@ class NormalizationFactory(ErrorReportingMixin):
         self.ner_gateway_uk = None
         self.ner_gateway_en = None
         self.ner_gateway_ru = None
+        self.ner_batch_gateway = None
         self.ner_disabled = False
         
         try:
-            from ..ner_gateways import get_spacy_uk_ner, get_spacy_en_ner, get_spacy_ru_ner
+            from ..ner_gateways import get_spacy_uk_ner, get_spacy_en_ner, get_spacy_ru_ner, get_batched_gateway
             self.ner_gateway_uk = get_spacy_uk_ner()
             self.ner_gateway_en = get_spacy_en_ner()
             self.ner_gateway_ru = get_spacy_ru_ner()
+            # Requests are batched through nlp.pipe in a worker thread; models load on first use
+            self.ner_batch_gateway = get_batched_gateway()
             
             # Check if any NER is available
             if not any([self.ner_gateway_uk, self.ner_gateway_en, self.ner_gateway_ru]):
@@ -205,14 +217,36 @@ class NormalizationFactory(ErrorReportingMixin):
                     result.success = len(result.errors or []) == 0
                     return result
                 
+                # Shared result cache (only enabled with the cross-worker L2 tier)
+                cache_key = None
+                normalization_cache = self.cache_manager.get_normalization_cache()
+                if config.enable_cache and normalization_cache:
+                    cache_key = self._normalization_cache_key(text, config, effective_flags)
+                if cache_key is not None:
+                    hit, cached_result = normalization_cache.get(cache_key)
+                    if hit:
+                        result = cached_result.model_copy()
+                        result.processing_time = timer.elapsed
+                        return result
+
                 result = await self._normalize_with_error_handling(text, config, effective_flags)
                 result.processing_time = timer.elapsed
                 result.success = len(result.errors or []) == 0
+                if cache_key is not None and result.success:
+                    normalization_cache.set(cache_key, result.model_copy())
                 return result
             except Exception as e:
                 self.logger.error(f"Normalization failed for text '{text}': {e}")
                 return self._build_error_result(text, str(e), timer.elapsed)
 
+    @staticmethod
+    def _normalization_cache_key(text: str, config: NormalizationConfig, effective_flags) -> Optional[Tuple[str, str, str, str]]:
+        """Key for the normalization result cache, or None if the flags cannot be hashed."""
+        flags = getattr(effective_flags, "_flags", effective_flags)
+        if not is_dataclass(config) or not hasattr(flags, "to_dict"):
+            return None
+        return ("normalize", text, create_flags_hash(asdict(config)), create_flags_hash(flags.to_dict()))
+
     async def _normalize_with_error_handling(
         self,
         text: str,
@@ -314,31 +348,26 @@ class NormalizationFactory(ErrorReportingMixin):
             try:
                 # Get NER hints if enabled
                 ner_hints = None
-                if config.language == "uk" and config.enable_spacy_uk_ner and self.ner_gateway_uk:
+                ner_enabled = {
+                    "uk": config.enable_spacy_uk_ner and self.ner_gateway_uk,
+                    "en": config.enable_spacy_en_ner and self.ner_gateway_en,
+                    "ru": config.enable_spacy_ru_ner and self.ner_gateway_ru,
+                }.get(config.language)
+                if ner_enabled and self.ner_batch_gateway:
                     try:
-                        ner_hints = self.ner_gateway_uk.extract_entities(text)
-                        self.logger.debug(f"Ukrainian NER extracted {len(ner_hints.person_spans)} person spans and {len(ner_hints.org_spans)} org spans")
-                    except Exception as e:
-                        self.logger.warning(f"Ukrainian NER extraction failed: {e}")
-                elif config.language == "en" and config.enable_spacy_en_ner and self.ner_gateway_en:
-                    try:
-                        ner_hints = self.ner_gateway_en.extract_entities(text)
-                        self.logger.debug(f"English NER extracted {len(ner_hints.person_spans)} person spans and {len(ner_hints.org_spans)} org spans")
-                    except Exception as e:
-                        self.logger.warning(f"English NER extraction failed: {e}")
-                elif config.language == "ru" and config.enable_spacy_ru_ner and self.ner_gateway_ru:
-                    try:
-                        ner_hints = self.ner_gateway_ru.extract_entities(text)
-                        self.logger.debug(f"Russian NER extracted {len(ner_hints.person_spans)} person spans and {len(ner_hints.org_spans)} org spans")
+                        ner_hints = await self.ner_batch_gateway.get_ner_hints_async(
+                            text, SupportedLanguage(config.language), config.ner_time_budget_ms
+                        )
+                        self.logger.debug(f"{config.language} NER extracted {len(ner_hints.persons)} persons and {len(ner_hints.organizations)} organizations")
                     except Exception as e:
-                        self.logger.warning(f"Russian NER extraction failed: {e}")
+                        self.logger.warning(f"{config.language} NER extraction failed: {e}")
                 
                 # Use new FSM-based role tagger service
                 if not hasattr(self, 'role_tagger_service') or self.role_tagger_service is None:
                     # Initialize role tagger service
                     self.role_tagger_service = RoleTaggerService(role_classifier=self.role_classifier)
                 
-                role_tags = self.role_tagger_service.tag(tokens, config.language)
+                role_tags = self.role_tagger_service.tag(tokens, config.language, ner_hints=ner_hints)
                 role_tagger_traces = self._create_fsm_role_tagger_traces(role_tags, tokens)
                 self.logger.debug(f"FSM role tagger classified: {[(tag.role.value, tag.reason) for tag in role_tags]}")
 
@@ -15,6 +15,7 @@ from .person_extraction import PersonExtractor
 from .result_builder import ResultBuilder, ProcessingMetrics
 from ..tokenizer_service import TokenizerService
 from ..morphology_adapter import MorphologyAdapter
+from ..morphology_lexicon import get_morphology_lexicon
 from ....contracts.base_contracts import NormalizationResult, TokenTrace
 from ....utils.logging_config import get_logger
 from ....utils.perf_timer import PerfTimer
@@ -49,7 +50,7 @@ class NormalizationFactoryRefactored:
 
         # Initialize core services
         self.tokenizer_service = TokenizerService()
-        self.morphology_adapter = MorphologyAdapter()
+        self.morphology_adapter = MorphologyAdapter(lexicon=get_morphology_lexicon())
 
         # Initialize dictionaries
         self.name_dictionaries = name_dictionaries or {}
@@ -9,7 +9,7 @@ Replaces fragile if-else logic with configurable state transitions.
 import re
 import logging
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntFlag
 from typing import Dict, List, Optional, Set, Tuple, Any
 from abc import ABC, abstractmethod
 
@@ -49,6 +49,13 @@ def is_person_stopword(token: str, lang: str, lexicons: Lexicons) -> bool:
     lang_stopwords = lexicons.stopwords_person.get(lang, set())
     return token.lower() in lang_stopwords
 
+def _window_index(token: "Token", context: List["Token"]) -> Optional["TokenFeatureIndex"]:
+    """Return the token's feature index if it was built for this context."""
+    index = token.feature_index
+    if index is not None and len(index) == len(context):
+        return index
+    return None
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,6 +69,10 @@ class FSMState(Enum):
     DONE = "DONE"
 
 
+# Punctuation stripped when matching tokens against NER entity words
+_NER_WORD_PUNCT = ".,;:!?\"'«»()"
+
+
 class TokenRole(Enum):
     """Token roles in the normalization pipeline."""
     SURNAME = "surname"
@@ -74,6 +85,59 @@ class TokenRole(Enum):
     UNKNOWN = "unknown"
 
 
+class TokenFeature(IntFlag):
+    """Per-token feature bits computed once before the FSM pass."""
+    NONE = 0
+    LEGAL_FORM = 1  # Global or language-specific legal form
+    STOPWORD = 2
+    PERSON_STOPWORD = 4
+    PAYMENT_CONTEXT = 8
+    ALL_CAPS = 16  # All caps and longer than one character
+    PATRONYMIC_SUFFIX = 32
+    SURNAME_SUFFIX = 64
+    INITIAL = 128
+
+
+class TokenFeatureIndex:
+    """
+    Feature bitmasks for a token sequence with prefix sums for window queries.
+
+    Context rules ask "is there a legal form / CAPS token within ±N positions"
+    for every token; prefix sums answer that in O(1) instead of rescanning
+    the window and re-running the lexicon checks.
+    """
+
+    WINDOW_FEATURES = (TokenFeature.LEGAL_FORM, TokenFeature.ALL_CAPS)
+
+    def __init__(self, masks: List[int]):
+        self.masks = masks
+        self._prefix: Dict[TokenFeature, List[int]] = {}
+        for feature in self.WINDOW_FEATURES:
+            running = 0
+            prefix = [0]
+            for mask in masks:
+                if mask & feature:
+                    running += 1
+                prefix.append(running)
+            self._prefix[feature] = prefix
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def has(self, pos: int, feature: TokenFeature) -> bool:
+        """Check if token at position has the feature."""
+        return bool(self.masks[pos] & feature)
+
+    def window_count(self, feature: TokenFeature, pos: int, window: int) -> int:
+        """Count tokens with the feature in [pos - window, pos + window]."""
+        prefix = self._prefix[feature]
+        start = max(0, pos - window)
+        end = min(len(self.masks), pos + window + 1)
+        if start >= end:
+            return 0
+        return prefix[end] - prefix[start]
+
+
 @dataclass
 class Token:
     """Token with features for FSM processing."""
@@ -84,6 +148,10 @@ class Token:
     has_hyphen: bool
     pos: int
     lang: str = "ru"
+    # Filled by RoleTaggerService._create_token_objects; rules fall back to
+    # direct lexicon checks when a token is built without an index
+    features: int = 0
+    feature_index: Optional[TokenFeatureIndex] = field(default=None, repr=False, compare=False)
     
     # Pre-compiled patterns for efficiency
     _initial_pattern = re.compile(r'^[A-Za-zА-ЯЁІЇЄҐ]\.$')
@@ -170,6 +238,8 @@ class InitialDetectionRule(FSMTransitionRule):
     """Rule for detecting initials."""
     
     def can_apply(self, state: FSMState, token: Token, context: List[Token]) -> bool:
+        if token.feature_index is not None:
+            return bool(token.features & TokenFeature.INITIAL)
         return token.looks_like_initial
     
     def apply(self, state: FSMState, token: Token, context: List[Token]) -> Tuple[FSMState, TokenRole, str, List[str]]:
@@ -193,6 +263,9 @@ class SurnameSuffixRule(FSMTransitionRule):
         if not token.is_capitalized or token.is_punct:
             return False
         
+        if token.feature_index is not None:
+            return bool(token.features & TokenFeature.SURNAME_SUFFIX)
+
         # Check if token ends with surname suffix
         token_lower = token.norm.lower()
         return any(token_lower.endswith(suffix) for suffix in self.surname_suffixes)
@@ -225,6 +298,9 @@ class PatronymicSuffixRule(FSMTransitionRule):
         if not token.is_capitalized or token.is_punct:
             return False
         
+        if token.feature_index is not None:
+            return bool(token.features & TokenFeature.PATRONYMIC_SUFFIX)
+
         # Check if token ends with patronymic suffix
         token_lower = token.norm.lower()
         return any(token_lower.endswith(suffix) for suffix in self.patronymic_suffixes)
@@ -274,8 +350,19 @@ class OrganizationContextRule(FSMTransitionRule):
     def __init__(self, lexicons: Lexicons, window: int = 3):
         self.lexicons = lexicons
         self.window = window
+
+    def _is_legal_form_at(self, context: List[Token], i: int, token: Token,
+                          index: Optional[TokenFeatureIndex]) -> bool:
+        if index is not None:
+            return index.has(i, TokenFeature.LEGAL_FORM)
+        return (is_legal_form(context[i].text, self.lexicons) or
+                is_legal_form_lang(context[i].text, token.lang, self.lexicons))
     
     def can_apply(self, state: FSMState, token: Token, context: List[Token]) -> bool:
+        index = _window_index(token, context)
+        if index is not None:
+            return index.window_count(TokenFeature.LEGAL_FORM, token.pos, self.window) > 0
+
         # Check if there's a legal form in the context window
         start_idx = max(0, token.pos - self.window)
         end_idx = min(len(context), token.pos + self.window + 1)
@@ -293,6 +380,7 @@ class OrganizationContextRule(FSMTransitionRule):
         evidence = ["org_legal_form_context"]
         window_tokens = []
         legal_forms_found = []
+        index = _window_index(token, context)
         
         # Find legal form in context window
         start_idx = max(0, token.pos - self.window)
@@ -302,8 +390,7 @@ class OrganizationContextRule(FSMTransitionRule):
             if i < len(context):
                 window_tokens.append(context[i].text)
                 # Check both global and language-specific legal forms
-                if (is_legal_form(context[i].text, self.lexicons) or 
-                    is_legal_form_lang(context[i].text, token.lang, self.lexicons)):
+                if self._is_legal_form_at(context, i, token, index):
                     legal_forms_found.append(context[i].text)
                     evidence.append(f"legal_form_{context[i].text}")
         
@@ -323,8 +410,20 @@ class OrganizationNgramRule(FSMTransitionRule):
     def __init__(self, lexicons: Lexicons, window: int = 3):
         self.lexicons = lexicons
         self.window = window
+
+    def _is_legal_form_at(self, context: List[Token], i: int, token: Token,
+                          index: Optional[TokenFeatureIndex]) -> bool:
+        if index is not None:
+            return index.has(i, TokenFeature.LEGAL_FORM)
+        return (is_legal_form(context[i].text, self.lexicons) or
+                is_legal_form_lang(context[i].text, token.lang, self.lexicons))
     
     def can_apply(self, state: FSMState, token: Token, context: List[Token]) -> bool:
+        index = _window_index(token, context)
+        if index is not None:
+            return (index.window_count(TokenFeature.LEGAL_FORM, token.pos, self.window) > 0 and
+                    index.window_count(TokenFeature.ALL_CAPS, token.pos, self.window) > 0)
+
         # Check if there's a legal form + UPPERCASE pattern in the context window
         start_idx = max(0, token.pos - self.window)
         end_idx = min(len(context), token.pos + self.window + 1)
@@ -350,6 +449,7 @@ class OrganizationNgramRule(FSMTransitionRule):
         window_tokens = []
         legal_forms_found = []
         uppercase_tokens = []
+        index = _window_index(token, context)
         
         # Find legal form and UPPERCASE in context window
         start_idx = max(0, token.pos - self.window)
@@ -359,8 +459,7 @@ class OrganizationNgramRule(FSMTransitionRule):
             if i < len(context):
                 window_tokens.append(context[i].text)
                 # Check both global and language-specific legal forms
-                if (is_legal_form(context[i].text, self.lexicons) or 
-                    is_legal_form_lang(context[i].text, token.lang, self.lexicons)):
+                if self._is_legal_form_at(context, i, token, index):
                     legal_forms_found.append(context[i].text)
                     evidence.append(f"legal_form_{context[i].text}")
                 
@@ -385,6 +484,8 @@ class StopwordRule(FSMTransitionRule):
         self.strict = strict
     
     def can_apply(self, state: FSMState, token: Token, context: List[Token]) -> bool:
+        if token.feature_index is not None:
+            return bool(token.features & TokenFeature.STOPWORD)
         return is_stopword(token.text, token.lang, self.lexicons)
     
     def apply(self, state: FSMState, token: Token, context: List[Token]) -> Tuple[FSMState, TokenRole, str, List[str]]:                                                                                             
@@ -405,6 +506,8 @@ class PaymentContextRule(FSMTransitionRule):
         self.strict = strict
     
     def can_apply(self, state: FSMState, token: Token, context: List[Token]) -> bool:
+        if token.feature_index is not None:
+            return bool(token.features & TokenFeature.PAYMENT_CONTEXT)
         if not self.lexicons or not self.lexicons.payment_context:
             return False
         return token.text.lower() in self.lexicons.payment_context
@@ -426,6 +529,8 @@ class LegalFormRule(FSMTransitionRule):
 
     def can_apply(self, state: FSMState, token: Token, context: List[Token]) -> bool:
         # Check if token is a legal form
+        if token.feature_index is not None:
+            return bool(token.features & TokenFeature.LEGAL_FORM)
         return (is_legal_form(token.text, self.lexicons) or
                 is_legal_form_lang(token.text, token.lang, self.lexicons))
 
@@ -449,6 +554,13 @@ class PersonStopwordRule(FSMTransitionRule):
         if not self.strict:
             return False
         
+        index = _window_index(token, context)
+        if index is not None:
+            if not token.features & TokenFeature.PERSON_STOPWORD:
+                return False
+            # A legal form nearby makes this an ORG, so don't filter it
+            return index.window_count(TokenFeature.LEGAL_FORM, token.pos, self.window) == 0
+
         # Check if token is a person stopword
         if not is_person_stopword(token.text, token.lang, self.lexicons):
             return False
@@ -532,6 +644,10 @@ class LegalFormOrgSpanRule(FSMTransitionRule):
         # Check if current token is uppercase and has 2+ characters
         if not (token.is_all_caps and len(token.text) >= 2):
             return False
+
+        index = _window_index(token, context)
+        if index is not None:
+            return index.window_count(TokenFeature.LEGAL_FORM, token.pos, self.window) > 0
         
         # Check if there's a legal form in the context window
         start_idx = max(0, token.pos - self.window)
@@ -554,10 +670,15 @@ class LegalFormOrgSpanRule(FSMTransitionRule):
         end_idx = min(len(context), token.pos + self.window + 1)
         
         legal_form_found = None
+        index = _window_index(token, context)
         for i in range(start_idx, end_idx):
             if i < len(context):
                 context_token = context[i]
-                if (is_legal_form(context_token.text, self.lexicons) or 
+                if index is not None:
+                    if index.has(i, TokenFeature.LEGAL_FORM):
+                        legal_form_found = context_token.text
+                        break
+                elif (is_legal_form(context_token.text, self.lexicons) or 
                     is_legal_form_lang(context_token.text, token.lang, self.lexicons)):
                     legal_form_found = context_token.text
                     break
@@ -685,6 +806,10 @@ class DefaultPersonRule(FSMTransitionRule):
                     return True
 
         # Additional exclusions to prevent non-names from getting person roles
+        if token.feature_index is not None:
+            excluded = TokenFeature.PAYMENT_CONTEXT | TokenFeature.LEGAL_FORM | TokenFeature.STOPWORD
+            return not token.features & excluded
+
         if self.lexicons:
             # Exclude payment context words
             if (self.lexicons.payment_context and
@@ -862,6 +987,24 @@ class RoleTaggerService:
             r'^(' + '|'.join(re.escape(form) for form in self.lexicons.legal_forms) + r')$',
             re.IGNORECASE
         )
+        # Suffix sets grouped by length so each token needs one slice per length
+        self._surname_suffixes_by_len = self._group_suffixes(self.rules.surname_suffixes)
+        self._patronymic_suffixes_by_len = self._group_suffixes(self.rules.patronymic_suffixes)
+
+    @staticmethod
+    def _group_suffixes(suffixes: Set[str]) -> List[Tuple[int, Set[str]]]:
+        """Group suffixes by length for slice-and-lookup matching."""
+        grouped: Dict[int, Set[str]] = {}
+        for suffix in suffixes:
+            grouped.setdefault(len(suffix), set()).add(suffix)
+        return sorted(grouped.items())
+
+    @staticmethod
+    def _ends_with_any(text: str, suffixes_by_len: List[Tuple[int, Set[str]]]) -> bool:
+        for length, suffixes in suffixes_by_len:
+            if length <= len(text) and text[-length:] in suffixes:
+                return True
+        return False
     
     def _init_rules(self):
         """Initialize FSM transition rules."""
@@ -884,7 +1027,7 @@ class RoleTaggerService:
             DefaultPersonRule(self.role_classifier, self.lang, self.lexicons),  # Pass role classifier, language, and lexicons
         ]
     
-    def tag(self, tokens: List[str], lang: str, flags: Any = None) -> List[RoleTag]:
+    def tag(self, tokens: List[str], lang: str, flags: Any = None, ner_hints: Any = None) -> List[RoleTag]:
         """
         Tag tokens with roles using FSM.
         
@@ -892,6 +1035,8 @@ class RoleTaggerService:
             tokens: List of token strings
             lang: Language code
             flags: Feature flags (for future use)
+            ner_hints: Optional spaCy NER hints (persons/organizations) used
+                for tokens the rules could only guess
             
         Returns:
             List of RoleTag objects with detailed tracing
@@ -906,13 +1051,22 @@ class RoleTaggerService:
         
         # Apply FSM processing
         role_tags = self._process_with_fsm(token_objects)
+        if ner_hints is not None:
+            role_tags = self._apply_ner_hints(role_tags, tokens, ner_hints)
         
         logger.debug(f"Tagged tokens: {self._get_role_summary(role_tags)}")
         return role_tags
     
     def _create_token_objects(self, tokens: List[str], lang: str) -> List[Token]:
-        """Convert token strings to Token objects with features."""
+        """
+        Convert token strings to Token objects with features.
+
+        Lexicon and suffix checks run once per token here; the resulting
+        bitmasks and a shared TokenFeatureIndex let the FSM rules answer
+        per-token and ±window questions without rescanning.
+        """
         token_objects = []
+        masks = []
         
         for i, token_text in enumerate(tokens):
             # Normalize token
@@ -932,10 +1086,45 @@ class RoleTaggerService:
                 pos=i,
                 lang=lang
             )
+            token_obj.features = self._compute_features(token_obj)
             
             token_objects.append(token_obj)
+            masks.append(token_obj.features)
+
+        index = TokenFeatureIndex(masks)
+        for token_obj in token_objects:
+            token_obj.feature_index = index
         
         return token_objects
+
+    def _compute_features(self, token: Token) -> int:
+        """Compute the TokenFeature bitmask for a single token."""
+        lexicons = self.lexicons
+        text = token.text
+        text_lower = text.lower()
+        features = TokenFeature.NONE
+
+        if is_legal_form(text, lexicons) or is_legal_form_lang(text, token.lang, lexicons):
+            features |= TokenFeature.LEGAL_FORM
+        if lexicons and lexicons.stopwords and text_lower in lexicons.stopwords.get(token.lang, ()):
+            features |= TokenFeature.STOPWORD
+        if (lexicons and lexicons.stopwords_person and
+                text_lower in lexicons.stopwords_person.get(token.lang, ())):
+            features |= TokenFeature.PERSON_STOPWORD
+        if lexicons and lexicons.payment_context and text_lower in lexicons.payment_context:
+            features |= TokenFeature.PAYMENT_CONTEXT
+        if token.is_all_caps and len(text) > 1:
+            features |= TokenFeature.ALL_CAPS
+        if token.looks_like_initial:
+            features |= TokenFeature.INITIAL
+
+        norm_lower = token.norm.lower()
+        if self._ends_with_any(norm_lower, self._surname_suffixes_by_len):
+            features |= TokenFeature.SURNAME_SUFFIX
+        if self._ends_with_any(norm_lower, self._patronymic_suffixes_by_len):
+            features |= TokenFeature.PATRONYMIC_SUFFIX
+
+        return int(features)
     
     def _process_with_fsm(self, tokens: List[Token]) -> List[RoleTag]:
         """Process tokens through FSM."""
@@ -958,7 +1147,8 @@ class RoleTaggerService:
             role_tags.append(role_tag)
 
         # Post-processing: Fix surname + surname → given + surname for English transliterations
-        role_tags = self._fix_double_surnames(role_tags, tokens, lang)
+        lang = tokens[0].lang if tokens else "ru"
+        role_tags = self._fix_double_surnames(role_tags, [t.text for t in tokens], lang)
 
         return role_tags
     
@@ -1024,6 +1214,40 @@ class RoleTaggerService:
 
         return current_state
     
+    @staticmethod
+    def _apply_ner_hints(role_tags: List[RoleTag], tokens: List[str], ner_hints: Any) -> List[RoleTag]:
+        """
+        Fill in guessed roles from NER hints.
+
+        Only tokens the FSM left unknown or placed by positional fallback are
+        changed; dictionary, suffix and context rules always win.
+        """
+        def words(entities: Set[str]) -> Set[str]:
+            return {word.strip(_NER_WORD_PUNCT).lower() for entity in entities for word in entity.split()}
+
+        org_words = words(ner_hints.organizations)
+        person_words = words(ner_hints.persons)
+        if not org_words and not person_words:
+            return role_tags
+
+        person_roles = (TokenRole.GIVEN, TokenRole.SURNAME, TokenRole.PATRONYMIC, TokenRole.INITIAL)
+        for i, (role_tag, token) in enumerate(zip(role_tags, tokens)):
+            unknown = role_tag.role == TokenRole.UNKNOWN and role_tag.reason == "fallback_unknown"
+            if not unknown and "positional_fallback" not in role_tag.evidence:
+                continue
+
+            word = token.strip(_NER_WORD_PUNCT).lower()
+            if word in org_words:
+                role_tag.role = TokenRole.ORG
+                role_tag.reason = "ner_org"
+                role_tag.evidence = role_tag.evidence + ["spacy_ner_org"]
+            elif unknown and word in person_words:
+                previous = role_tags[i - 1].role if i > 0 else None
+                role_tag.role = TokenRole.SURNAME if previous in person_roles else TokenRole.GIVEN
+                role_tag.reason = "ner_person"
+                role_tag.evidence = role_tag.evidence + ["spacy_ner_person"]
+        return role_tags
+
     def _get_role_summary(self, tags: List[RoleTag]) -> Dict[str, int]:
         """Get summary of role distribution for logging."""
         role_counts = {}
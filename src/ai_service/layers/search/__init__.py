@@ -30,6 +30,8 @@ try:
         ElasticsearchVectorAdapter,
     )
     from .elasticsearch_client import ElasticsearchClientFactory
+    from .local_ac_automaton import LocalACAutomaton
+    from .ac_snapshot import ACSnapshotManager
 except ImportError:
     # Provide dummy placeholders
     Candidate = None
@@ -41,6 +43,8 @@ except ImportError:
     ElasticsearchACAdapter = None
     ElasticsearchVectorAdapter = None
     ElasticsearchClientFactory = None
+    LocalACAutomaton = None
+    ACSnapshotManager = None
 
 # Always available
 from .mock_search_service import MockSearchService
@@ -58,4 +62,6 @@ __all__ = [
     "ElasticsearchACAdapter",
     "ElasticsearchVectorAdapter",
     "ElasticsearchClientFactory",
+    "LocalACAutomaton",
+    "ACSnapshotManager",
 ]
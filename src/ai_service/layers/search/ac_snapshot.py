@@ -0,0 +1,197 @@
+"""
+Versioned AC automaton snapshots with atomic activation and hot-swap.
+
+Layout of a snapshot directory::
+
+    ac_snapshots/
+        CURRENT                       # name of the active version
+        ac_20250101120000.acsnap
+        ac_20250102120000.acsnap
+
+Publishing writes the new ``.acsnap`` file and then replaces ``CURRENT`` with
+``os.replace``, so readers always see either the old or the new version.
+Workers map the active file read-only and swap their reference when the
+pointer changes; searches already running keep the automaton they started
+with, mirroring the active/overlay swap in ``WatchlistIndexService``.
+"""
+
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from ...utils.data_version import set_data_version
+from ...utils.logging_config import get_logger
+from .local_ac_automaton import LocalACAutomaton
+
+logger = get_logger(__name__)
+
+_VERSION_RE = re.compile(r"^[A-Za-z0-9._-]+$")
+
+_shared_managers: Dict[str, "ACSnapshotManager"] = {}
+_shared_lock = threading.Lock()
+
+
+class ACSnapshotManager:
+    """Manages a directory of versioned AC snapshots and the active one."""
+
+    POINTER_FILE = "CURRENT"
+    SNAPSHOT_PREFIX = "ac_"
+    SNAPSHOT_SUFFIX = ".acsnap"
+
+    def __init__(self, snapshot_dir: Union[str, Path]):
+        self.snapshot_dir = Path(snapshot_dir)
+        self._current: Optional[LocalACAutomaton] = None
+        self._current_version: Optional[str] = None
+        self._lock = threading.Lock()
+        self.stats = {
+            "reloads": 0,
+            "reload_failures": 0,
+            "last_reload_at": None,
+            "last_load_time_ms": 0.0,
+        }
+
+    @property
+    def pointer_path(self) -> Path:
+        return self.snapshot_dir / self.POINTER_FILE
+
+    @property
+    def current(self) -> Optional[LocalACAutomaton]:
+        """Active automaton (plain attribute read; safe to call from any task)."""
+        return self._current
+
+    @property
+    def current_version(self) -> Optional[str]:
+        return self._current_version
+
+    def snapshot_path(self, version: str) -> Path:
+        if not _VERSION_RE.match(version):
+            raise ValueError(f"Invalid AC snapshot version: {version!r}")
+        return self.snapshot_dir / f"{self.SNAPSHOT_PREFIX}{version}{self.SNAPSHOT_SUFFIX}"
+
+    def list_versions(self) -> List[str]:
+        """Available snapshot versions, oldest first."""
+        if not self.snapshot_dir.exists():
+            return []
+        prefix, suffix = self.SNAPSHOT_PREFIX, self.SNAPSHOT_SUFFIX
+        versions = [
+            p.name[len(prefix):-len(suffix)]
+            for p in self.snapshot_dir.iterdir()
+            if p.name.startswith(prefix) and p.name.endswith(suffix)
+        ]
+        return sorted(versions)
+
+    def read_pointer(self) -> Optional[str]:
+        """Version named by the ``CURRENT`` pointer, if any."""
+        try:
+            version = self.pointer_path.read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            return None
+        return version or None
+
+    def publish(
+        self,
+        automaton: LocalACAutomaton,
+        version: Optional[str] = None,
+        activate: bool = True,
+        keep: int = 3,
+    ) -> Dict[str, Any]:
+        """
+        Write a snapshot for ``automaton`` and optionally make it active.
+
+        Args:
+            automaton: Built automaton to serialize
+            version: Version label (defaults to a UTC timestamp)
+            activate: Point ``CURRENT`` at the new version
+            keep: Number of most recent versions to retain (0 keeps all)
+        """
+        version = version or time.strftime("%Y%m%d%H%M%S", time.gmtime())
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        info = automaton.save_snapshot(self.snapshot_path(version), version=version)
+        if activate:
+            self.activate(version)
+        if keep:
+            info["pruned"] = self.prune(keep)
+        return info
+
+    def activate(self, version: str) -> None:
+        """Atomically point ``CURRENT`` at an existing version."""
+        if not self.snapshot_path(version).exists():
+            raise FileNotFoundError(f"AC snapshot version not found: {version}")
+        tmp_path = self.snapshot_dir / f".{self.POINTER_FILE}.tmp-{os.getpid()}"
+        tmp_path.write_text(version, encoding="utf-8")
+        os.replace(tmp_path, self.pointer_path)
+        logger.info(f"AC snapshot activated: {version}")
+
+    def prune(self, keep: int) -> List[str]:
+        """Delete all but the ``keep`` newest versions, never the active one."""
+        active = self.read_pointer()
+        versions = self.list_versions()
+        removed = []
+        for version in versions[:-keep] if keep else []:
+            if version == active:
+                continue
+            # Workers still mapping an old file keep their pages until they swap
+            self.snapshot_path(version).unlink(missing_ok=True)
+            removed.append(version)
+        return removed
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Map the version named by ``CURRENT`` if it differs from the active one.
+
+        Returns:
+            True if a new automaton was swapped in
+        """
+        with self._lock:
+            version = self.read_pointer()
+            if version is None:
+                return False
+            if version == self._current_version and not force:
+                return False
+
+            start_time = time.perf_counter()
+            try:
+                automaton = LocalACAutomaton.load_snapshot(self.snapshot_path(version))
+            except Exception as exc:
+                self.stats["reload_failures"] += 1
+                logger.error(f"Failed to load AC snapshot {version}: {exc}")
+                return False
+
+            previous = self._current_version
+            self._current = automaton
+            self._current_version = version
+            self.stats["reloads"] += 1
+            self.stats["last_reload_at"] = time.time()
+            self.stats["last_load_time_ms"] = (time.perf_counter() - start_time) * 1000
+            set_data_version("ac_patterns", f"snapshot:{version}")
+            logger.info(f"AC snapshot swapped: {previous} -> {version}")
+            return True
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "snapshot_dir": str(self.snapshot_dir),
+            "active_version": self._current_version,
+            "pointer_version": self.read_pointer(),
+            "available_versions": self.list_versions(),
+            "automaton": self._current.get_stats() if self._current else None,
+            **self.stats,
+        }
+
+
+def get_snapshot_manager(snapshot_dir: Union[str, Path]) -> ACSnapshotManager:
+    """
+    Process-wide manager for ``snapshot_dir``.
+
+    The search layer and the smart filter both read the local AC automaton;
+    sharing the manager keeps a single mapped copy per worker and lets one
+    reload serve every consumer.
+    """
+    key = str(Path(snapshot_dir).resolve())
+    with _shared_lock:
+        manager = _shared_managers.get(key)
+        if manager is None:
+            manager = _shared_managers[key] = ACSnapshotManager(key)
+        return manager
@@ -221,9 +221,22 @@ class HybridSearchConfig(BaseModel):
     enable_escalation: bool = Field(default=True, description="Enable AC->Vector escalation")
     escalation_threshold: float = Field(default=0.6, ge=0.0, le=1.0, description="AC score threshold for escalation")
     max_escalation_results: int = Field(default=100, ge=10, le=500, description="Max results for escalation")
+    enable_parallel_escalation: bool = Field(default=False, description="Run fuzzy and vector retrieval concurrently on escalation")
+    search_deadline_ms: int = Field(default=0, ge=0, le=30000, description="Global hybrid search deadline in milliseconds (0 disables)")
+    enable_msearch_batching: bool = Field(default=False, description="Coalesce concurrent ES searches into _msearch requests")
+    msearch_max_batch_size: int = Field(default=50, ge=1, le=500, description="Maximum searches per _msearch request")
+    msearch_window_ms: float = Field(default=2.0, ge=0.0, le=100.0, description="How long a search waits for others to join its _msearch")
     
     # AC patterns in Elasticsearch
     enable_ac_es: bool = Field(default=True, description="Enable AC patterns search in Elasticsearch")
+
+    # In-process AC automaton (primary AC stage when a corpus is available)
+    enable_local_ac: bool = Field(default=True, description="Use local Aho-Corasick automaton as primary AC stage")
+    local_ac_patterns_path: Optional[str] = Field(default=None, description="Path to exported AC pattern corpus JSON")
+    local_ac_min_pattern_length: int = Field(default=3, ge=1, le=20, description="Skip shorter AC patterns when building")
+    ac_es_secondary: bool = Field(default=False, description="Also query Elasticsearch AC when local automaton is active")
+    local_ac_snapshot_dir: Optional[str] = Field(default=None, description="Directory of versioned mmap AC snapshots (preferred over patterns path)")
+    local_ac_watch_interval_seconds: float = Field(default=5.0, ge=0.0, le=3600.0, description="Snapshot pointer poll interval (0 disables the watcher)")
     
     # Vector fallback settings
     enable_vector_fallback: bool = Field(default=True, description="Enable vector fallback when AC search fails")
@@ -263,6 +276,9 @@ class HybridSearchConfig(BaseModel):
     embedding_cache_ttl_seconds: int = Field(default=3600, ge=60, le=86400, description="Embedding cache TTL in seconds")
     enable_embedding_preprocessing: bool = Field(default=True, description="Enable query preprocessing for embeddings")
     embedding_batch_size: int = Field(default=1, ge=1, le=32, description="Batch size for embedding generation")
+    enable_embedding_batching: bool = Field(default=True, description="Coalesce concurrent query embeddings into batched encodes")
+    embedding_max_batch_size: int = Field(default=32, ge=1, le=256, description="Maximum query texts per batched encode")
+    embedding_batch_window_ms: float = Field(default=2.0, ge=0.0, le=100.0, description="How long a query text waits for others to join its encode")
     
     # Search result caching settings
     enable_search_cache: bool = Field(default=True, description="Enable caching for search results")
@@ -392,6 +408,32 @@ class HybridSearchConfig(BaseModel):
             except ValueError:
                 pass
 
+        if env_map.get("LOCAL_AC_PATTERNS_PATH"):
+            config_payload["local_ac_patterns_path"] = env_map["LOCAL_AC_PATTERNS_PATH"]
+        if env_map.get("LOCAL_AC_SNAPSHOT_DIR"):
+            config_payload["local_ac_snapshot_dir"] = env_map["LOCAL_AC_SNAPSHOT_DIR"]
+        if env_map.get("ENABLE_LOCAL_AC"):
+            config_payload["enable_local_ac"] = ElasticsearchConfig._parse_bool(env_map["ENABLE_LOCAL_AC"])
+        if env_map.get("AC_ES_SECONDARY"):
+            config_payload["ac_es_secondary"] = ElasticsearchConfig._parse_bool(env_map["AC_ES_SECONDARY"])
+        if env_map.get("ENABLE_PARALLEL_ESCALATION"):
+            config_payload["enable_parallel_escalation"] = ElasticsearchConfig._parse_bool(
+                env_map["ENABLE_PARALLEL_ESCALATION"]
+            )
+        if env_map.get("ENABLE_MSEARCH_BATCHING"):
+            config_payload["enable_msearch_batching"] = ElasticsearchConfig._parse_bool(
+                env_map["ENABLE_MSEARCH_BATCHING"]
+            )
+        if env_map.get("ENABLE_EMBEDDING_BATCHING"):
+            config_payload["enable_embedding_batching"] = ElasticsearchConfig._parse_bool(
+                env_map["ENABLE_EMBEDDING_BATCHING"]
+            )
+        if env_map.get("SEARCH_DEADLINE_MS"):
+            try:
+                config_payload["search_deadline_ms"] = int(env_map["SEARCH_DEADLINE_MS"])
+            except ValueError:
+                pass
+
         if ac_settings:
             config_payload["ac_search"] = {**ac_settings}
         if vector_settings:
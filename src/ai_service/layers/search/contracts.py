@@ -108,6 +108,8 @@ class SearchMetrics(BaseModel):
     successful_requests: int = 0
     failed_requests: int = 0
     escalation_triggered: int = 0
+    escalation_branches_cancelled: int = 0
+    deadline_exceeded: int = 0
     
     # Performance metrics
     avg_ac_latency_ms: float = 0.0
@@ -48,6 +48,7 @@ from .contracts import Candidate, SearchOpts, ElasticsearchAdapter, SearchMode
 from .config import HybridSearchConfig
 from .elasticsearch_client import ElasticsearchClientFactory
 from .elasticsearch_index_manager import ElasticsearchIndexManager
+from .msearch_batcher import MSearchBatcher
 
 
 def retry_elasticsearch(max_retries: int = 3, delay: float = 1.0, backoff: float = 2.0):
@@ -78,6 +79,27 @@ def retry_elasticsearch(max_retries: int = 3, delay: float = 1.0, backoff: float
     return decorator
 
 
+def _create_msearch_batcher(config: HybridSearchConfig) -> Optional[MSearchBatcher]:
+    if not getattr(config, "enable_msearch_batching", False):
+        return None
+    return MSearchBatcher(
+        max_batch_size=config.msearch_max_batch_size,
+        window_ms=config.msearch_window_ms,
+    )
+
+
+async def _execute_search(
+    client: AsyncElasticsearch,
+    batcher: Optional[MSearchBatcher],
+    index: str,
+    body: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Run a search directly or through the ``_msearch`` batcher."""
+    if batcher is None:
+        return await client.search(index=index, body=body)
+    return await batcher.search(client, index, body)
+
+
 class ElasticsearchACAdapter(ElasticsearchAdapter):
     """Elasticsearch adapter for AC (exact/almost-exact) search."""
 
@@ -104,6 +126,7 @@ class ElasticsearchACAdapter(ElasticsearchAdapter):
         self._last_connection_check: Optional[datetime] = None
         self._connection_lock = asyncio.Lock()
         self._ac_patterns_initialized = False
+        self._msearch = _create_msearch_batcher(config)
 
     async def _ensure_connection(self) -> AsyncElasticsearch:
         """Ensure Elasticsearch connection is established and cached."""
@@ -440,7 +463,7 @@ class ElasticsearchACAdapter(ElasticsearchAdapter):
 
         try:
             search_body = self._build_ac_query(query, opts)
-            response = await client.search(index=index_name, body=search_body)
+            response = await _execute_search(client, self._msearch, index_name, search_body)
             candidates = self._parse_candidates(response)
             
             # Add AC pattern hits if enabled
@@ -559,6 +582,7 @@ class ElasticsearchVectorAdapter(ElasticsearchAdapter):
         self._last_connection_check: Optional[datetime] = None
         self._connection_lock = asyncio.Lock()
         self._vector_index_initialized = False
+        self._msearch = _create_msearch_batcher(config)
 
     async def _ensure_connection(self) -> AsyncElasticsearch:
         if (
@@ -646,7 +670,9 @@ class ElasticsearchVectorAdapter(ElasticsearchAdapter):
             # Build hybrid query combining kNN and BM25
             search_body = self._build_vector_fallback_query(query_vector, query_text, opts)
             
-            response = await client.search(index=self.config.elasticsearch.vector_index, body=search_body)
+            response = await _execute_search(
+                client, self._msearch, self.config.elasticsearch.vector_index, search_body
+            )
             candidates = self._parse_vector_fallback_candidates(response, query_text)
             
         except ElasticsearchException as exc:
@@ -887,7 +913,7 @@ class ElasticsearchVectorAdapter(ElasticsearchAdapter):
 
         try:
             body = self._build_vector_query(query_vector, opts)
-            response = await client.search(index=index_name, body=body)
+            response = await _execute_search(client, self._msearch, index_name, body)
             candidates = self._parse_candidates(response)
         except ElasticsearchException as exc:
             self.logger.error(f"Elasticsearch error during vector search: {exc}")
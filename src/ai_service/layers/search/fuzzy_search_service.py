@@ -10,6 +10,8 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from collections import defaultdict
 
+import numpy as np
+
 try:
     import rapidfuzz
     from rapidfuzz import fuzz, process
@@ -20,6 +22,7 @@ except ImportError:
 from ...utils.logging_config import get_logger
 from ...utils.profiling import profile_function
 from ...contracts.search_contracts import Candidate, SearchResult
+from .fuzzy_blocking_index import FuzzyBlockingIndex
 
 
 @dataclass
@@ -49,7 +52,9 @@ class FuzzyConfig:
     token_set_ratio_weight: float = 0.2
 
     # Performance settings
-    max_candidates: int = 1000  # Maximum candidates to consider
+    max_candidates: int = 1000  # Maximum candidates to consider without an index
+    shortlist_size: int = 50  # Candidates taken from the blocking index per query
+    min_trigram_overlap: float = 0.2  # Share of query trigrams a shortlisted name must have
     max_results: int = 50  # Maximum results to return
     enable_preprocessing: bool = True  # Enable query preprocessing
 
@@ -77,6 +82,7 @@ class FuzzySearchService:
 
         self.enabled = True
         self._scorer_cache = {} if self.config.use_scorer_cache else None
+        self._index: Optional[FuzzyBlockingIndex] = None
 
         # Pre-compiled patterns for optimization
         self._name_patterns = self._compile_name_patterns()
@@ -90,6 +96,54 @@ class FuzzySearchService:
             'org_patterns': {'ооо', 'тов', 'llc', 'ltd', 'inc', 'corp', 'gmbh'}
         }
 
+    def build_index(self, candidates: List[str]) -> Optional[FuzzyBlockingIndex]:
+        """
+        Build the blocking index over the full candidate list.
+
+        Later searches against this same list score only the shortlist
+        returned by the index instead of the first ``max_candidates`` names.
+        """
+        if not self.enabled:
+            return None
+        self._index = FuzzyBlockingIndex(candidates)
+        return self._index
+
+    def _select_candidates(self, query: str, candidates: List[str]) -> List[str]:
+        """Candidates worth scoring for ``query``."""
+        if self._index is not None and candidates is self._index.names:
+            return self._index.shortlist_names(
+                query,
+                limit=self.config.shortlist_size,
+                min_overlap=self.config.min_trigram_overlap,
+            )
+        return candidates[:self.config.max_candidates]
+
+    def _to_results(
+        self,
+        query: str,
+        matches: List[Tuple[str, float, str]],
+        doc_mapping: Optional[Dict[str, str]],
+        metadata_mapping: Optional[Dict[str, Dict[str, Any]]],
+    ) -> List[FuzzyMatchResult]:
+        """Convert combined matches to results sorted by score."""
+        results = []
+        for candidate, score, algorithm in matches:
+            doc_id = doc_mapping.get(candidate) if doc_mapping else None
+            metadata = metadata_mapping.get(candidate) if metadata_mapping else None
+
+            result = FuzzyMatchResult(
+                original_query=query,
+                matched_text=candidate,
+                score=score,
+                algorithm=algorithm,
+                doc_id=doc_id,
+                metadata=metadata
+            )
+            results.append(result)
+
+        results.sort(key=lambda x: x.score, reverse=True)
+        return results[:self.config.max_results]
+
     @profile_function("fuzzy_search.search")
     async def search_async(
         self,
@@ -122,31 +176,13 @@ class FuzzySearchService:
             # Preprocess query
             processed_query = self._preprocess_query(query) if self.config.enable_preprocessing else query
 
-            # Limit candidates for performance
-            candidate_subset = candidates[:self.config.max_candidates]
+            # Shortlist from the blocking index, or limit candidates for performance
+            candidate_subset = self._select_candidates(processed_query, candidates)
 
             # Perform fuzzy matching with multiple algorithms
             matches = self._fuzzy_match_multi_algorithm(processed_query, candidate_subset)
 
-            # Convert to FuzzyMatchResult objects
-            results = []
-            for candidate, score, algorithm in matches:
-                doc_id = doc_mapping.get(candidate) if doc_mapping else None
-                metadata = metadata_mapping.get(candidate) if metadata_mapping else None
-
-                result = FuzzyMatchResult(
-                    original_query=query,
-                    matched_text=candidate,
-                    score=score,
-                    algorithm=algorithm,
-                    doc_id=doc_id,
-                    metadata=metadata
-                )
-                results.append(result)
-
-            # Sort by score (descending) and limit results
-            results.sort(key=lambda x: x.score, reverse=True)
-            results = results[:self.config.max_results]
+            results = self._to_results(query, matches, doc_mapping, metadata_mapping)
 
             processing_time = (time.time() - start_time) * 1000
             self.logger.debug(f"Fuzzy search completed: {len(results)} results in {processing_time:.2f}ms")
@@ -157,6 +193,119 @@ class FuzzySearchService:
             self.logger.error(f"Fuzzy search failed: {e}")
             return []
 
+    @profile_function("fuzzy_search.search_many")
+    async def search_many_async(
+        self,
+        queries: List[str],
+        candidates: List[str],
+        doc_mapping: Optional[Dict[str, str]] = None,
+        metadata_mapping: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> List[List[FuzzyMatchResult]]:
+        """
+        Fuzzy search for several queries at once.
+
+        Each query is scored against its own shortlist, and all
+        (query, candidate) pairs of the batch are scored per algorithm in one
+        ``process.cpdist`` call using all cores. Without an index every query
+        shares the same candidate slice, so a single ``process.cdist`` matrix
+        is computed instead. Results match ``search_async``.
+
+        Returns:
+            One result list per query, in query order
+        """
+        if not self.enabled or not queries or not candidates:
+            return [[] for _ in queries]
+
+        start_time = time.time()
+
+        try:
+            processed_queries = [
+                self._preprocess_query(query) if self.config.enable_preprocessing else query
+                for query in queries
+            ]
+
+            if self._index is not None and candidates is self._index.names:
+                shortlists = [self._select_candidates(query, candidates) for query in processed_queries]
+                pair_queries = [
+                    query for query, shortlist in zip(processed_queries, shortlists) for _ in shortlist
+                ]
+                pair_choices = [candidate for shortlist in shortlists for candidate in shortlist]
+                pair_scores = {
+                    algorithm: process.cpdist(
+                        pair_queries, pair_choices, scorer=scorer, score_cutoff=threshold * 100,
+                        dtype=np.float64, workers=-1
+                    )
+                    for algorithm, scorer, threshold in self._algorithms()
+                } if pair_choices else {}
+
+                row_scores = []
+                offset = 0
+                for shortlist in shortlists:
+                    end = offset + len(shortlist)
+                    row_scores.append(
+                        {algorithm: scores[offset:end] for algorithm, scores in pair_scores.items()}
+                    )
+                    offset = end
+            else:
+                shared = candidates[:self.config.max_candidates]
+                shortlists = [shared] * len(queries)
+                matrices = {
+                    algorithm: process.cdist(
+                        processed_queries, shared, scorer=scorer, score_cutoff=threshold * 100,
+                        dtype=np.float64, workers=-1
+                    )
+                    for algorithm, scorer, threshold in self._algorithms()
+                }
+                row_scores = [
+                    {algorithm: matrix[row] for algorithm, matrix in matrices.items()}
+                    for row in range(len(queries))
+                ]
+
+            all_results = []
+            for query, shortlist, scores in zip(queries, shortlists, row_scores):
+                matches = self._matches_from_scores(shortlist, scores) if shortlist else []
+                all_results.append(self._to_results(query, matches, doc_mapping, metadata_mapping))
+
+            processing_time = (time.time() - start_time) * 1000
+            self.logger.debug(
+                f"Batch fuzzy search completed: {len(queries)} queries in {processing_time:.2f}ms"
+            )
+            return all_results
+
+        except Exception as e:
+            self.logger.error(f"Batch fuzzy search failed: {e}")
+            return [[] for _ in queries]
+
+    def _algorithms(self) -> List[Tuple[str, Any, float]]:
+        """(algorithm, scorer, threshold) for every algorithm in use."""
+        return [
+            ('ratio', fuzz.ratio, self.config.min_score_threshold),
+            ('partial_ratio', fuzz.partial_ratio, self.config.partial_match_threshold),
+            ('token_sort_ratio', fuzz.token_sort_ratio, self.config.token_match_threshold),
+            ('token_set_ratio', fuzz.token_set_ratio, self.config.token_match_threshold),
+        ]
+
+    def _matches_from_scores(
+        self,
+        candidates: List[str],
+        scores: Dict[str, np.ndarray]
+    ) -> List[Tuple[str, float, str]]:
+        """
+        Same selection as ``_fuzzy_match_multi_algorithm`` from precomputed
+        scores: the best ``max_results * 2`` candidates per algorithm above its
+        threshold, combined.
+        """
+        limit = self.config.max_results * 2
+        all_matches = []
+        for algorithm, _, threshold in self._algorithms():
+            algo_scores = scores[algorithm]
+            passing = np.flatnonzero(algo_scores >= threshold * 100)
+            if passing.size > limit:
+                passing = passing[np.argsort(-algo_scores[passing], kind="stable")[:limit]]
+            for position in passing:
+                all_matches.append((candidates[position], float(algo_scores[position]) / 100.0, algorithm))
+        return self._combine_fuzzy_results(all_matches)
+
     def _preprocess_query(self, query: str) -> str:
         """Preprocess query for better matching."""
         # Basic normalization
@@ -268,6 +417,13 @@ class FuzzySearchService:
         for candidate, score, algorithm in matches:
             candidate_scores[candidate].append((score, algorithm))
 
+        weights = {
+            'ratio': self.config.ratio_weight,
+            'partial_ratio': self.config.partial_ratio_weight,
+            'token_sort_ratio': self.config.token_sort_ratio_weight,
+            'token_set_ratio': self.config.token_set_ratio_weight
+        }
+
         # Calculate final scores
         final_results = []
         for candidate, score_list in candidate_scores.items():
@@ -282,13 +438,6 @@ class FuzzySearchService:
             final_score = 0.0
             total_weight = 0.0
 
-            weights = {
-                'ratio': self.config.ratio_weight,
-                'partial_ratio': self.config.partial_ratio_weight,
-                'token_sort_ratio': self.config.token_sort_ratio_weight,
-                'token_set_ratio': self.config.token_set_ratio_weight
-            }
-
             for algorithm, score in algo_scores.items():
                 weight = weights.get(algorithm, 0.25)  # Default weight
                 final_score += score * weight
@@ -298,9 +447,9 @@ class FuzzySearchService:
                 final_score /= total_weight
 
                 # Apply name boost if applicable
-                if self._is_person_name(candidate) and self.config.enable_name_fuzzy:
-                    final_score *= self.config.name_boost_factor
-                    final_score = min(final_score, 1.0)  # Cap at 1.0
+                boost = self._name_boost(candidate)
+                if boost != 1.0:
+                    final_score = min(final_score * boost, 1.0)  # Cap at 1.0
 
                 # Determine best algorithm for this candidate
                 best_algorithm = max(algo_scores.keys(), key=lambda k: algo_scores[k])
@@ -309,6 +458,22 @@ class FuzzySearchService:
 
         return final_results
 
+    def _name_boost(self, candidate: str) -> float:
+        """Score multiplier for ``candidate``, memoized in the scorer cache."""
+        if not self.config.enable_name_fuzzy:
+            return 1.0
+
+        cache = self._scorer_cache
+        if cache is not None:
+            boost = cache.get(candidate)
+            if boost is not None:
+                return boost
+
+        boost = self.config.name_boost_factor if self._is_person_name(candidate) else 1.0
+        if cache is not None and len(cache) < self.config.cache_size:
+            cache[candidate] = boost
+        return boost
+
     def _is_person_name(self, text: str) -> bool:
         """Check if text looks like a person name."""
         text_lower = text.lower()
@@ -336,8 +501,10 @@ class FuzzySearchService:
                 'min_score_threshold': self.config.min_score_threshold,
                 'high_confidence_threshold': self.config.high_confidence_threshold,
                 'max_candidates': self.config.max_candidates,
-                'max_results': self.config.max_results
-            }
+                'max_results': self.config.max_results,
+                'shortlist_size': self.config.shortlist_size
+            },
+            'index': self._index.get_stats() if self._index is not None else None
         }
 
 
@@ -6,9 +6,10 @@ import math
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
 
 from ...core.base_service import BaseService
+from ...utils.data_version import set_data_version
 from ...utils.logging_config import get_logger
 from ...contracts.base_contracts import NormalizationResult
 
@@ -24,15 +25,22 @@ from .config import HybridSearchConfig
 from .elasticsearch_adapters import ElasticsearchACAdapter, ElasticsearchVectorAdapter
 from .elasticsearch_client import ElasticsearchClientFactory
 from .fuzzy_search_service import FuzzySearchService, FuzzyConfig
+from .local_ac_automaton import LocalACAutomaton
+from .ac_snapshot import ACSnapshotManager, get_snapshot_manager
 from .sanctions_data_loader import SanctionsDataLoader
 from ..embeddings.indexing.watchlist_index_service import WatchlistIndexService
 from ..embeddings.indexing.enhanced_vector_index_service import EnhancedVectorIndex
+from ..embeddings.embedding_batcher import EmbeddingBatcher
+from ..embeddings.embedding_cache import get_embedding_cache
 
 try:  # Optional heavy dependency
     from ..embeddings.optimized_embedding_service import OptimizedEmbeddingService
 except Exception:  # pragma: no cover - optional dependency may be unavailable
     OptimizedEmbeddingService = None  # type: ignore
 
+# Key namespace of query vectors in the shared embedding cache
+_QUERY_VECTOR_NAMESPACE = "query"
+
 
 class HybridSearchService(BaseService, SearchService):
     """
@@ -59,6 +67,11 @@ class HybridSearchService(BaseService, SearchService):
         self._vector_adapter: Optional[ElasticsearchVectorAdapter] = None
         self._client_factory: Optional[ElasticsearchClientFactory] = None
 
+        # In-process AC automaton (primary AC stage when loaded)
+        self._local_ac: Optional[LocalACAutomaton] = None
+        self._ac_snapshots: Optional[ACSnapshotManager] = None
+        self._ac_snapshot_watcher = None
+
         # Metrics tracking
         self._metrics = SearchMetrics()
         self._request_times: List[float] = []
@@ -76,6 +89,8 @@ class HybridSearchService(BaseService, SearchService):
         # Embedding service for vector queries (lazy init)
         self._embedding_service = None
         self._embedding_service_checked = False
+        self._embedding_batcher: Optional[EmbeddingBatcher] = None
+        self._embedding_batcher_service = None
 
         # Fuzzy search service for typo handling
         fuzzy_config = FuzzyConfig(
@@ -97,9 +112,10 @@ class HybridSearchService(BaseService, SearchService):
         if os.getenv("FORCE_RELOAD_SANCTIONS", "false").lower() == "true":
             self.logger.warning("🔄 FORCE_RELOAD_SANCTIONS=true, will force reload sanctions data")
 
-        # Embedding cache
-        self._embedding_cache: Dict[str, Tuple[List[float], datetime]] = {}
-        self._cache_lock = asyncio.Lock()
+        # Embedding cache (process-wide, shared with the embedding service)
+        self._embedding_cache = get_embedding_cache(
+            self.config.embedding_cache_size, self.config.embedding_cache_ttl_seconds
+        )
         
         # Search result cache
         self._search_cache: Dict[str, Tuple[List[Candidate], datetime]] = {}
@@ -140,6 +156,10 @@ class HybridSearchService(BaseService, SearchService):
                 self.logger.info("📝 Will use fallback services for search")
                 # Don't raise - continue with fallback services
 
+            # Build local AC automaton (ES AC becomes secondary when this succeeds)
+            self._load_local_ac()
+            self._start_ac_snapshot_watcher()
+
             # Initialize fallback services (always try these)
             try:
                 self._ensure_fallback_services()
@@ -181,6 +201,7 @@ class HybridSearchService(BaseService, SearchService):
 
         def _init_service():
             return OptimizedEmbeddingService(
+                embedding_cache=self._embedding_cache,
                 enable_batch_optimization=True,
                 enable_gpu=False,
                 precompute_common_patterns=False,
@@ -223,20 +244,9 @@ class HybridSearchService(BaseService, SearchService):
         
         service = await self._get_embedding_service()
         if service is not None:
-            loop = asyncio.get_running_loop()
-
-            def _compute():
-                return service.get_embeddings_optimized(
-                    [processed_text], 
-                    batch_size=self.config.embedding_batch_size, 
-                    use_cache=True
-                )
-
             try:
-                result = await loop.run_in_executor(None, _compute)
-                embeddings = result.get("embeddings") if isinstance(result, dict) else None
-                if embeddings and embeddings[0]:
-                    vector = list(embeddings[0])
+                vector = await self._embed_query_text(service, processed_text)
+                if vector:
                     dimension = self.config.vector_search.vector_dimension
                     if len(vector) > dimension:
                         vector = vector[:dimension]
@@ -258,36 +268,59 @@ class HybridSearchService(BaseService, SearchService):
         await self._cache_embedding(processed_text, pseudo_vector)
         return pseudo_vector
 
+    async def _embed_query_text(self, service, text: str) -> Optional[List[float]]:
+        """Embed one query text, batched with concurrent queries when enabled."""
+        if self.config.enable_embedding_batching:
+            if self._embedding_batcher is None or self._embedding_batcher_service is not service:
+                self._embedding_batcher = self._create_embedding_batcher(service)
+                self._embedding_batcher_service = service
+            return await self._embedding_batcher.embed(text)
+
+        loop = asyncio.get_running_loop()
+
+        def _compute():
+            return service.get_embeddings_optimized(
+                [text], 
+                batch_size=self.config.embedding_batch_size, 
+                use_cache=True
+            )
+
+        result = await loop.run_in_executor(None, _compute)
+        embeddings = result.get("embeddings") if isinstance(result, dict) else None
+        return list(embeddings[0]) if embeddings and embeddings[0] else None
+
+    def _create_embedding_batcher(self, service) -> EmbeddingBatcher:
+        max_batch_size = self.config.embedding_max_batch_size
+
+        def _encode(texts: List[str]) -> List[Optional[List[float]]]:
+            result = service.get_embeddings_optimized(
+                texts,
+                batch_size=max(self.config.embedding_batch_size, max_batch_size),
+                use_cache=True,
+            )
+            if not isinstance(result, dict) or not result.get("success", True):
+                error = result.get("error") if isinstance(result, dict) else None
+                raise RuntimeError(error or "embedding service returned no result")
+            return result.get("embeddings") or []
+
+        return EmbeddingBatcher(
+            _encode,
+            max_batch_size=max_batch_size,
+            window_ms=self.config.embedding_batch_window_ms,
+        )
+
     async def _get_cached_embedding(self, text: str) -> Optional[List[float]]:
         """Get cached embedding if available and not expired."""
         if not self.config.enable_embedding_cache:
             return None
-            
-        async with self._cache_lock:
-            if text in self._embedding_cache:
-                vector, timestamp = self._embedding_cache[text]
-                age_seconds = (datetime.now() - timestamp).total_seconds()
-                if age_seconds < self.config.embedding_cache_ttl_seconds:
-                    return vector
-                else:
-                    # Remove expired entry
-                    del self._embedding_cache[text]
-        return None
+        vector = self._embedding_cache.get(text, _QUERY_VECTOR_NAMESPACE)
+        return vector.tolist() if vector is not None else None
 
     async def _cache_embedding(self, text: str, vector: List[float]) -> None:
         """Cache embedding with TTL."""
         if not self.config.enable_embedding_cache:
             return
-            
-        async with self._cache_lock:
-            # Remove oldest entries if cache is full
-            if len(self._embedding_cache) >= self.config.embedding_cache_size:
-                # Remove oldest entry
-                oldest_key = min(self._embedding_cache.keys(), 
-                               key=lambda k: self._embedding_cache[k][1])
-                del self._embedding_cache[oldest_key]
-            
-            self._embedding_cache[text] = (vector, datetime.now())
+        self._embedding_cache.put(text, vector, _QUERY_VECTOR_NAMESPACE)
 
     def _preprocess_query_for_embedding(self, text: str) -> str:
         """Preprocess query text for better embedding generation."""
@@ -300,6 +333,81 @@ class HybridSearchService(BaseService, SearchService):
         processed = re.sub(r'[^\w\s\-\.]', '', processed)
         return processed
 
+    def _load_local_ac(self) -> None:
+        """Map the active AC snapshot, or build the automaton from the exported corpus."""
+        if not self.config.enable_local_ac:
+            return
+
+        if self.config.local_ac_snapshot_dir:
+            self._ac_snapshots = get_snapshot_manager(self.config.local_ac_snapshot_dir)
+            self._ac_snapshots.reload()
+            if self._ac_snapshots.current is not None:
+                self._local_ac = self._ac_snapshots.current
+                return
+            self.logger.warning(
+                f"No active AC snapshot in {self.config.local_ac_snapshot_dir}, "
+                "falling back to patterns file"
+            )
+
+        if not self.config.local_ac_patterns_path:
+            return
+
+        patterns_path = Path(self.config.local_ac_patterns_path)
+        if not patterns_path.exists():
+            self.logger.warning(f"Local AC patterns file not found: {patterns_path}")
+            return
+
+        try:
+            self._local_ac = LocalACAutomaton.from_file(
+                patterns_path,
+                min_pattern_length=self.config.local_ac_min_pattern_length,
+            )
+            set_data_version("ac_patterns", f"local:{patterns_path}:{patterns_path.stat().st_mtime_ns}")
+            self.logger.info(f"✅ Local AC automaton loaded from {patterns_path}")
+        except Exception as exc:
+            self._local_ac = None
+            self.logger.warning(f"⚠️ Failed to build local AC automaton: {exc}")
+
+    async def reload_local_ac(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Swap in the AC snapshot named by the snapshot pointer, if it changed.
+
+        Called by ``/reload-config`` and the snapshot watcher. The snapshot is
+        loaded in a worker thread so requests keep being served meanwhile; the
+        swap is a single reference assignment and in-flight searches finish on
+        the old automaton.
+        """
+        if self._ac_snapshots is None:
+            return {"reloaded": False, "reason": "snapshots not configured"}
+
+        reloaded = await asyncio.to_thread(self._ac_snapshots.reload, force)
+        # The manager is shared, so another consumer may have swapped it already
+        current = self._ac_snapshots.current
+        if current is not None and current is not self._local_ac:
+            self._local_ac = current
+            self._search_cache.clear()
+            reloaded = True
+        return {"reloaded": reloaded, "version": self._ac_snapshots.current_version}
+
+    def _start_ac_snapshot_watcher(self) -> None:
+        """Poll the snapshot pointer file and hot-swap on change."""
+        interval = self.config.local_ac_watch_interval_seconds
+        if self._ac_snapshots is None or not interval or self._ac_snapshot_watcher:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self.logger.debug("No running event loop – AC snapshot watcher not started")
+            return
+
+        from ...config.hot_reload import ConfigurationWatcher
+
+        watcher = ConfigurationWatcher([self._ac_snapshots.pointer_path], check_interval=interval)
+        watcher.add_callback(self.reload_local_ac)
+        asyncio.create_task(watcher.start())
+        self._ac_snapshot_watcher = watcher
+        self.logger.info(f"AC snapshot watcher started for {self._ac_snapshots.pointer_path}")
+
     def _ensure_fallback_services(self) -> None:
         """Initialize fallback services with proper error handling."""
         if not self.config.enable_fallback:
@@ -538,12 +646,26 @@ class HybridSearchService(BaseService, SearchService):
         try:
             query_text = normalized.normalized or text
             start_time = time.perf_counter()
-            
-            candidates = await self._ac_adapter.search(
-                query=query_text,
-                opts=opts,
-                index_name=self.config.elasticsearch.ac_index
-            )
+
+            local_ac = self._local_ac  # Pin one version for the whole request
+            if local_ac is not None:
+                ac_backend = "local"
+                candidates = local_ac.search_candidates(query_text, opts)
+                if self.config.ac_es_secondary and self._ac_adapter is not None:
+                    ac_backend = "local+elasticsearch"
+                    es_candidates = await self._ac_adapter.search(
+                        query=query_text,
+                        opts=opts,
+                        index_name=self.config.elasticsearch.ac_index
+                    )
+                    candidates = self._deduplicate_and_rerank(candidates + es_candidates, opts)
+            else:
+                ac_backend = "elasticsearch"
+                candidates = await self._ac_adapter.search(
+                    query=query_text,
+                    opts=opts,
+                    index_name=self.config.elasticsearch.ac_index
+                )
 
             search_time = (time.perf_counter() - start_time) * 1000  # Convert to ms
 
@@ -580,6 +702,7 @@ class HybridSearchService(BaseService, SearchService):
                 meta={
                     "index_name": self.config.elasticsearch.ac_index,
                     "search_mode": "exact",
+                    "ac_backend": ac_backend,
                     "fallback_enabled": self.config.enable_fallback,
                     "adapter_connected": getattr(self._ac_adapter, "_connected", True)
                 }
@@ -587,6 +710,7 @@ class HybridSearchService(BaseService, SearchService):
             
             if (
                 not candidates
+                and local_ac is None
                 and self.config.enable_fallback
                 and not getattr(self._ac_adapter, "_connected", True)
             ):
@@ -741,10 +865,17 @@ class HybridSearchService(BaseService, SearchService):
         
         query_text = normalized.normalized or text
         hybrid_start_time = time.perf_counter()
+        deadline = (
+            hybrid_start_time + self.config.search_deadline_ms / 1000
+            if self.config.search_deadline_ms
+            else None
+        )
         
         # Step 1: Try AC search first
         ac_start_time = time.perf_counter()
-        ac_candidates = await self._ac_search_only(normalized, text, opts, search_trace)
+        ac_candidates = await self._await_stage(
+            self._ac_search_only(normalized, text, opts, search_trace), deadline, "AC"
+        )
         ac_time = (time.perf_counter() - ac_start_time) * 1000
 
         # Add AC trace step
@@ -766,6 +897,12 @@ class HybridSearchService(BaseService, SearchService):
         # Check if AC results are sufficient
         should_escalate = self._should_escalate(ac_candidates, opts)
         print(f"🔥 ESCALATION DEBUG: ac_count={len(ac_candidates)}, should_escalate={should_escalate}, threshold={opts.escalation_threshold}")
+        if should_escalate and self.config.enable_parallel_escalation:
+            self.logger.info("AC results insufficient, starting fuzzy and vector search concurrently")
+            self._metrics.escalation_triggered += 1
+            return await self._parallel_escalation(
+                normalized, text, opts, search_trace, ac_candidates, hybrid_start_time, deadline
+            )
         if should_escalate:
             print(f"🚀 ESCALATING: AC results insufficient, trying fuzzy search first")
             self.logger.info("AC results insufficient, trying fuzzy search first")
@@ -773,7 +910,9 @@ class HybridSearchService(BaseService, SearchService):
 
             # Step 2: Try fuzzy search before vector search
             fuzzy_start_time = time.perf_counter()
-            fuzzy_candidates = await self._fuzzy_search(query_text, opts, search_trace)
+            fuzzy_candidates = await self._await_stage(
+                self._fuzzy_search(query_text, opts, search_trace), deadline, "fuzzy"
+            )
             fuzzy_time = (time.perf_counter() - fuzzy_start_time) * 1000
 
             # Add fuzzy trace step
@@ -829,7 +968,9 @@ class HybridSearchService(BaseService, SearchService):
 
             # Step 3: Execute vector search (fuzzy wasn't sufficient)
             vector_start_time = time.perf_counter()
-            vector_candidates = await self._vector_search_only(normalized, text, opts, search_trace)
+            vector_candidates = await self._await_stage(
+                self._vector_search_only(normalized, text, opts, search_trace), deadline, "vector"
+            )
             vector_time = (time.perf_counter() - vector_start_time) * 1000
 
             # Add vector trace step
@@ -856,7 +997,11 @@ class HybridSearchService(BaseService, SearchService):
             # Step 4: Check if vector fallback is needed
             if self._should_use_vector_fallback(ac_candidates, vector_candidates, opts):
                 self.logger.info("Using vector fallback for better results")
-                fallback_candidates = await self._vector_fallback_search(normalized, text, opts, search_trace)
+                fallback_candidates = await self._await_stage(
+                    self._vector_fallback_search(normalized, text, opts, search_trace),
+                    deadline,
+                    "vector_fallback",
+                )
                 
                 # Combine all results
                 all_candidates = self._combine_results(ac_candidates, vector_candidates, opts)
@@ -909,6 +1054,158 @@ class HybridSearchService(BaseService, SearchService):
             
             return ac_candidates
     
+    async def _parallel_escalation(
+        self,
+        normalized: NormalizationResult,
+        text: str,
+        opts: SearchOpts,
+        search_trace: SearchTrace,
+        ac_candidates: List[Candidate],
+        hybrid_start_time: float,
+        deadline: Optional[float],
+    ) -> List[Candidate]:
+        """
+        Speculative escalation: fuzzy and vector retrieval start together.
+
+        Fuzzy results keep priority – when they are sufficient the vector branch
+        is cancelled, otherwise the vector results (and vector fallback, if
+        needed) are merged in. Escalated queries pay max(fuzzy, vector) instead
+        of their sum, bounded by the global search deadline.
+        """
+        query_text = normalized.normalized or text
+        stage_times: Dict[str, float] = {}
+
+        async def timed(stage: str, coro):
+            stage_start = time.perf_counter()
+            try:
+                return await coro
+            finally:
+                stage_times[stage] = (time.perf_counter() - stage_start) * 1000
+
+        fuzzy_task = asyncio.create_task(
+            timed("fuzzy", self._fuzzy_search(query_text, opts, search_trace))
+        )
+        vector_task = asyncio.create_task(
+            timed("vector", self._vector_search_only(normalized, text, opts, search_trace))
+        )
+
+        vector_cancelled = False
+        fallback_candidates: List[Candidate] = []
+        try:
+            fuzzy_candidates = await self._await_stage(fuzzy_task, deadline, "fuzzy")
+            fuzzy_sufficient = self._fuzzy_results_sufficient(fuzzy_candidates, opts)
+            if fuzzy_sufficient:
+                vector_cancelled = not vector_task.done()
+                vector_task.cancel()
+                if vector_cancelled:
+                    self._metrics.escalation_branches_cancelled += 1
+                vector_candidates: List[Candidate] = []
+            else:
+                vector_candidates = await self._await_stage(vector_task, deadline, "vector")
+        finally:
+            for task in (fuzzy_task, vector_task):
+                if not task.done():
+                    task.cancel()
+
+        search_trace.add_step(SearchTraceStep(
+            stage="LEXICAL",
+            query=query_text,
+            topk=opts.top_k,
+            took_ms=stage_times.get("fuzzy", 0.0),
+            hits=[SearchTraceHit(doc_id=c.doc_id, score=c.score, rank=i+1, source="LEXICAL")
+                  for i, c in enumerate(fuzzy_candidates[:10])],
+            meta={
+                "search_type": "fuzzy",
+                "best_score": max((c.score for c in fuzzy_candidates), default=0.0),
+                "total_hits": len(fuzzy_candidates),
+                "escalation_triggered": True,
+                "parallel": True,
+            }
+        ))
+
+        if fuzzy_sufficient:
+            self.logger.info(
+                f"Fuzzy search found {len(fuzzy_candidates)} good matches - vector branch cancelled"
+            )
+            all_candidates = self._combine_results(ac_candidates, fuzzy_candidates, opts)
+        else:
+            search_trace.add_step(SearchTraceStep(
+                stage="SEMANTIC",
+                query=query_text,
+                topk=opts.top_k,
+                took_ms=stage_times.get("vector", 0.0),
+                hits=[SearchTraceHit(doc_id=c.doc_id, score=c.score, rank=i+1, source="SEMANTIC")
+                      for i, c in enumerate(vector_candidates[:10])],
+                meta={
+                    "search_type": "vector",
+                    "best_score": max((c.score for c in vector_candidates), default=0.0),
+                    "total_hits": len(vector_candidates),
+                    "fuzzy_insufficient": True,
+                    "parallel": True,
+                }
+            ))
+            all_candidates = self._combine_results(ac_candidates, fuzzy_candidates, opts)
+            all_candidates = self._combine_results(all_candidates, vector_candidates, opts)
+
+            if self._should_use_vector_fallback(ac_candidates, vector_candidates, opts):
+                self.logger.info("Using vector fallback for better results")
+                fallback_candidates = await self._await_stage(
+                    self._vector_fallback_search(normalized, text, opts, search_trace),
+                    deadline,
+                    "vector_fallback",
+                )
+                all_candidates.extend(fallback_candidates)
+                all_candidates = self._deduplicate_and_rerank(all_candidates, opts)
+
+        hybrid_time = (time.perf_counter() - hybrid_start_time) * 1000
+        self._add_hybrid_trace_step(search_trace, query_text, opts, all_candidates, hybrid_time, {
+            "escalation_triggered": True,
+            "parallel_escalation": True,
+            "fuzzy_search_used": True,
+            "vector_search_cancelled": vector_cancelled,
+            "vector_fallback_used": bool(fallback_candidates),
+            "deadline_exceeded": deadline is not None and time.perf_counter() >= deadline,
+            "ac_candidates": len(ac_candidates),
+            "fuzzy_candidates": len(fuzzy_candidates),
+            "vector_candidates": len(vector_candidates),
+            "fallback_candidates": len(fallback_candidates),
+            "final_candidates": len(all_candidates)
+        })
+
+        return all_candidates
+
+    async def _await_stage(
+        self, stage: Awaitable[List[Candidate]], deadline: Optional[float], name: str
+    ) -> List[Candidate]:
+        """
+        Await a search stage within the global search deadline.
+
+        Stages that run past the deadline are cancelled and contribute no
+        candidates; the search returns whatever earlier stages produced.
+        """
+        if deadline is None:
+            return await stage
+
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            if isinstance(stage, asyncio.Future) and stage.done() and not stage.cancelled():
+                return stage.result()
+            if isinstance(stage, asyncio.Future):
+                stage.cancel()
+            else:
+                stage.close()
+        else:
+            try:
+                return await asyncio.wait_for(stage, timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
+
+        self._metrics.deadline_exceeded += 1
+        self.logger.warning(
+            f"{name} search skipped: search deadline of {self.config.search_deadline_ms}ms exceeded"
+        )
+        return []
+
     def _should_escalate(self, ac_candidates: List[Candidate], opts: SearchOpts) -> bool:
         """Determine if escalation to vector search is needed."""
         self.logger.info(f"Checking escalation: enable={opts.enable_escalation}, ac_count={len(ac_candidates)}, threshold={opts.escalation_threshold}")
@@ -1433,10 +1730,9 @@ class HybridSearchService(BaseService, SearchService):
         return health
     
     async def clear_embedding_cache(self) -> None:
-        """Clear the embedding cache."""
-        async with self._cache_lock:
-            self._embedding_cache.clear()
-            self.logger.info("Embedding cache cleared")
+        """Clear the process-wide embedding cache."""
+        self._embedding_cache.clear()
+        self.logger.info("Embedding cache cleared")
     
     async def _get_cached_search_result(self, cache_key: str) -> Optional[List[Candidate]]:
         """Get cached search result if available and not expired."""
@@ -1811,30 +2107,23 @@ class HybridSearchService(BaseService, SearchService):
     
     async def get_embedding_cache_stats(self) -> Dict[str, Any]:
         """Get embedding cache statistics."""
-        async with self._cache_lock:
-            cache_size = len(self._embedding_cache)
-            max_size = self.config.embedding_cache_size
-            ttl_seconds = self.config.embedding_cache_ttl_seconds
-            
-            # Calculate cache age statistics
-            now = datetime.now()
-            ages = []
-            for _, (_, timestamp) in self._embedding_cache.items():
-                age = (now - timestamp).total_seconds()
-                ages.append(age)
-            
-            avg_age = sum(ages) / len(ages) if ages else 0
-            max_age = max(ages) if ages else 0
-            
-            return {
-                "cache_size": cache_size,
-                "max_size": max_size,
-                "utilization": cache_size / max_size if max_size > 0 else 0,
-                "ttl_seconds": ttl_seconds,
-                "avg_age_seconds": avg_age,
-                "max_age_seconds": max_age,
-                "cache_enabled": self.config.enable_embedding_cache
-            }
+        stats = self._embedding_cache.get_stats()
+        max_size = stats["capacity"]
+        return {
+            "cache_size": stats["size"],
+            "max_size": max_size,
+            "utilization": stats["size"] / max_size if max_size > 0 else 0,
+            "ttl_seconds": stats["ttl_seconds"],
+            "avg_age_seconds": stats["avg_age_seconds"],
+            "max_age_seconds": stats["max_age_seconds"],
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "hit_rate": stats["hit_rate"],
+            "evictions": stats["evictions"],
+            "memory_bytes": stats["memory_bytes"],
+            "cache_enabled": self.config.enable_embedding_cache,
+            "batching": self._embedding_batcher.get_stats() if self._embedding_batcher else None,
+        }
     
     def _update_metrics(self, success: bool, processing_time_ms: float, result_count: int, avg_score: float = 0.0) -> None:
         """Update search metrics."""
@@ -2042,6 +2331,9 @@ class HybridSearchService(BaseService, SearchService):
             except Exception as e:
                 self.logger.warning(f"Failed to get AC adapter stats: {e}")
 
+        if self._local_ac is not None:
+            comprehensive["adapter_stats"]["local_ac"] = self._local_ac.get_stats()
+
         # Get Vector adapter stats
         if self._vector_adapter and hasattr(self._vector_adapter, 'get_latency_stats'):
             try:
@@ -2070,7 +2362,9 @@ class HybridSearchService(BaseService, SearchService):
             "fallback_services": {
                 "watchlist": self._fallback_watchlist_service is not None,
                 "vector": self._fallback_vector_service is not None,
-            }
+            },
+            "local_ac": self._local_ac.get_stats() if self._local_ac else None,
+            "ac_snapshots": self._ac_snapshots.get_status() if self._ac_snapshots else None,
         }
     
     def _add_hybrid_trace_step(
@@ -2172,11 +2466,12 @@ class HybridSearchService(BaseService, SearchService):
             # Update fallback services if needed
             self._ensure_fallback_services()
             
-            # Clear embedding cache if cache settings changed
+            # Clear embedding cache if cache settings changed; the shared
+            # cache keeps the size and TTL it was created with
             if (old_config.enable_embedding_cache != new_config.enable_embedding_cache or
                 old_config.embedding_cache_size != new_config.embedding_cache_size or
                 old_config.embedding_cache_ttl_seconds != new_config.embedding_cache_ttl_seconds):
-                await self.clear_embedding_cache()
+                self._embedding_cache.clear()
                 self.logger.info("Embedding cache cleared due to configuration changes")
             
             self.logger.info("Search service configuration updated successfully")
@@ -2603,12 +2898,12 @@ class HybridSearchService(BaseService, SearchService):
             candidates = self._get_common_names()
             self.logger.warning(f"Using fallback common names: {len(candidates)} entries")
 
-        # Cache the candidates (limit for performance)
-        cached_candidates = candidates[:20000]  # Increased limit for sanctions data
-        self._fuzzy_candidates_cache[cache_key] = cached_candidates
+        # Cache the full list; the blocking index keeps per-query scoring to a shortlist
+        self._fuzzy_service.build_index(candidates)
+        self._fuzzy_candidates_cache[cache_key] = candidates
 
-        self.logger.info(f"Fuzzy search initialized with {len(cached_candidates)} candidates")
-        return cached_candidates
+        self.logger.info(f"Fuzzy search initialized with {len(candidates)} candidates")
+        return candidates
 
     async def _get_watchlist_names(self) -> List[str]:
         """Extract all names from watchlist for fuzzy matching."""
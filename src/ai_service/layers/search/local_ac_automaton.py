@@ -0,0 +1,487 @@
+"""
+In-process Aho-Corasick automaton over the sanctions AC pattern corpus.
+
+Builds a pyahocorasick automaton from ``HighRecallACGenerator.generate_full_corpus()``
+output so the AC stage runs locally in microseconds instead of paying an
+Elasticsearch round trip per request.
+
+Pattern payloads (tier, entity id, entity type, confidence) are stored in flat
+columns: ``array`` objects plus one deduplicated UTF-8 string blob. The
+automaton itself only maps a folded pattern key to a group id; a group lists
+the payload rows sharing that key. The same columns can be written to a
+binary snapshot and mapped back read-only with ``mmap``, so uvicorn workers
+share the payload pages instead of each holding a private copy.
+"""
+
+import json
+import mmap
+import os
+import pickle
+import re
+import sys
+import time
+import unicodedata
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+from ...utils.logging_config import get_logger
+from .contracts import Candidate, SearchMode, SearchOpts
+
+logger = get_logger(__name__)
+
+_APOSTROPHES = re.compile(r"[‘’ʼʹ`´]")
+_DASHES = re.compile(r"[‐-―−]")
+_WHITESPACE = re.compile(r"\s+")
+
+SNAPSHOT_MAGIC = b"AIACSNP1"
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Column name -> array typecode. Order is the on-disk section order.
+_COLUMNS = {
+    "tiers": "b",
+    "confidences": "f",
+    "entity_type_codes": "H",
+    "pattern_type_codes": "H",
+    "string_refs": "I",   # (offset, length) pairs: pattern, canonical, entity_id
+    "group_offsets": "I",  # n_groups + 1 offsets into group_rows
+    "group_rows": "I",
+    "group_key_lengths": "H",
+}
+_STRINGS_PER_ROW = 3
+
+
+def fold_for_ac(text: str) -> str:
+    """
+    Fold text into the key space shared by patterns and queries.
+
+    Mirrors the cheap parts of ``TextCanonicalizer.normalize_for_ac``
+    (NFKC, apostrophe/hyphen unification, whitespace collapse) plus casefold.
+    """
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKC", text)
+    text = _APOSTROPHES.sub("'", text)
+    text = _DASHES.sub("-", text)
+    text = _WHITESPACE.sub(" ", text)
+    return text.casefold().strip()
+
+
+@dataclass
+class ACMatch:
+    """Single pattern hit inside a query text."""
+
+    pattern: str
+    tier: int
+    pattern_type: str
+    entity_id: str
+    entity_type: str
+    confidence: float
+    canonical: str
+    start: int
+    end: int
+
+
+class LocalACAutomaton:
+    """Local Aho-Corasick matcher with tier/entity payloads."""
+
+    def __init__(self, min_pattern_length: int = 3):
+        """
+        Initialize an empty automaton.
+
+        Args:
+            min_pattern_length: Patterns shorter than this (after folding) are skipped
+        """
+        if not AHOCORASICK_AVAILABLE:
+            raise ImportError("pyahocorasick is required for LocalACAutomaton")
+
+        self.min_pattern_length = min_pattern_length
+        self.version: Optional[str] = None
+        self._automaton = None
+        self._mmap: Optional[mmap.mmap] = None
+
+        # Payload columns; arrays when built in-process, memoryviews over mmap
+        # when loaded from a snapshot. Both support len() and integer indexing.
+        self._columns: Dict[str, Any] = {name: array(code) for name, code in _COLUMNS.items()}
+        self._blob: Union[bytearray, memoryview] = bytearray()
+        self._entity_types: List[str] = []
+        self._pattern_types: List[str] = []
+
+        self.stats = {
+            "patterns_total": 0,
+            "patterns_indexed": 0,
+            "unique_keys": 0,
+            "build_time_ms": 0.0,
+            "searches": 0,
+            "mmap_bytes": 0,
+        }
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the automaton has been built or loaded."""
+        return self._automaton is not None
+
+    @property
+    def is_mapped(self) -> bool:
+        """Whether payload columns are served from a memory-mapped snapshot."""
+        return self._mmap is not None
+
+    def __len__(self) -> int:
+        return len(self._columns["tiers"])
+
+    def build(self, patterns: Iterable[Dict[str, Any]]) -> "LocalACAutomaton":
+        """
+        Build the automaton from AC-exported pattern dictionaries.
+
+        Args:
+            patterns: Items in ``HighRecallACGenerator.export_for_ac`` format
+
+        Returns:
+            self, for chaining
+        """
+        start_time = time.perf_counter()
+        cols = self._columns
+        keys: Dict[str, List[int]] = {}
+        string_refs: Dict[str, Tuple[int, int]] = {}
+        entity_type_codes: Dict[str, int] = {}
+        pattern_type_codes: Dict[str, int] = {}
+
+        def add_string(value: str) -> None:
+            ref = string_refs.get(value)
+            if ref is None:
+                encoded = value.encode("utf-8")
+                ref = (len(self._blob), len(encoded))
+                self._blob.extend(encoded)
+                string_refs[value] = ref
+            cols["string_refs"].extend(ref)
+
+        for item in patterns:
+            self.stats["patterns_total"] += 1
+            raw = item.get("pattern") or ""
+            key = fold_for_ac(raw)
+            if len(key) < self.min_pattern_length:
+                continue
+
+            row = len(cols["tiers"])
+            entity_type = str(item.get("entity_type", "unknown"))
+            pattern_type = str(item.get("type", "unknown"))
+            cols["tiers"].append(int(item.get("tier", 3)))
+            cols["confidences"].append(float(item.get("confidence", 0.0)))
+            cols["entity_type_codes"].append(
+                entity_type_codes.setdefault(entity_type, len(entity_type_codes))
+            )
+            cols["pattern_type_codes"].append(
+                pattern_type_codes.setdefault(pattern_type, len(pattern_type_codes))
+            )
+            add_string(raw)
+            add_string(item.get("canonical") or raw)
+            add_string(str(item.get("entity_id", "")))
+            keys.setdefault(key, []).append(row)
+
+        self._entity_types = list(entity_type_codes)
+        self._pattern_types = list(pattern_type_codes)
+
+        automaton = ahocorasick.Automaton(ahocorasick.STORE_INTS)
+        confidences = cols["confidences"]
+        cols["group_offsets"].append(0)
+        for group, (key, rows) in enumerate(keys.items()):
+            automaton.add_word(key, group)
+            # Highest confidence first so search() can stop at the threshold
+            rows.sort(key=lambda r: -confidences[r])
+            cols["group_rows"].extend(rows)
+            cols["group_offsets"].append(len(cols["group_rows"]))
+            cols["group_key_lengths"].append(len(key))
+        if keys:
+            automaton.make_automaton()
+
+        self._automaton = automaton
+        self.stats["patterns_indexed"] = len(cols["tiers"])
+        self.stats["unique_keys"] = len(keys)
+        self.stats["build_time_ms"] = (time.perf_counter() - start_time) * 1000
+
+        logger.info(
+            f"Local AC automaton built: {self.stats['patterns_indexed']} patterns, "
+            f"{self.stats['unique_keys']} keys in {self.stats['build_time_ms']:.1f}ms"
+        )
+        return self
+
+    @classmethod
+    def from_corpus(cls, corpus: Union[Dict[str, Any], List[Dict[str, Any]]], **kwargs) -> "LocalACAutomaton":
+        """Build from ``generate_full_corpus()`` output or a bare pattern list."""
+        patterns = corpus.get("patterns", []) if isinstance(corpus, dict) else corpus
+        return cls(**kwargs).build(patterns)
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path], **kwargs) -> "LocalACAutomaton":
+        """Build from a corpus JSON file written by ``export_high_recall_ac_patterns.py``."""
+        with open(path, "r", encoding="utf-8") as f:
+            corpus = json.load(f)
+        return cls.from_corpus(corpus, **kwargs)
+
+    @classmethod
+    def from_sanctions_files(
+        cls,
+        persons_file: Optional[str] = None,
+        companies_file: Optional[str] = None,
+        terrorism_file: Optional[str] = None,
+        **kwargs,
+    ) -> "LocalACAutomaton":
+        """Generate the full corpus from sanctions files and build from it."""
+        from ..patterns.high_recall_ac_generator import HighRecallACGenerator
+
+        corpus = HighRecallACGenerator().generate_full_corpus(
+            persons_file=persons_file,
+            companies_file=companies_file,
+            terrorism_file=terrorism_file,
+        )
+        return cls.from_corpus(corpus, **kwargs)
+
+    def save_snapshot(self, path: Union[str, Path], version: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Serialize automaton and payload columns into one binary snapshot file.
+
+        The file is written to a temporary sibling and moved into place with
+        ``os.replace`` so readers never observe a partial snapshot.
+        """
+        if self._automaton is None:
+            raise RuntimeError("Automaton is not built")
+
+        path = Path(path)
+        automaton_blob = pickle.dumps(self._automaton, protocol=pickle.HIGHEST_PROTOCOL)
+        payloads = [(name, memoryview(self._columns[name]).cast("B")) for name in _COLUMNS]
+        payloads.append(("strings", memoryview(self._blob)))
+        payloads.append(("automaton", memoryview(automaton_blob)))
+
+        header = {
+            "version": version or self.version or time.strftime("%Y%m%d%H%M%S"),
+            "created_at": time.time(),
+            "byteorder": sys.byteorder,
+            "itemsizes": {code: array(code).itemsize for code in set(_COLUMNS.values())},
+            "min_pattern_length": self.min_pattern_length,
+            "entity_types": self._entity_types,
+            "pattern_types": self._pattern_types,
+            "stats": {k: self.stats[k] for k in ("patterns_total", "patterns_indexed", "unique_keys")},
+            "sections": {},
+        }
+
+        # Section offsets are relative to the aligned start of the data area
+        relative = 0
+        for name, payload in payloads:
+            relative = _align(relative)
+            header["sections"][name] = [relative, payload.nbytes]
+            relative += payload.nbytes
+
+        header_bytes = json.dumps(header).encode("utf-8")
+        data_start = _align(16 + len(header_bytes))
+
+        tmp_path = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+        with open(tmp_path, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(SNAPSHOT_FORMAT_VERSION.to_bytes(4, "little"))
+            f.write(len(header_bytes).to_bytes(4, "little"))
+            f.write(header_bytes)
+            for name, payload in payloads:
+                offset = data_start + header["sections"][name][0]
+                f.write(b"\0" * (offset - f.tell()))
+                f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+        self.version = header["version"]
+        size = path.stat().st_size
+        logger.info(f"AC snapshot written: {path} ({size} bytes, version={self.version})")
+        return {"path": str(path), "version": self.version, "bytes": size}
+
+    @classmethod
+    def load_snapshot(cls, path: Union[str, Path]) -> "LocalACAutomaton":
+        """
+        Map a snapshot file read-only.
+
+        Payload columns and strings are served straight from the shared page
+        cache; only the trie is deserialized into the process heap.
+        """
+        start_time = time.perf_counter()
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(mapped)
+        if bytes(view[:8]) != SNAPSHOT_MAGIC:
+            raise ValueError(f"Not an AC snapshot: {path}")
+        format_version = int.from_bytes(view[8:12], "little")
+        if format_version != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported AC snapshot format {format_version}: {path}")
+        header_len = int.from_bytes(view[12:16], "little")
+        header = json.loads(bytes(view[16:16 + header_len]).decode("utf-8"))
+        data_start = _align(16 + header_len)
+
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"AC snapshot byte order {header['byteorder']} does not match host")
+        for code, size in header["itemsizes"].items():
+            if array(code).itemsize != size:
+                raise ValueError(f"AC snapshot item size mismatch for '{code}'")
+
+        def section(name: str) -> memoryview:
+            offset, length = header["sections"][name]
+            offset += data_start
+            return view[offset:offset + length]
+
+        automaton = cls(min_pattern_length=header["min_pattern_length"])
+        automaton._mmap = mapped
+        automaton._columns = {name: section(name).cast(code) for name, code in _COLUMNS.items()}
+        automaton._blob = section("strings")
+        automaton._entity_types = header["entity_types"]
+        automaton._pattern_types = header["pattern_types"]
+        automaton._automaton = pickle.loads(section("automaton"))
+        automaton.version = header["version"]
+        automaton.stats.update(header["stats"])
+        automaton.stats["mmap_bytes"] = len(mapped)
+        automaton.stats["build_time_ms"] = (time.perf_counter() - start_time) * 1000
+
+        logger.info(
+            f"AC snapshot mapped: {path} (version={automaton.version}, "
+            f"{automaton.stats['patterns_indexed']} patterns) in {automaton.stats['build_time_ms']:.1f}ms"
+        )
+        return automaton
+
+    def search(
+        self,
+        text: str,
+        max_tier: Optional[int] = None,
+        min_confidence: float = 0.0,
+    ) -> List[ACMatch]:
+        """
+        Find all whole-word pattern occurrences in text.
+
+        Args:
+            text: Query text (folded internally)
+            max_tier: Ignore patterns with a tier above this value
+            min_confidence: Ignore patterns below this confidence; checked on the
+                columns before a match object is materialized, which matters for
+                common tokens shared by hundreds of tier-3 patterns
+
+        Returns:
+            Matches ordered by tier, then confidence (descending); offsets refer
+            to the folded text
+        """
+        if self._automaton is None or not text or len(self._automaton) == 0:
+            return []
+
+        self.stats["searches"] += 1
+        haystack = fold_for_ac(text)
+        if not haystack:
+            return []
+
+        cols = self._columns
+        tiers = cols["tiers"]
+        confidences = cols["confidences"]
+        group_offsets = cols["group_offsets"]
+        group_rows = cols["group_rows"]
+        key_lengths = cols["group_key_lengths"]
+
+        matches: List[ACMatch] = []
+        last = len(haystack) - 1
+        for end_index, group in self._automaton.iter(haystack):
+            start_index = end_index - key_lengths[group] + 1
+            if start_index > 0 and haystack[start_index - 1].isalnum():
+                continue
+            if end_index < last and haystack[end_index + 1].isalnum():
+                continue
+            for i in range(group_offsets[group], group_offsets[group + 1]):
+                row = group_rows[i]
+                if confidences[row] < min_confidence:
+                    break  # rows are sorted by confidence within a group
+                if max_tier is not None and tiers[row] > max_tier:
+                    continue
+                matches.append(self._make_match(row, start_index, end_index + 1))
+
+        matches.sort(key=lambda m: (m.tier, -m.confidence))
+        return matches
+
+    def search_candidates(self, text: str, opts: SearchOpts) -> List[Candidate]:
+        """
+        Run AC matching and collapse hits into one candidate per entity.
+
+        The candidate score is the best pattern confidence for the entity,
+        filtered by ``opts.ac_min_score`` and ``opts.entity_types``.
+        """
+        best: Dict[Tuple[str, str], ACMatch] = {}
+        hit_counts: Dict[Tuple[str, str], int] = {}
+        for match in self.search(text, min_confidence=opts.ac_min_score):
+            key = (match.entity_type, match.entity_id)
+            hit_counts[key] = hit_counts.get(key, 0) + 1
+            if key not in best:  # search() already orders by tier/confidence
+                best[key] = match
+
+        entity_types = set(opts.entity_types or [])
+        candidates: List[Candidate] = []
+        for key, match in best.items():
+            if entity_types and match.entity_type not in entity_types:
+                continue
+            candidates.append(
+                Candidate(
+                    doc_id=match.entity_id,
+                    score=match.confidence,
+                    text=match.canonical,
+                    entity_type=match.entity_type,
+                    metadata={
+                        "tier": match.tier,
+                        "pattern": match.pattern,
+                        "pattern_type": match.pattern_type,
+                        "span": [match.start, match.end],
+                        "pattern_hits": hit_counts[key],
+                        "ac_backend": "local",
+                        "ac_version": self.version,
+                    },
+                    search_mode=SearchMode.AC,
+                    match_fields=["ac_pattern"],
+                    confidence=match.confidence,
+                    trace={"tier": match.tier, "reason": "local_ac_pattern_match"},
+                )
+            )
+
+        candidates.sort(key=lambda c: (c.metadata["tier"], -c.score))
+        return candidates[:opts.top_k]
+
+    def _string(self, row: int, field_index: int) -> str:
+        refs = self._columns["string_refs"]
+        ref = (row * _STRINGS_PER_ROW + field_index) * 2
+        offset, length = refs[ref], refs[ref + 1]
+        return str(self._blob[offset:offset + length], "utf-8")
+
+    def _make_match(self, row: int, start: int, end: int) -> ACMatch:
+        cols = self._columns
+        return ACMatch(
+            pattern=self._string(row, 0),
+            tier=cols["tiers"][row],
+            pattern_type=self._pattern_types[cols["pattern_type_codes"][row]],
+            entity_id=self._string(row, 2),
+            entity_type=self._entity_types[cols["entity_type_codes"][row]],
+            confidence=round(cols["confidences"][row], 4),
+            canonical=self._string(row, 1),
+            start=start,
+            end=end,
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get automaton statistics."""
+        return {
+            **self.stats,
+            "ready": self.is_ready,
+            "mapped": self.is_mapped,
+            "version": self.version,
+            "payload_bytes": sum(memoryview(c).nbytes for c in self._columns.values())
+            + memoryview(self._blob).nbytes,
+        }
+
+
+def _align(offset: int, boundary: int = 8) -> int:
+    return (offset + boundary - 1) // boundary * boundary
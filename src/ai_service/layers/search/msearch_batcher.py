@@ -0,0 +1,117 @@
+"""
+Coalesce concurrent Elasticsearch searches into ``_msearch`` requests.
+
+When many requests are screened at once (``/process-batch``, re-screening
+jobs), every item issues its own ``_search`` round-trip. ``MSearchBatcher``
+queues searches for a short window and sends them as a single ``_msearch``
+call, resolving each caller with its own response section. A lone request
+waits at most ``window_ms`` before it is sent.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class MSearchItemError(Exception):
+    """Error reported by Elasticsearch for one search inside an ``_msearch``."""
+
+
+class MSearchBatcher:
+    """Queues single-index searches and flushes them as ``_msearch`` batches."""
+
+    def __init__(self, max_batch_size: int = 50, window_ms: float = 2.0):
+        self.max_batch_size = max_batch_size
+        self.window_seconds = window_ms / 1000
+        self._pending: List[Tuple[Any, str, Dict[str, Any], asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._inflight: set = set()
+        self.stats = {
+            "searches": 0,
+            "msearch_calls": 0,
+            "largest_batch": 0,
+            "failed_batches": 0,
+        }
+
+    async def search(self, client: Any, index: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Queue a search and wait for its section of the ``_msearch`` response.
+
+        Args:
+            client: AsyncElasticsearch client used for the flush
+            index: Index to search
+            body: Search request body
+
+        Returns:
+            Search response for this query (same shape as ``client.search``)
+
+        Raises:
+            MSearchItemError: If Elasticsearch rejected this query
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((client, index, body, future))
+        self.stats["searches"] += 1
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_seconds, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._send(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, batch: List[Tuple[Any, str, Dict[str, Any], asyncio.Future]]) -> None:
+        client = batch[0][0]
+        body: List[Dict[str, Any]] = []
+        for _, index, query, _ in batch:
+            body.append({"index": index})
+            body.append(query)
+
+        self.stats["msearch_calls"] += 1
+        self.stats["largest_batch"] = max(self.stats["largest_batch"], len(batch))
+
+        try:
+            response = await client.msearch(body=body)
+            responses = response["responses"]
+        except Exception as exc:
+            self.stats["failed_batches"] += 1
+            logger.error(f"_msearch of {len(batch)} queries failed: {exc}")
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for position, (*_, future) in enumerate(batch):
+            if future.done():  # caller was cancelled
+                continue
+            if position >= len(responses):
+                future.set_exception(MSearchItemError("missing _msearch response section"))
+                continue
+            item = responses[position]
+            if "error" in item:
+                future.set_exception(MSearchItemError(str(item["error"])))
+            else:
+                future.set_result(item)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "max_batch_size": self.max_batch_size,
+            "window_ms": self.window_seconds * 1000,
+            "pending": len(self._pending),
+            **self.stats,
+        }
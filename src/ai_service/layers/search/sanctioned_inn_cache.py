@@ -3,13 +3,19 @@ Fast lookup cache for sanctioned INNs.
 
 Provides O(1) lookup for INN -> sanctioned person/organization mapping.
 Much faster than AC search or Elasticsearch for INN-specific queries.
+
+When ``sanctioned_inns_cache.idx`` (built by ``build_inn_index.py``) is
+present and not older than the JSON file, the memory-mapped index is used
+instead of loading the JSON into a dict in every worker.
 """
 
 import json
 import time
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, Iterable, Optional, Any
+from ...utils.data_version import bump_data_version
 from ...utils.logging_config import get_logger
+from .sanctioned_inn_index import SanctionedINNIndex, default_index_path
 
 logger = get_logger(__name__)
 
@@ -19,8 +25,10 @@ class SanctionedINNCache:
 
     def __init__(self):
         self.cache: Dict[str, Dict[str, Any]] = {}
+        self.index: Optional[SanctionedINNIndex] = None
         self.loaded_at: Optional[float] = None
         self.cache_file = Path(__file__).parent.parent.parent / "data" / "sanctioned_inns_cache.json"
+        self.index_file = default_index_path(self.cache_file)
         self.stats = {
             "total_inns": 0,
             "persons": 0,
@@ -31,8 +39,11 @@ class SanctionedINNCache:
         }
 
     def load_cache(self) -> bool:
-        """Load sanctioned INNs cache from file."""
+        """Load sanctioned INNs cache (mapped index if available, else JSON)."""
         try:
+            if self._index_is_usable():
+                return self._load_index()
+
             if not self.cache_file.exists():
                 logger.warning(f"INN cache file not found: {self.cache_file}")
                 return False
@@ -46,6 +57,8 @@ class SanctionedINNCache:
 
             # Update statistics
             self.stats["total_inns"] = len(self.cache)
+            self.stats["persons"] = 0
+            self.stats["organizations"] = 0
             for inn_data in self.cache.values():
                 if inn_data.get("type") == "person":
                     self.stats["persons"] += 1
@@ -63,6 +76,34 @@ class SanctionedINNCache:
             logger.error(f"❌ Failed to load INN cache: {e}")
             return False
 
+    def _index_is_usable(self) -> bool:
+        if not self.index_file.exists():
+            return False
+        if self.cache_file.exists() and self.cache_file.stat().st_mtime > self.index_file.stat().st_mtime:
+            logger.warning(f"INN index {self.index_file} is older than {self.cache_file}, using JSON")
+            return False
+        return True
+
+    def _load_index(self) -> bool:
+        start_time = time.time()
+        self.index = SanctionedINNIndex(self.index_file)
+        self.loaded_at = time.time()
+
+        type_counts = self.index.type_counts
+        self.stats["total_inns"] = len(self.index)
+        self.stats["persons"] = type_counts.get("person", 0)
+        self.stats["organizations"] = type_counts.get("organization", 0)
+
+        logger.info(
+            f"✅ Mapped INN index with {self.stats['total_inns']} sanctioned INNs "
+            f"({self.stats['persons']} persons, {self.stats['organizations']} orgs) "
+            f"in {(self.loaded_at - start_time) * 1000:.2f}ms"
+        )
+        return True
+
+    def _ensure_loaded(self) -> bool:
+        return self.index is not None or bool(self.cache) or self.load_cache()
+
     def lookup(self, inn: str) -> Optional[Dict[str, Any]]:
         """
         Fast lookup for sanctioned INN.
@@ -75,21 +116,52 @@ class SanctionedINNCache:
         """
         self.stats["lookups"] += 1
 
-        if not self.cache and not self.load_cache():
+        if not self._ensure_loaded():
             self.stats["misses"] += 1
             return None
 
         inn_normalized = str(inn).strip()
-        result = self.cache.get(inn_normalized)
+        if self.index is not None:
+            result = self.index.get(inn_normalized)  # decoded per hit, already a fresh dict
+        else:
+            result = self.cache.get(inn_normalized)
+            result = result.copy() if result else None  # Return copy to prevent modification
 
         if result:
             self.stats["hits"] += 1
             logger.debug(f"🚨 SANCTIONED INN FOUND: {inn_normalized} -> {result.get('name', 'Unknown')}")
-            return result.copy()  # Return copy to prevent modification
+            return result
         else:
             self.stats["misses"] += 1
             return None
 
+    def lookup_many(self, inns: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up many INNs in one call.
+
+        Args:
+            inns: INNs to check
+
+        Returns:
+            Mapping of sanctioned INNs (stripped) to their data; misses are omitted
+        """
+        inns = [str(inn).strip() for inn in inns]
+        self.stats["lookups"] += len(inns)
+
+        if not self._ensure_loaded():
+            self.stats["misses"] += len(inns)
+            return {}
+
+        if self.index is not None:
+            found = self.index.get_many(inns)
+        else:
+            found = {inn: self.cache[inn].copy() for inn in inns if self.cache.get(inn)}
+
+        hits = sum(1 for inn in inns if inn in found)
+        self.stats["hits"] += hits
+        self.stats["misses"] += len(inns) - hits
+        return found
+
     def is_sanctioned(self, inn: str) -> bool:
         """Check if INN is sanctioned."""
         return self.lookup(inn) is not None
@@ -114,6 +186,7 @@ class SanctionedINNCache:
         return {
             **self.stats,
             "hit_rate_percent": round(hit_rate, 2),
+            "backend": "mmap_index" if self.index is not None else "json",
             "loaded_at": self.loaded_at,
             "cache_age_seconds": time.time() - self.loaded_at if self.loaded_at else None
         }
@@ -121,13 +194,18 @@ class SanctionedINNCache:
     def reload_cache(self) -> bool:
         """Force reload cache from file."""
         self.cache.clear()
+        if self.index is not None:
+            self.index.close()
+            self.index = None
         self.loaded_at = None
         # Reset lookup stats (but keep total counts)
         self.stats["lookups"] = 0
         self.stats["hits"] = 0
         self.stats["misses"] = 0
 
-        return self.load_cache()
+        loaded = self.load_cache()
+        bump_data_version("sanctioned_inn")
+        return loaded
 
 
 # Global cache instance
@@ -0,0 +1,230 @@
+"""
+Memory-mapped sorted index of sanctioned INNs.
+
+Replaces the ``json.load`` of ``sanctioned_inns_cache.json`` (a dict of dicts
+built in every worker) with one binary file mapped read-only:
+
+- ``keys``: sorted ``uint64`` column, one per INN. The key packs the digits
+  and their count (``int(inn) * 32 + len(inn)``) so leading zeros stay
+  significant.
+- ``record_offsets``: ``n + 1`` offsets into ``records``.
+- ``records``: compact JSON metadata per INN, decoded only on a hit.
+
+Lookups are a binary search over the mapped key column. Opening the index
+costs a header parse, and workers share the pages through the page cache.
+The file layout follows the AC snapshot format (magic, format version, JSON
+header, aligned sections).
+"""
+
+import json
+import mmap
+import os
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+from ...utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+INDEX_MAGIC = b"AIINNIX1"
+INDEX_FORMAT_VERSION = 1
+
+_SECTION_ALIGN = 8
+# 17 digits * 32 + 17 still fits into an unsigned 64-bit key
+MAX_INN_DIGITS = 17
+
+
+def _align(offset: int) -> int:
+    return (offset + _SECTION_ALIGN - 1) // _SECTION_ALIGN * _SECTION_ALIGN
+
+
+def encode_inn(inn: Any) -> Optional[int]:
+    """Pack an INN into its sortable key, or ``None`` if it is not an INN."""
+    value = str(inn).strip()
+    if not value.isdigit() or not value.isascii() or len(value) > MAX_INN_DIGITS:
+        return None
+    return int(value) * 32 + len(value)
+
+
+def build_inn_index(
+    cache: Mapping[str, Dict[str, Any]],
+    path: Union[str, Path],
+    source: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Write an index for ``cache`` (INN -> metadata, the JSON cache layout).
+
+    Entries whose key is not a plain digit string are skipped. The file is
+    written to a temporary sibling and moved into place with ``os.replace``.
+    """
+    path = Path(path)
+    entries = []
+    skipped = 0
+    for inn, record in cache.items():
+        key = encode_inn(inn)
+        if key is None:
+            skipped += 1
+            continue
+        entries.append((key, record))
+    entries.sort(key=lambda entry: entry[0])
+
+    keys = array("Q")
+    offsets = array("I", [0])
+    records = bytearray()
+    type_counts: Dict[str, int] = {}
+    for key, record in entries:
+        keys.append(key)
+        records += json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        offsets.append(len(records))
+        entity_type = record.get("type", "unknown")
+        type_counts[entity_type] = type_counts.get(entity_type, 0) + 1
+
+    payloads = [
+        ("keys", memoryview(keys).cast("B")),
+        ("record_offsets", memoryview(offsets).cast("B")),
+        ("records", memoryview(records)),
+    ]
+    header = {
+        "created_at": time.time(),
+        "source": source,
+        "byteorder": sys.byteorder,
+        "count": len(keys),
+        "type_counts": type_counts,
+        "skipped": skipped,
+        "sections": {},
+    }
+    relative = 0
+    for name, payload in payloads:
+        relative = _align(relative)
+        header["sections"][name] = [relative, payload.nbytes]
+        relative += payload.nbytes
+
+    header_bytes = json.dumps(header).encode("utf-8")
+    data_start = _align(16 + len(header_bytes))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+    with open(tmp_path, "wb") as f:
+        f.write(INDEX_MAGIC)
+        f.write(INDEX_FORMAT_VERSION.to_bytes(4, "little"))
+        f.write(len(header_bytes).to_bytes(4, "little"))
+        f.write(header_bytes)
+        for name, payload in payloads:
+            offset = data_start + header["sections"][name][0]
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+    size = path.stat().st_size
+    logger.info(f"INN index written: {path} ({len(keys)} INNs, {size} bytes, {skipped} skipped)")
+    return {"path": str(path), "count": len(keys), "bytes": size, "skipped": skipped}
+
+
+class SanctionedINNIndex:
+    """Read-only view over a mapped INN index file."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(self._mmap)
+        if bytes(view[:8]) != INDEX_MAGIC:
+            raise ValueError(f"Not an INN index: {path}")
+        format_version = int.from_bytes(view[8:12], "little")
+        if format_version != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported INN index format {format_version}: {path}")
+        header_len = int.from_bytes(view[12:16], "little")
+        self.header = json.loads(bytes(view[16:16 + header_len]).decode("utf-8"))
+        if self.header["byteorder"] != sys.byteorder:
+            raise ValueError(f"INN index byte order {self.header['byteorder']} does not match host")
+        data_start = _align(16 + header_len)
+
+        def section(name: str) -> memoryview:
+            offset, length = self.header["sections"][name]
+            offset += data_start
+            return view[offset:offset + length]
+
+        self._keys = section("keys").cast("Q")
+        self._offsets = section("record_offsets").cast("I")
+        self._records = section("records")
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, inn: Any) -> bool:
+        return self._position(encode_inn(inn)) is not None
+
+    @property
+    def type_counts(self) -> Dict[str, int]:
+        return dict(self.header.get("type_counts", {}))
+
+    def _position(self, key: Optional[int], lo: int = 0) -> Optional[int]:
+        if key is None:
+            return None
+        position = bisect_left(self._keys, key, lo)
+        if position < len(self._keys) and self._keys[position] == key:
+            return position
+        return None
+
+    def _record(self, position: int) -> Dict[str, Any]:
+        start, end = self._offsets[position], self._offsets[position + 1]
+        return json.loads(bytes(self._records[start:end]).decode("utf-8"))
+
+    def get(self, inn: Any) -> Optional[Dict[str, Any]]:
+        """Metadata for ``inn`` (a fresh dict), or ``None``."""
+        position = self._position(encode_inn(inn))
+        return None if position is None else self._record(position)
+
+    def get_many(self, inns: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up many INNs at once.
+
+        Queries are sorted by key so each binary search starts where the
+        previous one ended.
+
+        Returns:
+            Mapping of the (stripped) INNs that were found to their metadata
+        """
+        queries = sorted(
+            {(key, str(inn).strip()) for inn in inns for key in [encode_inn(inn)] if key is not None}
+        )
+        found: Dict[str, Dict[str, Any]] = {}
+        lo = 0
+        for key, inn in queries:
+            position = bisect_left(self._keys, key, lo)
+            lo = position
+            if position < len(self._keys) and self._keys[position] == key:
+                found[inn] = self._record(position)
+        return found
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate ``(inn, metadata)`` pairs in key order."""
+        for position, key in enumerate(self._keys):
+            digits = key % 32
+            yield str(key // 32).zfill(digits), self._record(position)
+
+    def close(self) -> None:
+        for name in ("_keys", "_offsets", "_records"):
+            getattr(self, name).release()
+        self._mmap.close()
+
+
+def default_index_path(json_path: Union[str, Path]) -> Path:
+    """Index file that sits next to a JSON cache file."""
+    json_path = Path(json_path)
+    return json_path.with_suffix(".idx")
+
+
+def build_index_from_json(json_path: Union[str, Path], index_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+    """Convert a ``sanctioned_inns_cache.json`` file into an index."""
+    json_path = Path(json_path)
+    with open(json_path, "r", encoding="utf-8") as f:
+        cache = json.load(f)
+    return build_inn_index(cache, index_path or default_index_path(json_path), source=json_path.name)
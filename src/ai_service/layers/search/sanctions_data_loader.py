@@ -7,8 +7,9 @@ from __future__ import annotations
 
 import json
 import time
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import asyncio
@@ -20,8 +21,23 @@ try:
 except ImportError:
     AIOFILES_AVAILABLE = False
 
+from ...utils.data_version import set_data_version
 from ...utils.logging_config import get_logger
 from ...utils.profiling import profile_function
+from .sanctions_dataset_cache import SanctionsDatasetCache, write_dataset_cache
+
+# Bump when the way entries are built from the source files changes, so
+# existing dataset caches are rebuilt
+DATASET_VERSION = 1
+
+SOURCE_FILES = (
+    "sanctioned_persons.json",
+    "sanctioned_companies.json",
+    "terrorism_black_list.json",
+    "ofac_sdn.json",
+    "eu_sanctions.json",
+    "uk_sanctions.json",
+)
 
 
 @dataclass
@@ -69,6 +85,82 @@ class SanctionsDataset:
         return names
 
 
+class _CachedNameIndex(Mapping):
+    """``name_to_entry`` over a dataset cache; entries are built on lookup."""
+
+    def __init__(self, dataset: "CachedSanctionsDataset"):
+        self._dataset = dataset
+
+    def __getitem__(self, name: str) -> SanctionEntry:
+        entry_index = self._dataset.cache.find_entry_index(name)
+        if entry_index is None:
+            raise KeyError(name)
+        return self._dataset.entry(entry_index)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self._dataset.cache.find_entry_index(name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._dataset.cache.lookup_names())
+
+    def __len__(self) -> int:
+        return len(self._dataset.cache._lookup_ids)
+
+
+class CachedSanctionsDataset:
+    """
+    ``SanctionsDataset`` backed by a memory-mapped dataset cache.
+
+    Name lists are decoded straight from the string table; ``SanctionEntry``
+    objects are only built for entries that are looked up, or for all of
+    them when ``persons`` / ``organizations`` are accessed.
+    """
+
+    def __init__(self, cache: SanctionsDatasetCache):
+        self.cache = cache
+        self.loaded_at = datetime.fromtimestamp(cache.header["loaded_at"])
+        self.sources: List[str] = cache.header["sources"]
+        self.total_entries: int = cache.total_entries
+        self.name_to_entry = _CachedNameIndex(self)
+        self._entries: Dict[int, SanctionEntry] = {}
+        self._all_names: Optional[List[str]] = None
+
+    def entry(self, entry_index: int) -> SanctionEntry:
+        entry = self._entries.get(entry_index)
+        if entry is None:
+            entry = self._entries[entry_index] = SanctionEntry(**self.cache.entry(entry_index))
+        return entry
+
+    def _entries_of_type(self, entity_type: str) -> List[SanctionEntry]:
+        return [
+            self.entry(entry_index)
+            for entry_index in range(self.total_entries)
+            if self.cache.entry_type(entry_index) == entity_type
+        ]
+
+    @property
+    def persons(self) -> List[SanctionEntry]:
+        return self._entries_of_type("person")
+
+    @property
+    def organizations(self) -> List[SanctionEntry]:
+        return self._entries_of_type("organization")
+
+    @property
+    def all_names(self) -> List[str]:
+        if self._all_names is None:
+            self._all_names = self.cache.all_names()
+        return self._all_names
+
+    def get_person_names(self) -> List[str]:
+        """Get all person names including aliases."""
+        return self.cache.person_names()
+
+    def get_org_names(self) -> List[str]:
+        """Get all organization names including aliases."""
+        return self.cache.org_names()
+
+
 class SanctionsDataLoader:
     """Loads and manages sanctions data for fuzzy search."""
 
@@ -81,9 +173,15 @@ class SanctionsDataLoader:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
+        # Kept for compatibility: caches are invalidated by the source file
+        # fingerprint, not by age
         self.cache_ttl = timedelta(hours=cache_ttl_hours)
         self._cached_dataset: Optional[SanctionsDataset] = None
-        self._cache_file = self.data_dir / "sanctions_cache.json"
+        self._cached_fingerprint: Optional[str] = None
+        self._cache_file = self.data_dir / "sanctions_cache.bin"
+        self._legacy_cache_file = self.data_dir / "sanctions_cache.json"
+        self._source_stat_key: Optional[Tuple] = None
+        self._source_digest: Optional[str] = None
 
         self.logger.info(f"SanctionsDataLoader initialized with data_dir: {self.data_dir}")
 
@@ -105,70 +203,74 @@ class SanctionsDataLoader:
         Returns:
             Complete sanctions dataset
         """
+        fingerprint = self._source_fingerprint()
+
         # Check cache first
-        if not force_reload and self._cached_dataset:
-            if datetime.now() - self._cached_dataset.loaded_at < self.cache_ttl:
-                self.logger.debug("Using cached sanctions dataset")
-                return self._cached_dataset
+        if not force_reload and self._cached_dataset and self._cached_fingerprint == fingerprint:
+            self.logger.debug("Using cached sanctions dataset")
+            return self._cached_dataset
 
         # Try to load from cache file
-        if not force_reload and await self._load_from_cache():
+        if not force_reload and await self._load_from_cache(fingerprint):
             self.logger.info(f"✅ Loaded from cache: {self._cached_dataset.total_entries} entries")
+            set_data_version("sanctions", fingerprint)
             return self._cached_dataset
 
         # Load from source files
-        self.logger.info("Loading sanctions data from source files (cache miss or expired)...")
+        self.logger.info("Loading sanctions data from source files (cache miss or sources changed)...")
         dataset = await self._load_from_sources()
 
         # Cache the dataset
-        await self._save_to_cache(dataset)
+        await self._save_to_cache(dataset, fingerprint)
         self._cached_dataset = dataset
+        self._cached_fingerprint = fingerprint
+        set_data_version("sanctions", fingerprint)
 
         self.logger.info(f"Loaded {dataset.total_entries} sanctions entries from {len(dataset.sources)} sources")
         return dataset
 
-    async def _load_from_cache(self) -> bool:
-        """Try to load dataset from cache file."""
+    def _source_files(self) -> List[Path]:
+        """Files the dataset is built from, in a stable order."""
+        files = [self.data_dir / name for name in SOURCE_FILES]
+        files.extend(sorted(self.data_dir.glob("custom_*.json")))
+        return [path for path in files if path.exists()]
+
+    def _source_fingerprint(self) -> str:
+        """
+        Hash of the source files (and ``DATASET_VERSION``).
+
+        Contents are only re-hashed when a file's size or mtime changed since
+        the previous call.
+        """
+        files = self._source_files()
+        stat_key = tuple((path.name, path.stat().st_size, path.stat().st_mtime_ns) for path in files)
+        if stat_key == self._source_stat_key and self._source_digest:
+            return self._source_digest
+
+        digest = hashlib.sha256(f"sanctions-dataset-v{DATASET_VERSION}".encode("utf-8"))
+        for path in files:
+            digest.update(path.name.encode("utf-8"))
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+
+        self._source_stat_key = stat_key
+        self._source_digest = digest.hexdigest()
+        return self._source_digest
+
+    async def _load_from_cache(self, fingerprint: str) -> bool:
+        """Try to open the dataset cache built from the current sources."""
         try:
             if not self._cache_file.exists():
                 return False
 
-            if AIOFILES_AVAILABLE:
-                async with aiofiles.open(self._cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.loads(await f.read())
-            else:
-                with open(self._cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-
-            # Check cache age
-            loaded_at = datetime.fromisoformat(cache_data['loaded_at'])
-            if datetime.now() - loaded_at > self.cache_ttl:
-                self.logger.debug("Cache expired")
+            cache = SanctionsDatasetCache(self._cache_file)
+            if cache.fingerprint != fingerprint:
+                self.logger.debug("Cache built from different source files")
+                cache.close()
                 return False
 
-            # Reconstruct dataset
-            persons = [SanctionEntry(**entry) for entry in cache_data['persons']]
-            organizations = [SanctionEntry(**entry) for entry in cache_data['organizations']]
-
-            self._cached_dataset = SanctionsDataset(
-                persons=persons,
-                organizations=organizations,
-                all_names=cache_data['all_names'],
-                name_to_entry=cache_data['name_to_entry'],
-                loaded_at=loaded_at,
-                sources=cache_data['sources'],
-                total_entries=cache_data['total_entries']
-            )
-
-            # Rebuild name_to_entry mapping with actual objects
-            name_to_entry = {}
-            all_entries = persons + organizations
-            for entry in all_entries:
-                name_to_entry[entry.name] = entry
-                for alias in entry.aliases:
-                    name_to_entry[alias] = entry
-
-            self._cached_dataset.name_to_entry = name_to_entry
+            self._close_cached_dataset()
+            self._cached_dataset = CachedSanctionsDataset(cache)
+            self._cached_fingerprint = fingerprint
 
             self.logger.debug("Successfully loaded from cache")
             return True
@@ -177,32 +279,35 @@ class SanctionsDataLoader:
             self.logger.warning(f"Failed to load from cache: {e}")
             return False
 
-    async def _save_to_cache(self, dataset: SanctionsDataset):
+    async def _save_to_cache(self, dataset: SanctionsDataset, fingerprint: str):
         """Save dataset to cache file."""
         try:
-            # Convert to JSON-serializable format
-            cache_data = {
-                'persons': [self._entry_to_dict(entry) for entry in dataset.persons],
-                'organizations': [self._entry_to_dict(entry) for entry in dataset.organizations],
-                'all_names': dataset.all_names,
-                'name_to_entry': {name: self._entry_to_dict(entry) for name, entry in dataset.name_to_entry.items()},
-                'loaded_at': dataset.loaded_at.isoformat(),
-                'sources': dataset.sources,
-                'total_entries': dataset.total_entries
-            }
+            entries = list(dataset.persons) + list(dataset.organizations)
+            known = {id(entry) for entry in entries}
+            for entry in dataset.name_to_entry.values():
+                if id(entry) not in known:
+                    known.add(id(entry))
+                    entries.append(entry)
 
-            if AIOFILES_AVAILABLE:
-                async with aiofiles.open(self._cache_file, 'w', encoding='utf-8') as f:
-                    await f.write(json.dumps(cache_data, indent=2, ensure_ascii=False))
-            else:
-                with open(self._cache_file, 'w', encoding='utf-8') as f:
-                    json.dump(cache_data, f, indent=2, ensure_ascii=False)
+            write_dataset_cache(
+                self._cache_file,
+                entries=entries,
+                all_names=dataset.all_names,
+                name_to_entry=dataset.name_to_entry,
+                sources=dataset.sources,
+                fingerprint=fingerprint,
+                loaded_at=dataset.loaded_at.timestamp(),
+            )
 
             self.logger.debug("Successfully saved to cache")
 
         except Exception as e:
             self.logger.warning(f"Failed to save to cache: {e}")
 
+    def _close_cached_dataset(self):
+        if isinstance(self._cached_dataset, CachedSanctionsDataset):
+            self._cached_dataset.cache.close()
+
     def _entry_to_dict(self, entry: SanctionEntry) -> Dict[str, Any]:
         """Convert SanctionEntry to dictionary."""
         return {
@@ -264,7 +369,7 @@ class SanctionsDataLoader:
         dataset = SanctionsDataset(
             persons=persons,
             organizations=organizations,
-            all_names=list(set(all_names)),  # Remove duplicates
+            all_names=list(dict.fromkeys(all_names)),  # Remove duplicates, keep order
             name_to_entry=name_to_entry,
             loaded_at=datetime.now(),
             sources=sources,
@@ -630,20 +735,33 @@ class SanctionsDataLoader:
         else:
             dataset = self._cached_dataset
 
+        if isinstance(dataset, CachedSanctionsDataset):
+            # Counts come from the cache header, without building entries
+            persons = dataset.cache.header['persons']
+            organizations = dataset.cache.header['organizations']
+        else:
+            persons = len(dataset.persons)
+            organizations = len(dataset.organizations)
+
         return {
             'total_entries': dataset.total_entries,
-            'persons': len(dataset.persons),
-            'organizations': len(dataset.organizations),
+            'persons': persons,
+            'organizations': organizations,
             'unique_names': len(dataset.all_names),
             'sources': dataset.sources,
             'loaded_at': dataset.loaded_at.isoformat(),
             'cache_age_hours': (datetime.now() - dataset.loaded_at).total_seconds() / 3600,
+            'cache_backend': 'mmap' if isinstance(dataset, CachedSanctionsDataset) else 'memory',
+            'source_fingerprint': self._cached_fingerprint,
             'data_dir': str(self.data_dir)
         }
 
     async def clear_cache(self):
         """Clear cached data and force reload."""
+        self._close_cached_dataset()
         self._cached_dataset = None
-        if self._cache_file.exists():
-            self._cache_file.unlink()
+        self._cached_fingerprint = None
+        for cache_file in (self._cache_file, self._legacy_cache_file):
+            if cache_file.exists():
+                cache_file.unlink()
         self.logger.info("Cache cleared")
\ No newline at end of file
@@ -0,0 +1,279 @@
+"""
+Columnar, memory-mapped cache of the sanctions dataset.
+
+Replaces the indented ``sanctions_cache.json`` (every entry stored twice,
+re-parsed into ``SanctionEntry`` objects by every worker) with one binary
+file mapped read-only:
+
+- ``string_offsets`` / ``strings``: interned UTF-8 string table. Names,
+  aliases, sources, list names, dates and nationalities are stored once.
+- ``entry_*``: one column per ``SanctionEntry`` field, holding string ids
+  (``NO_STRING`` for ``None``).
+- ``alias_offsets`` / ``alias_ids``: aliases of each entry.
+- ``metadata_offsets`` / ``metadata``: compact JSON per entry, decoded only
+  when the entry is materialized.
+- ``all_names``, ``person_names``, ``org_names``: string ids of the fuzzy
+  candidate lists, so names come out without touching any entry.
+- ``lookup_ids`` / ``lookup_entries``: name string ids sorted by text with
+  the entry each one belongs to, for binary-search lookups.
+
+The header records the fingerprint of the source files the cache was built
+from; a cache with a different fingerprint is stale. The file layout follows
+the AC snapshot format (magic, format version, JSON header, aligned
+sections).
+"""
+
+import json
+import mmap
+import os
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+from ...utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_MAGIC = b"AISNCDS1"
+CACHE_FORMAT_VERSION = 1
+
+NO_STRING = 0xFFFFFFFF
+
+_SECTION_ALIGN = 8
+_ENTRY_STRING_FIELDS = ("name", "entity_type", "source", "list_name", "birth_date", "nationality")
+
+
+def _align(offset: int) -> int:
+    return (offset + _SECTION_ALIGN - 1) // _SECTION_ALIGN * _SECTION_ALIGN
+
+
+class _StringTable:
+    """Interns strings into ids during a build."""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.offsets = array("I", [0])
+        self.blob = bytearray()
+
+    def intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return NO_STRING
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = self.ids[value] = len(self.ids)
+            self.blob += value.encode("utf-8")
+            self.offsets.append(len(self.blob))
+        return string_id
+
+
+def write_dataset_cache(
+    path: Union[str, Path],
+    entries: Sequence[Any],
+    all_names: Sequence[str],
+    name_to_entry: Mapping[str, Any],
+    sources: Sequence[str],
+    fingerprint: str,
+    loaded_at: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Write a dataset cache for ``entries`` (``SanctionEntry``-like objects).
+
+    ``name_to_entry`` decides which entry a name or alias resolves to; every
+    entry it refers to must be in ``entries``.
+
+    The file is written to a temporary sibling and moved into place with
+    ``os.replace``, so readers never see a partial cache.
+    """
+    path = Path(path)
+    strings = _StringTable()
+
+    columns = {field: array("I") for field in _ENTRY_STRING_FIELDS}
+    alias_offsets = array("I", [0])
+    alias_ids = array("I")
+    metadata_offsets = array("I", [0])
+    metadata = bytearray()
+    person_names = array("I")
+    org_names = array("I")
+
+    for entry_index, entry in enumerate(entries):
+        for field in _ENTRY_STRING_FIELDS:
+            columns[field].append(strings.intern(getattr(entry, field)))
+
+        alias_ids.extend(strings.intern(alias) for alias in entry.aliases or [])
+        alias_offsets.append(len(alias_ids))
+
+        if entry.metadata is not None:
+            metadata += json.dumps(entry.metadata, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        metadata_offsets.append(len(metadata))
+
+        if entry.entity_type in ("person", "organization"):
+            name_ids = [strings.intern(entry.name), *(strings.intern(alias) for alias in entry.aliases or [])]
+            (person_names if entry.entity_type == "person" else org_names).extend(name_ids)
+
+    entry_indexes = {id(entry): entry_index for entry_index, entry in enumerate(entries)}
+    name_entries = {strings.intern(name): entry_indexes[id(entry)] for name, entry in name_to_entry.items()}
+    all_name_ids = array("I", (strings.intern(name) for name in all_names))
+
+    def text(string_id: int) -> str:
+        start, end = strings.offsets[string_id], strings.offsets[string_id + 1]
+        return bytes(strings.blob[start:end]).decode("utf-8")
+
+    lookup_ids = array("I", sorted(name_entries, key=text))
+    lookup_entries = array("I", (name_entries[string_id] for string_id in lookup_ids))
+
+    payloads = [
+        ("string_offsets", memoryview(strings.offsets).cast("B")),
+        ("strings", memoryview(strings.blob)),
+        *((f"entry_{field}", memoryview(columns[field]).cast("B")) for field in _ENTRY_STRING_FIELDS),
+        ("alias_offsets", memoryview(alias_offsets).cast("B")),
+        ("alias_ids", memoryview(alias_ids).cast("B")),
+        ("metadata_offsets", memoryview(metadata_offsets).cast("B")),
+        ("metadata", memoryview(metadata)),
+        ("all_names", memoryview(all_name_ids).cast("B")),
+        ("person_names", memoryview(person_names).cast("B")),
+        ("org_names", memoryview(org_names).cast("B")),
+        ("lookup_ids", memoryview(lookup_ids).cast("B")),
+        ("lookup_entries", memoryview(lookup_entries).cast("B")),
+    ]
+    header = {
+        "created_at": time.time(),
+        "loaded_at": loaded_at if loaded_at is not None else time.time(),
+        "fingerprint": fingerprint,
+        "byteorder": sys.byteorder,
+        "sources": list(sources),
+        "total_entries": len(entries),
+        "persons": sum(1 for entry in entries if entry.entity_type == "person"),
+        "organizations": sum(1 for entry in entries if entry.entity_type == "organization"),
+        "strings": len(strings.ids),
+        "sections": {},
+    }
+    relative = 0
+    for name, payload in payloads:
+        relative = _align(relative)
+        header["sections"][name] = [relative, payload.nbytes]
+        relative += payload.nbytes
+
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    data_start = _align(16 + len(header_bytes))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+    with open(tmp_path, "wb") as f:
+        f.write(CACHE_MAGIC)
+        f.write(CACHE_FORMAT_VERSION.to_bytes(4, "little"))
+        f.write(len(header_bytes).to_bytes(4, "little"))
+        f.write(header_bytes)
+        for name, payload in payloads:
+            offset = data_start + header["sections"][name][0]
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+    size = path.stat().st_size
+    logger.info(
+        f"Sanctions dataset cache written: {path} ({len(entries)} entries, "
+        f"{len(strings.ids)} strings, {size} bytes)"
+    )
+    return {"path": str(path), "entries": len(entries), "strings": len(strings.ids), "bytes": size}
+
+
+class SanctionsDatasetCache:
+    """Read-only view over a mapped dataset cache file."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(self._mmap)
+        if bytes(view[:8]) != CACHE_MAGIC:
+            raise ValueError(f"Not a sanctions dataset cache: {path}")
+        format_version = int.from_bytes(view[8:12], "little")
+        if format_version != CACHE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported sanctions dataset cache format {format_version}: {path}")
+        header_len = int.from_bytes(view[12:16], "little")
+        self.header = json.loads(bytes(view[16:16 + header_len]).decode("utf-8"))
+        if self.header["byteorder"] != sys.byteorder:
+            raise ValueError(f"Sanctions dataset cache byte order {self.header['byteorder']} does not match host")
+        data_start = _align(16 + header_len)
+
+        self._sections: Dict[str, memoryview] = {}
+        for name, (offset, length) in self.header["sections"].items():
+            section = view[data_start + offset:data_start + offset + length]
+            self._sections[name] = section if name in ("strings", "metadata") else section.cast("I")
+
+        self._string_offsets = self._sections["string_offsets"]
+        self._strings = self._sections["strings"]
+        self._lookup_ids = self._sections["lookup_ids"]
+
+    @property
+    def fingerprint(self) -> str:
+        return self.header["fingerprint"]
+
+    @property
+    def total_entries(self) -> int:
+        return self.header["total_entries"]
+
+    def __len__(self) -> int:
+        return self.header["total_entries"]
+
+    def string(self, string_id: int) -> Optional[str]:
+        if string_id == NO_STRING:
+            return None
+        start, end = self._string_offsets[string_id], self._string_offsets[string_id + 1]
+        return bytes(self._strings[start:end]).decode("utf-8")
+
+    def _strings_for(self, string_ids: Iterable[int]) -> List[str]:
+        return [self.string(string_id) for string_id in string_ids]
+
+    def all_names(self) -> List[str]:
+        """Unique names and aliases, without materializing entries."""
+        return self._strings_for(self._sections["all_names"])
+
+    def person_names(self) -> List[str]:
+        return self._strings_for(self._sections["person_names"])
+
+    def org_names(self) -> List[str]:
+        return self._strings_for(self._sections["org_names"])
+
+    def entry_type(self, entry_index: int) -> Optional[str]:
+        return self.string(self._sections["entry_entity_type"][entry_index])
+
+    def entry(self, entry_index: int) -> Dict[str, Any]:
+        """Fields of one entry, as keyword arguments for ``SanctionEntry``."""
+        fields: Dict[str, Any] = {
+            field: self.string(self._sections[f"entry_{field}"][entry_index])
+            for field in _ENTRY_STRING_FIELDS
+        }
+        alias_offsets = self._sections["alias_offsets"]
+        fields["aliases"] = self._strings_for(
+            self._sections["alias_ids"][alias_offsets[entry_index]:alias_offsets[entry_index + 1]]
+        )
+        metadata_offsets = self._sections["metadata_offsets"]
+        start, end = metadata_offsets[entry_index], metadata_offsets[entry_index + 1]
+        fields["metadata"] = (
+            json.loads(bytes(self._sections["metadata"][start:end]).decode("utf-8")) if end > start else None
+        )
+        return fields
+
+    def find_entry_index(self, name: str) -> Optional[int]:
+        """Index of the entry that has ``name`` as name or alias."""
+        position = bisect_left(self._lookup_ids, name, key=self.string)
+        if position < len(self._lookup_ids) and self.string(self._lookup_ids[position]) == name:
+            return self._sections["lookup_entries"][position]
+        return None
+
+    def lookup_names(self) -> List[str]:
+        """Every name and alias that ``find_entry_index`` resolves, sorted."""
+        return self._strings_for(self._lookup_ids)
+
+    def close(self) -> None:
+        for section in self._sections.values():
+            section.release()
+        self._sections.clear()
+        self._mmap.close()
@@ -24,9 +24,9 @@ class BirthdateExtractor(BaseExtractor):
             return []
 
         try:
-            from ....data.patterns.dates import extract_birthdates_from_text
+            from ....data.patterns.identifier_scanner import scan_identifiers
 
-            birthdates = extract_birthdates_from_text(text)
+            birthdates = scan_identifiers(text).dates()
             self._log_extraction_result(text, len(birthdates), "birthdate")
             return birthdates
 
@@ -53,54 +53,10 @@ class IdentifierExtractor(BaseExtractor):
             return []
 
         try:
-            from ....data.patterns.identifiers import (
-                get_compiled_patterns_cached,
-                get_validation_function,
-                normalize_identifier,
-            )
-
-            found_ids = []
-
-            for pattern, compiled_regex in get_compiled_patterns_cached():
-                if pattern.type not in id_types:
-                    continue
-
-                for match in compiled_regex.finditer(text):
-                    # Handle patterns with multiple capture groups (e.g. passport series + number)
-                    if pattern.type in ['passport_rf', 'passport_ua'] and len(match.groups()) > 1:
-                        # Combine multiple groups for passport patterns
-                        raw_value = ''.join(g for g in match.groups() if g is not None)
-                    else:
-                        raw_value = match.group(1) if match.group(1) else match.group(0)
-
-                    normalized_value = normalize_identifier(raw_value, pattern.type)
-
-                    # Validate if validator exists
-                    validator = get_validation_function(pattern.type)
-                    is_valid = True
-                    if validator:
-                        is_valid = validator(normalized_value)
-
-                    confidence = 0.9 if is_valid else 0.6
-
-                    id_info = {
-                        "type": pattern.type,
-                        "value": normalized_value,
-                        "raw": match.group(0),
-                        "name": pattern.name,
-                        "confidence": confidence,
-                        "position": match.span(),
-                        "valid": is_valid,
-                    }
-                    found_ids.append(id_info)
+            from ....data.patterns.identifier_scanner import scan_identifiers
 
-            # Remove duplicates by value
-            unique_ids = []
-            seen_values = set()
-            for id_info in found_ids:
-                if id_info["value"] not in seen_values:
-                    seen_values.add(id_info["value"])
-                    unique_ids.append(id_info)
+            # One shared scan per text serves both the org and person categories
+            unique_ids = scan_identifiers(text).ids_for(id_types)
 
             entity_type = "organization" if id_types == self._org_id_types else "person"
             self._log_extraction_result(text, len(unique_ids), f"{entity_type}_id")
@@ -723,11 +723,7 @@ class SignalsService:
 
     def _extract_org_ids(self, text: str) -> List[Dict]:
         """Детектор организационных ID"""
-        from ...data.patterns.identifiers import (
-            get_compiled_patterns_cached,
-            get_validation_function,
-            normalize_identifier,
-        )
+        from ...data.patterns.identifier_scanner import scan_identifiers
 
         org_id_types = {
             "edrpou",
@@ -740,99 +736,22 @@ class SignalsService:
             "ein",
         }
 
-        found_ids = []
-
-        for pattern, compiled_regex in get_compiled_patterns_cached():
-            if pattern.type not in org_id_types:
-                continue
-
-            for match in compiled_regex.finditer(text):
-                raw_value = match.group(1)
-                normalized_value = normalize_identifier(raw_value, pattern.type)
-
-                # Дополнительная валидация если есть
-                validator = get_validation_function(pattern.type)
-                is_valid = True
-                if validator:
-                    is_valid = validator(normalized_value)
-
-                confidence = 0.9 if is_valid else 0.6
-
-                id_info = {
-                    "type": pattern.type,
-                    "value": normalized_value,
-                    "raw": match.group(0),  # Полное совпадение
-                    "name": pattern.name,
-                    "confidence": confidence,
-                    "position": match.span(),
-                    "valid": is_valid,
-                }
-                found_ids.append(id_info)
-
-        # Удаляем дубликаты по value
-        seen_values = set()
-        unique_ids = []
-        for id_info in found_ids:
-            if id_info["value"] not in seen_values:
-                seen_values.add(id_info["value"])
-                unique_ids.append(id_info)
-
-        return unique_ids
+        # Один общий проход по тексту для всех типов ID (с позициями)
+        return scan_identifiers(text).ids_for(org_id_types)
 
     def _extract_person_ids(self, text: str) -> List[Dict]:
         """Детектор личных ID"""
-        from ...data.patterns.identifiers import (
-            get_compiled_patterns_cached,
-            get_validation_function,
-            normalize_identifier,
-        )
+        from ...data.patterns.identifier_scanner import scan_identifiers
 
         person_id_types = {"inn_ua", "inn_ru", "snils", "ssn", "passport_ua"}
 
-        found_ids = []
-
-        for pattern, compiled_regex in get_compiled_patterns_cached():
-            if pattern.type not in person_id_types:
-                continue
-
-            for match in compiled_regex.finditer(text):
-                raw_value = match.group(1)
-                normalized_value = normalize_identifier(raw_value, pattern.type)
-
-                # Дополнительная валидация если есть
-                validator = get_validation_function(pattern.type)
-                is_valid = True
-                if validator:
-                    is_valid = validator(normalized_value)
-
-                confidence = 0.9 if is_valid else 0.6
-
-                id_info = {
-                    "type": pattern.type,
-                    "value": normalized_value,
-                    "raw": match.group(0),  # Полное совпадение
-                    "name": pattern.name,
-                    "confidence": confidence,
-                    "position": match.span(),
-                    "valid": is_valid,
-                }
-                found_ids.append(id_info)
-
-        # Удаляем дубликаты по value
-        seen_values = set()
-        unique_ids = []
-        for id_info in found_ids:
-            if id_info["value"] not in seen_values:
-                seen_values.add(id_info["value"])
-                unique_ids.append(id_info)
-
-        return unique_ids
+        return scan_identifiers(text).ids_for(person_id_types)
 
     def _extract_birthdates(self, text: str) -> List[Dict]:
         """Детектор дат рождения"""
-        from ...data.patterns.dates import extract_birthdates_from_text
+        from ...data.patterns.identifier_scanner import scan_identifiers
 
-        return extract_birthdates_from_text(text)
+        return scan_identifiers(text).dates()
 
     def _enrich_organizations_with_ids(
         self, organizations: List[OrganizationSignal], org_ids: List[Dict]
@@ -1658,10 +1577,11 @@ class SignalsService:
 
             self.logger.debug(f"🚀 FAST PATH: Checking {len(all_ids_to_check)} IDs against sanctions cache")
 
-            # Проверяем каждый ID в cache
+            # Проверяем все ID одним пакетным запросом к cache
+            sanctioned_by_id = inn_cache.lookup_many(id_value for id_value, _, _ in all_ids_to_check)
             sanctioned_matches = 0
             for id_value, entity_type, id_info in all_ids_to_check:
-                sanctioned_data = inn_cache.lookup(id_value)
+                sanctioned_data = sanctioned_by_id.get(id_value)
 
                 # Record cache lookup metrics
                 cache_hit = sanctioned_data is not None
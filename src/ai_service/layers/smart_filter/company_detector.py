@@ -9,17 +9,24 @@ of potential company names.
 # Standard library imports
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set
 
 # Local imports
 from ...data.dicts.smart_filter_patterns import (
     ADDRESS_PATTERNS,
+    BANKING_TERMS,
     COMPANY_KEYWORDS,
     COMPANY_PATTERNS,
     REGISTRATION_PATTERNS,
     SIGNAL_WEIGHTS,
 )
 from ...utils.logging_config import get_logger
+from .lexicon_matcher import (
+    BANKING_TERMS_CATEGORY,
+    COMPANY_KEYWORDS_CATEGORY,
+    LexiconHits,
+    get_smart_filter_matcher,
+)
 
 
 @dataclass
@@ -52,191 +59,8 @@ class CompanyDetector:
         # Patterns for registration numbers (from dictionary)
         self.registration_patterns = REGISTRATION_PATTERNS.copy()
 
-        # Extended banking terms
-        self.banking_terms = {
-            "ukrainian": [
-                "банк",
-                "банківська",
-                "банківський",
-                "банківське",
-                "кредитний",
-                "кредитна",
-                "кредитне",
-                "фінансовий",
-                "фінансова",
-                "фінансове",
-                "фінансові",
-                "операції",
-                "програми",
-                "інвестиційний",
-                "інвестиційна",
-                "інвестиційне",
-                "страховий",
-                "страхова",
-                "страхове",
-                "лізинговий",
-                "лізингова",
-                "лізингове",
-                "факторинговий",
-                "факторингова",
-                "факторингове",
-                "мікрофінанс",
-                "мікрокредит",
-                "платіжний",
-                "платіжна",
-                "платіжне",
-                "розрахунковий",
-                "розрахункова",
-                "розрахункове",
-                "депозитний",
-                "депозитна",
-                "депозитне",
-                "валютний",
-                "валютна",
-                "валютне",
-                "біржовий",
-                "біржова",
-                "біржове",
-                "брокерський",
-                "брокерська",
-                "брокерське",
-                "трастовий",
-                "трастова",
-                "трастове",
-                "клірингова",
-                "клірингове",
-                "клірингової",
-                "національний банк",
-                "центральний банк",
-                "комерційний банк",
-                "ощадний банк",
-                "приват банк",
-                "альфа банк",
-                "укрексімбанк",
-                "ощадбанк",
-                "райффайзен",
-                "кредитспілка",
-                "кредитна спілка",
-                "ломбард",
-                "мікрофінансова організація",
-            ],
-            "russian": [
-                "банк",
-                "банковская",
-                "банковский",
-                "банковское",
-                "кредитный",
-                "кредитная",
-                "кредитное",
-                "финансовый",
-                "финансовая",
-                "финансовое",
-                "инвестиционный",
-                "инвестиционная",
-                "инвестиционное",
-                "страховой",
-                "страховая",
-                "страховое",
-                "лизинговый",
-                "лизинговая",
-                "лизинговое",
-                "факторинговый",
-                "факторинговая",
-                "факторинговое",
-                "микрофинанс",
-                "микрокредит",
-                "платежный",
-                "платежная",
-                "платежное",
-                "расчетный",
-                "расчетная",
-                "расчетное",
-                "депозитный",
-                "депозитная",
-                "депозитное",
-                "валютный",
-                "валютная",
-                "валютное",
-                "биржевой",
-                "биржевая",
-                "биржевое",
-                "брокерский",
-                "брокерская",
-                "брокерское",
-                "трастовый",
-                "трастовая",
-                "трастовое",
-                "клиринговая",
-                "клиринговое",
-                "клиринговой",
-                "национальный банк",
-                "центральный банк",
-                "коммерческий банк",
-                "сберегательный банк",
-                "приват банк",
-                "альфа банк",
-                "сбербанк",
-                "втб",
-                "газпромбанк",
-                "россельхозбанк",
-                "кредитный союз",
-                "ломбард",
-                "микрофинансовая организация",
-            ],
-            "english": [
-                "bank",
-                "banking",
-                "financial",
-                "finance",
-                "investment",
-                "credit",
-                "loan",
-                "insurance",
-                "leasing",
-                "factoring",
-                "microfinance",
-                "microcredit",
-                "payment",
-                "settlement",
-                "deposit",
-                "currency",
-                "exchange",
-                "trading",
-                "brokerage",
-                "trust",
-                "clearing",
-                "custodial",
-                "wealth",
-                "asset",
-                "fund",
-                "capital",
-                "national bank",
-                "central bank",
-                "commercial bank",
-                "savings bank",
-                "investment bank",
-                "private bank",
-                "retail bank",
-                "corporate bank",
-                "development bank",
-                "jpmorgan",
-                "goldman sachs",
-                "morgan stanley",
-                "wells fargo",
-                "bank of america",
-                "credit union",
-                "credit card",
-                "debit card",
-                "atm",
-                "swift",
-                "wire transfer",
-                "correspondent bank",
-                "nostro",
-                "vostro",
-                "clearing house",
-                "settlement system",
-            ],
-        }
+        # Extended banking terms (from dictionary)
+        self.banking_terms = BANKING_TERMS.copy()
 
         # Special patterns for financial services
         self.financial_services_patterns = [
@@ -252,14 +76,34 @@ class CompanyDetector:
             r"\b(?:валюта|currency|обмін|обмен|exchange)\b",
         ]
 
+        # Compile regex patterns once instead of on every call
+        self._legal_entity_regexes = self._compile(self.company_patterns["legal_entities"])
+        self._business_type_regexes = self._compile(self.company_patterns["business_types"])
+        self._address_regexes = self._compile(self.address_patterns)
+        self._registration_regexes = self._compile(self.registration_patterns)
+        self._financial_services_regexes = self._compile(self.financial_services_patterns)
+        self._capitalized_name_regex = re.compile(
+            r"\b[A-ZА-ЯІЇЄҐ][a-zа-яіїєґ]{2,}(?:\s+[A-ZА-ЯІЇЄҐ][a-zа-яіїєґ]{2,})*\b"
+        )
+
+        # Shared single-pass matcher for keyword and banking term lexicons
+        self.lexicon_matcher = get_smart_filter_matcher()
+
         self.logger.info("CompanyDetector initialized")
 
-    def detect_company_signals(self, text: str) -> Dict[str, Any]:
+    @staticmethod
+    def _compile(patterns: List[str]) -> List[re.Pattern]:
+        return [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+
+    def detect_company_signals(
+        self, text: str, lexicon_hits: Optional[LexiconHits] = None
+    ) -> Dict[str, Any]:
         """
         Detect company signals in text
 
         Args:
             text: Text to analyze
+            lexicon_hits: Precomputed lexicon matcher hits for text
 
         Returns:
             Company signal detection results
@@ -267,11 +111,14 @@ class CompanyDetector:
         if not text or not text.strip():
             return self._create_empty_result()
 
+        if lexicon_hits is None:
+            lexicon_hits = self.lexicon_matcher.scan(text)
+
         signals = []
         total_confidence = 0.0
 
         # 1. Search for company keywords
-        keyword_signals = self._detect_keywords(text)
+        keyword_signals = self._detect_keywords(text, lexicon_hits)
         if keyword_signals["confidence"] > 0:
             signals.append(keyword_signals)
             total_confidence += keyword_signals["confidence"]
@@ -307,7 +154,7 @@ class CompanyDetector:
             total_confidence += capitalized_signals["confidence"]
 
         # 7. Search for banking terms
-        banking_signals = self._detect_banking_terms(text)
+        banking_signals = self._detect_banking_terms(text, lexicon_hits)
         if banking_signals["confidence"] > 0:
             signals.append(banking_signals)
             total_confidence += banking_signals["confidence"]
@@ -331,15 +178,13 @@ class CompanyDetector:
             "analysis_complete": True,
         }
 
-    def _detect_keywords(self, text: str) -> Dict[str, Any]:
+    def _detect_keywords(
+        self, text: str, lexicon_hits: Optional[LexiconHits] = None
+    ) -> Dict[str, Any]:
         """Detect company keywords"""
-        matches = []
-        text_lower = text.lower()
-
-        for language, keywords in self.company_keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in text_lower:
-                    matches.append(keyword)
+        if lexicon_hits is None:
+            lexicon_hits = self.lexicon_matcher.scan(text)
+        matches = lexicon_hits.matches(COMPANY_KEYWORDS_CATEGORY)
 
         confidence = min(len(matches) * 0.2, 0.8) if matches else 0.0
 
@@ -354,8 +199,8 @@ class CompanyDetector:
         """Detect legal entities"""
         matches = []
 
-        for pattern in self.company_patterns["legal_entities"]:
-            found_matches = re.findall(pattern, text, re.IGNORECASE)
+        for regex in self._legal_entity_regexes:
+            found_matches = regex.findall(text)
             matches.extend(found_matches)
 
         confidence = min(len(matches) * 0.3, 0.9) if matches else 0.0
@@ -371,8 +216,8 @@ class CompanyDetector:
         """Detect business types"""
         matches = []
 
-        for pattern in self.company_patterns["business_types"]:
-            found_matches = re.findall(pattern, text, re.IGNORECASE)
+        for regex in self._business_type_regexes:
+            found_matches = regex.findall(text)
             matches.extend(found_matches)
 
         confidence = min(len(matches) * 0.25, 0.8) if matches else 0.0
@@ -388,8 +233,8 @@ class CompanyDetector:
         """Detect address information"""
         matches = []
 
-        for pattern in self.address_patterns:
-            found_matches = re.findall(pattern, text, re.IGNORECASE)
+        for regex in self._address_regexes:
+            found_matches = regex.findall(text)
             matches.extend(found_matches)
 
         confidence = min(len(matches) * 0.4, 0.7) if matches else 0.0
@@ -405,8 +250,8 @@ class CompanyDetector:
         """Detect registration numbers"""
         matches = []
 
-        for pattern in self.registration_patterns:
-            found_matches = re.findall(pattern, text, re.IGNORECASE)
+        for regex in self._registration_regexes:
+            found_matches = regex.findall(text)
             matches.extend(found_matches)
 
         confidence = min(len(matches) * 0.5, 0.8) if matches else 0.0
@@ -420,11 +265,8 @@ class CompanyDetector:
 
     def _detect_capitalized_names(self, text: str) -> Dict[str, Any]:
         """Detect capitalized names"""
-        # Pattern for words starting with capital letter
-        pattern = (
-            r"\b[A-ZА-ЯІЇЄҐ][a-zа-яіїєґ]{2,}(?:\s+[A-ZА-ЯІЇЄҐ][a-zа-яіїєґ]{2,})*\b"
-        )
-        matches = re.findall(pattern, text)
+        # Words starting with capital letter
+        matches = self._capitalized_name_regex.findall(text)
 
         # Filter common words
         common_words = {"Оплата", "Платеж", "Перевод", "Счет", "Квитанция", "Документ"}
@@ -447,16 +289,14 @@ class CompanyDetector:
                 all_keywords.extend(signal["matches"])
         return list(set(all_keywords))
 
-    def _detect_banking_terms(self, text: str) -> Dict[str, Any]:
+    def _detect_banking_terms(
+        self, text: str, lexicon_hits: Optional[LexiconHits] = None
+    ) -> Dict[str, Any]:
         """Detect banking terms"""
-        matches = []
-        text_lower = text.lower()
-
         # Search across all languages
-        for language, terms in self.banking_terms.items():
-            for term in terms:
-                if term.lower() in text_lower:
-                    matches.append(term)
+        if lexicon_hits is None:
+            lexicon_hits = self.lexicon_matcher.scan(text)
+        matches = lexicon_hits.matches(BANKING_TERMS_CATEGORY)
 
         confidence = min(len(matches) * 0.6, 0.9) if matches else 0.0
 
@@ -471,8 +311,8 @@ class CompanyDetector:
         """Detect financial services by patterns"""
         matches = []
 
-        for pattern in self.financial_services_patterns:
-            found_matches = re.findall(pattern, text, re.IGNORECASE)
+        for regex in self._financial_services_regexes:
+            found_matches = regex.findall(text)
             matches.extend(found_matches)
 
         confidence = min(len(matches) * 0.5, 0.8) if matches else 0.0
@@ -0,0 +1,176 @@
+"""
+Lexicon Matcher
+
+Single-pass substring matcher over all smart-filter keyword lexicons.
+
+The detectors used to test every keyword with ``keyword.lower() in text_lower``,
+i.e. one scan of the text per keyword. This module compiles every lexicon
+once, tagging each keyword with its category and list position, and finds
+all of them in one pass over the lowered text. Results keep the original
+``in`` semantics and list order, so detectors can swap it in unchanged.
+
+Uses pyahocorasick when available; otherwise keywords are bucketed by their
+first two characters and only buckets present in the text are checked.
+"""
+
+import functools
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+from ...data.dicts.smart_filter_patterns import BANKING_TERMS, COMPANY_KEYWORDS
+from ...utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+COMPANY_KEYWORDS_CATEGORY = "company_keywords"
+BANKING_TERMS_CATEGORY = "banking_terms"
+PAYMENT_TRIGGER_KINDS = ("context", "preps", "currencies")
+
+
+def payment_category(language: str, kind: str) -> str:
+    """Category name for a PAYMENT_TRIGGERS list."""
+    return f"payment:{language}:{kind}"
+
+
+class LexiconHits:
+    """Keywords found in one text, grouped by category."""
+
+    __slots__ = ("_matcher", "_hits")
+
+    def __init__(self, matcher: "LexiconMatcher", hits: Dict[int, List[int]]):
+        self._matcher = matcher
+        self._hits = hits
+
+    def matches(self, category: str) -> List[str]:
+        """Matched keywords of a category, in lexicon order (duplicates kept)."""
+        category_id = self._matcher._category_ids.get(category)
+        if category_id is None:
+            return []
+        indices = self._hits.get(category_id)
+        if not indices:
+            return []
+        keywords = self._matcher._keywords[category_id]
+        return [keywords[i] for i in indices]
+
+    def categories(self) -> Set[str]:
+        """Categories with at least one match."""
+        names = self._matcher._category_names
+        return {names[category_id] for category_id in self._hits}
+
+    def __bool__(self) -> bool:
+        return bool(self._hits)
+
+
+class LexiconMatcher:
+    """Compiled multi-lexicon matcher with category tags."""
+
+    def __init__(self, lexicons: Mapping[str, Sequence[str]], use_ahocorasick: Optional[bool] = None):
+        """
+        Compile lexicons.
+
+        Args:
+            lexicons: Category name -> keywords (matched case-insensitively)
+            use_ahocorasick: Force backend selection (None = use if installed)
+        """
+        self._category_names: List[str] = []
+        self._category_ids: Dict[str, int] = {}
+        self._keywords: List[List[str]] = []
+
+        # Lowered keyword -> [(category_id, index), ...]
+        self._payloads: Dict[str, List[Tuple[int, int]]] = {}
+        # Empty keywords are substrings of every text
+        self._always: List[Tuple[int, int]] = []
+
+        for category, keywords in lexicons.items():
+            category_id = len(self._category_names)
+            self._category_names.append(category)
+            self._category_ids[category] = category_id
+            keywords = list(keywords)
+            self._keywords.append(keywords)
+            for index, keyword in enumerate(keywords):
+                key = keyword.lower()
+                if key:
+                    self._payloads.setdefault(key, []).append((category_id, index))
+                else:
+                    self._always.append((category_id, index))
+
+        if use_ahocorasick is None:
+            use_ahocorasick = AHOCORASICK_AVAILABLE
+        self._automaton = None
+        self._buckets: Dict[str, List[str]] = {}
+        if use_ahocorasick and AHOCORASICK_AVAILABLE and self._payloads:
+            automaton = ahocorasick.Automaton()
+            for key in self._payloads:
+                automaton.add_word(key, key)
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            for key in self._payloads:
+                self._buckets.setdefault(key[:2], []).append(key)
+
+        logger.debug(
+            f"LexiconMatcher compiled {len(self._payloads)} keys in "
+            f"{len(self._category_names)} categories "
+            f"({'ahocorasick' if self._automaton is not None else 'bigram buckets'})"
+        )
+
+    @property
+    def categories(self) -> List[str]:
+        return list(self._category_names)
+
+    def scan(self, text: str) -> LexiconHits:
+        """Find every keyword occurring in text (case-insensitive substring match)."""
+        text_lower = text.lower() if text else ""
+        hits: Dict[int, List[int]] = {}
+        for category_id, index in self._always:
+            hits.setdefault(category_id, []).append(index)
+        if not text_lower:
+            return LexiconHits(self, hits)
+
+        for key in self._find_keys(text_lower):
+            for category_id, index in self._payloads[key]:
+                hits.setdefault(category_id, []).append(index)
+        for indices in hits.values():
+            indices.sort()
+        return LexiconHits(self, hits)
+
+    def _find_keys(self, text_lower: str) -> Iterable[str]:
+        if self._automaton is not None:
+            return {key for _, key in self._automaton.iter(text_lower)}
+
+        buckets = self._buckets
+        found = []
+        # Single-character keys live under their own character
+        prefixes = set(text_lower)
+        prefixes.update(text_lower[i:i + 2] for i in range(len(text_lower) - 1))
+        for prefix in prefixes:
+            candidates = buckets.get(prefix)
+            if candidates:
+                found.extend(key for key in candidates if key in text_lower)
+        return found
+
+
+def build_smart_filter_lexicons() -> Dict[str, List[str]]:
+    """Collect all smart-filter keyword lexicons under their category names."""
+    from ...data.dicts.payment_triggers import PAYMENT_TRIGGERS
+
+    lexicons: Dict[str, List[str]] = {
+        COMPANY_KEYWORDS_CATEGORY: [kw for keywords in COMPANY_KEYWORDS.values() for kw in keywords],
+        BANKING_TERMS_CATEGORY: [term for terms in BANKING_TERMS.values() for term in terms],
+    }
+    for language, triggers in PAYMENT_TRIGGERS.items():
+        for kind in PAYMENT_TRIGGER_KINDS:
+            lexicons[payment_category(language, kind)] = list(triggers.get(kind, []))
+    return lexicons
+
+
+@functools.lru_cache(maxsize=1)
+def get_smart_filter_matcher() -> LexiconMatcher:
+    """Process-wide matcher over all smart-filter lexicons (compiled on first use)."""
+    return LexiconMatcher(build_smart_filter_lexicons())
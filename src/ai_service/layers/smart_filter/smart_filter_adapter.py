@@ -70,8 +70,12 @@ class SmartFilterAdapter(SmartFilterInterface):
         start_time = time.time()
 
         try:
-            # Use existing service for detection
-            filter_result = self._service.should_process_text(text)
+            # Use existing service for detection. AC lookups may go to
+            # Elasticsearch, so keep them off the event loop.
+            if self._service.aho_corasick_enabled is True:
+                filter_result = await self._service.should_process_text_async(text)
+            else:
+                filter_result = self._service.should_process_text(text)
 
             # Map existing result to new contract
             classification = self._map_to_classification(
@@ -6,8 +6,10 @@ Intelligent pre-filtering service for Aho-Corasick search decisions.
 
 # Standard library imports
 import asyncio
+import functools
 import os
 import re
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
@@ -28,9 +30,16 @@ from .company_detector import CompanyDetector
 from .confidence_scorer import ConfidenceScorer
 from .decision_logic import DecisionLogic, DecisionType, RiskLevel
 from .document_detector import DocumentDetector
+from .lexicon_matcher import LexiconHits, get_smart_filter_matcher, payment_category
 from .name_detector import NameDetector
 from .terrorism_detector import TerrorismDetector
 
+# Exact-term AC lookup against Elasticsearch (see _build_ac_terms_query)
+_AC_MAX_SHINGLE_TOKENS = 6
+_AC_MAX_TERMS = 512
+_AC_MIN_TERM_LENGTH = 3
+_AC_TOKEN_PUNCTUATION = ".,;:!?\"'«»()[]{}"
+
 
 @dataclass
 class FilterResult:
@@ -54,6 +63,7 @@ class SmartFilterService:
         enable_terrorism_detection: bool = True,
         enable_aho_corasick: Optional[bool] = None,  # Use config if None
         pattern_service: Optional[UnifiedPatternService] = None,
+        local_ac: Optional[Any] = None,
     ):
         """
         Initialize smart filter service
@@ -64,6 +74,7 @@ class SmartFilterService:
             enable_terrorism_detection: Enable terrorism detection
             enable_aho_corasick: Enable Aho-Corasick pattern matching (None = use config)
             pattern_service: Unified pattern service for AC integration
+            local_ac: In-process AC automaton (defaults to LOCAL_AC_SNAPSHOT_DIR)
 
         Raises:
             SmartFilterError: If service initialization fails
@@ -85,6 +96,9 @@ class SmartFilterService:
             else:
                 self.aho_corasick_enabled = enable_aho_corasick
             self.pattern_service = pattern_service or UnifiedPatternService()
+            self._local_ac = local_ac
+            self._ac_snapshots = None
+            self._unicode_service = None
 
             # Initialize main decision module
             self.decision_logic = DecisionLogic(
@@ -113,6 +127,20 @@ class SmartFilterService:
             # Date and time patterns
             self.date_time_patterns = DATE_TIME_PATTERNS.copy()
 
+            # Compiled once; the exclusion and date checks run on every request
+            self._exclusion_regexes = [
+                re.compile(pattern, re.IGNORECASE) for pattern in self.exclusion_patterns
+            ]
+            self._date_time_regexes = [
+                re.compile(pattern, re.IGNORECASE)
+                for pattern_group in self.date_time_patterns.values()
+                for pattern in pattern_group
+            ]
+
+            # One compiled matcher over all keyword lexicons; a single scan
+            # per text feeds the payment context and company detectors
+            self.lexicon_matcher = get_smart_filter_matcher()
+
             self.logger.info(
                 f"SmartFilterService initialized (terrorism detection: {enable_terrorism_detection})"
             )
@@ -120,12 +148,15 @@ class SmartFilterService:
             self.logger.error(f"Failed to initialize SmartFilterService: {e}")
             raise SmartFilterError(f"Service initialization failed: {str(e)}")
 
-    def should_process_text(self, text: str) -> FilterResult:
+    def should_process_text(
+        self, text: str, ac_matches: Optional[List[Dict[str, Any]]] = None
+    ) -> FilterResult:
         """
         Determines whether to process text with full search
 
         Args:
             text: Text to analyze
+            ac_matches: Precomputed AC matches (skips the AC lookup)
 
         Returns:
             FilterResult with recommendation
@@ -166,33 +197,21 @@ class SmartFilterService:
                 )
 
             # Tier-0: Aho-Corasick search (if enabled)
-            ac_matches = []
+            if ac_matches is None:
+                ac_matches = self._collect_ac_matches(original_text)
             ac_confidence_bonus = 0.0
-            if self.aho_corasick_enabled:
-                # Search original text
-                ac_result = self.search_aho_corasick(original_text)
-                ac_matches = ac_result.get("matches", [])
-
-                # If no matches, try normalized name order variants
-                if not ac_matches:
-                    # Try to normalize names and check reversed order
-                    text_variants = self._generate_name_variants(original_text)
-                    for variant in text_variants:
-                        variant_result = self.search_aho_corasick(variant)
-                        variant_matches = variant_result.get("matches", [])
-                        if variant_matches:
-                            ac_matches.extend(variant_matches)
-                            break  # Found matches, stop trying variants
-
-                if ac_matches:
-                    ac_confidence_bonus = SERVICE_CONFIG.aho_corasick_confidence_bonus
+            if ac_matches:
+                ac_confidence_bonus = SERVICE_CONFIG.aho_corasick_confidence_bonus
+
+            # Single pass over all keyword lexicons
+            lexicon_hits = self.lexicon_matcher.scan(original_text)
 
             # Context analysis with payment triggers
-            context_signals = self._analyze_payment_context(original_text)
+            context_signals = self._analyze_payment_context(original_text, lexicon_hits)
 
             # Signal analysis with original text (preserving context)
             company_signals = self.company_detector.detect_company_signals(
-                original_text
+                original_text, lexicon_hits=lexicon_hits
             )
             name_signals = self.name_detector.detect_name_signals(original_text)
 
@@ -326,14 +345,22 @@ class SmartFilterService:
             raise SmartFilterError(f"Payment description analysis failed: {str(e)}")
 
     def search_aho_corasick(
-        self, text: str, max_matches: Optional[int] = None
+        self,
+        text: str,
+        max_matches: Optional[int] = None,
+        deadline_ms: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Perform real AC pattern matching using Elasticsearch AC patterns
 
+        Blocking counterpart of search_aho_corasick_async: same in-process
+        automaton and exact n-gram term lookups, through the pooled sync
+        HTTP session. The ES request is bounded by ``deadline_ms``.
+
         Args:
             text: Text to search in
             max_matches: Maximum number of matches to return
+            deadline_ms: Overall time budget (default AHO_CORASICK_TIMEOUT_MS)
 
         Returns:
             Real AC pattern search results
@@ -342,197 +369,404 @@ class SmartFilterService:
             SmartFilterError: If search fails
         """
         if not self.aho_corasick_enabled:
-            return {
-                "matches": [],
-                "total_matches": 0,
-                "processing_time_ms": 0.0,
-                "patterns_loaded": 0,
-                "text_length": len(text),
-                "enabled": False,
-                "message": "AC integration disabled",
-            }
+            return self._empty_ac_result(text, enabled=False, message="AC integration disabled")
 
-        try:
-            import time
-            import requests
-            from requests.auth import HTTPBasicAuth
-            start_time = time.time()
-
-            # ES connection details - using environment variables for security
-            ES_HOST = os.getenv("ES_HOST", "localhost")
-            ES_PORT = int(os.getenv("ES_PORT", "9200"))
-            ES_USER = os.getenv("ES_USERNAME", os.getenv("ES_USER"))
-            ES_PASSWORD = os.getenv("ES_PASSWORD")
-            ES_INDEX = os.getenv("ES_AC_PATTERNS_INDEX", "ai_service_ac_patterns")
-
-            # Check if credentials are available, skip ES lookup if not
-            if not ES_PASSWORD or not ES_USER:
-                # Fallback to basic detection without ES lookup
-                return {
-                    "should_use_ac": False,
-                    "confidence": 0.5,
-                    "reason": "ES credentials not configured",
-                    "processing_time": time.time() - start_time
-                }
+        start_time = time.perf_counter()
+        deadline_ms = SERVICE_CONFIG.aho_corasick_timeout_ms if deadline_ms is None else deadline_ms
+        timings: Dict[str, float] = {}
 
-            # Normalize text for search (same as AC patterns)
-            from ..unicode.unicode_service import UnicodeService
-            unicode_service = UnicodeService()
-            normalized_result = unicode_service.normalize_text(text, normalize_homoglyphs=True)
-            normalized_text = normalized_result["normalized"]
-
-            # Search for AC patterns that match this text
-            search_url = f"http://{ES_HOST}:{ES_PORT}/{ES_INDEX}/_search"
-            auth = HTTPBasicAuth(ES_USER, ES_PASSWORD)
-
-            # Create search query to find patterns that match our text
-            search_query = {
-                "query": {
-                    "bool": {
-                        "should": [
-                            {
-                                "wildcard": {
-                                    "pattern": {
-                                        "value": f"*{normalized_text.lower()}*",
-                                        "case_insensitive": True
-                                    }
-                                }
-                            },
-                            {
-                                "match": {
-                                    "pattern": {
-                                        "query": normalized_text,
-                                        "fuzziness": "AUTO"
-                                    }
-                                }
-                            }
-                        ],
-                        "minimum_should_match": 1
-                    }
-                },
-                "size": max_matches or 50,
-                "sort": [
-                    {"tier": {"order": "asc"}},  # Lower tier = higher priority
-                    {"confidence": {"order": "desc"}},
-                    {"_score": {"order": "desc"}}
-                ]
-            }
+        local_ac = self._get_local_ac()
+        if local_ac is not None:
+            return self._search_local_ac(local_ac, text, max_matches)
 
-            # Use configurable timeout instead of hardcoded 5 seconds
-            # Import SearchConfig to get proper ES timeout
-            from ...config.settings import SearchConfig
-            search_config = SearchConfig()
-            timeout = search_config.es_timeout
-            response = requests.post(search_url, json=search_query, auth=auth, timeout=timeout)
-
-            matches = []
-            patterns_loaded = 0
-
-            if response.status_code == 200:
-                result = response.json()
-                hits = result.get("hits", {}).get("hits", [])
-                patterns_loaded = result.get("hits", {}).get("total", {}).get("value", 0)
-
-                for hit in hits:
-                    source = hit["_source"]
-                    pattern = source.get("pattern", "")
-
-                    # Check if this pattern actually matches our normalized text
-                    if pattern.lower() in normalized_text.lower() or normalized_text.lower() in pattern.lower():
-                        matches.append({
-                            "pattern": pattern,
-                            "tier": f"tier_{source.get('tier', 3)}",
-                            "start": normalized_text.lower().find(pattern.lower()),
-                            "end": normalized_text.lower().find(pattern.lower()) + len(pattern),
-                            "matched_text": pattern,
-                            "confidence": source.get("confidence", 0.5),
-                            "pattern_type": source.get("type", "unknown"),
-                            "entity_type": source.get("entity_type", "unknown"),
-                            "entity_id": source.get("entity_id", ""),
-                            "es_score": hit.get("_score", 0)
-                        })
-
-            processing_time_ms = (time.time() - start_time) * 1000
+        es_settings = self._ac_es_settings()
+        if es_settings is None:
+            return self._empty_ac_result(text, message="ES credentials not configured")
 
-            return {
-                "matches": matches,
-                "total_matches": len(matches),
-                "processing_time_ms": processing_time_ms,
-                "patterns_loaded": patterns_loaded,
-                "text_length": len(text),
-                "enabled": True,
-                "normalized_text": normalized_text,
-                "message": f"Real AC search completed with {len(matches)} matches from {patterns_loaded} total patterns",
-            }
+        stage_start = time.perf_counter()
+        normalized_text = self._normalize_for_ac(text)
+        timings["normalize"] = (time.perf_counter() - stage_start) * 1000
+
+        remaining_s = (deadline_ms - (time.perf_counter() - start_time) * 1000) / 1000
+        if remaining_s <= 0:
+            return self._empty_ac_result(
+                text, error_type="timeout", message="AC search deadline exceeded", timings_ms=timings
+            )
+
+        query = self._build_ac_terms_query(normalized_text, max_matches or 50)
+        if query is None:
+            return self._empty_ac_result(text, message="No searchable tokens", timings_ms=timings)
+
+        import requests
+        from ...utils.http_client_pool import get_http_pool
 
+        stage_start = time.perf_counter()
+        try:
+            response = get_http_pool().sync_post_json(
+                es_settings["search_url"], query, timeout=remaining_s, auth=es_settings["auth"]
+            )
         except Exception as e:
-            import requests
-            is_timeout = isinstance(e, (requests.Timeout, requests.ConnectTimeout, requests.ReadTimeout))
+            timings["es_request"] = (time.perf_counter() - stage_start) * 1000
+            is_timeout = isinstance(e, requests.Timeout)
             error_type = "timeout" if is_timeout else "error"
-
             if is_timeout:
-                self.logger.warning(f"AC search timeout after {timeout}s: {e}")
+                self.logger.warning(f"AC search timeout after {deadline_ms:.0f}ms")
             else:
                 self.logger.error(f"Error in real AC search: {e}")
+            return self._empty_ac_result(
+                text,
+                error=str(e),
+                error_type=error_type,
+                message=f"AC search {error_type}: {str(e)}",
+                timings_ms=timings,
+            )
+        timings["es_request"] = (time.perf_counter() - stage_start) * 1000
 
-            # Fallback to empty result instead of failing
-            return {
-                "matches": [],
-                "total_matches": 0,
-                "processing_time_ms": 0.0,
-                "patterns_loaded": 0,
-                "text_length": len(text),
-                "enabled": True,
-                "error": str(e),
-                "error_type": error_type,
-                "timeout_used": timeout,
-                "message": f"AC search {error_type}: {str(e)}",
+        return self._es_ac_result(response, text, normalized_text, timings, start_time)
+
+    async def search_aho_corasick_async(
+        self,
+        text: str,
+        max_matches: Optional[int] = None,
+        deadline_ms: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Non-blocking AC pattern matching for the async pipeline
+
+        Uses the in-process automaton when one is available; otherwise looks
+        up exact word n-grams of the text in the ES AC index through the
+        pooled async HTTP client. The whole call is bounded by ``deadline_ms``.
+
+        Args:
+            text: Text to search in
+            max_matches: Maximum number of matches to return
+            deadline_ms: Overall time budget (default AHO_CORASICK_TIMEOUT_MS)
+
+        Returns:
+            AC search results in the same format as search_aho_corasick, plus
+            ``backend`` and per-stage ``timings_ms``
+        """
+        if not self.aho_corasick_enabled:
+            return self._empty_ac_result(text, enabled=False, message="AC integration disabled")
+
+        start_time = time.perf_counter()
+        deadline_ms = SERVICE_CONFIG.aho_corasick_timeout_ms if deadline_ms is None else deadline_ms
+        timings: Dict[str, float] = {}
+
+        local_ac = self._get_local_ac()
+        if local_ac is not None:
+            result = self._search_local_ac(local_ac, text, max_matches)
+            result["timings_ms"]["total"] = (time.perf_counter() - start_time) * 1000
+            return result
+
+        es_settings = self._ac_es_settings()
+        if es_settings is None:
+            return self._empty_ac_result(text, message="ES credentials not configured")
+
+        stage_start = time.perf_counter()
+        normalized_text = self._normalize_for_ac(text)
+        timings["normalize"] = (time.perf_counter() - stage_start) * 1000
+
+        remaining_s = (deadline_ms - (time.perf_counter() - start_time) * 1000) / 1000
+        if remaining_s <= 0:
+            return self._empty_ac_result(
+                text, error_type="timeout", message="AC search deadline exceeded", timings_ms=timings
+            )
+
+        query = self._build_ac_terms_query(normalized_text, max_matches or 50)
+        if query is None:
+            return self._empty_ac_result(text, message="No searchable tokens", timings_ms=timings)
+
+        from ...utils.http_client_pool import get_http_pool
+
+        stage_start = time.perf_counter()
+        try:
+            # wait_for owns the deadline and cancels the pooled request on expiry
+            response = await asyncio.wait_for(
+                get_http_pool().async_post_json(
+                    es_settings["search_url"], query, auth=es_settings["auth"]
+                ),
+                timeout=remaining_s,
+            )
+        except Exception as e:
+            timings["es_request"] = (time.perf_counter() - stage_start) * 1000
+            is_timeout = isinstance(e, asyncio.TimeoutError)
+            error_type = "timeout" if is_timeout else "error"
+            if is_timeout:
+                self.logger.warning(f"Async AC search timeout after {deadline_ms:.0f}ms")
+            else:
+                self.logger.error(f"Error in async AC search: {e}")
+            return self._empty_ac_result(
+                text,
+                error=str(e),
+                error_type=error_type,
+                message=f"AC search {error_type}: {str(e)}",
+                timings_ms=timings,
+            )
+        timings["es_request"] = (time.perf_counter() - stage_start) * 1000
+
+        return self._es_ac_result(response, text, normalized_text, timings, start_time)
+
+    def _es_ac_result(
+        self,
+        response: Any,
+        text: str,
+        normalized_text: str,
+        timings: Dict[str, float],
+        start_time: float,
+    ) -> Dict[str, Any]:
+        """AC search result from an ES terms-query response (httpx or requests)."""
+        matches = []
+        patterns_loaded = 0
+        if response.status_code == 200:
+            result = response.json()
+            hits = result.get("hits", {}).get("hits", [])
+            patterns_loaded = result.get("hits", {}).get("total", {}).get("value", 0)
+            lowered_text = normalized_text.lower()
+            for hit in hits:
+                source = hit["_source"]
+                pattern = source.get("pattern", "")
+                start = lowered_text.find(pattern.lower())
+                matches.append({
+                    "pattern": pattern,
+                    "tier": f"tier_{source.get('tier', 3)}",
+                    "start": start,
+                    "end": start + len(pattern),
+                    "matched_text": pattern,
+                    "confidence": source.get("confidence", 0.5),
+                    "pattern_type": source.get("type", "unknown"),
+                    "entity_type": source.get("entity_type", "unknown"),
+                    "entity_id": source.get("entity_id", ""),
+                    "es_score": hit.get("_score", 0),
+                })
+        else:
+            self.logger.warning(f"AC search returned HTTP {response.status_code}")
+
+        timings["total"] = (time.perf_counter() - start_time) * 1000
+        return {
+            "matches": matches,
+            "total_matches": len(matches),
+            "processing_time_ms": timings["total"],
+            "patterns_loaded": patterns_loaded,
+            "text_length": len(text),
+            "enabled": True,
+            "backend": "elasticsearch",
+            "normalized_text": normalized_text,
+            "timings_ms": timings,
+            "message": f"AC search completed with {len(matches)} matches",
+        }
+
+    def _collect_ac_matches(self, original_text: str) -> List[Dict[str, Any]]:
+        """Tier-0 AC stage: search the text, then reordered name variants, sharing one deadline."""
+        if not self.aho_corasick_enabled:
+            return []
+
+        deadline = time.perf_counter() + SERVICE_CONFIG.aho_corasick_timeout_ms / 1000
+
+        def remaining_ms() -> float:
+            return (deadline - time.perf_counter()) * 1000
+
+        ac_matches = self.search_aho_corasick(original_text, deadline_ms=remaining_ms()).get("matches", [])
+        if not ac_matches:
+            for variant in self._generate_name_variants(original_text):
+                if remaining_ms() <= 0:
+                    break
+                variant_matches = self.search_aho_corasick(variant, deadline_ms=remaining_ms()).get("matches", [])
+                if variant_matches:
+                    ac_matches.extend(variant_matches)
+                    break  # Found matches, stop trying variants
+        return ac_matches
+
+    async def _collect_ac_matches_async(self, original_text: str) -> List[Dict[str, Any]]:
+        """Async counterpart of _collect_ac_matches sharing one deadline."""
+        deadline = time.perf_counter() + SERVICE_CONFIG.aho_corasick_timeout_ms / 1000
+
+        def remaining_ms() -> float:
+            return (deadline - time.perf_counter()) * 1000
+
+        ac_result = await self.search_aho_corasick_async(original_text, deadline_ms=remaining_ms())
+        ac_matches = ac_result.get("matches", [])
+        if not ac_matches:
+            for variant in self._generate_name_variants(original_text):
+                if remaining_ms() <= 0:
+                    break
+                variant_result = await self.search_aho_corasick_async(variant, deadline_ms=remaining_ms())
+                variant_matches = variant_result.get("matches", [])
+                if variant_matches:
+                    ac_matches.extend(variant_matches)
+                    break
+        return ac_matches
+
+    def _get_local_ac(self) -> Optional[Any]:
+        """In-process AC automaton, if one is injected or snapshots are configured."""
+        if self._local_ac is not None:
+            return self._local_ac
+
+        if self._ac_snapshots is None:
+            snapshot_dir = os.getenv("LOCAL_AC_SNAPSHOT_DIR")
+            if not snapshot_dir:
+                return None
+            from ..search.ac_snapshot import get_snapshot_manager
+
+            self._ac_snapshots = get_snapshot_manager(snapshot_dir)
+            if self._ac_snapshots.current is None:
+                self._ac_snapshots.reload()
+        return self._ac_snapshots.current
+
+    def _search_local_ac(
+        self, automaton: Any, text: str, max_matches: Optional[int]
+    ) -> Dict[str, Any]:
+        """Match text against the in-process automaton (no network, no wildcard scan)."""
+        start_time = time.perf_counter()
+        normalized_text = self._normalize_for_ac(text)
+        normalize_ms = (time.perf_counter() - start_time) * 1000
+
+        stage_start = time.perf_counter()
+        found = automaton.search(normalized_text)
+        if max_matches:
+            found = found[:max_matches]
+        matches = [
+            {
+                "pattern": match.pattern,
+                "tier": f"tier_{match.tier}",
+                "start": match.start,
+                "end": match.end,
+                "matched_text": match.pattern,
+                "confidence": match.confidence,
+                "pattern_type": match.pattern_type,
+                "entity_type": match.entity_type,
+                "entity_id": match.entity_id,
             }
+            for match in found
+        ]
+        search_ms = (time.perf_counter() - stage_start) * 1000
+
+        total_ms = (time.perf_counter() - start_time) * 1000
+        return {
+            "matches": matches,
+            "total_matches": len(matches),
+            "processing_time_ms": total_ms,
+            "patterns_loaded": len(automaton),
+            "text_length": len(text),
+            "enabled": True,
+            "backend": "local",
+            "normalized_text": normalized_text,
+            "timings_ms": {"normalize": normalize_ms, "local_ac": search_ms, "total": total_ms},
+            "message": f"Local AC search completed with {len(matches)} matches",
+        }
+
+    def _normalize_for_ac(self, text: str) -> str:
+        """Normalize text the same way AC patterns are normalized."""
+        if self._unicode_service is None:
+            from ..unicode.unicode_service import UnicodeService
+
+            self._unicode_service = UnicodeService()
+        return self._unicode_service.normalize_text(text, normalize_homoglyphs=True)["normalized"]
+
+    @staticmethod
+    def _ac_es_settings() -> Optional[Dict[str, Any]]:
+        """ES endpoint and credentials for the AC index, or None if not configured."""
+        es_user = os.getenv("ES_USERNAME", os.getenv("ES_USER"))
+        es_password = os.getenv("ES_PASSWORD")
+        if not es_password or not es_user:
+            return None
+        es_host = os.getenv("ES_HOST", "localhost")
+        es_port = int(os.getenv("ES_PORT", "9200"))
+        es_index = os.getenv("ES_AC_PATTERNS_INDEX", "ai_service_ac_patterns")
+        return {
+            "search_url": f"http://{es_host}:{es_port}/{es_index}/_search",
+            "auth": (es_user, es_password),
+        }
+
+    @staticmethod
+    def _build_ac_terms_query(normalized_text: str, size: int) -> Optional[Dict[str, Any]]:
+        """
+        Exact-term query over the word n-grams of the text
 
-    def _analyze_payment_context(self, text: str) -> Dict[str, Any]:
+        Patterns are stored as whole keywords, so a pattern occurs in the text
+        only if it equals one of its n-grams. This replaces the ``*text*``
+        wildcard scan with bounded term lookups.
+        """
+        tokens = [
+            token.strip(_AC_TOKEN_PUNCTUATION)
+            for token in normalized_text.split()
+        ]
+        tokens = [token for token in tokens if token]
+        shingles: List[str] = []
+        seen = set()
+        for i in range(len(tokens)):
+            for n in range(1, _AC_MAX_SHINGLE_TOKENS + 1):
+                if i + n > len(tokens):
+                    break
+                shingle = " ".join(tokens[i:i + n])
+                if len(shingle) >= _AC_MIN_TERM_LENGTH and shingle not in seen:
+                    seen.add(shingle)
+                    shingles.append(shingle)
+                if len(shingles) >= _AC_MAX_TERMS:
+                    break
+            if len(shingles) >= _AC_MAX_TERMS:
+                break
+
+        if not shingles:
+            return None
+
+        return {
+            "query": {
+                "bool": {
+                    "should": [
+                        {"term": {"pattern": {"value": shingle, "case_insensitive": True}}}
+                        for shingle in shingles
+                    ],
+                    "minimum_should_match": 1,
+                }
+            },
+            "size": size,
+            "sort": [
+                {"tier": {"order": "asc"}},
+                {"confidence": {"order": "desc"}},
+            ],
+        }
+
+    @staticmethod
+    def _empty_ac_result(text: str, enabled: bool = True, **extra: Any) -> Dict[str, Any]:
+        result = {
+            "matches": [],
+            "total_matches": 0,
+            "processing_time_ms": 0.0,
+            "patterns_loaded": 0,
+            "text_length": len(text),
+            "enabled": enabled,
+            "timings_ms": {},
+        }
+        result.update(extra)
+        return result
+
+    def _analyze_payment_context(
+        self, text: str, lexicon_hits: Optional[LexiconHits] = None
+    ) -> Dict[str, Any]:
         """
         Analyze payment context using payment triggers as signals
 
         Args:
             text: Original text to analyze
+            lexicon_hits: Precomputed lexicon matcher hits for text
 
         Returns:
             Context analysis results
         """
         try:
-            # Import payment triggers
-            from ...data.dicts.payment_triggers import PAYMENT_TRIGGERS
-
             # Detect language
             detected_language = self._detect_language(text)
 
-            # Get payment triggers for the language
-            triggers = PAYMENT_TRIGGERS.get(detected_language, {})
-            context_words = triggers.get("context", [])
-            prep_words = triggers.get("preps", [])
-            currency_words = triggers.get("currencies", [])
-
-            # Find context signals
-            context_matches = []
-            prep_matches = []
-            currency_matches = []
-
-            text_lower = text.lower()
-
-            # Check for context words
-            for word in context_words:
-                if word.lower() in text_lower:
-                    context_matches.append(word)
-
-            # Check for prepositional phrases that indicate names
-            for prep in prep_words:
-                if prep.lower() in text_lower:
-                    prep_matches.append(prep)
+            if lexicon_hits is None:
+                lexicon_hits = self.lexicon_matcher.scan(text)
 
-            # Check for currency indicators
-            for currency in currency_words:
-                if currency.lower() in text_lower:
-                    currency_matches.append(currency)
+            # Payment triggers for the language, in dictionary order
+            context_matches = lexicon_hits.matches(payment_category(detected_language, "context"))
+            # Prepositional phrases that indicate names
+            prep_matches = lexicon_hits.matches(payment_category(detected_language, "preps"))
+            # Currency indicators
+            currency_matches = lexicon_hits.matches(payment_category(detected_language, "currencies"))
 
             # Calculate confidence based on matches
             total_matches = (
@@ -730,8 +964,8 @@ class SmartFilterService:
         """Проверка на исключение из обработки"""
         text_lower = text.lower().strip()
 
-        for pattern in self.exclusion_patterns:
-            if re.match(pattern, text_lower, re.IGNORECASE):
+        for regex in self._exclusion_regexes:
+            if regex.match(text_lower):
                 return True
 
         return False
@@ -740,14 +974,9 @@ class SmartFilterService:
         """Проверка, содержит ли текст только даты и время"""
         text_stripped = text.strip()
 
-        # Check all date and time patterns
-        all_date_patterns = []
-        for pattern_group in self.date_time_patterns.values():
-            all_date_patterns.extend(pattern_group)
-
         # Check if text consists only of dates/time
-        for pattern in all_date_patterns:
-            if re.fullmatch(pattern, text_stripped, re.IGNORECASE):
+        for regex in self._date_time_regexes:
+            if regex.fullmatch(text_stripped):
                 return True
 
         # Additional check for relative dates
@@ -1051,7 +1280,10 @@ class SmartFilterService:
     async def should_process_text_async(self, text: str) -> FilterResult:
         """
         Async version of should_process_text using thread pool executor
-        
+
+        When AC is enabled, the AC lookup is awaited on the event loop via
+        search_aho_corasick_async and its matches are handed to the detectors.
+
         Args:
             text: Text to analyze
 
@@ -1059,6 +1291,18 @@ class SmartFilterService:
             FilterResult with recommendation
         """
         loop = asyncio.get_event_loop()
+        stripped = text.strip() if text else ""
+        if self.aho_corasick_enabled and stripped:
+            normalized_text = self._normalize_text(stripped)
+            if not (self._is_excluded_text(normalized_text) or self._is_date_only_text(normalized_text)):
+                # AC lookup runs on the loop without blocking; the CPU-bound
+                # detectors still go to the thread pool
+                ac_matches = await self._collect_ac_matches_async(stripped)
+                return await loop.run_in_executor(
+                    None,
+                    functools.partial(self.should_process_text, text, ac_matches=ac_matches),
+                )
+
         return await loop.run_in_executor(
             None,  # Use default thread pool executor
             self.should_process_text,
@@ -97,6 +97,14 @@ class TerrorismDetector:
         # Risk thresholds
         self.risk_thresholds = {"high": 0.8, "medium": 0.5, "low": 0.3}
 
+        # Compile regex patterns once instead of on every call
+        flags = re.IGNORECASE | re.UNICODE
+        self._financing_regexes = [re.compile(p, flags) for p in self.financing_patterns]
+        self._weapons_regexes = [re.compile(p, flags) for p in self.weapons_patterns]
+        self._organization_regexes = [re.compile(p, flags) for p in self.organization_patterns]
+        self._activity_regexes = [re.compile(p, flags) for p in self.activity_patterns]
+        self._exclusion_regexes = [re.compile(p, re.IGNORECASE) for p in self.exclusion_patterns]
+
         self.logger.info("TerrorismDetector initialized for defensive purposes")
 
     def detect_terrorism_signals(self, text: str) -> Dict[str, Any]:
@@ -202,8 +210,8 @@ class TerrorismDetector:
         """Detect terrorism financing patterns"""
         matches = []
 
-        for pattern in self.financing_patterns:
-            found_matches = re.findall(pattern, text, re.IGNORECASE | re.UNICODE)
+        for regex in self._financing_regexes:
+            found_matches = regex.findall(text)
             matches.extend(found_matches)
 
         confidence = min(len(matches) * 0.3, 0.9) if matches else 0.0
@@ -221,8 +229,8 @@ class TerrorismDetector:
         """Detect weapons and explosives patterns"""
         matches = []
 
-        for pattern in self.weapons_patterns:
-            found_matches = re.findall(pattern, text, re.IGNORECASE | re.UNICODE)
+        for regex in self._weapons_regexes:
+            found_matches = regex.findall(text)
             matches.extend(found_matches)
 
         confidence = min(len(matches) * 0.4, 0.95) if matches else 0.0
@@ -240,8 +248,8 @@ class TerrorismDetector:
         """Detect suspicious organizations patterns"""
         matches = []
 
-        for pattern in self.organization_patterns:
-            found_matches = re.findall(pattern, text, re.IGNORECASE | re.UNICODE)
+        for regex in self._organization_regexes:
+            found_matches = regex.findall(text)
             matches.extend(found_matches)
 
         confidence = min(len(matches) * 0.25, 0.8) if matches else 0.0
@@ -259,8 +267,8 @@ class TerrorismDetector:
         """Detect suspicious activity patterns"""
         matches = []
 
-        for pattern in self.activity_patterns:
-            found_matches = re.findall(pattern, text, re.IGNORECASE | re.UNICODE)
+        for regex in self._activity_regexes:
+            found_matches = regex.findall(text)
             matches.extend(found_matches)
 
         confidence = min(len(matches) * 0.2, 0.7) if matches else 0.0
@@ -278,8 +286,8 @@ class TerrorismDetector:
         """Check for exclusions (false positives)"""
         text_lower = text.lower()
 
-        for pattern in self.exclusion_patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
+        for regex in self._exclusion_regexes:
+            if regex.search(text_lower):
                 return True
 
         return False
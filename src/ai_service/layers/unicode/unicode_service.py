@@ -9,13 +9,190 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Union, Literal
 
 from ...utils.logging_config import get_logger
+from ...utils.lru_cache_ttl import LruTtlCache
+
+
+# Combining accents removed after NFC (mixed_diacritics support)
+COMBINING_ACCENT_MAP = {
+    # Combining acute accent (U+0301) - most common
+    '\u0301': '',  # Remove combining acute accent
+    # Combining grave accent (U+0300)
+    '\u0300': '',  # Remove combining grave accent
+    # Combining circumflex (U+0302)
+    '\u0302': '',  # Remove combining circumflex
+    # Combining tilde (U+0303)
+    '\u0303': '',  # Remove combining tilde
+    # Combining diaeresis (U+0308)
+    '\u0308': '',  # Remove combining diaeresis
+    # Combining cedilla (U+0327)
+    '\u0327': '',  # Remove combining cedilla
+    # Combining caron (U+030C)
+    '\u030C': '',  # Remove combining caron
+    # Combining double acute (U+030B)
+    '\u030B': '',  # Remove combining double acute
+    # Combining breve (U+0306)
+    '\u0306': '',  # Remove combining breve
+    # Combining dot above (U+0307)
+    '\u0307': '',  # Remove combining dot above
+    # Combining ring above (U+030A)
+    '\u030A': '',  # Remove combining ring above
+    # Combining hook above (U+0309)
+    '\u0309': '',  # Remove combining hook above
+    # Combining horn (U+031B)
+    '\u031B': '',  # Remove combining horn
+    # Combining double grave (U+030F)
+    '\u030F': '',  # Remove combining double grave
+    # Combining inverted breve (U+0311)
+    '\u0311': '',  # Remove combining inverted breve
+    # Combining turned comma above (U+0312)
+    '\u0312': '',  # Remove combining turned comma above
+    # Combining comma above (U+0313)
+    '\u0313': '',  # Remove combining comma above
+    # Combining reversed comma above (U+0314)
+    '\u0314': '',  # Remove combining reversed comma above
+    # Combining comma above right (U+0315)
+    '\u0315': '',  # Remove combining comma above right
+    # Combining grave accent below (U+0316)
+    '\u0316': '',  # Remove combining grave accent below
+    # Combining acute accent below (U+0317)
+    '\u0317': '',  # Remove combining acute accent below
+    # Combining left tack below (U+0318)
+    '\u0318': '',  # Remove combining left tack below
+    # Combining right tack below (U+0319)
+    '\u0319': '',  # Remove combining right tack below
+    # Combining left angle above (U+031A)
+    '\u031A': '',  # Remove combining left angle above
+    # Combining horn (U+031B)
+    '\u031B': '',  # Remove combining horn
+    # Combining left half ring below (U+031C)
+    '\u031C': '',  # Remove combining left half ring below
+    # Combining up tack below (U+031D)
+    '\u031D': '',  # Remove combining up tack below
+    # Combining down tack below (U+031E)
+    '\u031E': '',  # Remove combining down tack below
+    # Combining plus sign below (U+031F)
+    '\u031F': '',  # Remove combining plus sign below
+    # Combining minus sign below (U+0320)
+    '\u0320': '',  # Remove combining minus sign below
+    # Combining palatalized hook below (U+0321)
+    '\u0321': '',  # Remove combining palatalized hook below
+    # Combining retroflex hook below (U+0322)
+    '\u0322': '',  # Remove combining retroflex hook below
+    # Combining dot below (U+0323)
+    '\u0323': '',  # Remove combining dot below
+    # Combining diaeresis below (U+0324)
+    '\u0324': '',  # Remove combining diaeresis below
+    # Combining ring below (U+0325)
+    '\u0325': '',  # Remove combining ring below
+    # Combining comma below (U+0326)
+    '\u0326': '',  # Remove combining comma below
+    # Combining cedilla (U+0327)
+    '\u0327': '',  # Remove combining cedilla
+    # Combining ogonek (U+0328)
+    '\u0328': '',  # Remove combining ogonek
+    # Combining vertical line below (U+0329)
+    '\u0329': '',  # Remove combining vertical line below
+    # Combining bridge below (U+032A)
+    '\u032A': '',  # Remove combining bridge below
+    # Combining inverted double arch below (U+032B)
+    '\u032B': '',  # Remove combining inverted double arch below
+    # Combining caron below (U+032C)
+    '\u032C': '',  # Remove combining caron below
+    # Combining circumflex accent below (U+032D)
+    '\u032D': '',  # Remove combining circumflex accent below
+    # Combining breve below (U+032E)
+    '\u032E': '',  # Remove combining breve below
+    # Combining inverted breve below (U+032F)
+    '\u032F': '',  # Remove combining inverted breve below
+    # Combining tilde below (U+0330)
+    '\u0330': '',  # Remove combining tilde below
+    # Combining macron below (U+0331)
+    '\u0331': '',  # Remove combining macron below
+    # Combining low line (U+0332)
+    '\u0332': '',  # Remove combining low line
+    # Combining double low line (U+0333)
+    '\u0333': '',  # Remove combining double low line
+    # Combining tilde overlay (U+0334)
+    '\u0334': '',  # Remove combining tilde overlay
+    # Combining short stroke overlay (U+0335)
+    '\u0335': '',  # Remove combining short stroke overlay
+    # Combining long stroke overlay (U+0336)
+    '\u0336': '',  # Remove combining long stroke overlay
+    # Combining short solidus overlay (U+0337)
+    '\u0337': '',  # Remove combining short solidus overlay
+    # Combining long solidus overlay (U+0338)
+    '\u0338': '',  # Remove combining long solidus overlay
+    # Combining horizontal bar (U+0339)
+    '\u0339': '',  # Remove combining horizontal bar
+    # Combining double overline (U+033A)
+    '\u033A': '',  # Remove combining double overline
+    # Combining double low line (U+033B)
+    '\u033B': '',  # Remove combining double low line
+    # Combining wavy line below (U+033C)
+    '\u033C': '',  # Remove combining wavy line below
+    # Combining double wavy line below (U+033D)
+    '\u033D': '',  # Remove combining double wavy line below
+    # Combining dotted grave accent (U+033E)
+    '\u033E': '',  # Remove combining dotted grave accent
+    # Combining dotted acute accent (U+033F)
+    '\u033F': '',  # Remove combining dotted acute accent
+    # Combining double acute accent (U+0340)
+    '\u0340': '',  # Remove combining double acute accent
+    # Combining double grave accent (U+0341)
+    '\u0341': '',  # Remove combining double grave accent
+    # Combining double tilde (U+0342)
+    '\u0342': '',  # Remove combining double tilde
+    # Combining double breve (U+0343)
+    '\u0343': '',  # Remove combining double breve
+    # Combining double circumflex (U+0344)
+    '\u0344': '',  # Remove combining double circumflex
+    # Combining double caron (U+0345)
+    '\u0345': '',  # Remove combining double caron
+    # Combining double macron (U+0346)
+    '\u0346': '',  # Remove combining double macron
+    # Combining double low line (U+0347)
+    '\u0347': '',  # Remove combining double low line
+    # Combining double overline (U+0348)
+    '\u0348': '',  # Remove combining double overline
+    # Combining double underline (U+0349)
+    '\u0349': '',  # Remove combining double underline
+    # Combining double wavy line (U+034A)
+    '\u034A': '',  # Remove combining double wavy line
+    # Combining double dotted line (U+034B)
+    '\u034B': '',  # Remove combining double dotted line
+    # Combining double solidus (U+034C)
+    '\u034C': '',  # Remove combining double solidus
+    # Combining double vertical line (U+034D)
+    '\u034D': '',  # Remove combining double vertical line
+    # Combining double horizontal line (U+034E)
+    '\u034E': '',  # Remove combining double horizontal line
+    # Combining double diagonal line (U+034F)
+    '\u034F': '',  # Remove combining double diagonal line
+}
+
+# Invisible characters that make a text non-idempotent
+INVISIBLE_CHARS = frozenset([
+    "\u200b", "\u200c", "\u200d", "\ufeff", "\u200e", "\u200f",
+    "\u202a", "\u202b", "\u202c", "\u202d", "\u202e", "\u2060"
+])
+
+# Characters _attempt_encoding_recovery can act on (C1 controls, UTF-8 read as CP1252)
+_ENCODING_RECOVERY_RE = re.compile("[\x80-\x9fÐÑ]")
+_MULTIPLE_WHITESPACE_RE = re.compile(r"\s{2,}")
+_COMBINING_ACCENT_TABLE = str.maketrans({char: None for char in COMBINING_ACCENT_MAP})
 
 
 class UnicodeService:
     """Service for Unicode normalization with focus on preventing FN"""
 
-    def __init__(self):
-        """Initialize Unicode service"""
+    def __init__(self, cache_size: int = 4096):
+        """
+        Initialize Unicode service
+
+        Args:
+            cache_size: Number of normalization results kept for repeated inputs
+                (0 disables the cache)
+        """
         self.logger = get_logger(__name__)
 
         # Mapping for complex characters
@@ -121,6 +298,15 @@ class UnicodeService:
             'т': 't', 'Т': 'T',  # Cyrillic т (U+0442) → Latin t (U+0074) - SAME VISUAL APPEARANCE
         }
 
+        # Precompiled tables for the single-pass fast path (multi-character keys never match a char)
+        single_char_mapping = {k: v for k, v in self.character_mapping.items() if len(k) == 1}
+        self._special_chars = frozenset(single_char_mapping)
+        self._character_table = str.maketrans(single_char_mapping)
+        self._special_chars_table = str.maketrans({char: None for char in single_char_mapping})
+
+        # Results are deterministic per (text, flags); the TTL only bounds memory of idle entries
+        self._result_cache = LruTtlCache(maxsize=cache_size, ttl_seconds=3600) if cache_size > 0 else None
+
         self.logger.info("UnicodeService initialized")
 
     def _attempt_encoding_recovery(self, text: str) -> str:
@@ -310,21 +496,98 @@ class UnicodeService:
             result["original"] = text  # Preserve None or empty string
             return result
 
+        normalized_text, confidence, changes_count, char_replacements, idempotent, homoglyph_traces = (
+            self._normalize_cached(text, aggressive, normalize_homoglyphs)
+        )
+        if idempotent:
+            result = self._create_normalization_result(text, 1.0, 0, 0, 0, aggressive)
+            result["original"] = text
+            result["idempotent"] = True
+            return result
+
+        result = self._create_normalization_result(
+            normalized_text,
+            confidence,
+            changes_count,
+            char_replacements,
+            len(text),
+            aggressive,
+        )
+        # Add original text to result
+        result["original"] = text
+
+        # Add homoglyph traces to result
+        if homoglyph_traces:
+            result["homoglyph_traces"] = list(homoglyph_traces)
+
+        self.logger.debug(
+            f"Text normalized: {len(text)} -> {len(normalized_text)} chars, confidence: {confidence:.2f}"
+        )
+        return result
+
+    def _normalize_cached(self, text: str, aggressive: bool, normalize_homoglyphs: bool) -> tuple:
+        if self._result_cache is None:
+            return self._normalize_uncached(text, aggressive, normalize_homoglyphs)
+        key = (text, aggressive, normalize_homoglyphs)
+        hit, cached = self._result_cache.get(key)
+        if hit:
+            return cached
+        result = self._normalize_uncached(text, aggressive, normalize_homoglyphs)
+        self._result_cache.set(key, result)
+        return result
+
+    def _normalize_uncached(self, text: str, aggressive: bool, normalize_homoglyphs: bool) -> tuple:
+        """
+        Normalize non-empty text.
+
+        Returns:
+            Tuple of (normalized, confidence, changes_count, char_replacements,
+            idempotent, homoglyph_traces)
+        """
+        if normalize_homoglyphs or _ENCODING_RECOVERY_RE.search(text):
+            return self._normalize_full(text, aggressive, normalize_homoglyphs)
+        return self._normalize_fast(text, aggressive)
+
+    def _normalize_fast(self, text: str, aggressive: bool) -> tuple:
+        """
+        Single-pass equivalent of ``_normalize_full`` for texts that need no
+        encoding recovery or homoglyph folding: one ``str.translate`` with the
+        precompiled character table, then NFC only when the text is not ASCII.
+        """
+        has_special_chars = not self._special_chars.isdisjoint(text)
+        if (
+            not has_special_chars
+            and (text.isascii() or unicodedata.is_normalized("NFC", text) or unicodedata.is_normalized("NFKC", text))
+            and not self._needs_whitespace_cleanup(text)
+            and INVISIBLE_CHARS.isdisjoint(text)
+            and (aggressive or not any(c.isupper() for c in text))
+        ):
+            return text, 1.0, 0, 0, True, ()
+
+        normalized_text, char_replacements = text, 0
+        if has_special_chars:
+            normalized_text = text.translate(self._character_table)
+            char_replacements = len(text) - len(text.translate(self._special_chars_table))
+
+        if not normalized_text.isascii():
+            normalized_text = unicodedata.normalize("NFC", normalized_text)
+            if normalized_text.translate(_COMBINING_ACCENT_TABLE) != normalized_text:
+                normalized_text = self._apply_unicode_normalization(normalized_text)
+
+        confidence = self._calculate_normalization_confidence(text, normalized_text, char_replacements)
+        return normalized_text, confidence, 0, char_replacements, False, ()
+
+    def _normalize_full(self, text: str, aggressive: bool, normalize_homoglyphs: bool) -> tuple:
+        """Complete pipeline: encoding recovery, homoglyphs, replacements, NFC."""
         # Idempotency check: if string is already NFC/NFKC normalized AND has no special characters to replace
         # AND doesn't need whitespace cleanup AND has no invisible characters
         # AND (doesn't need case normalization OR aggressive mode is enabled)
         has_special_chars = any(char in self.character_mapping for char in text)
         needs_whitespace_cleanup = re.search(r'\s{2,}', text) or text != text.strip()
-        has_invisible_chars = any(char in text for char in [
-            "\u200b", "\u200c", "\u200d", "\ufeff", "\u200e", "\u200f", 
-            "\u202a", "\u202b", "\u202c", "\u202d", "\u202e", "\u2060"
-        ])
+        has_invisible_chars = any(char in text for char in INVISIBLE_CHARS)
         needs_case_normalization = any(c.isupper() for c in text)
         if self._is_already_normalized(text) and not has_special_chars and not needs_whitespace_cleanup and not has_invisible_chars and (not needs_case_normalization or aggressive):
-            result = self._create_normalization_result(text, 1.0, 0, 0, 0, aggressive)
-            result["original"] = text
-            result["idempotent"] = True
-            return result
+            return text, 1.0, 0, 0, True, ()
 
         # Preserve original text before any changes
         original_text = text
@@ -373,25 +636,7 @@ class UnicodeService:
             original_text, normalized_text, char_replacements
         )
 
-        result = self._create_normalization_result(
-            normalized_text,
-            confidence,
-            changes_count,
-            char_replacements,
-            len(original_text),
-            aggressive,
-        )
-        # Add original text to result
-        result["original"] = original_text
-        
-        # Add homoglyph traces to result
-        if homoglyph_traces:
-            result["homoglyph_traces"] = homoglyph_traces
-
-        self.logger.info(
-            f"Text normalized: {len(original_text)} -> {len(normalized_text)} chars, confidence: {confidence:.2f}"
-        )
-        return result
+        return normalized_text, confidence, changes_count, char_replacements, False, tuple(homoglyph_traces)
 
     def normalize_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
         """Normalize multiple texts in batch"""
@@ -400,6 +645,15 @@ class UnicodeService:
             results.append(self.normalize_text(text))
         return results
 
+    def _needs_whitespace_cleanup(self, text: str) -> bool:
+        return bool(_MULTIPLE_WHITESPACE_RE.search(text)) or text != text.strip()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of the normalization result cache."""
+        if self._result_cache is None:
+            return {"enabled": False}
+        return self._result_cache.get_stats()
+
     def _normalize_homoglyphs(self, text: str) -> tuple[str, int]:
         """
         Normalize homoglyphs by detecting the dominant alphabet and converting to it.
@@ -507,167 +761,9 @@ class UnicodeService:
     
     def _replace_combining_accents(self, text: str) -> str:
         """Replace combining accents with base characters for mixed_diacritics support."""
-        # Mapping of combining accents to base characters
-        combining_accent_map = {
-            # Combining acute accent (U+0301) - most common
-            '\u0301': '',  # Remove combining acute accent
-            # Combining grave accent (U+0300)
-            '\u0300': '',  # Remove combining grave accent
-            # Combining circumflex (U+0302)
-            '\u0302': '',  # Remove combining circumflex
-            # Combining tilde (U+0303)
-            '\u0303': '',  # Remove combining tilde
-            # Combining diaeresis (U+0308)
-            '\u0308': '',  # Remove combining diaeresis
-            # Combining cedilla (U+0327)
-            '\u0327': '',  # Remove combining cedilla
-            # Combining caron (U+030C)
-            '\u030C': '',  # Remove combining caron
-            # Combining double acute (U+030B)
-            '\u030B': '',  # Remove combining double acute
-            # Combining breve (U+0306)
-            '\u0306': '',  # Remove combining breve
-            # Combining dot above (U+0307)
-            '\u0307': '',  # Remove combining dot above
-            # Combining ring above (U+030A)
-            '\u030A': '',  # Remove combining ring above
-            # Combining hook above (U+0309)
-            '\u0309': '',  # Remove combining hook above
-            # Combining horn (U+031B)
-            '\u031B': '',  # Remove combining horn
-            # Combining double grave (U+030F)
-            '\u030F': '',  # Remove combining double grave
-            # Combining inverted breve (U+0311)
-            '\u0311': '',  # Remove combining inverted breve
-            # Combining turned comma above (U+0312)
-            '\u0312': '',  # Remove combining turned comma above
-            # Combining comma above (U+0313)
-            '\u0313': '',  # Remove combining comma above
-            # Combining reversed comma above (U+0314)
-            '\u0314': '',  # Remove combining reversed comma above
-            # Combining comma above right (U+0315)
-            '\u0315': '',  # Remove combining comma above right
-            # Combining grave accent below (U+0316)
-            '\u0316': '',  # Remove combining grave accent below
-            # Combining acute accent below (U+0317)
-            '\u0317': '',  # Remove combining acute accent below
-            # Combining left tack below (U+0318)
-            '\u0318': '',  # Remove combining left tack below
-            # Combining right tack below (U+0319)
-            '\u0319': '',  # Remove combining right tack below
-            # Combining left angle above (U+031A)
-            '\u031A': '',  # Remove combining left angle above
-            # Combining horn (U+031B)
-            '\u031B': '',  # Remove combining horn
-            # Combining left half ring below (U+031C)
-            '\u031C': '',  # Remove combining left half ring below
-            # Combining up tack below (U+031D)
-            '\u031D': '',  # Remove combining up tack below
-            # Combining down tack below (U+031E)
-            '\u031E': '',  # Remove combining down tack below
-            # Combining plus sign below (U+031F)
-            '\u031F': '',  # Remove combining plus sign below
-            # Combining minus sign below (U+0320)
-            '\u0320': '',  # Remove combining minus sign below
-            # Combining palatalized hook below (U+0321)
-            '\u0321': '',  # Remove combining palatalized hook below
-            # Combining retroflex hook below (U+0322)
-            '\u0322': '',  # Remove combining retroflex hook below
-            # Combining dot below (U+0323)
-            '\u0323': '',  # Remove combining dot below
-            # Combining diaeresis below (U+0324)
-            '\u0324': '',  # Remove combining diaeresis below
-            # Combining ring below (U+0325)
-            '\u0325': '',  # Remove combining ring below
-            # Combining comma below (U+0326)
-            '\u0326': '',  # Remove combining comma below
-            # Combining cedilla (U+0327)
-            '\u0327': '',  # Remove combining cedilla
-            # Combining ogonek (U+0328)
-            '\u0328': '',  # Remove combining ogonek
-            # Combining vertical line below (U+0329)
-            '\u0329': '',  # Remove combining vertical line below
-            # Combining bridge below (U+032A)
-            '\u032A': '',  # Remove combining bridge below
-            # Combining inverted double arch below (U+032B)
-            '\u032B': '',  # Remove combining inverted double arch below
-            # Combining caron below (U+032C)
-            '\u032C': '',  # Remove combining caron below
-            # Combining circumflex accent below (U+032D)
-            '\u032D': '',  # Remove combining circumflex accent below
-            # Combining breve below (U+032E)
-            '\u032E': '',  # Remove combining breve below
-            # Combining inverted breve below (U+032F)
-            '\u032F': '',  # Remove combining inverted breve below
-            # Combining tilde below (U+0330)
-            '\u0330': '',  # Remove combining tilde below
-            # Combining macron below (U+0331)
-            '\u0331': '',  # Remove combining macron below
-            # Combining low line (U+0332)
-            '\u0332': '',  # Remove combining low line
-            # Combining double low line (U+0333)
-            '\u0333': '',  # Remove combining double low line
-            # Combining tilde overlay (U+0334)
-            '\u0334': '',  # Remove combining tilde overlay
-            # Combining short stroke overlay (U+0335)
-            '\u0335': '',  # Remove combining short stroke overlay
-            # Combining long stroke overlay (U+0336)
-            '\u0336': '',  # Remove combining long stroke overlay
-            # Combining short solidus overlay (U+0337)
-            '\u0337': '',  # Remove combining short solidus overlay
-            # Combining long solidus overlay (U+0338)
-            '\u0338': '',  # Remove combining long solidus overlay
-            # Combining horizontal bar (U+0339)
-            '\u0339': '',  # Remove combining horizontal bar
-            # Combining double overline (U+033A)
-            '\u033A': '',  # Remove combining double overline
-            # Combining double low line (U+033B)
-            '\u033B': '',  # Remove combining double low line
-            # Combining wavy line below (U+033C)
-            '\u033C': '',  # Remove combining wavy line below
-            # Combining double wavy line below (U+033D)
-            '\u033D': '',  # Remove combining double wavy line below
-            # Combining dotted grave accent (U+033E)
-            '\u033E': '',  # Remove combining dotted grave accent
-            # Combining dotted acute accent (U+033F)
-            '\u033F': '',  # Remove combining dotted acute accent
-            # Combining double acute accent (U+0340)
-            '\u0340': '',  # Remove combining double acute accent
-            # Combining double grave accent (U+0341)
-            '\u0341': '',  # Remove combining double grave accent
-            # Combining double tilde (U+0342)
-            '\u0342': '',  # Remove combining double tilde
-            # Combining double breve (U+0343)
-            '\u0343': '',  # Remove combining double breve
-            # Combining double circumflex (U+0344)
-            '\u0344': '',  # Remove combining double circumflex
-            # Combining double caron (U+0345)
-            '\u0345': '',  # Remove combining double caron
-            # Combining double macron (U+0346)
-            '\u0346': '',  # Remove combining double macron
-            # Combining double low line (U+0347)
-            '\u0347': '',  # Remove combining double low line
-            # Combining double overline (U+0348)
-            '\u0348': '',  # Remove combining double overline
-            # Combining double underline (U+0349)
-            '\u0349': '',  # Remove combining double underline
-            # Combining double wavy line (U+034A)
-            '\u034A': '',  # Remove combining double wavy line
-            # Combining double dotted line (U+034B)
-            '\u034B': '',  # Remove combining double dotted line
-            # Combining double solidus (U+034C)
-            '\u034C': '',  # Remove combining double solidus
-            # Combining double vertical line (U+034D)
-            '\u034D': '',  # Remove combining double vertical line
-            # Combining double horizontal line (U+034E)
-            '\u034E': '',  # Remove combining double horizontal line
-            # Combining double diagonal line (U+034F)
-            '\u034F': '',  # Remove combining double diagonal line
-        }
-        
         # Apply the mapping
         result = text
-        for combining_char, replacement in combining_accent_map.items():
+        for combining_char, replacement in COMBINING_ACCENT_MAP.items():
             if combining_char in result:
                 result = result.replace(combining_char, replacement)
                 self.logger.debug(f"unicode.nfc_applied: Replaced combining accent {combining_char} with {replacement}")
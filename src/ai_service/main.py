@@ -15,7 +15,7 @@ from collections import defaultdict
 import uvicorn
 from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, Field, ValidationError, validator, ValidationError
@@ -27,6 +27,7 @@ sys.path.insert(0, str(project_root))
 from ai_service.config import (
     DEPLOYMENT_CONFIG,
     INTEGRATION_CONFIG,
+    PERFORMANCE_CONFIG,
     SECURITY_CONFIG,
     SERVICE_CONFIG,
 )
@@ -37,6 +38,7 @@ from ai_service.exceptions import (
     ServiceUnavailableError,
     ValidationAPIError,
 )
+from ai_service.api.stream_processing import iter_ndjson_lines, stream_process_results
 from ai_service.utils import get_logger, setup_logging
 from ai_service.utils.response_formatter import format_processing_result
 from ai_service.contracts.base_contracts import NormalizationResponse, ProcessResponse, UnifiedProcessingResult
@@ -613,6 +615,8 @@ async def process_text(request: ProcessTextRequest):
             enable_advanced_features=True,
             # Pass feature flags to orchestrator
             feature_flags=merged_flags,
+            # Reuse results for repeated texts (invalidated on data reload)
+            cache_result=request.cache_result,
         )
 
         # Note: Feature flags are logged separately, not added to trace
@@ -749,6 +753,58 @@ async def process_batch(request: ProcessBatchRequest):
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
 
+@app.post("/process-stream")
+async def process_stream(
+    request: Request,
+    max_concurrent: int = PERFORMANCE_CONFIG.max_concurrent_requests,
+    generate_variants: bool = False,
+):
+    """
+    Streaming batch screening over NDJSON
+
+    The body holds one record per line, either a JSON string or an object
+    ``{"id": ..., "text": ...}``. Results are streamed back as NDJSON in
+    completion order, each tagged with its input ``line`` (and ``id``).
+    At most ``max_concurrent`` records are read ahead of the response; it
+    may not exceed the service-wide ``max_concurrent_requests``.
+    """
+    if not orchestrator:
+        raise HTTPException(status_code=503, detail="Orchestrator not initialized")
+    max_allowed = PERFORMANCE_CONFIG.max_concurrent_requests
+    if not 1 <= max_concurrent <= max_allowed:
+        raise HTTPException(status_code=422, detail=f"max_concurrent must be between 1 and {max_allowed}")
+
+    merged_flags = _merge_feature_flags(None)
+
+    async def _process(text: str) -> UnifiedProcessingResult:
+        return await orchestrator.process(
+            text=text,
+            generate_variants=generate_variants,
+            generate_embeddings=False,
+            remove_stop_words=True,
+            preserve_names=True,
+            enable_advanced_features=True,
+            feature_flags=merged_flags,
+        )
+
+    def _format(result: UnifiedProcessingResult) -> Dict[str, Any]:
+        return {
+            "success": result.success,
+            "original_text": result.original_text,
+            "normalized_text": result.normalized_text,
+            "language": result.language,
+            "processing_time": result.processing_time,
+            "decision": _extract_decision_dict(result),
+            "errors": result.errors or [],
+        }
+
+    lines = iter_ndjson_lines(request.stream(), max_length=SERVICE_CONFIG.max_input_length)
+    return StreamingResponse(
+        stream_process_results(lines, _process, _format, max_in_flight=max_concurrent),
+        media_type="application/x-ndjson",
+    )
+
+
 @app.post("/search-similar")
 async def search_similar_names(request: SearchSimilarRequest):
     """Search for similar names"""
@@ -821,6 +877,8 @@ async def get_statistics():
 
     try:
         stats = orchestrator.get_processing_stats()
+        processing_times = stats.get("processing_times") or []
+        result_cache = getattr(orchestrator, "result_cache", None)
         return {
             "processing": {
                 "total_processed": stats["total_processed"],
@@ -831,9 +889,13 @@ async def get_statistics():
                     if stats["total_processed"] > 0
                     else 0
                 ),
-                "average_processing_time": stats["average_time"],
+                "average_processing_time": stats.get(
+                    "average_time",
+                    sum(processing_times) / len(processing_times) if processing_times else 0.0,
+                ),
             },
             "cache": stats.get("cache", {}),
+            "result_cache": result_cache.get_stats() if result_cache is not None else {"enabled": False},
             "services": stats.get("services", {}),
         }
     except Exception as e:
@@ -881,7 +943,15 @@ async def reload_configuration(token: str = Depends(verify_admin_token)):
             if hasattr(orchestrator.search_service, 'config') and hasattr(orchestrator.search_service.config, '_reload_configuration'):
                 orchestrator.search_service.config._reload_configuration()
                 logger.info("Search service configuration reloaded")
-        
+
+            # Hot-swap the local AC automaton if a newer snapshot was published
+            ac_reload = {}
+            if hasattr(orchestrator.search_service, 'reload_local_ac'):
+                ac_reload = await orchestrator.search_service.reload_local_ac()
+                logger.info(f"Local AC snapshot reload: {ac_reload}")
+
+            return {"message": "Configuration reloaded successfully", "ac_snapshot": ac_reload}
+
         return {"message": "Configuration reloaded successfully"}
     except Exception as e:
         logger.error(f"Error reloading configuration: {e}")
@@ -1008,6 +1078,7 @@ async def root():
             "metrics": "/metrics",
             "process": "/process",
             "process_batch": "/process-batch",
+            "process_stream": "/process-stream",
             # "search": "/search",  # Temporarily disabled
             "search_similar": "/search-similar",
             "analyze_complexity": "/analyze-complexity",
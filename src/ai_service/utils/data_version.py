@@ -0,0 +1,58 @@
+"""
+Process-wide version stamps for reloadable screening data.
+
+Components that serve screening data (sanctions dataset, AC patterns,
+sanctioned INN cache, watchlist index) record the version they currently
+serve here. Caches of end-to-end results put ``get_data_stamp()`` into
+their keys, so any reload makes earlier entries unreachable without the
+data layers having to know which caches exist.
+"""
+
+import threading
+from typing import Any, Dict
+
+_lock = threading.Lock()
+_versions: Dict[str, str] = {}
+_generation = 0
+
+
+def set_data_version(source: str, version: Any) -> bool:
+    """
+    Record the version a data source now serves.
+
+    Args:
+        source: Data source name (e.g. "sanctions", "ac_patterns")
+        version: Version label, fingerprint or counter
+
+    Returns:
+        True if the version changed (the global stamp was advanced)
+    """
+    global _generation
+    version = str(version)
+    with _lock:
+        if _versions.get(source) == version:
+            return False
+        _versions[source] = version
+        _generation += 1
+        return True
+
+
+def bump_data_version(source: str) -> str:
+    """Advance a source that has no version label of its own; returns the new label."""
+    global _generation
+    with _lock:
+        _generation += 1
+        version = f"g{_generation}"
+        _versions[source] = version
+        return version
+
+
+def get_data_stamp() -> int:
+    """Combined stamp that changes whenever any data source changes."""
+    return _generation
+
+
+def get_data_versions() -> Dict[str, str]:
+    """Current version per data source."""
+    with _lock:
+        return dict(_versions)
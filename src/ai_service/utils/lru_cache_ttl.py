@@ -9,9 +9,14 @@ with automatic expiration and LRU eviction policies.
 import hashlib
 import threading
 import time
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
 from collections import OrderedDict
 
+from .shared_cache import get_shared_cache_store, shared_cache_enabled
+
+if TYPE_CHECKING:
+    from .shared_cache import SharedCacheNamespace, SharedCacheStore
+
 
 class LruTtlCache:
     """
@@ -23,18 +28,26 @@ class LruTtlCache:
     - Thread-safe operations with RLock
     - Hit/miss counters for metrics
     - Memory-efficient storage
+    - Optional shared L2 tier consulted on misses and written through on set
     """
     
-    def __init__(self, maxsize: int = 2048, ttl_seconds: int = 600):
+    def __init__(
+        self,
+        maxsize: int = 2048,
+        ttl_seconds: int = 600,
+        l2: Optional["SharedCacheNamespace"] = None,
+    ):
         """
         Initialize LRU TTL cache.
         
         Args:
             maxsize: Maximum number of items to store
             ttl_seconds: Time to live for cached items in seconds
+            l2: Optional shared second-level cache (see utils.shared_cache)
         """
         self.maxsize = maxsize
         self.ttl_seconds = ttl_seconds
+        self.l2 = l2
         
         # Thread-safe storage
         self._lock = threading.RLock()
@@ -46,6 +59,7 @@ class LruTtlCache:
         self._misses = 0
         self._evictions = 0
         self._expirations = 0
+        self._l2_hits = 0
         
         # Configuration
         self._enabled = True
@@ -68,23 +82,33 @@ class LruTtlCache:
             return False, None
         
         with self._lock:
-            if key not in self._cache:
-                self._misses += 1
-                return False, None
-            
-            # Check TTL
-            if self._is_expired(key):
+            if key in self._cache:
+                # Check TTL
+                if not self._is_expired(key):
+                    # Move to end (most recently used)
+                    value = self._cache.pop(key)
+                    self._cache[key] = value
+                    
+                    self._hits += 1
+                    return True, value
+                
                 del self._cache[key]
                 del self._timestamps[key]
                 self._expirations += 1
+            
+            if self.l2 is None:
                 self._misses += 1
                 return False, None
-            
-            # Move to end (most recently used)
-            value = self._cache.pop(key)
-            self._cache[key] = value
-            
+        
+        # L2 lookup happens outside the lock: it may wait on another worker
+        hit, value = self.l2.get(key)
+        with self._lock:
+            if not hit:
+                self._misses += 1
+                return False, None
+            self._insert(key, value)
             self._hits += 1
+            self._l2_hits += 1
             return True, value
     
     def set(self, key: Any, value: Any) -> None:
@@ -99,24 +123,31 @@ class LruTtlCache:
             return
         
         with self._lock:
-            current_time = time.time()
-            
-            # Remove existing entry if present
-            if key in self._cache:
-                del self._cache[key]
-                del self._timestamps[key]
-            
-            # Check if we need to evict
-            while len(self._cache) >= self.maxsize:
-                # Remove least recently used item
-                oldest_key = next(iter(self._cache))
-                del self._cache[oldest_key]
-                del self._timestamps[oldest_key]
-                self._evictions += 1
-            
-            # Add new entry
-            self._cache[key] = value
-            self._timestamps[key] = current_time
+            self._insert(key, value)
+        
+        if self.l2 is not None:
+            self.l2.set(key, value)
+    
+    def _insert(self, key: Any, value: Any) -> None:
+        """Insert into L1 (caller holds the lock)."""
+        current_time = time.time()
+        
+        # Remove existing entry if present
+        if key in self._cache:
+            del self._cache[key]
+            del self._timestamps[key]
+        
+        # Check if we need to evict
+        while len(self._cache) >= self.maxsize:
+            # Remove least recently used item
+            oldest_key = next(iter(self._cache))
+            del self._cache[oldest_key]
+            del self._timestamps[oldest_key]
+            self._evictions += 1
+        
+        # Add new entry
+        self._cache[key] = value
+        self._timestamps[key] = current_time
     
     def delete(self, key: Any) -> bool:
         """
@@ -128,15 +159,16 @@ class LruTtlCache:
         Returns:
             True if key was deleted, False if not found
         """
+        deleted_l2 = self.l2.delete(key) if self.l2 is not None else False
         with self._lock:
             if key in self._cache:
                 del self._cache[key]
                 del self._timestamps[key]
                 return True
-            return False
+            return deleted_l2
     
     def clear(self) -> None:
-        """Clear all entries from cache."""
+        """Clear all entries from cache (the shared L2 tier is left to other workers)."""
         with self._lock:
             self._cache.clear()
             self._timestamps.clear()
@@ -144,6 +176,7 @@ class LruTtlCache:
             self._misses = 0
             self._evictions = 0
             self._expirations = 0
+            self._l2_hits = 0
     
     def purge_expired(self) -> int:
         """
@@ -190,7 +223,7 @@ class LruTtlCache:
             total_requests = self._hits + self._misses
             hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0.0
             
-            return {
+            stats = {
                 'size': len(self._cache),
                 'maxsize': self.maxsize,
                 'hits': self._hits,
@@ -200,6 +233,10 @@ class LruTtlCache:
                 'expirations': self._expirations,
                 'enabled': self._enabled
             }
+            if self.l2 is not None:
+                stats['l2_hits'] = self._l2_hits
+                stats['l2'] = self.l2.get_stats()
+            return stats
     
     def enable(self) -> None:
         """Enable cache."""
@@ -283,6 +320,11 @@ class CacheManager:
     
     Provides centralized management of caches for different layers
     with unified configuration and metrics collection.
+    
+    When the shared cache is enabled (``enable_shared_cache`` or
+    ENABLE_SHARED_CACHE), every cache gets a namespace of the host-wide
+    SharedCacheStore as its L2 tier, so uvicorn workers warm one cache
+    instead of one each.
     """
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
@@ -298,18 +340,36 @@ class CacheManager:
         self.maxsize = self.config.get('max_size', 2048)
         self.ttl_seconds = self.config.get('ttl_sec', 600)
         self.enabled = self.config.get('enable_cache', True)
+        self.shared_enabled = self.enabled and self.config.get('enable_shared_cache', shared_cache_enabled())
+        
+        # Optional L2 tier shared across worker processes
+        self.shared_store: Optional["SharedCacheStore"] = None
+        if self.shared_enabled:
+            self.shared_store = get_shared_cache_store(self.config.get('shared_cache_path'))
         
         # Create caches for different layers
         self.tokenizer_cache = LruTtlCache(
             maxsize=self.maxsize,
-            ttl_seconds=self.ttl_seconds
+            ttl_seconds=self.ttl_seconds,
+            l2=self.get_shared_namespace('tokenizer')
         )
         
         self.morphology_cache = LruTtlCache(
             maxsize=self.maxsize,
-            ttl_seconds=self.ttl_seconds
+            ttl_seconds=self.ttl_seconds,
+            l2=self.get_shared_namespace('morphology')
         )
         
+        # Full normalization results; only worth keeping when shared, since
+        # the orchestrator already caches end-to-end results per process
+        self.normalization_cache = LruTtlCache(
+            maxsize=self.maxsize,
+            ttl_seconds=self.ttl_seconds,
+            l2=self.get_shared_namespace('normalization')
+        )
+        if not self.shared_enabled:
+            self.normalization_cache.disable()
+        
         # Disable if not enabled
         if not self.enabled:
             self.tokenizer_cache.disable()
@@ -323,38 +383,58 @@ class CacheManager:
         """Get morphology cache."""
         return self.morphology_cache
     
+    def get_normalization_cache(self) -> LruTtlCache:
+        """Get normalization result cache (disabled unless the shared tier is on)."""
+        return self.normalization_cache
+    
+    def get_shared_namespace(self, name: str) -> Optional["SharedCacheNamespace"]:
+        """Get a namespace of the shared L2 store, or None if it is disabled."""
+        if self.shared_store is None:
+            return None
+        return self.shared_store.namespace(name)
+    
     def get_all_stats(self) -> Dict[str, Any]:
         """Get statistics for all caches."""
-        return {
+        stats = {
             'tokenizer': self.tokenizer_cache.get_stats(),
             'morphology': self.morphology_cache.get_stats(),
             'config': {
                 'maxsize': self.maxsize,
                 'ttl_seconds': self.ttl_seconds,
-                'enabled': self.enabled
+                'enabled': self.enabled,
+                'shared_enabled': self.shared_enabled
             }
         }
+        if self.shared_store is not None:
+            stats['normalization'] = self.normalization_cache.get_stats()
+            stats['shared'] = self.shared_store.get_stats()
+        return stats
     
     def purge_all_expired(self) -> Dict[str, int]:
         """Purge expired entries from all caches."""
         return {
             'tokenizer': self.tokenizer_cache.purge_expired(),
-            'morphology': self.morphology_cache.purge_expired()
+            'morphology': self.morphology_cache.purge_expired(),
+            'normalization': self.normalization_cache.purge_expired()
         }
     
     def clear_all(self) -> None:
         """Clear all caches."""
         self.tokenizer_cache.clear()
         self.morphology_cache.clear()
+        self.normalization_cache.clear()
     
     def enable_all(self) -> None:
         """Enable all caches."""
         self.tokenizer_cache.enable()
         self.morphology_cache.enable()
+        if self.shared_enabled:
+            self.normalization_cache.enable()
         self.enabled = True
     
     def disable_all(self) -> None:
         """Disable all caches."""
         self.tokenizer_cache.disable()
         self.morphology_cache.disable()
+        self.normalization_cache.disable()
         self.enabled = False
@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+Second-level cache shared by all worker processes on one host.
+
+Every in-process cache (tokenizer, morphology, query embeddings) is warmed
+separately by each uvicorn worker. This module adds an optional L2 tier that
+all workers read and write: a SQLite database in WAL mode, placed in
+``/dev/shm`` when available so it lives in shared memory and needs no
+outside service.
+
+- keys are 16-byte BLAKE2b digests of namespace and ``repr(key)``;
+- values are stored compactly: raw ``bytes`` as-is (e.g. float32 vectors),
+  anything else pickled and zlib-compressed above a size threshold;
+- every row carries the store's version tag; rows written under another
+  tag (older code or dictionaries) are misses and get pruned;
+- callers never wait on SQLite locks: writes are queued to a background
+  writer thread that commits them in batches, and reads give up at once
+  (a miss) if the database is locked, so request paths on the event loop
+  do not stall under write contention;
+- all errors (lock contention, disk full, unpicklable values) degrade to a
+  cache miss, the L1 tier keeps working.
+
+The store is disabled by default; enable with ``ENABLE_SHARED_CACHE=true``.
+Values are unpickled, so the store refuses to open a database unless both
+its directory (mode 0700) and the file (mode 0600) are owned by the service
+user and closed to everyone else; a file planted in a shared location such
+as ``/dev/shm`` is never read.
+"""
+
+import os
+import pickle
+import queue
+import sqlite3
+import stat
+import tempfile
+import threading
+import time
+import zlib
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when the row layout or value encoding changes
+FORMAT_VERSION = 1
+
+_RAW = b"b"
+_PICKLE = b"p"
+_PICKLE_ZLIB = b"z"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key BLOB PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    version TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    value BLOB NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at);
+"""
+
+
+def shared_cache_enabled() -> bool:
+    """True if the shared L2 cache is enabled (ENABLE_SHARED_CACHE)."""
+    return os.getenv("ENABLE_SHARED_CACHE", "false").lower() == "true"
+
+
+def default_shared_cache_path() -> str:
+    """Database path: SHARED_CACHE_PATH, else /dev/shm, else the temp dir."""
+    path = os.getenv("SHARED_CACHE_PATH")
+    if path:
+        return path
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base, "ai_service_cache", "l2.sqlite3")
+
+
+def default_shared_cache_version() -> str:
+    """Version tag: SHARED_CACHE_VERSION, else the package version."""
+    version = os.getenv("SHARED_CACHE_VERSION")
+    if version:
+        return version
+    from .. import __version__
+    return __version__
+
+
+def _check_private(st: os.stat_result, path: Path, is_type) -> None:
+    """Refuse paths of the wrong type, owned by another user or open to others."""
+    if not is_type(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise PermissionError(
+            f"Refusing shared cache path {path}: must be owned by uid {os.getuid()} "
+            f"with no group/other permissions (found uid {st.st_uid}, mode {stat.S_IMODE(st.st_mode):o})"
+        )
+
+
+class SharedCacheStore:
+    """
+    Process-safe key/value store with TTL, size bound and version tag.
+
+    One SQLite connection is opened per thread and per process, so a store
+    created before uvicorn forks its workers is safe to use in each of them.
+    Writes are applied asynchronously by a per-process writer thread; call
+    flush() to wait for them.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        version: str = "",
+        max_entries: int = 200000,
+        ttl_seconds: int = 3600,
+        compress_min_bytes: int = 256,
+        prune_interval: int = 1000,
+        busy_timeout_ms: int = 1000,
+        max_pending_writes: int = 10000,
+    ):
+        """
+        Initialize shared store.
+
+        Args:
+            path: SQLite database file (created if missing)
+            version: Version tag; rows with another tag are ignored
+            max_entries: Maximum number of rows kept after pruning
+            ttl_seconds: Default time to live for stored values
+            compress_min_bytes: Pickled values at least this long are zlib-compressed
+            prune_interval: Writes per process between pruning passes
+            busy_timeout_ms: How long the writer thread waits on a locked database
+            max_pending_writes: Queued writes per process before new ones are dropped
+        """
+        self.path = str(path)
+        self.version = f"{FORMAT_VERSION}:{version}"
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.compress_min_bytes = compress_min_bytes
+        self.prune_interval = prune_interval
+        self.busy_timeout_ms = busy_timeout_ms
+        self.max_pending_writes = max_pending_writes
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+        self._writer: Optional[threading.Thread] = None
+        self._writer_pid: Optional[int] = None
+        self._pending: Optional[queue.Queue] = None
+
+        # Metrics (per process)
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._errors = 0
+        self._pruned = 0
+        self._dropped = 0
+
+    def namespace(self, name: str, ttl_seconds: Optional[int] = None) -> "SharedCacheNamespace":
+        """View of the store for one cache (keys of different namespaces never collide)."""
+        return SharedCacheNamespace(self, name, ttl_seconds)
+
+    def get(self, namespace: str, key: Any) -> Tuple[bool, Optional[Any]]:
+        """
+        Get value from the shared store.
+
+        Returns:
+            Tuple of (hit, value), same contract as LruTtlCache.get
+        """
+        try:
+            row = self._connection().execute(
+                "SELECT version, expires_at, value FROM entries WHERE key = ?",
+                (self._digest(namespace, key),),
+            ).fetchone()
+            if row is None or row[0] != self.version or row[1] < time.time():
+                self._count("_misses")
+                return False, None
+            value = self._decode(row[2])
+        except Exception as e:
+            self._record_error("get", e)
+            self._count("_misses")
+            return False, None
+
+        self._count("_hits")
+        return True, value
+
+    def set(self, namespace: str, key: Any, value: Any, ttl_seconds: Optional[int] = None) -> bool:
+        """
+        Queue value for storage.
+
+        Returns:
+            False if the value cannot be encoded or the write queue is full
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        try:
+            row = (self._digest(namespace, key), namespace, self.version, time.time() + ttl, self._encode(value))
+        except Exception as e:
+            self._record_error("set", e)
+            return False
+
+        try:
+            self._pending_writes().put_nowait(row)
+        except queue.Full:
+            self._count("_dropped")
+            return False
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until queued writes are committed; returns False on timeout."""
+        with self._lock:
+            pending = self._pending if self._writer_pid == os.getpid() else None
+        if pending is None:
+            return True
+        done = threading.Event()
+        pending.put(done)
+        return done.wait(timeout)
+
+    def delete(self, namespace: str, key: Any) -> bool:
+        """Delete key; returns True if a row was removed."""
+        try:
+            cursor = self._connection().execute(
+                "DELETE FROM entries WHERE key = ?", (self._digest(namespace, key),)
+            )
+            return cursor.rowcount > 0
+        except Exception as e:
+            self._record_error("delete", e)
+            return False
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Delete all rows (of one namespace) for every worker."""
+        self.flush()
+        try:
+            if namespace is None:
+                self._connection().execute("DELETE FROM entries")
+            else:
+                self._connection().execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+        except Exception as e:
+            self._record_error("clear", e)
+
+    def prune(self) -> int:
+        """
+        Remove expired rows, rows of other versions, and the rows closest
+        to expiry beyond max_entries.
+
+        Returns:
+            Number of rows removed
+        """
+        try:
+            conn = self._connection()
+            removed = conn.execute(
+                "DELETE FROM entries WHERE expires_at < ? OR version != ?",
+                (time.time(), self.version),
+            ).rowcount
+            excess = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] - self.max_entries
+            if excess > 0:
+                removed += conn.execute(
+                    "DELETE FROM entries WHERE key IN "
+                    "(SELECT key FROM entries ORDER BY expires_at LIMIT ?)",
+                    (excess,),
+                ).rowcount
+        except Exception as e:
+            self._record_error("prune", e)
+            return 0
+
+        with self._lock:
+            self._pruned += removed
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics (counters are per process, size is shared)."""
+        try:
+            size = self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        except Exception:
+            size = None
+        with self._lock:
+            total_requests = self._hits + self._misses
+            return {
+                'path': self.path,
+                'version': self.version,
+                'size': size,
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': (self._hits / total_requests * 100) if total_requests > 0 else 0.0,
+                'stores': self._stores,
+                'errors': self._errors,
+                'pruned': self._pruned,
+                'dropped': self._dropped,
+            }
+
+    def _pending_writes(self) -> queue.Queue:
+        pid = os.getpid()
+        with self._lock:
+            if self._writer_pid != pid:
+                # First write in this process (threads do not survive a fork)
+                self._pending = queue.Queue(maxsize=self.max_pending_writes)
+                self._writer = threading.Thread(
+                    target=self._write_loop, args=(self._pending,), name="shared-cache-writer", daemon=True
+                )
+                self._writer_pid = pid
+                self._writer.start()
+            return self._pending
+
+    def _write_loop(self, pending: queue.Queue) -> None:
+        while True:
+            rows: List[tuple] = []
+            waiters: List[threading.Event] = []
+            item = pending.get()
+            while True:
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    rows.append(item)
+                if len(rows) >= 500:
+                    break
+                try:
+                    item = pending.get_nowait()
+                except queue.Empty:
+                    break
+
+            if rows:
+                self._write_rows(rows)
+            for waiter in waiters:
+                waiter.set()
+
+    def _write_rows(self, rows: List[tuple]) -> None:
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO entries (key, namespace, version, expires_at, value) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+        except Exception as e:
+            self._record_error("set", e)
+            return
+
+        with self._lock:
+            self._stores += len(rows)
+            self._writes_since_prune += len(rows)
+            should_prune = self._writes_since_prune >= self.prune_interval
+            if should_prune:
+                self._writes_since_prune = 0
+        if should_prune:
+            self.prune()
+
+    def _connection(self) -> sqlite3.Connection:
+        local = self._local
+        pid = os.getpid()
+        if getattr(local, "pid", None) != pid:
+            # New thread, or a worker forked after the parent opened a connection.
+            # Only the writer thread waits on locks; every other caller treats
+            # a locked database as a miss.
+            is_writer = threading.current_thread() is self._writer
+            local.conn = self._connect(self.busy_timeout_ms if is_writer else 0)
+            local.pid = pid
+        return local.conn
+
+    def _connect(self, busy_timeout_ms: int) -> sqlite3.Connection:
+        path = Path(self.path)
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _check_private(os.lstat(path.parent), path.parent, stat.S_ISDIR)
+        fd = os.open(path, os.O_CREAT | os.O_RDWR | os.O_NOFOLLOW, 0o600)
+        try:
+            _check_private(os.fstat(fd), path, stat.S_ISREG)
+        finally:
+            os.close(fd)
+
+        conn = sqlite3.connect(
+            self.path,
+            timeout=busy_timeout_ms / 1000,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        # Losing the tail of a cache on power failure is fine
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    @staticmethod
+    def _digest(namespace: str, key: Any) -> bytes:
+        digest = blake2b(namespace.encode("utf-8"), digest_size=16)
+        digest.update(b"\0")
+        digest.update(repr(key).encode("utf-8"))
+        return digest.digest()
+
+    def _encode(self, value: Any) -> bytes:
+        if isinstance(value, bytes):
+            return _RAW + value
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) >= self.compress_min_bytes:
+            return _PICKLE_ZLIB + zlib.compress(data, 1)
+        return _PICKLE + data
+
+    @staticmethod
+    def _decode(blob: bytes) -> Any:
+        codec, data = blob[:1], blob[1:]
+        if codec == _RAW:
+            return bytes(data)
+        if codec == _PICKLE_ZLIB:
+            data = zlib.decompress(data)
+        return pickle.loads(data)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _record_error(self, operation: str, error: Exception) -> None:
+        self._count("_errors")
+        logger.debug(f"Shared cache {operation} failed ({self.path}): {error}")
+
+
+class SharedCacheNamespace:
+    """One cache's slice of a SharedCacheStore, with its own counters."""
+
+    def __init__(self, store: SharedCacheStore, name: str, ttl_seconds: Optional[int] = None):
+        self.store = store
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Any) -> Tuple[bool, Optional[Any]]:
+        hit, value = self.store.get(self.name, key)
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+        return hit, value
+
+    def set(self, key: Any, value: Any) -> bool:
+        return self.store.set(self.name, key, value, self.ttl_seconds)
+
+    def delete(self, key: Any) -> bool:
+        return self.store.delete(self.name, key)
+
+    def clear(self) -> None:
+        self.store.clear(self.name)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total_requests = self._hits + self._misses
+            return {
+                'namespace': self.name,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': (self._hits / total_requests * 100) if total_requests > 0 else 0.0,
+            }
+
+
+_stores: Dict[str, SharedCacheStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_shared_cache_store(path: Optional[str] = None) -> SharedCacheStore:
+    """
+    Process-wide store for path (default from SHARED_CACHE_PATH).
+
+    Size, TTL and version tag come from SHARED_CACHE_MAX_ENTRIES,
+    SHARED_CACHE_TTL and SHARED_CACHE_VERSION.
+    """
+    path = path or default_shared_cache_path()
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = SharedCacheStore(
+                path,
+                version=default_shared_cache_version(),
+                max_entries=int(os.getenv("SHARED_CACHE_MAX_ENTRIES", "200000")),
+                ttl_seconds=int(os.getenv("SHARED_CACHE_TTL", "3600")),
+            )
+            _stores[path] = store
+            logger.info(f"Shared L2 cache at {path} (version {store.version})")
+        return store
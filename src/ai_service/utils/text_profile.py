@@ -0,0 +1,127 @@
+"""
+Per-request text profile shared by the processing layers.
+
+Language detection, homoglyph detection and normalization each used to scan
+the same input for Cyrillic/Latin counts, mixed-script flags and whitespace
+tokens. ``TextProfile`` computes those once per text, on first access, and
+keeps them; the orchestrator creates one for the sanitized text, replaces it
+after Unicode normalization only if the text changed, and passes it through
+``ProcessingContext``.
+
+The script histogram keeps the character classes each layer already used,
+so reading it instead of rescanning does not change any layer's result.
+"""
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+UKRAINIAN_CHARS = "іїєґІЇЄҐ"
+RUSSIAN_CHARS = "ёъыэЁЪЫЭ"
+# Cyrillic letters outside А-я (U+0410-U+044F) counted as Cyrillic
+CYRILLIC_EXTRA_CHARS = "ёЁіїєґІЇЄҐ"
+
+
+@dataclass(frozen=True)
+class ScriptHistogram:
+    """Character class counts of a text."""
+
+    cyrillic: int  # А-я plus ёЁіїєґІЇЄҐ
+    latin: int  # A-Z, a-z
+    ukrainian: int  # іїєґІЇЄҐ
+    russian: int  # ёъыэЁЪЫЭ
+    uppercase: int  # uppercase Cyrillic and Latin letters
+    digits: int  # 0-9
+    other: int  # any other non-whitespace character
+    cyrillic_block: int  # U+0400-U+04FF
+    cyrillic_basic: int  # U+0410-U+044F (А-я)
+    latin_block: int  # U+0041-U+007A (Latin letters and [\]^_`)
+
+    @property
+    def letters(self) -> int:
+        return self.cyrillic + self.latin
+
+
+def _build_histogram(text: str) -> ScriptHistogram:
+    cyrillic = latin = ukrainian = russian = uppercase = digits = other = 0
+    cyrillic_block = cyrillic_basic = latin_block = 0
+
+    for char in text:
+        if "\u0400" <= char <= "\u04ff":
+            cyrillic_block += 1
+            if "\u0410" <= char <= "\u044f":
+                cyrillic_basic += 1
+            elif char not in CYRILLIC_EXTRA_CHARS:
+                other += 1
+                continue
+            cyrillic += 1
+            if char in UKRAINIAN_CHARS:
+                ukrainian += 1
+            elif char in RUSSIAN_CHARS:
+                russian += 1
+            if char.isupper():
+                uppercase += 1
+        elif "a" <= char <= "z" or "A" <= char <= "Z":
+            latin += 1
+            latin_block += 1
+            if char.isupper():
+                uppercase += 1
+        elif "0" <= char <= "9":
+            digits += 1
+        elif not char.isspace():
+            other += 1
+            if "[" <= char <= "`":
+                latin_block += 1
+
+    return ScriptHistogram(
+        cyrillic=cyrillic,
+        latin=latin,
+        ukrainian=ukrainian,
+        russian=russian,
+        uppercase=uppercase,
+        digits=digits,
+        other=other,
+        cyrillic_block=cyrillic_block,
+        cyrillic_basic=cyrillic_basic,
+        latin_block=latin_block,
+    )
+
+
+class TextProfile:
+    """Lazily computed, memoized analysis of one text."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self._char_positions: Dict[FrozenSet[str], Tuple[int, ...]] = {}
+
+    @classmethod
+    def for_text(cls, text: str, profile: Optional["TextProfile"] = None) -> "TextProfile":
+        """``profile`` if it describes ``text``, otherwise a new profile."""
+        if profile is not None and profile.text == text:
+            return profile
+        return cls(text)
+
+    @cached_property
+    def scripts(self) -> ScriptHistogram:
+        return _build_histogram(self.text)
+
+    @property
+    def has_mixed_scripts(self) -> bool:
+        """Both Latin (A-Z, a-z) and Cyrillic-block characters are present."""
+        return self.scripts.latin > 0 and self.scripts.cyrillic_block > 0
+
+    @cached_property
+    def tokens(self) -> List[str]:
+        """Whitespace tokens, as ``text.split()``."""
+        return self.text.split()
+
+    def char_positions(self, chars: FrozenSet[str]) -> Tuple[int, ...]:
+        """Positions of characters in ``chars`` (e.g. a homoglyph table), memoized per set."""
+        positions = self._char_positions.get(chars)
+        if positions is None:
+            if chars.isdisjoint(self.text):
+                positions = ()
+            else:
+                positions = tuple(i for i, char in enumerate(self.text) if char in chars)
+            self._char_positions[chars] = positions
+        return positions
@@ -830,6 +830,16 @@ def suppress_health_checks(request):
         warnings.filterwarnings("ignore", category=UserWarning, message=".*health.*")
 
 
+@pytest.fixture(autouse=True)
+def reset_process_embedding_cache():
+    """Каждый тест начинает с пустого общего кэша эмбеддингов."""
+    from src.ai_service.layers.embeddings.embedding_cache import reset_embedding_cache
+
+    reset_embedding_cache()
+    yield
+    reset_embedding_cache()
+
+
 # Хук для генерации отчетов
 def pytest_terminal_summary(terminalreporter, exitstatus, config):
     """Генерирует сводный отчет о тестах."""
@@ -0,0 +1,97 @@
+"""
+Tests for NDJSON streaming used by the /process-stream endpoint.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from ai_service.api.stream_processing import iter_ndjson_lines, stream_process_results
+
+
+async def _chunks(*parts):
+    for part in parts:
+        yield part
+
+
+async def _collect(agen):
+    return [item async for item in agen]
+
+
+def _format(result):
+    return {"success": True, "normalized_text": result.normalized_text}
+
+
+class TestIterNdjsonLines:
+    @pytest.mark.asyncio
+    async def test_records_split_across_chunks(self):
+        lines = await _collect(iter_ndjson_lines(
+            _chunks(b'"Ivan Pet', b'rov"\n\n{"id": 7, "text": "\xd0\x9e\xd0\x9e\xd0\x9e"}\nnot json\n', b'"tail"'),
+            max_length=100,
+        ))
+        assert [(n, rid, text) for n, rid, text, _ in lines] == [
+            (1, None, "Ivan Petrov"), (3, 7, "ООО"), (4, None, None), (5, None, "tail"),
+        ]
+        assert lines[2][3].startswith("Invalid JSON")
+
+    @pytest.mark.asyncio
+    async def test_oversized_line_is_discarded(self):
+        lines = await _collect(iter_ndjson_lines(
+            _chunks(b'"' + b"x" * 40, b"x" * 40, b'"\n"ok"\n'),
+            max_length=10,
+            max_line_bytes=32,
+        ))
+        assert lines[0][0] == 1 and "exceeds" in lines[0][3]
+        assert lines[1] == (2, None, "ok", None)
+
+    @pytest.mark.asyncio
+    async def test_text_length_limit(self):
+        lines = await _collect(iter_ndjson_lines(_chunks(b'"abcdef"\n'), max_length=3))
+        assert lines[0][2] is None
+        assert "Text too long" in lines[0][3]
+
+
+class TestStreamProcessResults:
+    @pytest.mark.asyncio
+    async def test_completion_order_and_errors(self):
+        async def process(text):
+            if text == "boom":
+                raise RuntimeError("failed")
+            await asyncio.sleep(0.01 * len(text))
+            return SimpleNamespace(normalized_text=text.upper())
+
+        body = b'"slow text"\n"a"\n"boom"\n{"id": "x", "text": 1}\n'
+        output = await _collect(stream_process_results(
+            iter_ndjson_lines(_chunks(body), max_length=100), process, _format, max_in_flight=4
+        ))
+        records = [json.loads(line) for line in output]
+        by_line = {r["line"]: r for r in records}
+
+        assert records[-1]["line"] == 1  # slowest item arrives last
+        assert by_line[2]["normalized_text"] == "A"
+        assert by_line[3] == {"line": 3, "success": False, "original_text": "boom",
+                              "errors": ["failed"], "processing_time": by_line[3]["processing_time"]}
+        assert by_line[4]["id"] == "x" and by_line[4]["success"] is False
+
+    @pytest.mark.asyncio
+    async def test_backpressure_limits_read_ahead(self):
+        read = []
+
+        async def lines():
+            for n in range(1, 101):
+                read.append(n)
+                yield n, None, f"t{n}", None
+
+        async def process(text):
+            return SimpleNamespace(normalized_text=text)
+
+        stream = stream_process_results(lines(), process, _format, max_in_flight=3)
+        first = json.loads(await stream.__anext__())
+        await asyncio.sleep(0.05)
+
+        # Consumer stopped after one result: reader may be at most a few lines ahead
+        assert first["line"] == 1
+        assert len(read) <= 5
+        await stream.aclose()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the end-to-end processing result cache.
+
+Entries are keyed on sanitized text, feature flags, options and the
+screening data stamp, and must disappear when screening data reloads.
+"""
+
+from dataclasses import replace
+from types import SimpleNamespace
+
+from src.ai_service.core.result_cache import ProcessingResultCache
+from src.ai_service.utils.data_version import (
+    bump_data_version,
+    get_data_stamp,
+    get_data_versions,
+    set_data_version,
+)
+from src.ai_service.utils.feature_flags import FeatureFlags
+
+
+OPTIONS = {"remove_stop_words": True, "preserve_names": True}
+
+
+class TestDataVersion:
+    """Test process-wide data version stamps."""
+
+    def test_set_same_version_keeps_stamp(self):
+        set_data_version("test_source", "v1")
+        stamp = get_data_stamp()
+
+        assert set_data_version("test_source", "v1") is False
+        assert get_data_stamp() == stamp
+        assert set_data_version("test_source", "v2") is True
+        assert get_data_stamp() > stamp
+        assert get_data_versions()["test_source"] == "v2"
+
+    def test_bump_always_advances(self):
+        stamp = get_data_stamp()
+        version = bump_data_version("test_bumped")
+
+        assert get_data_stamp() > stamp
+        assert get_data_versions()["test_bumped"] == version
+
+
+class TestProcessingResultCache:
+    """Test ProcessingResultCache behaviour."""
+
+    def test_hit_and_miss_counting(self):
+        cache = ProcessingResultCache(maxsize=10, ttl_seconds=60)
+        key = cache.make_key("Іван Петров", FeatureFlags(), OPTIONS)
+
+        assert cache.get(key) is None
+        cache.set(key, SimpleNamespace(normalized_text="іван петров", processing_time=0.5))
+        cached = cache.get(key)
+
+        assert cached.normalized_text == "іван петров"
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+        assert stats["size"] == 1
+
+    def test_returns_copy(self):
+        cache = ProcessingResultCache(maxsize=10, ttl_seconds=60)
+        key = cache.make_key("text", FeatureFlags(), OPTIONS)
+        cache.set(key, SimpleNamespace(processing_time=0.5))
+
+        cache.get(key).processing_time = 0.0
+        assert cache.get(key).processing_time == 0.5
+
+    def test_returns_deep_copy(self):
+        cache = ProcessingResultCache(maxsize=10, ttl_seconds=60)
+        key = cache.make_key("text", FeatureFlags(), OPTIONS)
+        stored = SimpleNamespace(original_text="text", tokens=["іван"], trace=[])
+        cache.set(key, stored)
+
+        stored.tokens.append("петров")
+        cache.get(key).trace.append("step")
+
+        cached = cache.get(key)
+        assert cached.tokens == ["іван"]
+        assert cached.trace == []
+
+    def test_whitespace_variants_keep_their_original_text(self):
+        cache = ProcessingResultCache(maxsize=10, ttl_seconds=60)
+        first, second = "  Ivan Petrov  ", "Ivan  Petrov"
+        # Both requests sanitize to the same text
+        key = cache.make_key(" ".join(first.split()), FeatureFlags(), OPTIONS)
+        assert key == cache.make_key(" ".join(second.split()), FeatureFlags(), OPTIONS)
+
+        assert cache.get(key, first) is None
+        cache.set(key, SimpleNamespace(original_text=first, normalized_text="ivan petrov"))
+        cached = cache.get(key, second)
+
+        assert cached.original_text == second
+        assert cached.normalized_text == "ivan petrov"
+        assert cache.get(key, first).original_text == first
+
+    def test_flags_and_options_are_part_of_key(self):
+        cache = ProcessingResultCache(maxsize=10, ttl_seconds=60)
+        flags = FeatureFlags()
+        other_flags = replace(flags, use_factory_normalizer=not flags.use_factory_normalizer)
+
+        key = cache.make_key("text", flags, OPTIONS)
+        assert key != cache.make_key("text", other_flags, OPTIONS)
+        assert key != cache.make_key("text", flags, {**OPTIONS, "preserve_names": False})
+
+    def test_data_reload_invalidates(self):
+        cache = ProcessingResultCache(maxsize=10, ttl_seconds=60)
+        key = cache.make_key("text", FeatureFlags(), OPTIONS)
+        cache.set(key, SimpleNamespace(value=1))
+
+        set_data_version("sanctions", f"fingerprint-{get_data_stamp() + 1}")
+
+        assert cache.get(key) is None
+        assert cache.get(cache.make_key("text", FeatureFlags(), OPTIONS)) is None
+        stats = cache.get_stats()
+        assert stats["invalidations"] == 1
+        assert stats["size"] == 0
+
+    def test_stale_store_is_skipped(self):
+        cache = ProcessingResultCache(maxsize=10, ttl_seconds=60)
+        key = cache.make_key("text", FeatureFlags(), OPTIONS)
+
+        bump_data_version("watchlist")
+        cache.set(key, SimpleNamespace(value=1))
+
+        assert cache.get_stats()["stores"] == 0
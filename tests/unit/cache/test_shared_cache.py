@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared (cross-process) L2 cache tier.
+"""
+
+import multiprocessing
+import os
+import sqlite3
+import time
+
+import numpy as np
+import pytest
+
+from src.ai_service.layers.embeddings.embedding_cache import EmbeddingCache
+from src.ai_service.utils.lru_cache_ttl import CacheManager, LruTtlCache
+from src.ai_service.utils.shared_cache import SharedCacheStore
+
+
+def _write_from_child(store):
+    store.set("tokenizer", ("uk", "іван", "flags"), {"tokens": ["Іван"]})
+    store.flush(10)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SharedCacheStore(str(tmp_path / "l2.sqlite3"), version="test")
+
+
+class TestSharedCacheStore:
+    """Test SharedCacheStore behaviour."""
+
+    def test_roundtrip(self, store):
+        key = ("ru", "Иван Петров", "abc123")
+        value = {"tokens": ["Иван", "Петров"], "traces": ["x" * 1000]}
+
+        assert store.get("tokenizer", key) == (False, None)
+        assert store.set("tokenizer", key, value)
+        assert store.flush(5)
+        assert store.get("tokenizer", key) == (True, value)
+        assert store.get("morphology", key) == (False, None)
+
+    def test_raw_bytes_are_stored_as_is(self, store):
+        vector = np.arange(8, dtype=np.float32)
+        store.set("embeddings", b"key", vector.tobytes())
+        store.flush(5)
+
+        hit, blob = store.get("embeddings", b"key")
+        assert hit
+        assert np.array_equal(np.frombuffer(blob, dtype=np.float32), vector)
+
+    def test_version_tag_mismatch_is_miss(self, store, tmp_path):
+        store.set("tokenizer", "key", "value")
+        store.flush(5)
+        other = SharedCacheStore(store.path, version="other")
+
+        assert other.get("tokenizer", "key") == (False, None)
+        assert other.prune() == 1
+        assert store.get("tokenizer", "key") == (False, None)
+
+    def test_ttl_expiry(self, store):
+        store.set("tokenizer", "key", "value", ttl_seconds=-1)
+        store.flush(5)
+        assert store.get("tokenizer", "key") == (False, None)
+
+    def test_prune_bounds_size(self, tmp_path):
+        store = SharedCacheStore(str(tmp_path / "l2.sqlite3"), max_entries=5, prune_interval=1000)
+        for i in range(12):
+            store.set("tokenizer", i, i)
+        store.flush(5)
+
+        assert store.prune() == 7
+        assert store.get_stats()["size"] == 5
+        # Entries closest to expiry (the oldest) go first
+        assert store.get("tokenizer", 11) == (True, 11)
+        assert store.get("tokenizer", 0) == (False, None)
+
+    def test_writes_do_not_wait_on_locks(self, store):
+        # Another worker holds the write lock; set() returns at once and the
+        # read fails fast as a miss instead of waiting for the busy timeout
+        store.set("tokenizer", "warmup", 1)
+        store.flush(5)
+        blocker = sqlite3.connect(store.path, isolation_level=None)
+        blocker.execute("BEGIN EXCLUSIVE")
+        try:
+            start = time.perf_counter()
+            assert store.set("tokenizer", "key", "value")
+            store.get("tokenizer", "key")
+            assert time.perf_counter() - start < 0.05
+        finally:
+            blocker.execute("ROLLBACK")
+            blocker.close()
+
+        assert store.flush(5)
+        assert store.get("tokenizer", "key") == (True, "value")
+
+    def test_unpicklable_value_degrades(self, store):
+        assert store.set("tokenizer", "key", lambda: None) is False
+        assert store.get_stats()["errors"] == 1
+        assert store.get("tokenizer", "key") == (False, None)
+
+    @pytest.mark.parametrize("target", ["dir", "file"])
+    def test_refuses_path_open_to_others(self, tmp_path, target):
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir(mode=0o700)
+        path = cache_dir / "l2.sqlite3"
+        owner = SharedCacheStore(str(path))
+        owner.set("tokenizer", "key", "value")
+        owner.flush(5)
+        os.chmod(cache_dir if target == "dir" else path, 0o777 if target == "dir" else 0o666)
+
+        store = SharedCacheStore(str(path))
+        assert store.get("tokenizer", "key") == (False, None)
+        store.set("tokenizer", "key", "other")
+        store.flush(5)
+        assert store.get_stats()["errors"] == 2
+
+    def test_refuses_symlinked_file(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir(mode=0o700)
+        (cache_dir / "l2.sqlite3").symlink_to(tmp_path / "elsewhere.sqlite3")
+
+        store = SharedCacheStore(str(cache_dir / "l2.sqlite3"))
+        store.set("tokenizer", "key", "value")
+        store.flush(5)
+        assert store.get_stats()["errors"] == 1
+        assert not (tmp_path / "elsewhere.sqlite3").exists()
+
+    @pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+    def test_visible_across_forked_workers(self, store):
+        # Parent connection is opened before the fork, as in a preloaded app
+        assert store.get("tokenizer", "warmup") == (False, None)
+        process = multiprocessing.get_context("fork").Process(target=_write_from_child, args=(store,))
+        process.start()
+        process.join(30)
+
+        assert process.exitcode == 0
+        assert store.get("tokenizer", ("uk", "іван", "flags")) == (True, {"tokens": ["Іван"]})
+
+
+class TestTieredCaches:
+    """Test L1 caches backed by the shared tier."""
+
+    def test_lru_cache_reads_through_l2(self, store):
+        writer = LruTtlCache(maxsize=10, ttl_seconds=60, l2=store.namespace("tokenizer"))
+        reader = LruTtlCache(maxsize=10, ttl_seconds=60, l2=store.namespace("tokenizer"))
+
+        writer.set("key", "value")
+        store.flush(5)
+        assert reader.get("key") == (True, "value")
+        assert "key" in reader
+
+        stats = reader.get_stats()
+        assert stats["hits"] == 1
+        assert stats["l2_hits"] == 1
+        assert stats["l2"]["hits"] == 1
+
+    def test_lru_cache_without_l2_has_no_l2_stats(self):
+        cache = LruTtlCache(maxsize=10, ttl_seconds=60)
+        assert cache.get("key") == (False, None)
+        assert "l2" not in cache.get_stats()
+
+    def test_embedding_cache_reads_through_shared(self, store):
+        writer = EmbeddingCache(4, dimension=3, shared=store.namespace("query_embeddings:3"))
+        reader = EmbeddingCache(4, dimension=3, shared=store.namespace("query_embeddings:3"))
+
+        writer.put("Іван Петров", [0.1, 0.2, 0.3])
+        store.flush(5)
+        vector = reader.get("Іван Петров")
+
+        assert vector is not None
+        assert np.allclose(vector, [0.1, 0.2, 0.3])
+        assert reader.get_stats()["shared_hits"] == 1
+        assert reader.get("Петро Іванов") is None
+
+    def test_cache_manager_shared_tier(self, tmp_path):
+        manager = CacheManager({
+            "enable_shared_cache": True,
+            "shared_cache_path": str(tmp_path / "l2.sqlite3"),
+        })
+        other = CacheManager({
+            "enable_shared_cache": True,
+            "shared_cache_path": str(tmp_path / "l2.sqlite3"),
+        })
+
+        manager.get_morphology_cache().set(("parse", "uk", "іван"), ["parse"])
+        manager.shared_store.flush(5)
+        assert other.get_morphology_cache().get(("parse", "uk", "іван")) == (True, ["parse"])
+        assert manager.get_normalization_cache()
+        assert "shared" in manager.get_all_stats()
+
+    def test_cache_manager_shared_tier_off_by_default(self, monkeypatch):
+        monkeypatch.delenv("ENABLE_SHARED_CACHE", raising=False)
+        manager = CacheManager()
+
+        assert manager.shared_store is None
+        assert manager.get_tokenizer_cache().l2 is None
+        assert not manager.get_normalization_cache()
@@ -0,0 +1,132 @@
+"""
+Unit tests for offline bulk screening.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.ai_service.core import bulk_screening
+from src.ai_service.core.bulk_screening import read_records, run_bulk_screening
+
+
+class _FakeOrchestrator:
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.batches = []
+
+    async def process_batch(self, texts, max_concurrent=None, **kwargs):
+        self.batches.append(list(texts))
+        return [
+            SimpleNamespace(
+                success=text != self.fail_on,
+                normalized_text=text.upper(),
+                language="uk",
+                processing_time=0.01,
+                errors=[] if text != self.fail_on else ["boom"],
+                decision=SimpleNamespace(risk=SimpleNamespace(value="low"), score=0.1, review_required=False),
+            )
+            for text in texts
+        ]
+
+
+@pytest.fixture
+def fake_factory():
+    orchestrator = _FakeOrchestrator(fail_on="bad")
+    with patch.object(
+        bulk_screening.OrchestratorFactory, "create_orchestrator", AsyncMock(return_value=orchestrator)
+    ):
+        yield orchestrator
+
+
+def _write_csv(path, rows):
+    path.write_text("payment_id,purpose\n" + "".join(f"{i},{t}\n" for i, t in rows), encoding="utf-8")
+
+
+class TestReadRecords:
+    def test_csv_columns(self, tmp_path):
+        path = tmp_path / "in.csv"
+        _write_csv(path, [("p1", "Іван Петренко"), ("p2", "ТОВ Ромашка")])
+        records = list(read_records(path, text_column="purpose", id_column="payment_id"))
+        assert records == [(0, "p1", "Іван Петренко", None), (1, "p2", "ТОВ Ромашка", None)]
+
+        with pytest.raises(ValueError):
+            list(read_records(path, text_column="missing"))
+
+    def test_jsonl_records(self, tmp_path):
+        path = tmp_path / "in.jsonl"
+        path.write_text('"a"\n\n{"id": 5, "text": "b"}\nnot json\n', encoding="utf-8")
+        records = list(read_records(path))
+        assert [r[:3] for r in records] == [(0, None, "a"), (1, 5, "b"), (2, None, None)]
+        assert records[2][3].startswith("Invalid JSON")
+
+
+class TestRunBulkScreening:
+    def test_in_process_run_writes_rows_in_order(self, tmp_path, fake_factory):
+        src = tmp_path / "in.csv"
+        _write_csv(src, [(f"p{i}", "bad" if i == 3 else f"name {i}") for i in range(7)])
+        out = tmp_path / "out.jsonl"
+
+        stats = run_bulk_screening(
+            src, out, workers=0, chunk_size=3, text_column="purpose", id_column="payment_id"
+        )
+
+        rows = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+        assert [r["id"] for r in rows] == [f"p{i}" for i in range(7)]
+        assert rows[0]["normalized_text"] == "NAME 0"
+        assert rows[0]["risk_level"] == "low"
+        assert rows[3]["success"] is False and rows[3]["errors"] == ["boom"]
+        assert stats["records"] == 7 and stats["chunks"] == 3
+        assert len(fake_factory.batches) == 3
+
+        checkpoint = json.loads((tmp_path / "out.jsonl.checkpoint.json").read_text())
+        assert checkpoint["chunks_done"] == 3
+        assert checkpoint["output_offset"] == out.stat().st_size
+
+    def test_resume_skips_done_chunks_and_truncates_tail(self, tmp_path, fake_factory):
+        src = tmp_path / "in.jsonl"
+        src.write_text("".join(json.dumps(f"name {i}") + "\n" for i in range(6)), encoding="utf-8")
+        out = tmp_path / "out.jsonl"
+        run_bulk_screening(src, out, workers=0, chunk_size=2)
+
+        # Simulate a crash after the first chunk with a partially written second chunk
+        lines = out.read_text(encoding="utf-8").splitlines(keepends=True)
+        first_chunk = "".join(lines[:2]).encode("utf-8")
+        checkpoint_path = tmp_path / "out.jsonl.checkpoint.json"
+        state = json.loads(checkpoint_path.read_text())
+        state.update(chunks_done=1, records_done=2, output_offset=len(first_chunk))
+        checkpoint_path.write_text(json.dumps(state))
+        out.write_bytes(first_chunk + b'{"index": 2, "trunc')
+        fake_factory.batches.clear()
+
+        stats = run_bulk_screening(src, out, workers=0, chunk_size=2, resume=True)
+
+        rows = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+        assert [r["index"] for r in rows] == list(range(6))
+        assert fake_factory.batches == [["name 2", "name 3"], ["name 4", "name 5"]]
+        assert stats["records_this_run"] == 4 and stats["records"] == 6
+
+    def test_resume_rejects_other_chunk_size(self, tmp_path, fake_factory):
+        src = tmp_path / "in.jsonl"
+        src.write_text('"a"\n"b"\n', encoding="utf-8")
+        out = tmp_path / "out.jsonl"
+        run_bulk_screening(src, out, workers=0, chunk_size=1)
+        with pytest.raises(ValueError):
+            run_bulk_screening(src, out, workers=0, chunk_size=2, resume=True)
+
+    @pytest.mark.parametrize("damage", ["missing", "truncated"])
+    def test_resume_rejects_missing_or_short_output(self, tmp_path, fake_factory, damage):
+        src = tmp_path / "in.jsonl"
+        src.write_text("".join(json.dumps(f"name {i}") + "\n" for i in range(4)), encoding="utf-8")
+        out = tmp_path / "out.jsonl"
+        run_bulk_screening(src, out, workers=0, chunk_size=2)
+        if damage == "missing":
+            out.unlink()
+        else:
+            out.write_bytes(out.read_bytes()[:10])
+
+        with pytest.raises(ValueError, match="Cannot resume"):
+            run_bulk_screening(src, out, workers=0, chunk_size=2, resume=True)
+        assert not out.exists() or b"\0" not in out.read_bytes()
@@ -624,5 +624,148 @@ class TestUnifiedOrchestratorEdgeCases:
         assert len(result.errors) > 0
 
 
+class TestHomoglyphPermutationSearch:
+    """Test concurrent homoglyph permutation search"""
+
+    @pytest.fixture
+    def orchestrator(self):
+        return UnifiedOrchestrator(
+            validation_service=Mock(),
+            language_service=Mock(),
+            unicode_service=Mock(),
+            normalization_service=Mock(),
+            signals_service=Mock(),
+            search_service=Mock(),
+        )
+
+    def test_modified_norm_result_is_shallow(self, orchestrator):
+        original = NormalizationResult(
+            normalized="Іван Петров", tokens=["Іван", "Петров"], trace=[], success=True
+        )
+        modified = orchestrator._create_modified_norm_result(original, "Петров Іван")
+
+        assert modified.normalized == "Петров Іван"
+        assert modified.tokens == ["Петров", "Іван"]
+        assert original.normalized == "Іван Петров"
+        assert original.tokens == ["Іван", "Петров"]
+        assert modified.trace is original.trace
+
+    @pytest.mark.asyncio
+    async def test_permutations_run_concurrently(self, orchestrator, monkeypatch):
+        import ai_service.core.unified_orchestrator as orchestrator_module
+
+        monkeypatch.setattr(orchestrator_module, "HOMOGLYPH_SEARCH_CONCURRENCY", 2)
+        in_flight = {"current": 0, "max": 0}
+
+        async def find_candidates(normalized, text, opts):
+            in_flight["current"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["current"])
+            await asyncio.sleep(0.01)
+            in_flight["current"] -= 1
+            if normalized.normalized == "bad":
+                raise RuntimeError("search failed")
+            return [normalized.normalized]
+
+        orchestrator.search_service.find_candidates = find_candidates
+        norm_result = NormalizationResult(normalized="a b", tokens=["a", "b"], trace=[], success=True)
+
+        results = await orchestrator._search_permutations(
+            norm_result, ["a b", "b a", "bad", "a"], "a b", None
+        )
+
+        assert results[:2] == [["a b"], ["b a"]]
+        assert isinstance(results[2], RuntimeError)
+        assert results[3] == ["a"]
+        assert in_flight["max"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_permutation_is_returned(self, orchestrator):
+        async def find_candidates(normalized, text, opts):
+            if normalized.normalized == "cancelled":
+                raise asyncio.CancelledError()
+            return [normalized.normalized]
+
+        orchestrator.search_service.find_candidates = find_candidates
+        norm_result = NormalizationResult(normalized="a b", tokens=["a", "b"], trace=[], success=True)
+
+        results = await orchestrator._search_permutations(norm_result, ["a b", "cancelled"], "a b", None)
+
+        # Not an Exception subclass: callers must check for BaseException
+        assert results[0] == ["a b"]
+        assert isinstance(results[1], asyncio.CancelledError)
+        assert not isinstance(results[1], Exception)
+
+
+class TestProcessBatch:
+    """Test concurrent batch processing"""
+
+    @pytest.fixture
+    def orchestrator(self):
+        embeddings_service = Mock()
+        embeddings_service.encode_batch = Mock(side_effect=lambda texts: [[float(len(t))] for t in texts])
+        return UnifiedOrchestrator(
+            validation_service=Mock(),
+            language_service=Mock(),
+            unicode_service=Mock(),
+            normalization_service=Mock(),
+            signals_service=Mock(),
+            embeddings_service=embeddings_service,
+            enable_embeddings=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order_with_errors(self, orchestrator):
+        in_flight = {"current": 0, "max": 0}
+
+        async def process(text, **kwargs):
+            assert kwargs["generate_embeddings"] is False
+            in_flight["current"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["current"])
+            await asyncio.sleep(0.01 * (5 - len(text)))
+            in_flight["current"] -= 1
+            if text == "bad":
+                raise ValueError("boom")
+            return UnifiedProcessingResult(
+                original_text=text, language="en", language_confidence=1.0,
+                normalized_text=text.upper(), success=True,
+            )
+
+        orchestrator.process = process
+        results = await orchestrator.process_batch(["a", "bb", "bad", "dddd"], max_concurrent=2)
+
+        assert [r.original_text for r in results] == ["a", "bb", "bad", "dddd"]
+        assert results[2].success is False
+        assert results[2].errors == ["boom"]
+        assert in_flight["max"] == 2
+
+        # One encode_batch call for all successful items
+        orchestrator.embeddings_service.encode_batch.assert_called_once_with(["A", "BB", "DDDD"])
+        assert [r.embeddings for r in results] == [[1.0], [2.0], None, [4.0]]
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_keeps_success(self, orchestrator):
+        async def process(text, **kwargs):
+            return UnifiedProcessingResult(
+                original_text=text, language="en", language_confidence=1.0,
+                normalized_text=text, success=True,
+            )
+
+        def generate_embeddings(text):
+            if text == "bad":
+                raise RuntimeError("model down")
+            return [1.0]
+
+        orchestrator.process = process
+        # A short batch forces the per-item fallback
+        orchestrator.embeddings_service.encode_batch = Mock(return_value=[[1.0]])
+        orchestrator.embeddings_service.generate_embeddings = generate_embeddings
+        results = await orchestrator.process_batch(["ok", "bad"])
+
+        assert [r.success for r in results] == [True, True]
+        assert results[0].embeddings == [1.0]
+        assert results[1].embeddings is None
+        assert results[1].errors == ["Embeddings: model down"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
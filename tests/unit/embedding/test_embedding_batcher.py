@@ -0,0 +1,115 @@
+"""
+Unit tests for the cross-request embedding micro-batcher.
+"""
+
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from src.ai_service.layers.embeddings.embedding_batcher import EmbeddingBatcher, EmbeddingBatchError
+from src.ai_service.layers.search.config import HybridSearchConfig
+from src.ai_service.layers.search.hybrid_search_service import HybridSearchService
+
+
+def _encode(texts):
+    return [[float(len(text)), 1.0] for text in texts]
+
+
+class TestEmbeddingBatcher:
+    @pytest.mark.asyncio
+    async def test_concurrent_texts_share_one_encode(self):
+        encode = Mock(side_effect=_encode)
+        batcher = EmbeddingBatcher(encode, max_batch_size=10, window_ms=5)
+
+        vectors = await asyncio.gather(*(batcher.embed("x" * i) for i in range(1, 5)))
+
+        assert vectors == [[1.0, 1.0], [2.0, 1.0], [3.0, 1.0], [4.0, 1.0]]
+        encode.assert_called_once_with(["x", "xx", "xxx", "xxxx"])
+        assert batcher.get_stats()["largest_batch"] == 4
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_immediately(self):
+        encode = Mock(side_effect=_encode)
+        batcher = EmbeddingBatcher(encode, max_batch_size=2, window_ms=10_000)
+
+        await asyncio.wait_for(asyncio.gather(*(batcher.embed(str(i)) for i in range(4))), timeout=1)
+
+        assert encode.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_duplicate_texts_encoded_once(self):
+        encode = Mock(side_effect=_encode)
+        batcher = EmbeddingBatcher(encode, window_ms=1)
+
+        first, second = await asyncio.gather(batcher.embed("ivan"), batcher.embed("ivan"))
+
+        assert first == second == [4.0, 1.0]
+        encode.assert_called_once_with(["ivan"])
+        assert batcher.stats["requests"] == 2
+        assert batcher.stats["encoded_texts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_encode_error_fails_whole_batch(self):
+        batcher = EmbeddingBatcher(Mock(side_effect=RuntimeError("model down")), window_ms=1)
+
+        results = await asyncio.gather(batcher.embed("a"), batcher.embed("b"), return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert batcher.stats["failed_batches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_encode_cancels_callers(self):
+        started, release = threading.Event(), threading.Event()
+
+        def stall(texts):
+            started.set()
+            release.wait(5)
+            return _encode(texts)
+
+        batcher = EmbeddingBatcher(stall, window_ms=1)
+        callers = asyncio.gather(batcher.embed("a"), batcher.embed("b"), return_exceptions=True)
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 1)
+            for task in list(batcher._inflight):
+                task.cancel()
+
+            results = await asyncio.wait_for(callers, timeout=1)
+        finally:
+            release.set()
+
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+        assert batcher.stats["failed_batches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_vector_fails_only_that_text(self):
+        batcher = EmbeddingBatcher(lambda texts: [[1.0], []], window_ms=1)
+
+        ok, missing = await asyncio.gather(batcher.embed("a"), batcher.embed("b"), return_exceptions=True)
+
+        assert ok == [1.0]
+        assert isinstance(missing, EmbeddingBatchError)
+
+
+@pytest.mark.asyncio
+async def test_hybrid_query_vectors_use_one_batched_encode():
+    config = HybridSearchConfig(enable_embedding_cache=False)
+    service = HybridSearchService(config)
+    embedding_service = Mock()
+    embedding_service.get_embeddings_optimized.side_effect = lambda texts, **kwargs: {
+        "success": True,
+        "embeddings": [[1.0] + [0.0] * 383 for _ in texts],
+    }
+    service._embedding_service = embedding_service
+    service._embedding_service_checked = True
+
+    normalized = [Mock(normalized=name) for name in ("ivan petrov", "anna ivanova", "petro ivanenko")]
+    vectors = await asyncio.gather(*(service._build_query_vector(n, n.normalized) for n in normalized))
+
+    assert all(vector[0] == pytest.approx(1.0) for vector in vectors)
+    embedding_service.get_embeddings_optimized.assert_called_once()
+    texts = embedding_service.get_embeddings_optimized.call_args.args[0]
+    assert len(texts) == 3
+    stats = await service.get_embedding_cache_stats()
+    assert stats["batching"]["encode_calls"] == 1
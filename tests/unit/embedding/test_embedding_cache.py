@@ -0,0 +1,102 @@
+"""
+Unit tests for the float32 LRU embedding cache.
+"""
+
+import numpy as np
+import pytest
+
+from src.ai_service.layers.embeddings.embedding_cache import (
+    EmbeddingCache,
+    get_embedding_cache,
+    reset_embedding_cache,
+)
+from src.ai_service.layers.embeddings.optimized_embedding_service import OptimizedEmbeddingService
+
+
+def test_round_trip_as_float32():
+    cache = EmbeddingCache(4)
+
+    assert cache.put("ivan", [0.1, 0.2, 0.3])
+    vector = cache.get("ivan")
+
+    assert vector.dtype == np.float32
+    assert vector.tolist() == pytest.approx([0.1, 0.2, 0.3])
+    assert cache.get("petro") is None
+    assert cache.get_stats()["memory_bytes"] == 4 * 3 * 4 + 4 * 8
+
+
+def test_least_recently_used_is_evicted():
+    cache = EmbeddingCache(2)
+    cache.put("a", [1.0])
+    cache.put("b", [2.0])
+    cache.get("a")  # "b" is now the oldest
+
+    cache.put("c", [3.0])
+
+    assert cache.get("b") is None
+    assert cache.get("a").tolist() == [1.0]
+    assert cache.get("c").tolist() == [3.0]
+    assert cache.get_stats()["evictions"] == 1
+    assert len(cache) == 2
+
+
+def test_namespaces_and_hash_colliding_texts_are_separate(monkeypatch):
+    cache = EmbeddingCache(4)
+    cache.put("text", [1.0], namespace="model-a")
+    cache.put("text", [2.0], namespace="model-b")
+    # Integers equal to -1 and -2 share a hash; keys must not
+    assert hash(-1) == hash(-2)
+    cache.put(str(-1), [3.0])
+    cache.put(str(-2), [4.0])
+
+    assert cache.get("text", namespace="model-a").tolist() == [1.0]
+    assert cache.get("text", namespace="model-b").tolist() == [2.0]
+    assert cache.get("-1").tolist() == [3.0]
+    assert cache.get("-2").tolist() == [4.0]
+
+
+def test_ttl_and_dimension_mismatch(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("src.ai_service.layers.embeddings.embedding_cache.time.monotonic", lambda: now[0])
+    cache = EmbeddingCache(2, dimension=2, ttl_seconds=10)
+
+    assert not cache.put("short", [1.0])
+    cache.put("ivan", [1.0, 2.0])
+    now[0] += 11
+
+    assert cache.get("ivan") is None
+    stats = cache.get_stats()
+    assert stats["expirations"] == 1 and stats["rejected"] == 1 and stats["size"] == 0
+    # The expired row is reused
+    cache.put("a", [1.0, 1.0])
+    cache.put("b", [2.0, 2.0])
+    assert cache.get_stats()["evictions"] == 0
+
+
+def test_optimized_service_reports_cache_stats():
+    service = OptimizedEmbeddingService(max_cache_size=10, precompute_common_patterns=False)
+    service._cache_embedding("ivan", "model", [0.5, 0.5])
+
+    assert service._get_cached_embedding("ivan", "model") == [0.5, 0.5]
+    assert service._get_cached_embedding("ivan", "other-model") is None
+    metrics = service.get_performance_metrics()
+    assert metrics["cache_hit_rate"] == 0.5
+    assert metrics["embedding_cache"]["size"] == 1
+
+
+def test_services_share_the_process_cache(monkeypatch):
+    monkeypatch.setenv("EMBEDDING_CACHE_SIZE", "8")
+    reset_embedding_cache()
+    try:
+        cache = get_embedding_cache()
+        first = OptimizedEmbeddingService(precompute_common_patterns=False)
+        second = OptimizedEmbeddingService(precompute_common_patterns=False)
+
+        assert first.embedding_cache is cache and second.embedding_cache is cache
+        assert cache.capacity == 8 and first.max_cache_size == 8
+        first._cache_embedding("ivan", "model", [0.5, 0.5])
+        assert second._get_cached_embedding("ivan", "model") == [0.5, 0.5]
+        # An explicit size gets a private cache
+        assert OptimizedEmbeddingService(max_cache_size=4, precompute_common_patterns=False).embedding_cache is not cache
+    finally:
+        reset_embedding_cache()
@@ -0,0 +1,110 @@
+"""
+Unit tests for the persistent watchlist embedding store.
+"""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.ai_service.layers.embeddings.indexing.embedding_store import EmbeddingStore
+from src.ai_service.layers.embeddings.indexing.enhanced_vector_index_service import (
+    EnhancedVectorIndex,
+    EnhancedVectorIndexConfig,
+)
+
+
+def _encode(texts):
+    return np.array([[len(text), text.count(" ") + 1.0, 1.0] for text in texts], dtype=np.float32)
+
+
+def test_round_trip_and_reopen(tmp_path):
+    path = tmp_path / "names.embstore"
+    store = EmbeddingStore(path, "model@torch")
+    first = store.get_or_encode(["Ivan Petrov", "ТОВ Ромашка"], _encode)
+    assert store.save()["added"] == 2
+
+    reopened = EmbeddingStore(path, "model@torch")
+    encode = Mock(side_effect=_encode)
+    again = reopened.get_or_encode(["ТОВ Ромашка", "Ivan Petrov"], encode)
+
+    encode.assert_not_called()
+    np.testing.assert_array_equal(again, first[::-1])
+    assert len(reopened) == 2 and reopened.dimension == 3
+
+
+def test_only_missing_texts_are_encoded(tmp_path):
+    path = tmp_path / "names.embstore"
+    store = EmbeddingStore(path, "model@torch")
+    store.get_or_encode(["Ivan Petrov", "Anna Ivanova"], _encode)
+    store.save()
+
+    encode = Mock(side_effect=_encode)
+    vectors = store.get_or_encode(["Anna Ivanova", "Petro Ivanenko", "Petro Ivanenko", "Ivan Petrov"], encode)
+
+    encode.assert_called_once_with(["Petro Ivanenko"])
+    np.testing.assert_array_equal(vectors, _encode(["Anna Ivanova", "Petro Ivanenko", "Petro Ivanenko", "Ivan Petrov"]))
+    assert store.stats["hits"] == 2 and store.stats["misses"] == 4  # two misses on the first call
+
+    store.save()
+    assert len(EmbeddingStore(path, "model@torch")) == 3
+
+
+def test_other_model_version_starts_empty(tmp_path):
+    path = tmp_path / "names.embstore"
+    store = EmbeddingStore(path, "model@torch")
+    store.get_or_encode(["Ivan Petrov"], _encode)
+    store.save()
+
+    other = EmbeddingStore(path, "model@onnx_int8")
+    encode = Mock(side_effect=_encode)
+    other.get_or_encode(["Ivan Petrov"], encode)
+
+    assert len(other) == 1
+    encode.assert_called_once()
+    assert other.make_key("Ivan Petrov") != store.make_key("Ivan Petrov")
+
+
+def test_whitespace_is_normalized_case_is_kept(tmp_path):
+    store = EmbeddingStore(tmp_path / "names.embstore", "model@torch")
+    assert store.make_key("  Ivan \t Petrov ") == store.make_key("Ivan Petrov")
+    assert store.make_key("ivan petrov") != store.make_key("Ivan Petrov")
+
+    encode = Mock(side_effect=_encode)
+    store.get_or_encode(["Ivan  Petrov", "Ivan Petrov"], encode)
+    encode.assert_called_once_with(["Ivan Petrov"])
+
+
+def test_unreadable_file_is_ignored(tmp_path):
+    path = tmp_path / "names.embstore"
+    path.write_bytes(b"not a store")
+
+    store = EmbeddingStore(path, "model@torch")
+    assert len(store) == 0
+    store.get_or_encode(["Ivan Petrov"], _encode)
+    store.save()
+    assert len(EmbeddingStore(path, "model@torch")) == 1
+
+
+def test_index_rebuild_encodes_only_new_names(tmp_path):
+    config = EnhancedVectorIndexConfig(
+        use_faiss=False,
+        enable_hybrid_search=False,
+        embedding_store_path=str(tmp_path / "watchlist.embstore"),
+    )
+    index = EnhancedVectorIndex(config)
+    embedding_service = Mock(backend=None)
+    embedding_service.get_embeddings_optimized.side_effect = lambda texts, **kwargs: {
+        "success": True,
+        "embeddings": _encode(texts).tolist(),
+    }
+    index.embedding_service = embedding_service
+
+    index.rebuild([("d1", "Ivan Petrov"), ("d2", "Anna Ivanova")])
+    index.rebuild([("d1", "Ivan Petrov"), ("d2", "Anna Ivanova"), ("d3", "Petro Ivanenko")])
+
+    calls = embedding_service.get_embeddings_optimized.call_args_list
+    assert [call.args[0] for call in calls] == [["Ivan Petrov", "Anna Ivanova"], ["Petro Ivanenko"]]
+    assert index.semantic_embeddings.shape == (3, 3)
+    assert index.semantic_embeddings[2] == pytest.approx(_encode(["Petro Ivanenko"])[0] / np.linalg.norm(_encode(["Petro Ivanenko"])[0]))
+    assert index.get_index_statistics()["embedding_store"]["stored"] == 3
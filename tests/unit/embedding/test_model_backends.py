@@ -0,0 +1,142 @@
+"""
+Unit tests for the int8 embedding backends and their fp32 parity check.
+"""
+
+import sys
+import types
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.ai_service.layers.embeddings.models import embedding_model_manager
+from src.ai_service.layers.embeddings.models.embedding_model_manager import EmbeddingModelManager
+from src.ai_service.layers.embeddings.models import model_backends
+from src.ai_service.layers.embeddings.models.model_backends import embedding_parity, load_sentence_transformer
+from src.ai_service.layers.embeddings.models.model_config import (
+    DEFAULT_MODELS,
+    ModelBackend,
+    ModelConfig,
+    get_model_config,
+)
+
+
+def _fake_sentence_transformers(onnx_noise, onnx_runtime=True):
+    """sentence_transformers stand-in whose ONNX models add ``onnx_noise`` to fp32 vectors."""
+    loads = []
+
+    class FakeSentenceTransformer:
+        def __init__(self, model_path, device="cpu", cache_folder=None, backend="torch", model_kwargs=None):
+            self.backend = backend
+            self.model_kwargs = model_kwargs
+            loads.append(self)
+
+        def encode(self, texts, **kwargs):
+            vectors = np.array([[len(text), text.count(" ") + 1.0, 1.0] for text in texts])
+            if self.backend == "onnx":
+                vectors = vectors + onnx_noise
+            return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    modules = {"sentence_transformers": types.SimpleNamespace(SentenceTransformer=FakeSentenceTransformer)}
+    # None makes the import raise ImportError
+    optimum = types.ModuleType("optimum") if onnx_runtime else None
+    modules.update({
+        "onnxruntime": types.ModuleType("onnxruntime") if onnx_runtime else None,
+        "optimum": optimum,
+        "optimum.onnxruntime": types.ModuleType("optimum.onnxruntime") if onnx_runtime else None,
+    })
+    return patch.dict(sys.modules, modules), loads
+
+
+def test_embedding_parity():
+    reference = [[1.0, 0.0], [0.0, 1.0]]
+
+    assert embedding_parity(reference, reference, 0.99)["passed"]
+
+    report = embedding_parity(reference, [[1.0, 0.0], [1.0, 1.0]], 0.99)
+    assert report["min_cosine"] == pytest.approx(2 ** -0.5)
+    assert report["mean_cosine"] == pytest.approx((1 + 2 ** -0.5) / 2)
+    assert not report["passed"]
+    assert not embedding_parity(reference, [[1.0, 0.0]], 0.5)["passed"]
+
+
+def test_backend_selection(monkeypatch):
+    monkeypatch.delenv("EMBEDDING_BACKEND", raising=False)
+    assert get_model_config("english").backend == ModelBackend.TORCH
+    assert get_model_config("english", "onnx_int8").backend == ModelBackend.ONNX_INT8
+
+    monkeypatch.setenv("EMBEDDING_BACKEND", "torch_int8")
+    assert get_model_config("some/model").backend == ModelBackend.TORCH_INT8
+    # Predefined configs are copied, not modified
+    assert DEFAULT_MODELS["english"].backend == ModelBackend.TORCH
+
+    with pytest.raises(ValueError):
+        ModelConfig(name="m", backend="int4")
+
+
+def test_onnx_int8_within_parity_is_used():
+    modules, loads = _fake_sentence_transformers(onnx_noise=0.01)
+    with modules:
+        model, report = load_sentence_transformer(
+            "m", ModelConfig(name="m", backend="onnx_int8", onnx_quantization="avx512_vnni")
+        )
+
+    assert model.backend == "onnx"
+    assert model.model_kwargs == {"file_name": "onnx/model_qint8_avx512_vnni.onnx"}
+    assert report["passed"] and report["backend"] == "onnx_int8"
+    assert report["min_cosine"] > 0.99
+    assert len(loads) == 2  # fp32 reference and the int8 model
+
+
+def test_onnx_int8_failing_parity_falls_back_to_fp32():
+    modules, _ = _fake_sentence_transformers(onnx_noise=np.array([0.0, 0.0, 25.0]))
+    with modules:
+        model, report = load_sentence_transformer("m", ModelConfig(name="m", backend="onnx_int8"))
+
+    assert model.backend == "torch"
+    assert not report["passed"]
+    assert report["fallback"] == "torch"
+
+
+def test_onnx_int8_without_onnx_runtime_falls_back_to_fp32():
+    modules, loads = _fake_sentence_transformers(onnx_noise=0.01, onnx_runtime=False)
+    with modules:
+        model, report = load_sentence_transformer("m", ModelConfig(name="m", backend="onnx_int8"))
+
+    assert model.backend == "torch"
+    assert not report["passed"] and report["fallback"] == "torch"
+    assert "onnx" in report["error"]
+    assert len(loads) == 1
+
+
+def test_onnx_quantization_is_detected(monkeypatch):
+    modules, _ = _fake_sentence_transformers(onnx_noise=0.01)
+    monkeypatch.setattr(model_backends, "detect_onnx_quantization", lambda: "avx2")
+    with modules:
+        model, _ = load_sentence_transformer("m", ModelConfig(name="m", backend="onnx_int8"))
+    assert model.model_kwargs == {"file_name": "onnx/model_qint8_avx2.onnx"}
+
+    monkeypatch.setattr(model_backends, "detect_onnx_quantization", lambda: None)
+    with modules:
+        model, report = load_sentence_transformer("m", ModelConfig(name="m", backend="onnx_int8"))
+    assert model.backend == "torch" and report["fallback"] == "torch"
+
+    monkeypatch.setenv("EMBEDDING_ONNX_QUANTIZATION", "arm64")
+    assert get_model_config("english").onnx_quantization == "arm64"
+
+
+def test_model_manager_reports_parity(monkeypatch):
+    modules, _ = _fake_sentence_transformers(onnx_noise=0.01)
+    # Availability is cached per process; an earlier test may have cached "missing"
+    monkeypatch.setattr(embedding_model_manager, "SENTENCE_TRANSFORMERS_AVAILABLE", None)
+    manager = EmbeddingModelManager(enable_gpu=False)
+    try:
+        with modules:
+            manager.get_model("m", ModelConfig(name="m", backend="onnx_int8"))
+            manager.get_model("plain", ModelConfig(name="plain"))
+
+        assert manager.get_model_info("m")["backend"] == "onnx_int8"
+        assert manager.get_model_info("m")["parity"]["passed"]
+        assert manager.get_model_info("plain")["parity"] is None
+    finally:
+        manager.shutdown()
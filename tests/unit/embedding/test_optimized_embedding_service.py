@@ -60,7 +60,7 @@ class TestOptimizedEmbeddingService:
 
         # Should now be cached
         cached = optimized_service._get_cached_embedding(text, model)
-        assert cached == embedding
+        assert cached == pytest.approx(embedding)  # stored as float32
 
     def test_cache_lru_eviction(self):
         """Test LRU cache eviction when cache is full"""
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Tests for the precomputed morphology lexicon.
+
+Parses served from the lexicon must be identical to what pymorphy3 returns
+through ``MorphologyAdapter._parse_uncached``.
+"""
+
+import pytest
+
+from src.ai_service.layers.normalization.morphology_adapter import MorphologyAdapter, MorphParse
+from src.ai_service.layers.normalization import morphology_lexicon
+from src.ai_service.layers.normalization.morphology_lexicon import (
+    MorphologyLexicon,
+    analyzer_metadata,
+    get_morphology_lexicon,
+)
+
+
+PARSES = {
+    ("Петренка", "uk"): [
+        MorphParse(normal="петренко", tag="NOUN,Surn,masc,anim gent", score=0.5, case="gent", gender="masc", nominative="петренко"),
+        MorphParse(normal="петренко", tag="NOUN,Surn,masc,anim accs", score=0.5, case="accs", gender="masc", nominative="петренко"),
+    ],
+    ("Іванович", "uk"): [
+        MorphParse(normal="іванович", tag="NOUN,Patr,masc,anim nomn", score=1.0, case="nomn", gender="masc", nominative="іванович"),
+    ],
+    ("ёлка", "ru"): [
+        MorphParse(normal="ёлка", tag="NOUN,inan,femn sing,nomn", score=1.0 / 3, case="nomn", gender="femn", nominative=None),
+    ],
+    ("ыыы", "ru"): [],
+}
+
+
+@pytest.fixture
+def lexicon():
+    return MorphologyLexicon().build((token, lang, parses) for (token, lang), parses in PARSES.items())
+
+
+class TestMorphologyLexicon:
+    """Test lexicon build, lookup and mmap round trip."""
+
+    def test_lookup(self, lexicon):
+        for (token, lang), parses in PARSES.items():
+            assert lexicon.lookup(token, lang) == parses
+            assert lexicon.lookup(token.lower(), lang) == parses
+
+        assert lexicon.lookup("Петренка", "ru") is None
+        assert lexicon.lookup("ПЕТРЕНКА", "uk") is None
+        assert lexicon.lookup("невідомий", "uk") is None
+        assert len(lexicon) == 4
+
+    def test_patronymic_flag(self, lexicon):
+        assert lexicon.is_patronymic("Іванович", "uk") is True
+        assert lexicon.is_patronymic("Петренка", "uk") is False
+        assert lexicon.is_patronymic("невідомий", "uk") is None
+
+    def test_mmap_round_trip(self, lexicon, tmp_path):
+        path = tmp_path / "names.mlex"
+        lexicon.save(path, version="test", metadata={"pymorphy3": "x"})
+        mapped = MorphologyLexicon.load(path)
+
+        assert mapped.is_mapped
+        assert mapped.version == "test"
+        assert mapped.metadata == {"pymorphy3": "x"}
+        for (token, lang), parses in PARSES.items():
+            assert mapped.lookup(token, lang) == parses
+        assert mapped.lookup("невідомий", "uk") is None
+        assert mapped.get_stats()["hits"] == len(PARSES)
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "bogus.mlex"
+        path.write_bytes(b"not a lexicon at all")
+        with pytest.raises(ValueError):
+            MorphologyLexicon.load(path)
+
+
+class TestAnalyzerVersions:
+    """A lexicon built with other pymorphy3 or dictionary versions is not used."""
+
+    @pytest.fixture
+    def load_default(self, lexicon, tmp_path, monkeypatch):
+        pytest.importorskip("pymorphy3")
+        path = tmp_path / "names.mlex"
+        monkeypatch.setenv("MORPHOLOGY_LEXICON_PATH", str(path))
+
+        def load(metadata):
+            lexicon.save(path, version="test", metadata=metadata)
+            monkeypatch.setattr(morphology_lexicon, "_default_lexicon", None)
+            monkeypatch.setattr(morphology_lexicon, "_default_lexicon_loaded", False)
+            return get_morphology_lexicon()
+
+        return load
+
+    def test_matching_versions_are_used(self, load_default):
+        assert load_default(analyzer_metadata()) is not None
+
+    def test_other_pymorphy3_is_ignored(self, load_default):
+        metadata = analyzer_metadata()
+        metadata["pymorphy3"] = "0.0.1"
+        assert load_default(metadata) is None
+
+    def test_other_dictionary_is_ignored(self, load_default):
+        metadata = analyzer_metadata()
+        if not metadata["dictionaries"]:
+            pytest.skip("no pymorphy3 dictionaries installed")
+        lang = next(iter(metadata["dictionaries"]))
+        metadata["dictionaries"][lang] = {**metadata["dictionaries"][lang], "source_version": "0.0"}
+        assert load_default(metadata) is None
+
+
+class TestAdapterWithLexicon:
+    """Test MorphologyAdapter consults the lexicon before pymorphy3."""
+
+    def test_lexicon_parses_are_used(self, lexicon):
+        adapter = MorphologyAdapter(lexicon=lexicon)
+
+        assert adapter.parse("Петренка", "uk") == PARSES[("Петренка", "uk")]
+        assert adapter.get_cache_stats()["lexicon_hits"] == 1
+
+    def test_without_lexicon(self):
+        adapter = MorphologyAdapter()
+        assert adapter.lexicon is None
+        assert adapter.get_cache_stats()["lexicon_hits"] == 0
+
+    def test_matches_pymorphy(self):
+        pytest.importorskip("pymorphy3")
+        plain = MorphologyAdapter()
+        tokens = [
+            ("Петренка", "uk"), ("Олександра", "uk"), ("Іванівною", "uk"), ("Коваленку", "uk"),
+            ("Иванову", "ru"), ("Сергеевича", "ru"), ("Анной", "ru"), ("Пушкиным", "ru"),
+        ]
+        lexicon = MorphologyLexicon().build(
+            (token, lang, plain._parse_uncached(token, lang)) for token, lang in tokens
+        )
+        adapter = MorphologyAdapter(lexicon=lexicon)
+
+        for token, lang in tokens:
+            assert adapter._parse_uncached(token, lang) == plain._parse_uncached(token, lang)
+            assert adapter.to_nominative(token, lang) == plain.to_nominative(token, lang)
+            assert adapter.detect_gender(token, lang) == plain.detect_gender(token, lang)
+        assert lexicon.stats["hits"] > 0
+
+    def test_cased_variants_match_pymorphy(self):
+        pytest.importorskip("pymorphy3")
+        plain = MorphologyAdapter()
+        words = [("а", "ru"), ("б", "ru"), ("и", "uk"), ("і", "uk"), ("иванов", "ru"), ("петренка", "uk")]
+        # Built the way scripts/build_morphology_lexicon.py does: lowercase tokens
+        lexicon = MorphologyLexicon().build(
+            (word, lang, plain._parse_uncached(word, lang)) for word, lang in words
+        )
+        adapter = MorphologyAdapter(lexicon=lexicon)
+
+        for word, lang in words:
+            for token in {word, word.capitalize(), word.upper()}:
+                assert adapter._parse_uncached(token, lang) == plain._parse_uncached(token, lang), token
+        # Initials keep their Name,Abbr,Init readings
+        assert any("Init" in parse.tag for parse in adapter._parse_uncached("А", "ru"))
+
+
+class TestNominativeFlagsCacheBound:
+    """The flag-aware nominative cache must not grow without limit."""
+
+    def test_bounded(self):
+        from src.ai_service.utils.feature_flags import FeatureFlags
+
+        adapter = MorphologyAdapter(cache_size=5)
+        for i in range(20):
+            adapter.to_nominative_cached(f"Тест{i}", "ru", FeatureFlags())
+
+        assert adapter.get_cache_stats()["nominative_flags_cache_size"] <= 5
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the batched spaCy NER gateway.
+
+A minimal stand-in pipeline is used so the tests do not need spaCy models.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import types
+from types import SimpleNamespace
+
+import pytest
+
+from src.ai_service.layers.normalization.ner_gateways.batched_spacy_gateway import BatchedSpacyGateway
+from src.ai_service.layers.normalization.ner_gateways.unified_spacy_gateway import (
+    SupportedLanguage,
+    UnifiedSpacyGateway,
+    load_ner_model,
+)
+
+
+class FakePipeline:
+    """Tags every capitalized word as a person."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.pipe_calls = []
+        self.pipe_names = ["tok2vec", "morphologizer", "parser", "lemmatizer", "ner"]
+        self.disabled = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, text):
+        return self._doc(text)
+
+    def pipe(self, texts, batch_size=None):
+        texts = list(texts)
+        self.pipe_calls.append((texts, batch_size))
+        self.release.wait(5)
+        time.sleep(self.delay)
+        return [self._doc(text) for text in texts]
+
+    def select_pipes(self, disable):
+        self.disabled = list(disable)
+
+    @staticmethod
+    def _doc(text):
+        ents, start = [], 0
+        for word in text.split():
+            start = text.index(word, start)
+            if word[0].isupper():
+                ents.append(SimpleNamespace(text=word, label_="PER", start_char=start, end_char=start + len(word)))
+            start += len(word)
+        return SimpleNamespace(ents=ents)
+
+
+def make_gateway(nlp, **kwargs):
+    gateway = UnifiedSpacyGateway()
+    gateway._models[SupportedLanguage.UKRAINIAN] = nlp
+    gateway._availability[SupportedLanguage.UKRAINIAN] = True
+    gateway._models[SupportedLanguage.RUSSIAN] = None
+    gateway._availability[SupportedLanguage.RUSSIAN] = False
+    return BatchedSpacyGateway(gateway, **kwargs)
+
+
+class TestBatchedSpacyGateway:
+    """Test request batching, time budget and fallbacks."""
+
+    def test_concurrent_requests_share_one_pipe_call(self):
+        nlp = FakePipeline()
+        batched = make_gateway(nlp, batch_size=8, max_wait_ms=50, time_budget_ms=2000)
+        texts = [f"платіж Іван{i} Петренко" for i in range(5)]
+
+        async def run():
+            return await asyncio.gather(
+                *(batched.extract_entities_async(text, SupportedLanguage.UKRAINIAN) for text in texts)
+            )
+
+        results = asyncio.run(run())
+        batched.shutdown(5)
+
+        assert len(nlp.pipe_calls) == 1
+        assert nlp.pipe_calls[0] == (texts, 8)
+        for i, entities in enumerate(results):
+            assert [e.text for e in entities] == [f"Іван{i}", "Петренко"]
+            assert all(e.label == "PERSON" for e in entities)
+        assert batched.get_stats()["completed"] == 5
+
+    def test_batches_are_capped(self):
+        nlp = FakePipeline()
+        nlp.release.clear()
+        batched = make_gateway(nlp, batch_size=2, max_wait_ms=20, time_budget_ms=2000)
+
+        futures = [batched.submit(f"Іван{i}", SupportedLanguage.UKRAINIAN) for i in range(5)]
+        nlp.release.set()
+        results = [future.result(5) for future in futures]
+        batched.shutdown(5)
+
+        assert all(len(texts) <= 2 for texts, _ in nlp.pipe_calls)
+        assert [entities[0].text for entities in results] == [f"Іван{i}" for i in range(5)]
+
+    def test_time_budget(self):
+        nlp = FakePipeline(delay=0.3)
+        batched = make_gateway(nlp, time_budget_ms=20)
+
+        start = time.perf_counter()
+        assert batched.extract_entities("Іван Петренко", SupportedLanguage.UKRAINIAN) == []
+        assert asyncio.run(batched.get_ner_hints_async("Іван Петренко", SupportedLanguage.UKRAINIAN)).persons == set()
+        assert time.perf_counter() - start < 0.25
+        assert batched.get_stats()["timeouts"] == 2
+        batched.shutdown(5)
+
+    def test_unavailable_model_and_empty_text(self):
+        batched = make_gateway(FakePipeline())
+
+        assert batched.extract_entities("Иван Петров", SupportedLanguage.RUSSIAN) == []
+        assert batched.extract_entities("  ", SupportedLanguage.UKRAINIAN) == []
+        assert batched.get_stats()["workers"] == []
+
+    def test_hints(self):
+        batched = make_gateway(FakePipeline(), time_budget_ms=2000)
+
+        hints = asyncio.run(batched.get_ner_hints_async("Іван Петренко", SupportedLanguage.UKRAINIAN))
+        batched.shutdown(5)
+
+        assert hints.persons == {"іван", "петренко"}
+        assert hints.organizations == set()
+
+
+class TestNerModelLoading:
+    """Test that unused pipes are disabled for NER."""
+
+    def test_parser_and_lemmatizer_disabled(self, monkeypatch):
+        nlp = FakePipeline()
+        monkeypatch.setitem(sys.modules, "spacy", types.SimpleNamespace(load=lambda name: nlp))
+
+        assert load_ner_model("uk_core_news_sm") is nlp
+        assert nlp.disabled == ["parser", "lemmatizer"]
+
+    def test_batch_extraction_matches_single(self):
+        gateway = make_gateway(FakePipeline()).gateway
+        texts = ["Іван Петренко", "", "оплата ТОВ Ромашка"]
+
+        batch = gateway.extract_entities_batch(texts, SupportedLanguage.UKRAINIAN)
+
+        assert batch == [gateway.extract_entities(text, SupportedLanguage.UKRAINIAN) for text in texts]
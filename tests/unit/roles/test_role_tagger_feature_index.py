@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for precomputed token feature bitmasks in the role tagger.
+
+The indexed FSM pass must produce exactly the same tags as the
+rule-by-rule lexicon checks it replaces.
+"""
+
+import random
+
+import pytest
+
+from src.ai_service.layers.normalization.role_tagger_service import (
+    RoleTaggerService, TokenFeature, TokenFeatureIndex
+)
+
+
+WORDS = [
+    "ТОВ", "ООО", "LLC", "РОМАШКА", "Іван", "Петров", "Иванович", "Петренко",
+    "И.", "А.", "оплата", "за", "и", "в", "з", "ТАРАС", "Ivan", "Petrov",
+    "1234567890", "инн", "ПАО", "Ltd", "СБЕРБАНК", "Коваленко", "Олегівна",
+    "по", "договору",
+]
+
+
+class TestTokenFeatureIndex:
+    """Test prefix-sum window queries."""
+
+    def test_window_count(self):
+        masks = [0, TokenFeature.LEGAL_FORM, 0, 0, 0, TokenFeature.LEGAL_FORM | TokenFeature.ALL_CAPS]
+        index = TokenFeatureIndex([int(m) for m in masks])
+
+        assert index.window_count(TokenFeature.LEGAL_FORM, 0, 1) == 1
+        assert index.window_count(TokenFeature.LEGAL_FORM, 3, 1) == 0
+        assert index.window_count(TokenFeature.LEGAL_FORM, 3, 3) == 2
+        assert index.window_count(TokenFeature.ALL_CAPS, 5, 3) == 1
+        assert index.window_count(TokenFeature.ALL_CAPS, 0, 3) == 0
+        assert index.has(5, TokenFeature.ALL_CAPS)
+        assert not index.has(0, TokenFeature.LEGAL_FORM)
+
+    def test_empty(self):
+        index = TokenFeatureIndex([])
+        assert len(index) == 0
+        assert index.window_count(TokenFeature.LEGAL_FORM, 0, 3) == 0
+
+
+class TestFeatureIndexParity:
+    """Indexed and unindexed FSM passes must agree."""
+
+    @pytest.fixture
+    def role_tagger(self):
+        return RoleTaggerService(strict_stopwords=True)
+
+    def _tag(self, tagger, tokens, lang, indexed):
+        token_objects = tagger._create_token_objects(tokens, lang)
+        if not indexed:
+            for token in token_objects:
+                token.feature_index = None
+        return [
+            (tag.role, tag.reason, tuple(tag.evidence), tag.state_from, tag.state_to)
+            for tag in tagger._process_with_fsm(token_objects)
+        ]
+
+    def test_features_computed(self, role_tagger):
+        tokens = role_tagger._create_token_objects(["ТОВ", "РОМАШКА", "И.", "Петренко"], "uk")
+
+        assert tokens[0].features & TokenFeature.LEGAL_FORM
+        assert tokens[1].features & TokenFeature.ALL_CAPS
+        assert tokens[2].features & TokenFeature.INITIAL
+        assert tokens[3].features & TokenFeature.SURNAME_SUFFIX
+        assert all(token.feature_index is tokens[0].feature_index for token in tokens)
+
+    def test_random_sequences_match(self, role_tagger):
+        rng = random.Random(7)
+        for _ in range(500):
+            tokens = [rng.choice(WORDS) for _ in range(rng.randint(1, 12))]
+            lang = rng.choice(["ru", "uk", "en"])
+            assert self._tag(role_tagger, tokens, lang, True) == self._tag(role_tagger, tokens, lang, False)
+
+    def test_two_surnames_with_latin_script(self, role_tagger):
+        role_tags = role_tagger.tag(["Liudmila", "Ulianova"], "ru")
+        assert len(role_tags) == 2
@@ -307,3 +307,39 @@ class TestRoleTaggerFSMEdgeCases:
         # Person names in org context should be marked as org
         assert role_tags[2].role == TokenRole.ORG
         assert role_tags[3].role == TokenRole.ORG
+
+
+class TestRoleTaggerNERHints:
+    """Test that spaCy NER hints fill in guessed roles."""
+
+    @staticmethod
+    def hints(persons=(), organizations=()):
+        from src.ai_service.layers.normalization.ner_gateways import NERHints
+        return NERHints(persons=set(persons), organizations=set(organizations), locations=set(), confidence=1.0)
+
+    def test_org_hint_overrides_positional_guess(self):
+        role_tagger = RoleTaggerService()
+        tokens = ["Приватбанк"]
+
+        assert role_tagger.tag(tokens, "uk")[0].role == TokenRole.GIVEN
+
+        tag = role_tagger.tag(tokens, "uk", ner_hints=self.hints(organizations={"приватбанк"}))[0]
+        assert tag.role == TokenRole.ORG
+        assert tag.reason == "ner_org"
+        assert "spacy_ner_org" in tag.evidence
+
+    def test_hints_do_not_override_rules(self):
+        role_tagger = RoleTaggerService()
+        tokens = ["переказ", "Шевчук"]
+        baseline = [tag.role for tag in role_tagger.tag(tokens, "uk")]
+
+        tags = role_tagger.tag(tokens, "uk", ner_hints=self.hints(persons={"переказ"}, organizations={"шевчук"}))
+        assert [tag.role for tag in tags] == baseline
+
+    def test_empty_hints_change_nothing(self):
+        role_tagger = RoleTaggerService()
+        tokens = ["Sunflower", "Holdings"]
+
+        without = [(tag.role, tag.reason) for tag in role_tagger.tag(tokens, "en")]
+        with_hints = [(tag.role, tag.reason) for tag in role_tagger.tag(tokens, "en", ner_hints=self.hints())]
+        assert with_hints == without
@@ -0,0 +1,78 @@
+"""
+Tests for the fuzzy blocking index and the indexed FuzzySearchService paths.
+"""
+
+import random
+
+import pytest
+
+from src.ai_service.layers.search.fuzzy_blocking_index import FuzzyBlockingIndex, name_trigrams
+from src.ai_service.layers.search.fuzzy_search_service import FuzzyConfig, FuzzySearchService
+
+pytest.importorskip("rapidfuzz")
+
+
+def _filler_names(count):
+    rng = random.Random(7)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return [
+        " ".join("".join(rng.choice(letters) for _ in range(rng.randint(5, 9))).title() for _ in range(2))
+        for _ in range(count)
+    ]
+
+
+@pytest.fixture
+def names():
+    # The sanctioned names sit beyond the old 20k truncation point
+    return _filler_names(25000) + ["Petrov Ivan Sergeevich", "Ковальчук Олена Петрівна"]
+
+
+def test_trigrams_ignore_case_diacritics_and_word_order():
+    assert name_trigrams("Ivan Petrov") == name_trigrams("PETROV ivan")
+    assert name_trigrams("José") == name_trigrams("jose")
+
+
+def test_shortlist_finds_misspelled_name(names):
+    index = FuzzyBlockingIndex(names)
+
+    shortlist = index.shortlist_names("Sergeevich Petrof Ivan", limit=50)
+
+    assert shortlist[0] == "Petrov Ivan Sergeevich"
+    assert len(shortlist) <= 50
+
+
+def test_shortlist_without_shared_trigrams_is_empty(names):
+    index = FuzzyBlockingIndex(names)
+
+    assert index.shortlist("1234567") == []
+
+
+@pytest.mark.asyncio
+async def test_indexed_search_covers_full_list(names):
+    service = FuzzySearchService(FuzzyConfig(max_candidates=1000))
+
+    unindexed = await service.search_async("Petrov Ivan Sergeevich", names)
+    service.build_index(names)
+    indexed = await service.search_async("Petrov Ivan Sergeevitch", names)
+
+    assert "Petrov Ivan Sergeevich" not in [r.matched_text for r in unindexed]
+    assert indexed[0].matched_text == "Petrov Ivan Sergeevich"
+    assert service.get_stats()["index"]["names"] == len(names)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("indexed", [True, False])
+async def test_search_many_matches_single_searches(names, indexed):
+    service = FuzzySearchService(FuzzyConfig(max_candidates=2000))
+    if indexed:
+        service.build_index(names)
+    queries = ["Petrov Ivan", "Коваьчук Олена", names[10], names[1500].lower(), "zzzz"]
+
+    batch = await service.search_many_async(queries, names)
+    single = [await service.search_async(query, names) for query in queries]
+
+    assert len(batch) == len(queries)
+    for batch_results, single_results in zip(batch, single):
+        assert [(r.matched_text, r.score, r.algorithm) for r in batch_results] == [
+            (r.matched_text, r.score, r.algorithm) for r in single_results
+        ]
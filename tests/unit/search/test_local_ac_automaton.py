@@ -0,0 +1,219 @@
+"""
+Unit tests for the in-process Aho-Corasick automaton.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.ai_service.contracts.base_contracts import NormalizationResult
+from src.ai_service.layers.search.config import HybridSearchConfig
+from src.ai_service.layers.search.contracts import SearchMode, SearchOpts
+from src.ai_service.layers.search.hybrid_search_service import HybridSearchService
+from src.ai_service.layers.search.ac_snapshot import ACSnapshotManager
+from src.ai_service.layers.search.local_ac_automaton import LocalACAutomaton, fold_for_ac
+
+
+@pytest.fixture
+def corpus():
+    return {
+        "patterns": [
+            {"pattern": "Порошенко Петро Олексійович", "tier": 0, "type": "full_name_canon",
+             "entity_id": "p1", "entity_type": "person", "confidence": 1.0,
+             "canonical": "Порошенко Петро Олексійович"},
+            {"pattern": "Petro Poroshenko", "tier": 1, "type": "transliteration",
+             "entity_id": "p1", "entity_type": "person", "confidence": 0.9,
+             "canonical": "Порошенко Петро Олексійович"},
+            {"pattern": "Порошенко", "tier": 3, "type": "surname_only",
+             "entity_id": "p1", "entity_type": "person", "confidence": 0.2,
+             "canonical": "Порошенко Петро Олексійович"},
+            {"pattern": "ООО Ромашка", "tier": 0, "type": "company_canon",
+             "entity_id": "c7", "entity_type": "organization", "confidence": 1.0,
+             "canonical": "ООО Ромашка"},
+            {"pattern": "2839403975", "tier": 0, "type": "tax_number",
+             "entity_id": "c7", "entity_type": "organization", "confidence": 1.0,
+             "canonical": "ООО Ромашка"},
+            {"pattern": "ab", "tier": 0, "type": "abbreviation",
+             "entity_id": "x", "entity_type": "person", "confidence": 1.0,
+             "canonical": "ab"},
+        ]
+    }
+
+
+@pytest.fixture
+def automaton(corpus):
+    return LocalACAutomaton.from_corpus(corpus)
+
+
+class TestLocalACAutomaton:
+    def test_fold_for_ac(self):
+        assert fold_for_ac("  O’Brien–Smith  ") == "o'brien-smith"
+
+    def test_build_skips_short_patterns(self, automaton):
+        stats = automaton.get_stats()
+        assert stats["patterns_total"] == 6
+        assert stats["patterns_indexed"] == 5
+        assert automaton.is_ready
+
+    def test_search_is_case_insensitive_and_word_bounded(self, automaton):
+        matches = automaton.search("оплата для ПОРОШЕНКО ПЕТРО ОЛЕКСІЙОВИЧ за послуги")
+        assert matches[0].tier == 0
+        assert matches[0].entity_id == "p1"
+        assert {m.tier for m in matches} == {0, 3}
+
+        # Substring inside a longer token must not match
+        assert automaton.search("Порошенкович") == []
+
+    def test_search_max_tier(self, automaton):
+        matches = automaton.search("Порошенко Петро Олексійович", max_tier=1)
+        assert [m.tier for m in matches] == [0]
+
+    def test_search_candidates_groups_by_entity(self, automaton):
+        opts = SearchOpts(top_k=10, ac_min_score=0.6)
+        candidates = automaton.search_candidates(
+            "ООО Ромашка ЄДРПОУ 2839403975, Petro Poroshenko", opts
+        )
+        by_id = {c.doc_id: c for c in candidates}
+        assert set(by_id) == {"c7", "p1"}
+        assert by_id["c7"].metadata["pattern_hits"] == 2
+        assert by_id["c7"].score == 1.0
+        assert by_id["p1"].metadata["tier"] == 1
+        assert all(c.search_mode == SearchMode.AC for c in candidates)
+
+    def test_search_candidates_filters(self, automaton):
+        # Tier 3 surname-only hit is below the AC minimum score
+        assert automaton.search_candidates("Порошенко", SearchOpts(ac_min_score=0.6)) == []
+
+        opts = SearchOpts(entity_types=["organization"])
+        candidates = automaton.search_candidates("ООО Ромашка, Petro Poroshenko", opts)
+        assert [c.doc_id for c in candidates] == ["c7"]
+
+    def test_from_file(self, tmp_path, corpus):
+        path = tmp_path / "patterns.json"
+        path.write_text(json.dumps(corpus, ensure_ascii=False), encoding="utf-8")
+        automaton = LocalACAutomaton.from_file(path)
+        assert len(automaton) == 5
+
+
+class TestACSnapshots:
+    def test_snapshot_roundtrip_is_mapped(self, tmp_path, automaton):
+        path = tmp_path / "ac.acsnap"
+        info = automaton.save_snapshot(path, version="v1")
+        assert info["version"] == "v1"
+
+        loaded = LocalACAutomaton.load_snapshot(path)
+        assert loaded.is_mapped
+        assert loaded.version == "v1"
+        assert len(loaded) == len(automaton)
+
+        text = "ООО Ромашка ЄДРПОУ 2839403975, Petro Poroshenko"
+        assert loaded.search(text) == automaton.search(text)
+        opts = SearchOpts()
+        assert [c.doc_id for c in loaded.search_candidates(text, opts)] == [
+            c.doc_id for c in automaton.search_candidates(text, opts)
+        ]
+
+    def test_load_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "bogus.acsnap"
+        path.write_bytes(b"not a snapshot at all")
+        with pytest.raises(ValueError):
+            LocalACAutomaton.load_snapshot(path)
+
+    def test_manager_publish_and_hot_swap(self, tmp_path, corpus):
+        manager = ACSnapshotManager(tmp_path / "snaps")
+        assert manager.reload() is False
+
+        manager.publish(LocalACAutomaton.from_corpus(corpus), version="v1")
+        assert manager.reload() is True
+        first = manager.current
+        assert manager.current_version == "v1"
+        assert manager.reload() is False  # pointer unchanged
+
+        corpus["patterns"].append(
+            {"pattern": "Іванов Іван", "tier": 0, "type": "full_name_canon",
+             "entity_id": "p9", "entity_type": "person", "confidence": 1.0}
+        )
+        manager.publish(LocalACAutomaton.from_corpus(corpus), version="v2")
+        assert manager.reload() is True
+        assert manager.current_version == "v2"
+        assert manager.current.search("Іванов Іван")[0].entity_id == "p9"
+
+        # The old reference stays usable for in-flight searches
+        assert first.search("Іванов Іван") == []
+
+    def test_manager_activate_and_prune(self, tmp_path, automaton):
+        manager = ACSnapshotManager(tmp_path)
+        for version in ("v1", "v2", "v3"):
+            manager.publish(automaton, version=version, keep=0)
+        manager.activate("v1")
+        assert manager.read_pointer() == "v1"
+
+        removed = manager.prune(keep=1)
+        assert removed == ["v2"]
+        assert manager.list_versions() == ["v1", "v3"]
+
+        with pytest.raises(FileNotFoundError):
+            manager.activate("v2")
+        with pytest.raises(ValueError):
+            manager.snapshot_path("../etc")
+
+
+class TestHybridSearchLocalAC:
+    @pytest.fixture
+    def normalized(self):
+        return NormalizationResult(
+            normalized="Petro Poroshenko",
+            tokens=["Petro", "Poroshenko"],
+            trace=[],
+            errors=[],
+            language="en",
+            confidence=0.9,
+            original_length=16,
+            normalized_length=16,
+            token_count=2,
+            processing_time=0.1,
+            success=True,
+        )
+
+    def _service(self, tmp_path, corpus, **overrides):
+        path = tmp_path / "patterns.json"
+        path.write_text(json.dumps(corpus, ensure_ascii=False), encoding="utf-8")
+        config = HybridSearchConfig(local_ac_patterns_path=str(path), **overrides)
+        service = HybridSearchService(config)
+        service._load_local_ac()
+        service._ac_adapter = MagicMock()
+        service._ac_adapter.search = AsyncMock(return_value=[])
+        return service
+
+    @pytest.mark.asyncio
+    async def test_local_ac_is_primary(self, tmp_path, corpus, normalized):
+        service = self._service(tmp_path, corpus)
+        candidates = await service._ac_search_only(normalized, "Petro Poroshenko", SearchOpts())
+        assert [c.doc_id for c in candidates] == ["p1"]
+        service._ac_adapter.search.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_es_secondary(self, tmp_path, corpus, normalized):
+        service = self._service(tmp_path, corpus, ac_es_secondary=True)
+        await service._ac_search_only(normalized, "Petro Poroshenko", SearchOpts())
+        service._ac_adapter.search.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_snapshot_dir_reload(self, tmp_path, corpus, normalized):
+        manager = ACSnapshotManager(tmp_path / "snaps")
+        manager.publish(LocalACAutomaton.from_corpus(corpus), version="v1")
+        service = HybridSearchService(
+            HybridSearchConfig(local_ac_snapshot_dir=str(tmp_path / "snaps"))
+        )
+        service._load_local_ac()
+        assert service._local_ac.is_mapped
+        assert await service.reload_local_ac() == {"reloaded": False, "version": "v1"}
+
+        manager.publish(LocalACAutomaton.from_corpus(corpus), version="v2")
+        assert await service.reload_local_ac() == {"reloaded": True, "version": "v2"}
+        assert service._local_ac.version == "v2"
+
+    def test_disabled_local_ac(self, tmp_path, corpus):
+        service = self._service(tmp_path, corpus, enable_local_ac=False)
+        assert service._local_ac is None
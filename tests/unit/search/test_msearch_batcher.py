@@ -0,0 +1,81 @@
+"""
+Unit tests for the _msearch request coalescer.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.ai_service.layers.search.msearch_batcher import MSearchBatcher, MSearchItemError
+
+
+def _client():
+    client = Mock()
+
+    async def msearch(body):
+        responses = []
+        for header, query in zip(body[::2], body[1::2]):
+            if query.get("fail"):
+                responses.append({"error": {"type": "query_shard_exception"}})
+            else:
+                responses.append({"hits": {"hits": [{"_id": f"{header['index']}:{query['q']}"}]}})
+        return {"responses": responses}
+
+    client.msearch = AsyncMock(side_effect=msearch)
+    return client
+
+
+class TestMSearchBatcher:
+    @pytest.mark.asyncio
+    async def test_concurrent_searches_share_one_msearch(self):
+        client = _client()
+        batcher = MSearchBatcher(max_batch_size=10, window_ms=5)
+
+        responses = await asyncio.gather(*(
+            batcher.search(client, "watchlist_ac", {"q": i}) for i in range(4)
+        ))
+
+        assert [r["hits"]["hits"][0]["_id"] for r in responses] == [
+            "watchlist_ac:0", "watchlist_ac:1", "watchlist_ac:2", "watchlist_ac:3"
+        ]
+        assert client.msearch.await_count == 1
+        assert batcher.get_stats()["largest_batch"] == 4
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_immediately(self):
+        client = _client()
+        batcher = MSearchBatcher(max_batch_size=2, window_ms=10_000)
+
+        await asyncio.wait_for(
+            asyncio.gather(*(batcher.search(client, "idx", {"q": i}) for i in range(4))),
+            timeout=1,
+        )
+        assert client.msearch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_per_item_errors(self):
+        client = _client()
+        batcher = MSearchBatcher(window_ms=1)
+
+        ok, failed = await asyncio.gather(
+            batcher.search(client, "idx", {"q": 1}),
+            batcher.search(client, "idx", {"q": 2, "fail": True}),
+            return_exceptions=True,
+        )
+        assert ok["hits"]["hits"][0]["_id"] == "idx:1"
+        assert isinstance(failed, MSearchItemError)
+
+    @pytest.mark.asyncio
+    async def test_transport_error_fails_whole_batch(self):
+        client = Mock()
+        client.msearch = AsyncMock(side_effect=ConnectionError("down"))
+        batcher = MSearchBatcher(window_ms=1)
+
+        results = await asyncio.gather(
+            batcher.search(client, "idx", {"q": 1}),
+            batcher.search(client, "idx", {"q": 2}),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert batcher.stats["failed_batches"] == 1
@@ -0,0 +1,125 @@
+"""
+Unit tests for speculative (parallel) escalation in HybridSearchService.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.ai_service.contracts.base_contracts import NormalizationResult
+from src.ai_service.layers.search.config import HybridSearchConfig
+from src.ai_service.layers.search.contracts import Candidate, SearchMode, SearchOpts
+from src.ai_service.layers.search.hybrid_search_service import HybridSearchService
+
+
+def _candidate(doc_id: str, score: float, mode: SearchMode) -> Candidate:
+    return Candidate(
+        doc_id=doc_id,
+        score=score,
+        text="John Doe",
+        entity_type="person",
+        metadata={},
+        search_mode=mode,
+        match_fields=["name"],
+        confidence=score,
+    )
+
+
+@pytest.fixture
+def normalized():
+    return NormalizationResult(
+        normalized="John Doe",
+        tokens=["John", "Doe"],
+        trace=[],
+        errors=[],
+        language="en",
+        confidence=0.9,
+        original_length=8,
+        normalized_length=8,
+        token_count=2,
+        processing_time=0.1,
+        success=True,
+    )
+
+
+def _service(fuzzy_delay, fuzzy_score, vector_delay, **overrides):
+    settings = {"enable_parallel_escalation": True, "enable_local_ac": False, **overrides}
+    service = HybridSearchService(HybridSearchConfig(**settings))
+    service.calls = {"vector_started": 0, "vector_finished": 0}
+
+    async def ac_search(*args, **kwargs):
+        return []
+
+    async def fuzzy_search(*args, **kwargs):
+        await asyncio.sleep(fuzzy_delay)
+        return [_candidate("f1", fuzzy_score, SearchMode.FUZZY)]
+
+    async def vector_search(*args, **kwargs):
+        service.calls["vector_started"] += 1
+        await asyncio.sleep(vector_delay)
+        service.calls["vector_finished"] += 1
+        return [_candidate("v1", 0.7, SearchMode.VECTOR)]
+
+    service._ac_search_only = ac_search
+    service._fuzzy_search = fuzzy_search
+    service._vector_search_only = vector_search
+    service._should_use_vector_fallback = lambda *args: False
+    return service
+
+
+class TestParallelEscalation:
+    @pytest.mark.asyncio
+    async def test_branches_run_concurrently(self, normalized):
+        service = _service(fuzzy_delay=0.1, fuzzy_score=0.1, vector_delay=0.1)
+
+        start = time.perf_counter()
+        candidates = await service._hybrid_search(normalized, "John Doe", SearchOpts())
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.18  # max(fuzzy, vector), not their sum
+        assert {c.doc_id for c in candidates} == {"f1", "v1"}
+
+    @pytest.mark.asyncio
+    async def test_sufficient_fuzzy_cancels_vector(self, normalized):
+        service = _service(fuzzy_delay=0.0, fuzzy_score=0.99, vector_delay=0.5)
+
+        candidates = await service._hybrid_search(normalized, "John Doe", SearchOpts())
+        await asyncio.sleep(0)
+
+        assert [c.doc_id for c in candidates] == ["f1"]
+        assert service.calls == {"vector_started": 1, "vector_finished": 0}
+        assert service._metrics.escalation_branches_cancelled == 1
+
+    @pytest.mark.asyncio
+    async def test_global_deadline(self, normalized):
+        service = _service(
+            fuzzy_delay=0.01, fuzzy_score=0.1, vector_delay=1.0, search_deadline_ms=100
+        )
+
+        start = time.perf_counter()
+        candidates = await service._hybrid_search(normalized, "John Doe", SearchOpts())
+
+        assert time.perf_counter() - start < 0.5
+        assert [c.doc_id for c in candidates] == ["f1"]
+        assert service._metrics.deadline_exceeded == 1
+
+    @pytest.mark.asyncio
+    async def test_sequential_mode_respects_deadline(self, normalized):
+        service = _service(
+            fuzzy_delay=0.01, fuzzy_score=0.1, vector_delay=1.0,
+            search_deadline_ms=100, enable_parallel_escalation=False,
+        )
+
+        start = time.perf_counter()
+        await service._hybrid_search(normalized, "John Doe", SearchOpts())
+
+        assert time.perf_counter() - start < 0.5
+        assert service._metrics.deadline_exceeded == 1
+
+    def test_config_from_env(self):
+        config = HybridSearchConfig.from_env(
+            env={"ENABLE_PARALLEL_ESCALATION": "true", "SEARCH_DEADLINE_MS": "750"}
+        )
+        assert config.enable_parallel_escalation is True
+        assert config.search_deadline_ms == 750
@@ -0,0 +1,109 @@
+"""
+Unit tests for the memory-mapped sanctioned INN index.
+"""
+
+import json
+import os
+
+import pytest
+
+from src.ai_service.layers.search.sanctioned_inn_cache import SanctionedINNCache
+from src.ai_service.layers.search.sanctioned_inn_index import (
+    SanctionedINNIndex,
+    build_inn_index,
+    encode_inn,
+)
+
+CACHE = {
+    "782611846337": {"type": "person", "name": "Ковриков Роман Валерійович", "entity_id": 1},
+    "00032106": {"type": "organization", "name": "ТОВ Ромашка", "entity_id": 7},
+    "32106": {"type": "organization", "name": "Short key", "entity_id": 8},
+    "2839403975": {"type": "person", "name": "Петренко Іван", "entity_id": 9},
+    "not-an-inn": {"type": "person", "name": "skipped"},
+}
+
+
+@pytest.fixture
+def index(tmp_path):
+    info = build_inn_index(CACHE, tmp_path / "inns.idx")
+    assert info["count"] == 4 and info["skipped"] == 1
+    index = SanctionedINNIndex(tmp_path / "inns.idx")
+    yield index
+    index.close()
+
+
+class TestSanctionedINNIndex:
+    def test_encode_keeps_leading_zeros_distinct(self):
+        assert encode_inn("00032106") != encode_inn("32106")
+        assert encode_inn(" 32106 ") == encode_inn("32106")
+        assert encode_inn("12a") is None
+        assert encode_inn("1" * 18) is None
+
+    def test_get(self, index):
+        assert len(index) == 4
+        assert index.get("00032106")["name"] == "ТОВ Ромашка"
+        assert index.get("32106")["name"] == "Short key"
+        assert index.get(" 782611846337 ")["entity_id"] == 1
+        assert index.get("0032106") is None
+        assert index.get("garbage") is None
+        assert "2839403975" in index
+        assert index.type_counts == {"person": 2, "organization": 2}
+
+    def test_get_many(self, index):
+        found = index.get_many(["2839403975", "1111", "00032106", "2839403975", "x"])
+        assert set(found) == {"2839403975", "00032106"}
+        assert found["2839403975"]["name"] == "Петренко Іван"
+
+    def test_records_are_fresh_dicts(self, index):
+        index.get("32106")["name"] = "changed"
+        assert index.get("32106")["name"] == "Short key"
+
+    def test_items_roundtrip(self, index):
+        assert dict(index.items()) == {k: v for k, v in CACHE.items() if k != "not-an-inn"}
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "bogus.idx"
+        path.write_bytes(b"definitely not an index")
+        with pytest.raises(ValueError):
+            SanctionedINNIndex(path)
+
+
+class TestSanctionedINNCacheBackends:
+    def _cache(self, tmp_path, with_index=True):
+        json_path = tmp_path / "sanctioned_inns_cache.json"
+        json_path.write_text(json.dumps(CACHE, ensure_ascii=False), encoding="utf-8")
+        cache = SanctionedINNCache()
+        cache.cache_file = json_path
+        cache.index_file = tmp_path / "sanctioned_inns_cache.idx"
+        if with_index:
+            build_inn_index(CACHE, cache.index_file)
+        return cache
+
+    def test_prefers_index(self, tmp_path):
+        cache = self._cache(tmp_path)
+        assert cache.lookup("00032106")["entity_id"] == 7
+        assert cache.index is not None and cache.cache == {}
+        assert cache.get_stats()["backend"] == "mmap_index"
+        assert cache.stats["persons"] == 2
+
+    def test_stale_index_falls_back_to_json(self, tmp_path):
+        cache = self._cache(tmp_path)
+        newer = cache.index_file.stat().st_mtime + 10
+        os.utime(cache.cache_file, (newer, newer))
+        assert cache.lookup("00032106")["entity_id"] == 7
+        assert cache.index is None
+        assert cache.get_stats()["backend"] == "json"
+
+    @pytest.mark.parametrize("with_index", [True, False])
+    def test_lookup_many(self, tmp_path, with_index):
+        cache = self._cache(tmp_path, with_index=with_index)
+        found = cache.lookup_many(["2839403975", "999", "782611846337"])
+        assert set(found) == {"2839403975", "782611846337"}
+        assert cache.stats["lookups"] == 3
+        assert cache.stats["hits"] == 2 and cache.stats["misses"] == 1
+
+    def test_reload_closes_index(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache.lookup("32106")
+        assert cache.reload_cache() is True
+        assert cache.lookup("32106")["name"] == "Short key"
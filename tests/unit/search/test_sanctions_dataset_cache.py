@@ -0,0 +1,117 @@
+"""
+Tests for the memory-mapped sanctions dataset cache.
+"""
+
+import json
+
+import pytest
+
+from src.ai_service.layers.search.sanctions_data_loader import (
+    CachedSanctionsDataset,
+    SanctionEntry,
+    SanctionsDataLoader,
+    SanctionsDataset,
+)
+from src.ai_service.layers.search.sanctions_dataset_cache import (
+    SanctionsDatasetCache,
+    write_dataset_cache,
+)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    persons = [
+        {"name": "Іванов Іван Іванович", "name_ru": "Иванов Иван Иванович", "name_en": "Ivanov Ivan",
+         "birthdate": "1970-01-01", "person_id": 1, "itn": "1234567890", "status": "active"},
+        {"name": "Петров Петро", "name_en": "Petrov Petro", "person_id": 2},
+    ]
+    companies = [{"name": "ТОВ Ромашка", "tax_number": "12345678", "person_id": 3}]
+    (tmp_path / "sanctioned_persons.json").write_text(json.dumps(persons, ensure_ascii=False), encoding="utf-8")
+    (tmp_path / "sanctioned_companies.json").write_text(json.dumps(companies, ensure_ascii=False), encoding="utf-8")
+    return tmp_path
+
+
+def _entries():
+    return [
+        SanctionEntry("Ivan Petrov", "person", "test", "List A", ["Иван Петров"], "1970-01-01", "RU", {"itn": "1"}),
+        SanctionEntry("Acme Ltd", "organization", "test", "List A", ["Acme"]),
+        SanctionEntry("Acme Holding", "organization", "test", "List B", ["Acme"], metadata={"k": [1, 2]}),
+        SanctionEntry("Vessel X", "vessel", "test", "List B"),
+    ]
+
+
+def test_round_trip_interns_strings(tmp_path):
+    entries = _entries()
+    name_to_entry = {}
+    for entry in entries:
+        for name in [entry.name, *entry.aliases]:
+            name_to_entry[name] = entry
+    all_names = list(name_to_entry)
+
+    write_dataset_cache(tmp_path / "cache.bin", entries, all_names, name_to_entry, ["A"], "fp")
+    cache = SanctionsDatasetCache(tmp_path / "cache.bin")
+
+    # "test", "List A", "List B" and the shared alias are stored once
+    assert cache.header["strings"] == 14
+    assert cache.fingerprint == "fp"
+    assert cache.all_names() == all_names
+    assert cache.person_names() == ["Ivan Petrov", "Иван Петров"]
+    assert cache.org_names() == ["Acme Ltd", "Acme", "Acme Holding", "Acme"]
+    for entry_index, entry in enumerate(entries):
+        assert SanctionEntry(**cache.entry(entry_index)) == entry
+    # Later entries win for a shared alias, as in the dict built from sources
+    assert cache.find_entry_index("Acme") == 2
+    assert cache.find_entry_index("Vessel X") == 3
+    assert cache.find_entry_index("Unknown") is None
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_loader_reuses_cache_built_from_same_sources(data_dir):
+    dataset = await SanctionsDataLoader(data_dir).load_dataset()
+    assert isinstance(dataset, SanctionsDataset)
+    assert (data_dir / "sanctions_cache.bin").exists()
+
+    cached = await SanctionsDataLoader(data_dir).load_dataset()
+
+    assert isinstance(cached, CachedSanctionsDataset)
+    assert cached.all_names == dataset.all_names
+    assert cached.get_person_names() == dataset.get_person_names()
+    assert cached.get_org_names() == dataset.get_org_names()
+    assert cached.persons == dataset.persons
+    assert cached.organizations == dataset.organizations
+    assert dict(cached.name_to_entry) == dataset.name_to_entry
+    assert cached.name_to_entry["Ivanov Ivan"].metadata["itn"] == "1234567890"
+
+
+@pytest.mark.asyncio
+async def test_loader_rebuilds_when_sources_change(data_dir):
+    loader = SanctionsDataLoader(data_dir)
+    await loader.load_dataset()
+
+    companies = [{"name": "ТОВ Волошка", "person_id": 4}]
+    (data_dir / "sanctioned_companies.json").write_text(json.dumps(companies, ensure_ascii=False), encoding="utf-8")
+
+    rebuilt = await loader.load_dataset()
+    reopened = await SanctionsDataLoader(data_dir).load_dataset()
+
+    assert isinstance(rebuilt, SanctionsDataset)
+    assert isinstance(reopened, CachedSanctionsDataset)
+    for dataset in (rebuilt, reopened):
+        assert "ТОВ Волошка" in dataset.all_names
+        assert "ТОВ Ромашка" not in dataset.all_names
+
+
+@pytest.mark.asyncio
+async def test_stats_do_not_build_entries(data_dir):
+    await SanctionsDataLoader(data_dir).load_dataset()
+    loader = SanctionsDataLoader(data_dir)
+
+    stats = await loader.get_stats()
+
+    assert stats["cache_backend"] == "mmap"
+    assert stats["persons"] == 8  # two source persons plus the sample data
+    assert loader._cached_dataset._entries == {}
+
+    await loader.clear_cache()
+    assert not (data_dir / "sanctions_cache.bin").exists()
@@ -101,6 +101,8 @@ class TestVectorFallbackIntegration:
         service._embedding_service = mock_embedding_service
         service._vector_adapter = mock_vector_adapter
         service._ac_adapter = mock_ac_adapter
+        # Keep the in-memory fuzzy fallback off the sanctions data on disk
+        service._fuzzy_candidates_cache["fuzzy_candidates"] = []
         return service
 
     @pytest.mark.asyncio
@@ -347,6 +349,7 @@ class TestVectorFallbackIntegration:
         service._vector_adapter = Mock()
         service._vector_adapter.search = AsyncMock(return_value=[])
         service._vector_adapter.search_vector_fallback = AsyncMock(return_value=[])
+        service._fuzzy_candidates_cache["fuzzy_candidates"] = []
         
         # Execute search
         results = await service._hybrid_search(
@@ -0,0 +1,98 @@
+"""
+Unit tests for batched watchlist index search.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.ai_service.contracts.trace_models import SearchTrace
+from src.ai_service.layers.embeddings.indexing.enhanced_vector_index_service import EnhancedVectorIndexConfig
+from src.ai_service.layers.embeddings.indexing.vector_index_service import (
+    CharTfidfVectorIndex,
+    VectorIndexConfig,
+)
+from src.ai_service.layers.embeddings.indexing.watchlist_index_service import WatchlistIndexService
+
+NAMES = [
+    "Іванов Іван Іванович",
+    "Петров Петро Петрович",
+    "Сидоренко Олена Миколаївна",
+    "Ivan Petrov",
+    "Petro Ivanenko",
+    "ТОВ Ромашка",
+    "ООО Рога и Копыта",
+    "Acme Trading Ltd",
+    "Kovalenko Andrii",
+    "Коваленко Андрій Вікторович",
+    "Shevchenko Taras",
+    "Шевченко Тарас Григорович",
+]
+
+QUERIES = ["іванов іван", "petrov ivan", "ромашка", "kovalenko", "шевченко тарас", "zzz"]
+
+
+def _matches(results):
+    """Docs sharing n-grams with the query; zero-score ties have no defined order."""
+    return sorted((-round(score, 4), doc_id) for doc_id, score in results if score > 1e-3)
+
+
+@pytest.fixture
+def service():
+    svc = WatchlistIndexService(
+        EnhancedVectorIndexConfig(use_semantic_embeddings=False, enable_hybrid_search=False, use_faiss=False)
+    )
+    svc.build_from_corpus([(f"doc{i}", name, "person", {}) for i, name in enumerate(NAMES)])
+    svc.set_overlay_from_corpus([("new1", "Іванов Іван Петрович", "person", {}), ("doc5", "ТОВ Ромашка", "organization", {})])
+    return svc
+
+
+def test_char_index_search_many_matches_search():
+    index = CharTfidfVectorIndex(VectorIndexConfig(use_faiss=False, svd_dim=8))
+    index.rebuild([(f"doc{i}", name) for i, name in enumerate(NAMES)])
+
+    batch = index.search_many(QUERIES, top_k=3, max_block_bytes=1)  # one query per block
+
+    for query, results in zip(QUERIES, batch):
+        expected = index.search(query, top_k=3)
+        assert _matches(results) == _matches(expected)
+        assert [score for _, score in results] == pytest.approx([score for _, score in expected], abs=1e-5)
+
+
+def test_search_many_matches_search(service):
+    batch = service.search_many(QUERIES, top_k=5)
+
+    assert len(batch) == len(QUERIES)
+    for query, results in zip(QUERIES, batch):
+        expected = service.search(query, top_k=5)
+        assert _matches(results) == _matches(expected)
+        assert [score for _, score in results] == pytest.approx([score for _, score in expected], abs=1e-5)
+
+
+def test_search_many_empty_and_not_ready():
+    svc = WatchlistIndexService(EnhancedVectorIndexConfig(use_semantic_embeddings=False))
+
+    assert svc.search_many([]) == []
+    assert svc.search_many(["a", "b"]) == [[], []]
+
+
+def test_search_without_trace_skips_signals(service):
+    with patch.object(service, "_extract_signals") as extract_signals:
+        results = service.search("іванов іван", top_k=5)
+
+    assert results
+    extract_signals.assert_not_called()
+
+
+def test_traced_rerank_keeps_first_hit_signals(service):
+    trace = SearchTrace(enabled=True)
+
+    results = service.search("ромашка", top_k=5, trace=trace)
+
+    rerank = trace.steps[-1]
+    assert rerank.stage == "RERANK"
+    # Trace steps order tied scores by doc_id
+    assert [hit.doc_id for hit in rerank.hits] == [doc_id for doc_id, _ in sorted(results, key=lambda r: (-r[1], r[0]))]
+    # doc5 is in both indexes; the overlay hit (organization) comes first
+    doc5 = next(hit for hit in rerank.hits if hit.doc_id == "doc5")
+    assert doc5.signals["entity_type"] == "organization"
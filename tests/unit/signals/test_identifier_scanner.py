@@ -0,0 +1,83 @@
+"""
+Parity and gating tests for the combined identifier scanner.
+"""
+
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from src.ai_service.data.patterns.dates import extract_birthdates_from_text
+from src.ai_service.data.patterns.identifier_scanner import IdentifierScanner, scan_identifiers
+from src.ai_service.data.patterns.identifiers import (
+    get_compiled_patterns_cached,
+    get_validation_function,
+    normalize_identifier,
+)
+
+ALL_TYPES = {pattern.type for pattern, _ in get_compiled_patterns_cached()}
+
+TEXTS = [
+    "Оплата ТОВ Ромашка ЄДРПОУ 12345678 за послуги",
+    "Іванов Іван Іванович, ІПН 1234567890, дата народження 15.03.1985",
+    "Петров Петр ИНН 7707083893 ОГРН 1027700132195 паспорт 4510 123456",
+    "Payment to John Smith SSN 123-45-6789 born January 5, 1970",
+    "IBAN: UA21 3223 1300 0002 6007 2335 6600 1 SWIFT: DEUTDEFF",
+    "серия АВ номер 123456 выдан 01.02.2003",
+    "ID-картка 123456789 документ",
+    "ОГРНИП 304500116000157 ИП Сидоров",
+    "LEI 5493001KJTIIGC8Y1R12 VAT DE123456789 EIN 12-3456789",
+    "TIN 123456789 taxpayer identification number 1234567890",
+    "İNN 1234567890",
+    "просто текст без идентификаторов",
+    "",
+]
+
+
+def _legacy_scan(text):
+    """Reference: every compiled pattern over the whole text."""
+    found = []
+    for pattern, compiled_regex in get_compiled_patterns_cached():
+        for match in compiled_regex.finditer(text):
+            if pattern.type in ("passport_rf", "passport_ua") and len(match.groups()) > 1:
+                raw_value = "".join(g for g in match.groups() if g is not None)
+            else:
+                raw_value = match.group(1) if match.group(1) else match.group(0)
+            value = normalize_identifier(raw_value, pattern.type)
+            validator = get_validation_function(pattern.type)
+            valid = validator(value) if validator else True
+            found.append((pattern.name, value, match.span(), valid))
+    return found
+
+
+def _scan_tuples(scan):
+    return [(i["name"], i["value"], i["position"], i["valid"]) for i in scan.identifiers]
+
+
+class TestIdentifierScanner:
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_parity_with_per_pattern_scan(self, text):
+        scan = IdentifierScanner().scan(text)
+        assert _scan_tuples(scan) == _legacy_scan(text)
+        assert scan.birthdates == (extract_birthdates_from_text(text) if text else [])
+
+    @settings(max_examples=200, deadline=None)
+    @given(st.lists(st.sampled_from(
+        ["ИНН", "інн", "ЄДРПОУ", "паспорт", "серия", "ID", "карта", "SWIFT", "IBAN", "ОГРН",
+         "TIN", "1234567890", "12345678", "123456789", "АВ", "123456", "15.03.1985", "UA21",
+         "DEUTDEFF", ":", " ", "\n", "Іван", "ТОВ"]
+    ), max_size=12))
+    def test_parity_on_token_mixes(self, tokens):
+        text = " ".join(tokens)
+        assert _scan_tuples(IdentifierScanner().scan(text)) == _legacy_scan(text)
+
+    def test_patterns_without_cues_are_skipped(self):
+        scanner = IdentifierScanner()
+        assert scanner.scan("Іван Петренко").patterns_run == 0
+        assert scanner.find_cues("ОГРНИП і ІНН") >= {"огрнип", "огрн", "інн"}
+
+    def test_ids_for_dedupes_and_copies(self):
+        scan = scan_identifiers("ИНН 7707083893 ИНН 7707083893")
+        ids = scan.ids_for(ALL_TYPES)
+        assert [i["value"] for i in ids] == ["7707083893"]
+        assert ids[0]["position"] == (0, 14)
+        ids[0]["value"] = "changed"
+        assert scan.ids_for(ALL_TYPES)[0]["value"] == "7707083893"
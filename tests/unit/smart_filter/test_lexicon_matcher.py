@@ -0,0 +1,80 @@
+"""
+Unit tests for the smart-filter LexiconMatcher
+"""
+
+import random
+import unittest
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+
+from ai_service.layers.smart_filter.lexicon_matcher import (
+    BANKING_TERMS_CATEGORY,
+    COMPANY_KEYWORDS_CATEGORY,
+    AHOCORASICK_AVAILABLE,
+    LexiconMatcher,
+    build_smart_filter_lexicons,
+    get_smart_filter_matcher,
+    payment_category,
+)
+
+
+class TestLexiconMatcher(unittest.TestCase):
+    """Test cases for LexiconMatcher"""
+
+    def test_substring_semantics_and_order(self):
+        """Matches follow `keyword.lower() in text.lower()` and lexicon order"""
+        matcher = LexiconMatcher({
+            "a": ["Банк", "ТОВ", "банк", "x"],
+            "b": ["ов", "zzz"],
+        })
+        hits = matcher.scan("ТОВ Укрексімбанк")
+
+        self.assertEqual(hits.matches("a"), ["Банк", "ТОВ", "банк"])
+        self.assertEqual(hits.matches("b"), ["ов"])
+        self.assertEqual(hits.matches("missing"), [])
+        self.assertEqual(hits.categories(), {"a", "b"})
+
+    def test_empty_text(self):
+        """Empty text matches nothing"""
+        matcher = LexiconMatcher({"a": ["банк"]})
+        hits = matcher.scan("")
+
+        self.assertFalse(hits)
+        self.assertEqual(hits.matches("a"), [])
+
+    def test_backends_agree_with_naive_scan(self):
+        """Both backends match the naive per-keyword loop on real lexicons"""
+        lexicons = build_smart_filter_lexicons()
+        backends = [LexiconMatcher(lexicons, use_ahocorasick=False)]
+        if AHOCORASICK_AVAILABLE:
+            backends.append(LexiconMatcher(lexicons, use_ahocorasick=True))
+
+        words = [word for words in lexicons.values() for word in words]
+        rng = random.Random(5)
+        texts = ["Оплата за послуги ТОВ Ромашка згідно договору, Приват Банк"]
+        for _ in range(300):
+            texts.append(" ".join(rng.choice(words + ["Іван", "1234", "x"]) for _ in range(rng.randint(1, 8))))
+
+        for text in texts:
+            text_lower = text.lower()
+            for matcher in backends:
+                hits = matcher.scan(text)
+                for category, keywords in lexicons.items():
+                    expected = [kw for kw in keywords if kw.lower() in text_lower]
+                    self.assertEqual(hits.matches(category), expected, (text, category))
+
+    def test_smart_filter_categories(self):
+        """Shared matcher covers company, banking and payment lexicons"""
+        matcher = get_smart_filter_matcher()
+
+        self.assertIs(matcher, get_smart_filter_matcher())
+        self.assertIn(COMPANY_KEYWORDS_CATEGORY, matcher.categories)
+        self.assertIn(BANKING_TERMS_CATEGORY, matcher.categories)
+        self.assertIn(payment_category("uk", "context"), matcher.categories)
+
+
+if __name__ == '__main__':
+    unittest.main()
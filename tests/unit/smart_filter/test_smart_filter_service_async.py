@@ -224,3 +224,97 @@ class TestSmartFilterServiceAsync:
             for text, expected_process in test_cases:
                 result = await service.should_process_text_async(text)
                 assert result.should_process == expected_process
+
+
+class TestSearchAhoCorasickAsync:
+    """Test the non-blocking AC search path"""
+
+    @pytest.fixture
+    def local_ac(self):
+        from src.ai_service.layers.search.local_ac_automaton import LocalACAutomaton
+
+        return LocalACAutomaton.from_corpus({
+            "patterns": [
+                {"pattern": "Petro Poroshenko", "tier": 1, "type": "transliteration",
+                 "entity_id": "p1", "entity_type": "person", "confidence": 0.9},
+            ]
+        })
+
+    @pytest.mark.asyncio
+    async def test_local_automaton_path(self, local_ac):
+        service = SmartFilterService(enable_aho_corasick=True, local_ac=local_ac)
+
+        with patch("src.ai_service.utils.http_client_pool.get_http_pool") as mock_pool:
+            result = await service.search_aho_corasick_async("оплата Petro Poroshenko")
+
+        mock_pool.assert_not_called()
+        assert result["backend"] == "local"
+        assert result["matches"][0]["entity_id"] == "p1"
+        assert result["matches"][0]["tier"] == "tier_1"
+        assert {"normalize", "local_ac", "total"} <= set(result["timings_ms"])
+
+    @pytest.mark.asyncio
+    async def test_es_deadline(self, monkeypatch):
+        monkeypatch.setenv("ES_USERNAME", "user")
+        monkeypatch.setenv("ES_PASSWORD", "secret")
+        monkeypatch.delenv("LOCAL_AC_SNAPSHOT_DIR", raising=False)
+        service = SmartFilterService(enable_aho_corasick=True)
+
+        async def slow_post(*args, **kwargs):
+            await asyncio.sleep(1)
+
+        pool = Mock()
+        pool.async_post_json = slow_post
+        with patch("src.ai_service.utils.http_client_pool.get_http_pool", return_value=pool):
+            result = await service.search_aho_corasick_async("Petro Poroshenko", deadline_ms=20)
+
+        assert result["matches"] == []
+        assert result["error_type"] == "timeout"
+        assert result["timings_ms"]["es_request"] < 500
+
+    def test_sync_search_uses_terms_query(self, monkeypatch):
+        pytest.importorskip("requests")
+        monkeypatch.setenv("ES_USERNAME", "user")
+        monkeypatch.setenv("ES_PASSWORD", "secret")
+        monkeypatch.delenv("LOCAL_AC_SNAPSHOT_DIR", raising=False)
+        service = SmartFilterService(enable_aho_corasick=True)
+
+        response = Mock(status_code=200)
+        response.json.return_value = {"hits": {"total": {"value": 1}, "hits": [
+            {"_source": {"pattern": "Petro Poroshenko", "tier": 1, "entity_id": "p1"}, "_score": 3.0},
+        ]}}
+        pool = Mock()
+        pool.sync_post_json.return_value = response
+        with patch("src.ai_service.utils.http_client_pool.get_http_pool", return_value=pool):
+            result = service.search_aho_corasick("оплата Petro Poroshenko", deadline_ms=150)
+
+        _, query = pool.sync_post_json.call_args.args
+        assert "wildcard" not in str(query)
+        assert pool.sync_post_json.call_args.kwargs["timeout"] <= 0.15
+        assert result["backend"] == "elasticsearch"
+        assert result["matches"][0]["entity_id"] == "p1"
+        assert result["matches"][0]["start"] == 7
+
+    def test_terms_query_has_no_wildcards(self):
+        query = SmartFilterService._build_ac_terms_query("Оплата, Petro Poroshenko!", 10)
+        values = [
+            clause["term"]["pattern"]["value"]
+            for clause in query["query"]["bool"]["should"]
+        ]
+        assert "Petro Poroshenko" in values
+        assert "Оплата Petro Poroshenko" in values
+        assert not any("*" in value for value in values)
+        assert SmartFilterService._build_ac_terms_query("a, b", 10)["query"]["bool"]["should"] == [
+            {"term": {"pattern": {"value": "a b", "case_insensitive": True}}}
+        ]
+        assert SmartFilterService._build_ac_terms_query("?! a", 10) is None
+
+    @pytest.mark.asyncio
+    async def test_should_process_text_async_passes_ac_matches(self, local_ac):
+        service = SmartFilterService(enable_aho_corasick=True, local_ac=local_ac)
+
+        with patch.object(service, 'should_process_text') as mock_should_process:
+            await service.should_process_text_async("Оплата Petro Poroshenko")
+
+        ac_matches = mock_should_process.call_args.kwargs["ac_matches"]
+        assert [m["entity_id"] for m in ac_matches] == ["p1"]
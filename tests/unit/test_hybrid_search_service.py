@@ -107,6 +107,9 @@ class TestHybridSearchService:
         
         # Mock the metrics service
         service.metrics_service = AsyncMock()
+
+        # Keep the in-memory fuzzy fallback off the sanctions data on disk
+        service._fuzzy_candidates_cache["fuzzy_candidates"] = []
         
         # Initialize the service
         service._initialized = True
@@ -113,6 +113,9 @@ class TestSearchFallbackLogic:
         # Mock the client factory
         service._client_factory = AsyncMock()
         service._client_factory.health_check.return_value = {"status": "red"}
+
+        # Keep the in-memory fuzzy fallback off the sanctions data on disk
+        service._fuzzy_candidates_cache["fuzzy_candidates"] = []
         
         # Initialize the service
         service._initialized = True
@@ -314,6 +317,7 @@ class TestSearchFallbackLogic:
         # Mock the fallback services (should not be called)
         service._fallback_watchlist_service = AsyncMock()
         service._fallback_vector_service = AsyncMock()
+        service._fuzzy_candidates_cache["fuzzy_candidates"] = []
         
         service._initialized = True
         
@@ -0,0 +1,87 @@
+"""
+Parity tests for the single-pass UnicodeService fast path.
+
+``_normalize_full`` is the complete step-by-step pipeline; the fast path
+must produce exactly the same result for every text it handles.
+"""
+
+import pytest
+from hypothesis import HealthCheck, given, settings, strategies as st
+
+from src.ai_service.layers.unicode.unicode_service import UnicodeService
+
+SAMPLES = [
+    "Ivan Petrov",
+    "ivan petrov",
+    "  Ivan   Petrov ",
+    "O'Connor",
+    "D’Artagnan",
+    "Jean—Baptiste",
+    "«Ромашка» ТОВ",
+    "Пётр Семёнов",
+    "Іванов Іван Іванович",
+    "François Müller",
+    "Straße",
+    "José García",
+    "ﬁnance ltd",
+    "Ivan​Petrov",
+    "İЀ",
+    "ὐЀ́",
+    "Ｉｖａｎ",
+    "x" * 300,
+    "\t",
+    "ivan petrov",
+]
+
+_ALPHABET = st.sampled_from(
+    list("abcxyzABCXYZ '-`\"«»–—−ёЁаеорсАЕОРСіїєґ") + ["á", "é", "ü", "ß", "Ä", "́", "̈", "​", " ", "ﬁ", "İ", "ὐ", "Ѐ", "Ｉ", "  "]
+)
+
+
+def _without_timestamp(result):
+    return {key: value for key, value in result.items() if key != "timestamp"}
+
+
+@pytest.fixture(scope="module")
+def service():
+    return UnicodeService()
+
+
+@pytest.mark.parametrize("aggressive", [False, True])
+@pytest.mark.parametrize("text", SAMPLES)
+def test_fast_path_matches_full_pipeline(service, text, aggressive):
+    assert service._normalize_fast(text, aggressive) == service._normalize_full(text, aggressive, False)
+
+
+@settings(max_examples=300, suppress_health_check=[HealthCheck.function_scoped_fixture])
+@given(st.lists(_ALPHABET, min_size=1, max_size=20).map("".join), st.booleans())
+def test_fast_path_matches_full_pipeline_generated(service, text, aggressive):
+    assert service._normalize_fast(text, aggressive) == service._normalize_full(text, aggressive, False)
+
+
+def test_encoding_recovery_and_homoglyphs_use_full_pipeline(service):
+    for text, homoglyphs in [("Ð¡ÐµÑ€Ð³ÐµÐ¹", False), ("caf\x82", False), ("Ivаn Petrоv", True)]:
+        expected = service._normalize_full(text, False, homoglyphs)
+        result = service.normalize_text(text, normalize_homoglyphs=homoglyphs)
+        assert (result["normalized"], result["confidence"], result["changes_count"]) == (
+            expected[0], expected[1], expected[2]
+        )
+
+
+def test_repeated_inputs_are_cached():
+    service = UnicodeService(cache_size=8)
+    first = service.normalize_text("François Müller")
+    first["normalized"] = "mutated"
+    second = service.normalize_text("François Müller")
+
+    assert second["normalized"] == "Francois Muller"
+    assert _without_timestamp(service.normalize_text("François Müller")) == _without_timestamp(second)
+    stats = service.get_cache_stats()
+    assert stats["misses"] == 1 and stats["hits"] == 2
+
+
+def test_idempotent_result_is_unchanged(service):
+    result = service.normalize_text("ivan petrov")
+    assert result["idempotent"] is True
+    assert result["normalized"] == result["original"] == "ivan petrov"
+    assert result["original_length"] == 0
@@ -0,0 +1,79 @@
+"""
+Unit tests for the shared per-request TextProfile.
+"""
+
+import pytest
+
+from src.ai_service.config import LANGUAGE_CONFIG
+from src.ai_service.layers.language.language_detection_service import LanguageDetectionService
+from src.ai_service.layers.normalization.homoglyph_detector import HomoglyphDetector
+from src.ai_service.utils.text_profile import TextProfile
+
+SAMPLES = [
+    "Ivan Petrov",
+    "Іван Петренко",
+    "Пётр Семёнов 1985",
+    "Ivаn Petrоv",  # Cyrillic а and о
+    "ТОВ «Ромашка» Ltd",
+    "Платеж Иванову за услуги",
+    "   ",
+    "12345 !!!",
+    "Ѐ ӹ Ivan",
+]
+
+
+def test_script_histogram_counts():
+    scripts = TextProfile("Їжак Ёж, Ivan 42!").scripts
+
+    assert scripts.cyrillic == 6 and scripts.latin == 4
+    assert scripts.ukrainian == 1 and scripts.russian == 1
+    assert scripts.uppercase == 3
+    assert scripts.digits == 2 and scripts.other == 2
+    assert scripts.letters == 10
+
+
+def test_for_text_reuses_matching_profile():
+    profile = TextProfile("Ivan Petrov")
+
+    assert TextProfile.for_text("Ivan Petrov", profile) is profile
+    assert TextProfile.for_text("Ivan  Petrov", profile) is not profile
+    assert TextProfile.for_text("Ivan Petrov", None).text == "Ivan Petrov"
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_tokens_match_split(text):
+    assert TextProfile(text).tokens == text.split()
+
+
+def test_char_positions():
+    profile = TextProfile("ДР 01.02.1985, паспорт 123")
+
+    assert profile.char_positions(frozenset(".,")) == (5, 8, 13)
+    assert profile.char_positions(frozenset("xyz")) == ()
+
+
+def test_mixed_scripts():
+    assert TextProfile("Ivаn").has_mixed_scripts
+    assert not TextProfile("Иван").has_mixed_scripts
+    assert not TextProfile("Ivan").has_mixed_scripts
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_language_detection_same_with_profile(text):
+    service = LanguageDetectionService()
+
+    plain = service.detect_language_config_driven(text, LANGUAGE_CONFIG)
+    profiled = service.detect_language_config_driven(text, LANGUAGE_CONFIG, profile=TextProfile(text))
+
+    assert (profiled.language, profiled.confidence, profiled.details) == (
+        plain.language, plain.confidence, plain.details
+    )
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_homoglyph_detection_same_with_profile(text):
+    detector = HomoglyphDetector()
+    profile = TextProfile(text)
+
+    assert detector.detect_homoglyphs(text, profile) == detector.detect_homoglyphs(text)
+    assert detector.normalize_homoglyphs(text, profile) == detector.normalize_homoglyphs(text)